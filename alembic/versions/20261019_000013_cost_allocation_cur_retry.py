@@ -0,0 +1,74 @@
+"""Add CUR reconciliation attempt tracking to cost_allocations.
+
+Revision ID: 20261019_000013
+Revises: 20260513_000012
+Create Date: 2026-10-19 00:00:13
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_000013"
+down_revision: Union[str, None] = "20260513_000012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {col["name"] for col in inspector.get_columns("cost_allocations")}
+    indexes = {index["name"] for index in inspector.get_indexes("cost_allocations")}
+
+    if "cur_reconcile_attempts" not in columns:
+        op.add_column(
+            "cost_allocations",
+            sa.Column(
+                "cur_reconcile_attempts",
+                sa.Integer,
+                nullable=False,
+                server_default="0",
+            ),
+        )
+    if "cur_next_attempt_at" not in columns:
+        op.add_column(
+            "cost_allocations",
+            sa.Column("cur_next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        )
+    if "cur_query_execution_id" not in columns:
+        op.add_column(
+            "cost_allocations",
+            sa.Column("cur_query_execution_id", sa.String(128), nullable=True),
+        )
+    if "ix_cost_allocations_cur_pending" not in indexes:
+        op.create_index(
+            "ix_cost_allocations_cur_pending",
+            "cost_allocations",
+            ["cur_next_attempt_at"],
+            sqlite_where=sa.text("actual_cost_usd_micros IS NULL"),
+            postgresql_where=sa.text("actual_cost_usd_micros IS NULL"),
+        )
+    if "ix_cost_allocations_cur_query" not in indexes:
+        op.create_index(
+            "ix_cost_allocations_cur_query",
+            "cost_allocations",
+            ["cur_query_execution_id"],
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {col["name"] for col in inspector.get_columns("cost_allocations")}
+    indexes = {index["name"] for index in inspector.get_indexes("cost_allocations")}
+
+    for index_name in ("ix_cost_allocations_cur_query", "ix_cost_allocations_cur_pending"):
+        if index_name in indexes:
+            op.drop_index(index_name, table_name="cost_allocations")
+    for col in ("cur_query_execution_id", "cur_next_attempt_at", "cur_reconcile_attempts"):
+        if col in columns:
+            op.drop_column("cost_allocations", col)
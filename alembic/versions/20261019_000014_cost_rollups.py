@@ -0,0 +1,166 @@
+"""Add cost_rollups table and backfill it from cost_allocations.
+
+Revision ID: 20261019_000014
+Revises: 20261019_000013
+Create Date: 2026-10-19 00:00:14
+"""
+
+from datetime import UTC, datetime
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261019_000014"
+down_revision: Union[str, None] = "20261019_000013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SUM_COLUMNS = (
+    "run_count",
+    "reconciled_run_count",
+    "estimated_vcpu_seconds",
+    "estimated_memory_gb_seconds",
+    "estimated_cost_usd_micros",
+    "actual_cost_usd_micros",
+    "effective_cost_usd_micros",
+)
+
+
+def _table_exists(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _usage_date(value: datetime | str | None) -> str:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value is None:
+        value = datetime.now(UTC)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).date().isoformat()
+
+
+def _backfill(bind: sa.engine.Connection) -> None:
+    allocations = sa.table(
+        "cost_allocations",
+        sa.column("team"),
+        sa.column("cost_center"),
+        sa.column("environment_id"),
+        sa.column("tenant_id"),
+        sa.column("billing_period"),
+        sa.column("created_at"),
+        sa.column("estimated_vcpu_seconds"),
+        sa.column("estimated_memory_gb_seconds"),
+        sa.column("estimated_cost_usd_micros"),
+        sa.column("actual_cost_usd_micros"),
+    )
+    totals: dict[tuple[str, ...], dict] = {}
+    for row in bind.execute(sa.select(allocations)).mappings():
+        key = (
+            row["team"],
+            row["cost_center"],
+            row["environment_id"],
+            row["billing_period"],
+            _usage_date(row["created_at"]),
+        )
+        entry = totals.setdefault(
+            key,
+            {"tenant_id": row["tenant_id"], **dict.fromkeys(_SUM_COLUMNS, 0)},
+        )
+        estimated = int(row["estimated_cost_usd_micros"] or 0)
+        actual = row["actual_cost_usd_micros"]
+        entry["run_count"] += 1
+        entry["estimated_vcpu_seconds"] += int(row["estimated_vcpu_seconds"] or 0)
+        entry["estimated_memory_gb_seconds"] += int(row["estimated_memory_gb_seconds"] or 0)
+        entry["estimated_cost_usd_micros"] += estimated
+        if actual is not None:
+            entry["reconciled_run_count"] += 1
+            entry["actual_cost_usd_micros"] += int(actual)
+            entry["effective_cost_usd_micros"] += int(actual)
+        else:
+            entry["effective_cost_usd_micros"] += estimated
+    if not totals:
+        return
+    rollups = sa.table(
+        "cost_rollups",
+        sa.column("id"),
+        sa.column("team"),
+        sa.column("cost_center"),
+        sa.column("environment_id"),
+        sa.column("billing_period"),
+        sa.column("usage_date"),
+        sa.column("tenant_id"),
+        sa.column("updated_at"),
+        *(sa.column(name) for name in _SUM_COLUMNS),
+    )
+    now = datetime.now(UTC)
+    op.bulk_insert(
+        rollups,
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "team": team,
+                "cost_center": cost_center,
+                "environment_id": environment_id,
+                "billing_period": billing_period,
+                "usage_date": usage_date,
+                "updated_at": now,
+                **entry,
+            }
+            for (team, cost_center, environment_id, billing_period, usage_date), entry in totals.items()
+        ],
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "cost_rollups"):
+        op.create_table(
+            "cost_rollups",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("team", sa.String(length=255), nullable=False),
+            sa.Column("cost_center", sa.String(length=255), nullable=False),
+            sa.Column("environment_id", sa.String(length=36), nullable=False),
+            sa.Column("tenant_id", sa.String(length=36), nullable=False),
+            sa.Column("billing_period", sa.String(length=7), nullable=False),
+            sa.Column("usage_date", sa.String(length=10), nullable=False),
+            *(
+                sa.Column(name, sa.BigInteger(), nullable=False, server_default="0")
+                for name in _SUM_COLUMNS
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint(
+                "team",
+                "cost_center",
+                "environment_id",
+                "billing_period",
+                "usage_date",
+                name="uq_cost_rollups_key",
+            ),
+        )
+        op.create_index(
+            "ix_cost_rollups_team_period",
+            "cost_rollups",
+            ["team", "billing_period"],
+        )
+        _backfill(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "cost_rollups"):
+        op.drop_index("ix_cost_rollups_team_period", table_name="cost_rollups")
+        op.drop_table("cost_rollups")
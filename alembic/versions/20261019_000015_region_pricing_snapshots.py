@@ -0,0 +1,62 @@
+"""Add region_pricing_snapshots table for persisted AWS pricing.
+
+Revision ID: 20261019_000015
+Revises: 20261019_000014
+Create Date: 2026-10-19 00:00:15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261019_000015"
+down_revision: Union[str, None] = "20261019_000014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "region_pricing_snapshots"):
+        op.create_table(
+            "region_pricing_snapshots",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("region", sa.String(length=32), nullable=False),
+            sa.Column("source", sa.String(length=255), nullable=False),
+            sa.Column("vcpu_usd_per_second", sa.Float(), nullable=False),
+            sa.Column("memory_gb_usd_per_second", sa.Float(), nullable=False),
+            sa.Column("arm64_discount_pct", sa.Float(), nullable=False),
+            sa.Column("mixed_discount_pct", sa.Float(), nullable=False),
+            sa.Column(
+                "fetched_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("last_error", sa.Text(), nullable=True),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("region", name="uq_region_pricing_snapshots_region"),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "region_pricing_snapshots"):
+        op.drop_table("region_pricing_snapshots")
@@ -0,0 +1,64 @@
+"""Add run_state_events table feeding run wait and event-stream endpoints.
+
+Revision ID: 20261019_000016
+Revises: 20261019_000015
+Create Date: 2026-10-19 00:00:16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261019_000016"
+down_revision: Union[str, None] = "20261019_000015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "run_state_events"):
+        op.create_table(
+            "run_state_events",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("run_id", sa.String(length=36), nullable=False),
+            sa.Column("environment_id", sa.String(length=36), nullable=False),
+            sa.Column("tenant_id", sa.String(length=36), nullable=False),
+            sa.Column("created_by_actor", sa.String(length=255), nullable=True),
+            sa.Column("state", sa.String(length=32), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(
+            "ix_run_state_events_tenant_id_id",
+            "run_state_events",
+            ["tenant_id", "id"],
+        )
+        op.create_index(
+            "ix_run_state_events_created_at",
+            "run_state_events",
+            ["created_at"],
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "run_state_events"):
+        op.drop_index("ix_run_state_events_created_at", table_name="run_state_events")
+        op.drop_index("ix_run_state_events_tenant_id_id", table_name="run_state_events")
+        op.drop_table("run_state_events")
@@ -0,0 +1,97 @@
+"""Add provisioning_checkpoints table and backfill it from checkpoint audit events.
+
+Revision ID: 20261019_000017
+Revises: 20261019_000016
+Create Date: 2026-10-19 00:00:17
+"""
+
+from datetime import UTC, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261019_000017"
+down_revision: Union[str, None] = "20261019_000016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_CHECKPOINT_AUDIT_ACTION = "environment.full_byoc_checkpoint"
+
+
+def _table_exists(inspector: sa.Inspector, table_name: str) -> bool:
+    return table_name in inspector.get_table_names()
+
+
+def _backfill(bind: sa.engine.Connection) -> None:
+    audit_events = sa.table(
+        "audit_events",
+        sa.column("action"),
+        sa.column("entity_id"),
+        sa.column("details_json", sa.JSON),
+        sa.column("created_at"),
+    )
+    operations = sa.table("provisioning_operations", sa.column("id"))
+    operation_ids = set(bind.execute(sa.select(operations.c.id)).scalars())
+    latest: dict[str, dict] = {}
+    rows = bind.execute(
+        sa.select(audit_events)
+        .where(audit_events.c.action == _CHECKPOINT_AUDIT_ACTION)
+        .order_by(audit_events.c.created_at)
+    ).mappings()
+    for row in rows:
+        details = row["details_json"] if isinstance(row["details_json"], dict) else {}
+        operation_id = details.get("operation_id")
+        checkpoint = details.get("checkpoint")
+        if operation_id not in operation_ids or not isinstance(checkpoint, dict):
+            continue
+        entry = latest.setdefault(
+            operation_id,
+            {"operation_id": operation_id, "environment_id": row["entity_id"], "version": 0},
+        )
+        entry["checkpoint_json"] = checkpoint
+        entry["version"] += 1
+    if not latest:
+        return
+    checkpoints = sa.table(
+        "provisioning_checkpoints",
+        sa.column("operation_id"),
+        sa.column("environment_id"),
+        sa.column("checkpoint_json", sa.JSON),
+        sa.column("version"),
+        sa.column("updated_at"),
+    )
+    now = datetime.now(UTC)
+    op.bulk_insert(checkpoints, [{**entry, "updated_at": now} for entry in latest.values()])
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "provisioning_checkpoints"):
+        op.create_table(
+            "provisioning_checkpoints",
+            sa.Column("operation_id", sa.String(length=36), nullable=False),
+            sa.Column("environment_id", sa.String(length=36), nullable=False),
+            sa.Column("checkpoint_json", sa.JSON(), nullable=False),
+            sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+            sa.ForeignKeyConstraint(["operation_id"], ["provisioning_operations.id"]),
+            sa.PrimaryKeyConstraint("operation_id"),
+        )
+        _backfill(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "provisioning_checkpoints"):
+        op.drop_table("provisioning_checkpoints")
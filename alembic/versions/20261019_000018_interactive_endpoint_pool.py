@@ -0,0 +1,65 @@
+"""Add warm-pool lease tracking to interactive_endpoints.
+
+Revision ID: 20261019_000018
+Revises: 20261019_000017
+Create Date: 2026-10-19 00:00:18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_000018"
+down_revision: Union[str, None] = "20261019_000017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {col["name"] for col in inspector.get_columns("interactive_endpoints")}
+    indexes = {index["name"] for index in inspector.get_indexes("interactive_endpoints")}
+
+    if "pooled" not in columns:
+        op.add_column(
+            "interactive_endpoints",
+            sa.Column("pooled", sa.Boolean(), nullable=False, server_default=sa.false()),
+        )
+    if "leased_by_actor" not in columns:
+        op.add_column(
+            "interactive_endpoints",
+            sa.Column("leased_by_actor", sa.String(255), nullable=True),
+        )
+    if "leased_at" not in columns:
+        op.add_column(
+            "interactive_endpoints",
+            sa.Column("leased_at", sa.DateTime(timezone=True), nullable=True),
+        )
+    if "last_activity_at" not in columns:
+        op.add_column(
+            "interactive_endpoints",
+            sa.Column("last_activity_at", sa.DateTime(timezone=True), nullable=True),
+        )
+    if "ix_interactive_endpoints_pool" not in indexes:
+        op.create_index(
+            "ix_interactive_endpoints_pool",
+            "interactive_endpoints",
+            ["environment_id", "pooled"],
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {col["name"] for col in inspector.get_columns("interactive_endpoints")}
+    indexes = {index["name"] for index in inspector.get_indexes("interactive_endpoints")}
+
+    if "ix_interactive_endpoints_pool" in indexes:
+        op.drop_index("ix_interactive_endpoints_pool", table_name="interactive_endpoints")
+    for col in ("last_activity_at", "leased_at", "leased_by_actor", "pooled"):
+        if col in columns:
+            op.drop_column("interactive_endpoints", col)
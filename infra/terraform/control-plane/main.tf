@@ -89,6 +89,8 @@ locals {
     trimspace(var.cur_athena_table) != "" &&
     trimspace(var.cur_athena_output_location) != ""
   )
+  cost_rollup_export_uri    = trimspace(var.cost_rollup_export_uri)
+  cost_rollup_export_prefix = trimsuffix(trimprefix(local.cost_rollup_export_uri, "s3://"), "/")
   customer_oidc_issuer             = trimspace(var.customer_oidc_issuer)
   customer_oidc_audience           = trimspace(var.customer_oidc_audience)
   customer_oidc_jwks_uri           = trimspace(var.customer_oidc_jwks_uri)
@@ -194,6 +196,9 @@ locals {
     { name = "SPARKPILOT_CUR_ATHENA_OUTPUT_LOCATION", value = var.cur_athena_output_location },
     { name = "SPARKPILOT_CUR_RUN_ID_COLUMN", value = var.cur_run_id_column },
     { name = "SPARKPILOT_CUR_COST_COLUMN", value = var.cur_cost_column },
+    { name = "SPARKPILOT_COST_ROLLUP_EXPORT_DIR", value = local.cost_rollup_export_uri },
+    { name = "SPARKPILOT_INTERACTIVE_POOL_MIN_SIZE", value = tostring(var.interactive_pool_min_size) },
+    { name = "SPARKPILOT_INTERACTIVE_POOL_MAX_SIZE", value = tostring(var.interactive_pool_max_size) },
     { name = "SPARKPILOT_COST_CENTER_POLICY_JSON", value = var.cost_center_policy_json },
     { name = "SPARKPILOT_INTERNAL_ADMINS", value = local.internal_admins_normalized },
   ]
@@ -229,12 +234,22 @@ locals {
     [for secret in local.invite_email_runtime_secrets : secret.valueFrom],
   )
 
-  worker_specs = {
-    provisioner        = ["python", "-m", "sparkpilot.workers", "provisioner"]
-    scheduler          = ["python", "-m", "sparkpilot.workers", "scheduler"]
-    reconciler         = ["python", "-m", "sparkpilot.workers", "reconciler"]
-    cur_reconciliation = ["python", "-m", "sparkpilot.workers", "cur-reconciliation"]
-  }
+  worker_specs = merge(
+    {
+      provisioner        = ["python", "-m", "sparkpilot.workers", "provisioner"]
+      scheduler          = ["python", "-m", "sparkpilot.workers", "scheduler"]
+      reconciler         = ["python", "-m", "sparkpilot.workers", "reconciler"]
+      cur_reconciliation = ["python", "-m", "sparkpilot.workers", "cur-reconciliation"]
+      pricing_refresh    = ["python", "-m", "sparkpilot.workers", "pricing-refresh"]
+    },
+    # Only deployed when there is somewhere durable to write the Parquet files.
+    local.cost_rollup_export_uri == "" ? tomap({}) : tomap({
+      cost_rollup_export = ["python", "-m", "sparkpilot.workers", "cost-rollup-export"]
+    }),
+    var.interactive_pool_max_size == 0 ? tomap({}) : tomap({
+      interactive_pool = ["python", "-m", "sparkpilot.workers", "interactive-pool"]
+    }),
+  )
 }
 
 data "aws_route_tables" "private_subnet_route_tables" {
@@ -323,6 +338,13 @@ check "cur_reconciliation_configuration_complete" {
   }
 }
 
+check "interactive_pool_size_bounds" {
+  assert {
+    condition     = var.interactive_pool_max_size >= var.interactive_pool_min_size
+    error_message = "interactive_pool_max_size must be greater than or equal to interactive_pool_min_size."
+  }
+}
+
 check "customer_oidc_configuration_complete" {
   assert {
     condition = (
@@ -907,6 +929,15 @@ data "aws_iam_policy_document" "ecs_task_runtime" {
     resources = ["*"]
   }
 
+  statement {
+    sid = "AllowPricingLookups"
+    actions = [
+      "pricing:GetProducts",
+    ]
+    # The pricing-refresh worker reads public list prices; the API has no resource-level scoping.
+    resources = ["*"]
+  }
+
   statement {
     sid = "AllowAssumeCustomerRoles"
     actions = [
@@ -917,6 +948,18 @@ data "aws_iam_policy_document" "ecs_task_runtime" {
     # provisioning time; this boundary prevents lateral movement to non-role ARNs.
     resources = ["arn:aws:iam::*:role/*"]
   }
+
+  dynamic "statement" {
+    for_each = local.cost_rollup_export_uri == "" ? [] : [local.cost_rollup_export_prefix]
+    content {
+      sid = "AllowCostRollupExportWrites"
+      actions = [
+        "s3:PutObject",
+        "s3:AbortMultipartUpload",
+      ]
+      resources = ["arn:aws:s3:::${statement.value}/*"]
+    }
+  }
 }
 
 resource "aws_iam_role" "ecs_task_runtime" {
@@ -233,14 +233,14 @@ variable "worker_desired_count" {
 
 variable "worker_desired_count_by_service" {
   type        = map(number)
-  description = "Per-service worker desired counts keyed by service name (provisioner/scheduler/reconciler)."
+  description = "Per-service worker desired counts keyed by service name (provisioner/scheduler/reconciler/cur_reconciliation/pricing_refresh/cost_rollup_export/interactive_pool)."
   default     = {}
   validation {
     condition = alltrue([
       for service_name, desired_count in var.worker_desired_count_by_service :
-      contains(["provisioner", "scheduler", "reconciler", "cur_reconciliation"], service_name) && desired_count >= 0
+      contains(["provisioner", "scheduler", "reconciler", "cur_reconciliation", "pricing_refresh", "cost_rollup_export", "interactive_pool"], service_name) && desired_count >= 0
     ])
-    error_message = "worker_desired_count_by_service keys must be provisioner/scheduler/reconciler/cur_reconciliation and values must be >= 0."
+    error_message = "worker_desired_count_by_service keys must be provisioner/scheduler/reconciler/cur_reconciliation/pricing_refresh/cost_rollup_export/interactive_pool and values must be >= 0."
   }
 }
 
@@ -573,6 +573,39 @@ variable "cur_cost_column" {
   }
 }
 
+variable "cost_rollup_export_uri" {
+  type        = string
+  description = "S3 prefix (s3://bucket/prefix) for the daily cost rollup Parquet export. Leave empty to skip deploying the cost-rollup-export worker."
+  default     = ""
+  validation {
+    condition = (
+      trimspace(var.cost_rollup_export_uri) == "" ||
+      can(regex("^s3://[^/]+", trimspace(var.cost_rollup_export_uri)))
+    )
+    error_message = "cost_rollup_export_uri must be empty or a valid s3:// URI."
+  }
+}
+
+variable "interactive_pool_min_size" {
+  type        = number
+  description = "Warm interactive endpoints kept per ready EMR on EKS environment during pool hours."
+  default     = 0
+  validation {
+    condition     = var.interactive_pool_min_size >= 0
+    error_message = "interactive_pool_min_size must be zero or greater."
+  }
+}
+
+variable "interactive_pool_max_size" {
+  type        = number
+  description = "Upper bound of the warm interactive endpoint pool per environment. 0 disables the pool and skips deploying the interactive-pool worker."
+  default     = 0
+  validation {
+    condition     = var.interactive_pool_max_size >= 0
+    error_message = "interactive_pool_max_size must be zero or greater."
+  }
+}
+
 variable "cost_center_policy_json" {
   type        = string
   description = "Optional JSON policy for namespace/virtual-cluster/team cost center mapping."
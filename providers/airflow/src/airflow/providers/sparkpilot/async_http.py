@@ -0,0 +1,173 @@
+"""Pooled HTTP clients and OIDC tokens shared by deferred triggers.
+
+The triggerer runs every deferred ``SparkPilotRunTrigger`` on one event loop.
+Instead of each trigger opening its own ``httpx.AsyncClient`` and fetching a
+token with a blocking ``httpx.post``, triggers on a loop share one pooled
+client per origin and one cached access token per OIDC client.  A token is
+fetched by a single request when it nears expiry or the API rejects it; other
+triggers needing it meanwhile await that request instead of sending their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+import weakref
+
+import httpx
+
+from airflow.providers.sparkpilot.common import (
+    SparkPilotPermanentError,
+    SparkPilotTransientError,
+    is_transient_status_code,
+)
+
+if TYPE_CHECKING:
+    from airflow.providers.sparkpilot.hooks.sparkpilot import _ResolvedOIDCConnection
+
+_TOKEN_REFRESH_MARGIN_SECONDS = 30.0
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+_TokenKey = tuple[str, str, str, str, str]
+
+
+def _origin(url: str) -> str:
+    parsed = httpx.URL(url)
+    return f"{parsed.scheme}://{parsed.netloc.decode('ascii')}"
+
+
+def _token_key(resolved: _ResolvedOIDCConnection) -> _TokenKey:
+    return (
+        resolved.issuer,
+        resolved.token_endpoint or "",
+        resolved.client_id,
+        resolved.audience,
+        resolved.scope or "",
+    )
+
+
+def _raise_for_oidc_status(response: httpx.Response, what: str) -> None:
+    if response.status_code < 400:
+        return
+    message = f"OIDC {what} request returned {response.status_code}."
+    if is_transient_status_code(response.status_code):
+        raise SparkPilotTransientError(message)
+    raise SparkPilotPermanentError(message)
+
+
+class AsyncSharedHTTP:
+    """Event-loop-local client pool and access-token cache."""
+
+    def __init__(self) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._tokens: dict[_TokenKey, tuple[str, float]] = {}
+        self._token_locks: dict[_TokenKey, asyncio.Lock] = {}
+        self._token_endpoints: dict[str, str] = {}
+
+    def client(self, url: str, *, timeout_seconds: float) -> httpx.AsyncClient:
+        """Return the pooled keep-alive client for the origin of *url*."""
+        origin = _origin(url)
+        client = self._clients.get(origin)
+        if client is None:
+            client = httpx.AsyncClient(timeout=timeout_seconds, limits=_POOL_LIMITS)
+            self._clients[origin] = client
+        return client
+
+    async def access_token(
+        self,
+        resolved: _ResolvedOIDCConnection,
+        *,
+        timeout_seconds: float,
+        rejected_token: str | None = None,
+    ) -> str:
+        """Return a cached access token, fetching one if it is missing or stale.
+
+        Pass the token the API just rejected as *rejected_token* to force a
+        refresh; concurrent callers rejecting the same token share one fetch.
+        """
+        key = _token_key(resolved)
+        token = self._fresh_token(key, rejected_token)
+        if token is not None:
+            return token
+        lock = self._token_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            token = self._fresh_token(key, rejected_token)
+            if token is not None:
+                return token
+            token, expires_at = await self._fetch_token(resolved, timeout_seconds=timeout_seconds)
+            self._tokens[key] = (token, expires_at)
+            return token
+
+    def _fresh_token(self, key: _TokenKey, rejected_token: str | None) -> str | None:
+        cached = self._tokens.get(key)
+        if cached is None:
+            return None
+        token, expires_at = cached
+        if token == rejected_token or expires_at <= time.time() + _TOKEN_REFRESH_MARGIN_SECONDS:
+            return None
+        return token
+
+    async def _token_endpoint(self, issuer: str, *, timeout_seconds: float) -> str:
+        token_endpoint = self._token_endpoints.get(issuer)
+        if token_endpoint:
+            return token_endpoint
+        metadata_url = f"{issuer.rstrip('/')}/.well-known/openid-configuration"
+        response = await self.client(metadata_url, timeout_seconds=timeout_seconds).get(
+            metadata_url, timeout=timeout_seconds
+        )
+        _raise_for_oidc_status(response, "discovery")
+        payload = response.json()
+        if not isinstance(payload, dict):
+            raise SparkPilotPermanentError("OIDC discovery response must be a JSON object.")
+        token_endpoint = str(payload.get("token_endpoint") or "").strip()
+        if not token_endpoint:
+            raise SparkPilotPermanentError("OIDC discovery did not return token_endpoint.")
+        self._token_endpoints[issuer] = token_endpoint
+        return token_endpoint
+
+    async def _fetch_token(
+        self,
+        resolved: _ResolvedOIDCConnection,
+        *,
+        timeout_seconds: float,
+    ) -> tuple[str, float]:
+        token_endpoint = resolved.token_endpoint or await self._token_endpoint(
+            resolved.issuer, timeout_seconds=timeout_seconds
+        )
+        body: dict[str, str] = {
+            "grant_type": "client_credentials",
+            "audience": resolved.audience,
+        }
+        if resolved.scope:
+            body["scope"] = resolved.scope
+        now = time.time()
+        response = await self.client(token_endpoint, timeout_seconds=timeout_seconds).post(
+            token_endpoint,
+            data=body,
+            auth=(resolved.client_id, resolved.client_secret),
+            headers={"Accept": "application/json"},
+            timeout=timeout_seconds,
+        )
+        _raise_for_oidc_status(response, "token")
+        payload = response.json()
+        if not isinstance(payload, dict):
+            raise SparkPilotPermanentError("OIDC token response must be a JSON object.")
+        token = str(payload.get("access_token") or "").strip()
+        if not token:
+            raise SparkPilotPermanentError("OIDC token response missing access_token.")
+        expires_in = int(payload.get("expires_in") or 300)
+        return token, now + max(30, expires_in)
+
+
+_SHARED: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncSharedHTTP] = weakref.WeakKeyDictionary()
+
+
+def shared_async_http() -> AsyncSharedHTTP:
+    """Return the client pool and token cache for the running event loop."""
+    loop = asyncio.get_running_loop()
+    shared = _SHARED.get(loop)
+    if shared is None:
+        shared = AsyncSharedHTTP()
+        _SHARED[loop] = shared
+    return shared
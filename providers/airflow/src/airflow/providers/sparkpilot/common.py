@@ -7,6 +7,10 @@ TERMINAL_STATES = {"succeeded", "failed", "cancelled", "timed_out"}
 SUCCESS_STATES = {"succeeded"}
 FAILURE_STATES = {"failed", "cancelled", "timed_out"}
 TRANSIENT_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+RUN_BATCH_MAX_IDS = 500
+RUN_BATCH_CREATE_MAX_ITEMS = 500
+# Upper bound for one GET /v1/runs/{id}/wait long-poll; the API caps it at 60.
+RUN_WAIT_MAX_SECONDS = 30
 
 
 class SparkPilotTransientError(RuntimeError):
@@ -9,8 +9,11 @@ from uuid import uuid4
 import httpx
 
 from airflow.providers.sparkpilot._compat import AirflowException, BaseHook
+from airflow.providers.sparkpilot.async_http import shared_async_http
 from airflow.providers.sparkpilot.common import (
     FAILURE_STATES,
+    RUN_BATCH_CREATE_MAX_ITEMS,
+    RUN_WAIT_MAX_SECONDS,
     SUCCESS_STATES,
     TERMINAL_STATES,
     SparkPilotPermanentError,
@@ -19,6 +22,8 @@ from airflow.providers.sparkpilot.common import (
     is_transient_status_code,
 )
 
+_HTTP_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
 
 @dataclass(frozen=True)
 class _ResolvedOIDCConnection:
@@ -51,6 +56,7 @@ class SparkPilotHook(BaseHook):
         timeout_seconds: float = 30.0,
         request_retries: int = 2,
         request_backoff_seconds: float = 1.0,
+        http2: bool = False,
     ) -> None:
         super().__init__()
         self.sparkpilot_conn_id = sparkpilot_conn_id
@@ -64,8 +70,35 @@ class SparkPilotHook(BaseHook):
         self.timeout_seconds = timeout_seconds
         self.request_retries = max(0, request_retries)
         self.request_backoff_seconds = max(0.0, request_backoff_seconds)
+        self.http2 = http2
         self._cached_access_token: str | None = None
         self._cached_access_token_expiry: float = 0.0
+        self._http_client: httpx.Client | None = None
+
+    def get_http_client(self) -> httpx.Client:
+        """Return the hook's keep-alive client, shared by its API and OIDC calls.
+
+        ``http2=True`` needs the ``h2`` package (``pip install httpx[http2]``).
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                timeout=self.timeout_seconds,
+                limits=_HTTP_POOL_LIMITS,
+                http2=self.http2,
+            )
+        return self._http_client
+
+    def close(self) -> None:
+        """Close pooled connections; the next request opens a new client."""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    def __enter__(self) -> SparkPilotHook:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
 
     @staticmethod
     def _env(*names: str) -> str | None:
@@ -177,7 +210,7 @@ class SparkPilotHook(BaseHook):
 
     def _discover_token_endpoint(self, issuer: str) -> str:
         metadata_url = f"{issuer.rstrip('/')}/.well-known/openid-configuration"
-        response = httpx.get(metadata_url, timeout=self.timeout_seconds)
+        response = self.get_http_client().get(metadata_url, timeout=self.timeout_seconds)
         response.raise_for_status()
         payload = response.json()
         if not isinstance(payload, dict):
@@ -203,7 +236,7 @@ class SparkPilotHook(BaseHook):
         }
         if resolved.scope:
             body["scope"] = resolved.scope
-        response = httpx.post(
+        response = self.get_http_client().post(
             token_endpoint,
             data=body,
             auth=(resolved.client_id, resolved.client_secret),
@@ -226,6 +259,23 @@ class SparkPilotHook(BaseHook):
         resolved = self.resolve_connection()
         return self._get_access_token(resolved, force_refresh=force_refresh)
 
+    async def async_get_access_token(
+        self,
+        resolved: _ResolvedOIDCConnection,
+        *,
+        rejected_token: str | None = None,
+    ) -> str:
+        """Return an access token from the event loop's shared token cache.
+
+        Used by triggers: the token and discovery requests are async and shared
+        by every trigger of the same OIDC client on the triggerer.
+        """
+        return await shared_async_http().access_token(
+            resolved,
+            timeout_seconds=self.timeout_seconds,
+            rejected_token=rejected_token,
+        )
+
     def _request(
         self,
         method: str,
@@ -234,6 +284,7 @@ class SparkPilotHook(BaseHook):
         json_body: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         extra_headers: dict[str, str] | None = None,
+        timeout_seconds: float | None = None,
     ) -> dict[str, Any]:
         resolved = self.resolve_connection()
         url = f"{resolved.base_url}{path}"
@@ -244,13 +295,13 @@ class SparkPilotHook(BaseHook):
                 headers = self.build_headers(access_token)
                 if extra_headers:
                     headers.update(extra_headers)
-                response = httpx.request(
+                response = self.get_http_client().request(
                     method=method,
                     url=url,
                     headers=headers,
                     json=json_body,
                     params=params,
-                    timeout=self.timeout_seconds,
+                    timeout=timeout_seconds or self.timeout_seconds,
                 )
             except httpx.RequestError as exc:
                 if attempt >= max_attempts:
@@ -339,9 +390,56 @@ class SparkPilotHook(BaseHook):
             extra_headers={"Idempotency-Key": key},
         )
 
+    def submit_runs(self, submissions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Submit many runs through ``POST /v1/runs:batchCreate``.
+
+        Each submission is ``{"job_id", "run_payload", "idempotency_key"}``
+        (the last two optional).  Missing keys are generated before the first
+        request, so a retried batch replays instead of duplicating runs.
+        Returns one result per submission, in order, with ``status_code`` and
+        either ``run`` or ``detail``; failed items are not raised.
+        """
+        items: list[dict[str, Any]] = []
+        for submission in submissions:
+            item = dict(submission.get("run_payload") or {})
+            item["job_id"] = submission["job_id"]
+            item["idempotency_key"] = submission.get("idempotency_key") or f"airflow-{uuid4()}"
+            items.append(item)
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(items), RUN_BATCH_CREATE_MAX_ITEMS):
+            chunk = items[start : start + RUN_BATCH_CREATE_MAX_ITEMS]
+            payload = self._request("POST", "/v1/runs:batchCreate", json_body={"runs": chunk})
+            results.extend(payload.get("results") or [])
+        return results
+
     def get_run(self, run_id: str) -> dict[str, Any]:
         return self._request("GET", f"/v1/runs/{run_id}")
 
+    def get_runs(self, run_ids: list[str], *, changed_since: str | None = None) -> dict[str, Any]:
+        """Fetch several runs in one ``POST /v1/runs:batchGet`` call."""
+        body: dict[str, Any] = {"run_ids": list(run_ids)}
+        if changed_since:
+            body["changed_since"] = changed_since
+        return self._request("POST", "/v1/runs:batchGet", json_body=body)
+
+    def wait_run(
+        self,
+        run_id: str,
+        *,
+        timeout_seconds: float = RUN_WAIT_MAX_SECONDS,
+        state_in: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Long-poll ``GET /v1/runs/{id}/wait`` until the run leaves ``state_in`` or the timeout passes."""
+        params: dict[str, Any] = {"timeout": timeout_seconds}
+        if state_in:
+            params["state_in"] = state_in
+        return self._request(
+            "GET",
+            f"/v1/runs/{run_id}/wait",
+            params=params,
+            timeout_seconds=timeout_seconds + self.timeout_seconds,
+        )
+
     def cancel_run(
         self,
         *,
@@ -367,15 +465,22 @@ class SparkPilotHook(BaseHook):
         poll_interval_seconds: int = 15,
         timeout_seconds: int = 3600,
     ) -> dict[str, Any]:
+        """Block until the run reaches a terminal state.
+
+        Uses the API's long-poll wait endpoint, so completion is noticed as soon
+        as the reconciler records it; ``poll_interval_seconds`` is the backoff
+        after transient errors.
+        """
         deadline = time.monotonic() + timeout_seconds
         while True:
+            remaining = max(0.0, deadline - time.monotonic())
             try:
-                run = self.get_run(run_id)
+                run = self.wait_run(run_id, timeout_seconds=min(RUN_WAIT_MAX_SECONDS, remaining))
             except SparkPilotTransientError as exc:
                 if time.monotonic() >= deadline:
                     raise
                 self.log.warning(
-                    "Transient SparkPilot error while polling run '%s'; retrying in %ss: %s",
+                    "Transient SparkPilot error while waiting for run '%s'; retrying in %ss: %s",
                     run_id,
                     max(1, poll_interval_seconds),
                     exc,
@@ -399,4 +504,3 @@ class SparkPilotHook(BaseHook):
                 raise SparkPilotTransientError(
                     f"Timed out waiting for run {run_id} to reach terminal state."
                 )
-            time.sleep(max(1, poll_interval_seconds))
@@ -103,6 +103,13 @@ class SparkPilotSubmitRunOperator(BaseOperator):
 
     def execute(self, context: dict[str, Any]) -> dict[str, Any] | None:  # noqa: ARG002
         hook = self.get_hook()
+        try:
+            return self._submit(hook)
+        finally:
+            if hook is not self._hook:
+                hook.close()
+
+    def _submit(self, hook: SparkPilotHook) -> dict[str, Any] | None:
         try:
             submitted = hook.submit_run(
                 job_id=self.job_id,
@@ -242,6 +249,13 @@ class SparkPilotCancelRunOperator(BaseOperator):
 
     def execute(self, context: dict[str, Any]) -> dict[str, Any]:  # noqa: ARG002
         hook = self.get_hook()
+        try:
+            return self._cancel(hook)
+        finally:
+            if hook is not self._hook:
+                hook.close()
+
+    def _cancel(self, hook: SparkPilotHook) -> dict[str, Any]:
         try:
             result = hook.cancel_run(
                 run_id=self.run_id,
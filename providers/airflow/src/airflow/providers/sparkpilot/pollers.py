@@ -0,0 +1,220 @@
+"""Shared run-status poller for deferred ``SparkPilotRunTrigger`` instances.
+
+Every waiter asks for the *next* status of its run.  Waiters that arrive
+before a poll tick are served together by one ``POST /v1/runs:batchGet``
+request (chunked at ``RUN_BATCH_MAX_IDS``), so a triggerer with thousands of
+deferred tasks sends a handful of requests per poll interval instead of one
+per task.
+
+While runs are pending the poller also listens to the API's
+``GET /v1/run-events`` stream and runs the next tick as soon as one of them
+changes state, so completion is noticed within about a second; the poll
+interval only matters when the stream is unavailable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable
+import weakref
+
+from airflow.providers.sparkpilot.common import (
+    RUN_BATCH_MAX_IDS,
+    SparkPilotPermanentError,
+)
+
+logger = logging.getLogger(__name__)
+
+AsyncBatchFetch = Callable[[list[str]], Awaitable[dict[str, Any]]]
+EventStreamFactory = Callable[[str | None], AsyncIterator[dict[str, Any]]]
+
+_EVENT_STREAM_MAX_BACKOFF_SECONDS = 60.0
+# Woken ticks still wait this long after the previous tick so that a burst of
+# state changes is fetched in one batch.
+_MIN_WOKEN_TICK_SPACING_SECONDS = 0.25
+
+
+def _chunks(run_ids: list[str], size: int) -> list[list[str]]:
+    return [run_ids[index : index + size] for index in range(0, len(run_ids), size)]
+
+
+def _index_batch_payload(payload: dict[str, Any], run_ids: list[str]) -> dict[str, Any]:
+    """Map each requested run id to its run payload or a not-found error."""
+    runs = payload.get("runs")
+    by_id: dict[str, Any] = {}
+    if isinstance(runs, list):
+        for item in runs:
+            if isinstance(item, dict) and item.get("id"):
+                by_id[str(item["id"])] = item
+    results: dict[str, Any] = {}
+    for run_id in run_ids:
+        results[run_id] = by_id.get(run_id) or SparkPilotPermanentError(
+            f"SparkPilot run {run_id} was not found or is not visible to this connection."
+        )
+    return results
+
+
+async def iter_sse_events(lines: AsyncIterable[str]) -> AsyncIterator[dict[str, Any]]:
+    """Parse server-sent event lines into ``{"id", "event", "data"}`` dicts.
+
+    Comment-only blocks such as keepalives yield an empty dict so that
+    consumers get a chance to run between events.
+    """
+    block: dict[str, Any] = {}
+    data_lines: list[str] = []
+    async for raw_line in lines:
+        line = raw_line.rstrip("\r")
+        if line:
+            if line.startswith(":"):
+                continue
+            field_name, _, value = line.partition(":")
+            value = value.removeprefix(" ")
+            if field_name == "data":
+                data_lines.append(value)
+            elif field_name in {"id", "event"}:
+                block[field_name] = value
+            continue
+        if data_lines:
+            try:
+                block["data"] = json.loads("\n".join(data_lines))
+            except ValueError:
+                block["data"] = "\n".join(data_lines)
+        yield block
+        block, data_lines = {}, []
+
+
+class AsyncRunStatusPoller:
+    """Event-loop-local poller shared by all ``SparkPilotRunTrigger`` instances.
+
+    Ticks run as their own task, so cancelling the trigger that scheduled a
+    tick does not strand the other waiters.
+    """
+
+    def __init__(self, *, max_batch_size: int = RUN_BATCH_MAX_IDS) -> None:
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: dict[str, list[asyncio.Future[Any]]] = {}
+        self._tick_task: asyncio.Task[None] | None = None
+        self._last_tick_monotonic = float("-inf")
+        self._in_flight: set[str] = set()
+        self._wake = asyncio.Event()
+        self._listen_task: asyncio.Task[None] | None = None
+        self._events_unavailable = False
+        # Kept across reconnects so the stream replays events missed meanwhile.
+        self._last_event_id: str | None = None
+
+    async def next_status(
+        self,
+        run_id: str,
+        *,
+        fetch_batch: AsyncBatchFetch,
+        interval_seconds: float,
+        open_event_stream: EventStreamFactory | None = None,
+    ) -> dict[str, Any]:
+        """Wait for the next poll tick and return the run payload for *run_id*.
+
+        With *open_event_stream* the tick runs as soon as the run changes state.
+        """
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(run_id, []).append(future)
+        if open_event_stream is not None:
+            self._attach_event_stream(open_event_stream)
+        if self._tick_task is None or self._tick_task.done():
+            self._tick_task = asyncio.ensure_future(self._tick(fetch_batch, interval_seconds))
+        return await future
+
+    def wake(self, run_id: str) -> None:
+        """Run the next tick now if *run_id* is being waited on or fetched."""
+        if run_id in self._pending or run_id in self._in_flight:
+            self._wake.set()
+
+    def _attach_event_stream(self, open_stream: EventStreamFactory) -> None:
+        # open_stream receives the last seen event id and returns the parsed
+        # events of a GET /v1/run-events stream.
+        if self._events_unavailable:
+            return
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.ensure_future(self._listen(open_stream))
+
+    def _idle(self) -> bool:
+        return not self._pending and not self._in_flight
+
+    async def _listen(self, open_stream: EventStreamFactory) -> None:
+        failures = 0
+        while not self._idle():
+            try:
+                async for event in open_stream(self._last_event_id):
+                    failures = 0
+                    if event.get("id"):
+                        self._last_event_id = str(event["id"])
+                    data = event.get("data")
+                    if isinstance(data, dict) and data.get("run_id"):
+                        self.wake(str(data["run_id"]))
+                    if self._idle():
+                        return
+            except SparkPilotPermanentError as exc:
+                logger.warning("SparkPilot run event stream unavailable; polling only: %s", exc)
+                self._events_unavailable = True
+                return
+            except Exception as exc:  # noqa: BLE001 -- reconnect; polling continues meanwhile
+                failures += 1
+                delay = min(_EVENT_STREAM_MAX_BACKOFF_SECONDS, 2.0 ** min(failures, 6))
+                logger.warning(
+                    "SparkPilot run event stream failed; reconnecting in %.0fs: %s", delay, exc
+                )
+                await asyncio.sleep(delay)
+
+    async def _tick(self, fetch_batch: AsyncBatchFetch, interval_seconds: float) -> None:
+        delay = self._last_tick_monotonic + max(1.0, interval_seconds) - time.monotonic()
+        if delay > 0:
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except TimeoutError:
+                pass
+            else:
+                spacing = self._last_tick_monotonic + _MIN_WOKEN_TICK_SPACING_SECONDS - time.monotonic()
+                if spacing > 0:
+                    await asyncio.sleep(spacing)
+        self._wake.clear()
+        pending, self._pending = self._pending, {}
+        self._last_tick_monotonic = time.monotonic()
+        self._tick_task = None
+        for chunk in _chunks(list(pending), self.max_batch_size):
+            live = [run_id for run_id in chunk if any(not f.done() for f in pending[run_id])]
+            if not live:
+                continue
+            self._in_flight.update(live)
+            try:
+                results = _index_batch_payload(await fetch_batch(live), live)
+            except Exception as exc:  # noqa: BLE001 -- delivered to every waiter in the chunk
+                results = dict.fromkeys(live, exc)
+            finally:
+                self._in_flight.difference_update(live)
+            for run_id in live:
+                for future in pending[run_id]:
+                    if future.done():
+                        continue
+                    if isinstance(results[run_id], BaseException):
+                        future.set_exception(results[run_id])
+                    else:
+                        future.set_result(results[run_id])
+
+
+_ASYNC_POLLERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], AsyncRunStatusPoller]
+] = weakref.WeakKeyDictionary()
+
+
+def shared_async_run_poller(*, base_url: str, client_id: str) -> AsyncRunStatusPoller:
+    """Return the poller for one SparkPilot API and OIDC client on the running event loop."""
+    loop = asyncio.get_running_loop()
+    pollers = _ASYNC_POLLERS.setdefault(loop, {})
+    key = (base_url, client_id)
+    poller = pollers.get(key)
+    if poller is None:
+        poller = AsyncRunStatusPoller()
+        pollers[key] = poller
+    return poller
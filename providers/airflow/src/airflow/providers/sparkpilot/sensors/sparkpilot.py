@@ -49,18 +49,19 @@ class SparkPilotRunSensor(BaseSensorOperator):
         self._hook = hook
 
     def get_hook(self) -> SparkPilotHook:
-        if self._hook is not None:
-            return self._hook
-        return SparkPilotHook(
-            sparkpilot_conn_id=self.sparkpilot_conn_id,
-            base_url=self.base_url,
-            oidc_issuer=self.oidc_issuer,
-            oidc_audience=self.oidc_audience,
-            oidc_client_id=self.oidc_client_id,
-            oidc_client_secret=self.oidc_client_secret,
-            oidc_token_endpoint=self.oidc_token_endpoint,
-            oidc_scope=self.oidc_scope,
-        )
+        # Kept across pokes so that poke-mode sensors reuse their connections.
+        if self._hook is None:
+            self._hook = SparkPilotHook(
+                sparkpilot_conn_id=self.sparkpilot_conn_id,
+                base_url=self.base_url,
+                oidc_issuer=self.oidc_issuer,
+                oidc_audience=self.oidc_audience,
+                oidc_client_id=self.oidc_client_id,
+                oidc_client_secret=self.oidc_client_secret,
+                oidc_token_endpoint=self.oidc_token_endpoint,
+                oidc_scope=self.oidc_scope,
+            )
+        return self._hook
 
     def poke(self, context: dict[str, Any]) -> bool | PokeReturnValue:  # noqa: ARG002
         hook = self.get_hook()
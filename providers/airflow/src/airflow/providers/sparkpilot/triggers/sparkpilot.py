@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
+import functools
 import time
 from typing import Any
 
@@ -11,11 +13,17 @@ from airflow.providers.sparkpilot.common import (
     FAILURE_STATES,
     SUCCESS_STATES,
     SparkPilotPermanentError,
+    SparkPilotTransientError,
     build_run_metadata,
     error_detail_from_json,
     is_transient_status_code,
 )
-from airflow.providers.sparkpilot.hooks.sparkpilot import SparkPilotHook
+from airflow.providers.sparkpilot.async_http import shared_async_http
+from airflow.providers.sparkpilot.hooks.sparkpilot import SparkPilotHook, _ResolvedOIDCConnection
+from airflow.providers.sparkpilot.pollers import iter_sse_events, shared_async_run_poller
+
+
+_RUN_EVENT_STREAM_READ_TIMEOUT_SECONDS = 45.0
 
 
 class SparkPilotTriggerTransientError(RuntimeError):
@@ -83,24 +91,33 @@ class SparkPilotRunTrigger(BaseTrigger):
             },
         )
 
-    async def _fetch_run(
-        self,
+    @staticmethod
+    async def _fetch_runs(
+        run_ids: list[str],
         *,
-        client: httpx.AsyncClient,
-        base_url: str,
-        headers: dict[str, str],
+        hook: SparkPilotHook,
+        resolved: _ResolvedOIDCConnection,
     ) -> dict[str, Any]:
-        response = await client.get(
-            f"{base_url}/v1/runs/{self.run_id}",
-            headers=headers,
-        )
+        client = shared_async_http().client(resolved.base_url, timeout_seconds=hook.timeout_seconds)
+        rejected_token: str | None = None
+        for _attempt in range(2):
+            access_token = await hook.async_get_access_token(resolved, rejected_token=rejected_token)
+            response = await client.post(
+                f"{resolved.base_url}/v1/runs:batchGet",
+                json={"run_ids": run_ids},
+                headers=hook.build_headers(access_token),
+            )
+            if response.status_code != 401:
+                break
+            # Access token may be expired/revoked; refresh once and retry.
+            rejected_token = access_token
         if response.status_code >= 400:
             try:
                 detail = error_detail_from_json(response.json())
             except ValueError:
                 detail = response.text.strip() if response.text else "Unknown error"
             message = (
-                f"SparkPilot API request failed: GET /v1/runs/{self.run_id} "
+                "SparkPilot API request failed: POST /v1/runs:batchGet "
                 f"returned {response.status_code}. Detail: {detail}"
             )
             if is_transient_status_code(response.status_code):
@@ -110,17 +127,44 @@ class SparkPilotRunTrigger(BaseTrigger):
             payload = response.json()
         except ValueError as exc:
             raise SparkPilotPermanentError(
-                f"SparkPilot API returned invalid JSON while fetching run {self.run_id}."
+                "SparkPilot API returned invalid JSON while fetching run status."
             ) from exc
         if not isinstance(payload, dict):
             raise SparkPilotPermanentError(
-                f"SparkPilot API returned unexpected JSON type while fetching run {self.run_id}: "
+                "SparkPilot API returned unexpected JSON type while fetching run status: "
                 f"{type(payload).__name__}"
             )
         return payload
 
-    def _create_async_client(self, *, timeout_seconds: float) -> httpx.AsyncClient:
-        return httpx.AsyncClient(timeout=timeout_seconds)
+    @staticmethod
+    async def _open_run_event_stream(
+        last_event_id: str | None,
+        *,
+        hook: SparkPilotHook,
+        resolved: _ResolvedOIDCConnection,
+    ) -> AsyncIterator[dict[str, Any]]:
+        access_token = await hook.async_get_access_token(resolved)
+        headers = hook.build_headers(access_token)
+        headers["Accept"] = "text/event-stream"
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        client = shared_async_http().client(resolved.base_url, timeout_seconds=hook.timeout_seconds)
+        # The server sends a keepalive every 15s; allow for a missed one.
+        timeout = httpx.Timeout(hook.timeout_seconds, read=_RUN_EVENT_STREAM_READ_TIMEOUT_SECONDS)
+        async with client.stream(
+            "GET", f"{resolved.base_url}/v1/run-events", headers=headers, timeout=timeout
+        ) as response:
+            if response.status_code == 401:
+                # Refresh the shared token; the poller reconnects with it.
+                await hook.async_get_access_token(resolved, rejected_token=access_token)
+                raise SparkPilotTriggerTransientError("GET /v1/run-events returned 401.")
+            if response.status_code >= 400:
+                message = f"GET /v1/run-events returned {response.status_code}."
+                if is_transient_status_code(response.status_code):
+                    raise SparkPilotTriggerTransientError(message)
+                raise SparkPilotPermanentError(message)
+            async for event in iter_sse_events(response.aiter_lines()):
+                yield event
 
     async def run(self):  # noqa: ANN201
         hook = SparkPilotHook(
@@ -133,81 +177,41 @@ class SparkPilotRunTrigger(BaseTrigger):
             oidc_token_endpoint=self.oidc_token_endpoint,
             oidc_scope=self.oidc_scope,
         )
-        resolved = hook.resolve_connection()
+        # Connection lookup may hit the metadata database; keep it off the event loop.
+        resolved = await asyncio.to_thread(hook.resolve_connection)
+        poller = shared_async_run_poller(base_url=resolved.base_url, client_id=resolved.client_id)
+        fetch_batch = functools.partial(self._fetch_runs, hook=hook, resolved=resolved)
+        open_event_stream = functools.partial(self._open_run_event_stream, hook=hook, resolved=resolved)
         deadline = time.monotonic() + self.timeout_seconds
         consecutive_transient_failures = 0
-        async with self._create_async_client(timeout_seconds=hook.timeout_seconds) as client:
-            while True:
-                try:
-                    headers = hook.build_headers(hook.get_access_token(force_refresh=False))
-                    run = await self._fetch_run(
-                        client=client,
-                        base_url=resolved.base_url,
-                        headers=headers,
-                    )
-                    consecutive_transient_failures = 0
-                except SparkPilotPermanentError as exc:
-                    yield TriggerEvent(
-                        {
-                            "status": "failed",
-                            "transient": False,
-                            "message": str(exc),
-                        }
-                    )
-                    return
-                except (SparkPilotTriggerTransientError, httpx.RequestError) as exc:
-                    consecutive_transient_failures += 1
-                    if consecutive_transient_failures > self.max_transient_failures:
-                        yield TriggerEvent(
-                            {
-                                "status": "error",
-                                "transient": True,
-                                "message": (
-                                    f"Exceeded max transient failures ({self.max_transient_failures}) "
-                                    f"while waiting for run {self.run_id}: {exc}"
-                                ),
-                            }
-                        )
-                        return
-                    if time.monotonic() >= deadline:
-                        yield TriggerEvent(
-                            {
-                                "status": "error",
-                                "transient": True,
-                                "message": f"Timed out waiting for run {self.run_id}: {exc}",
-                            }
-                        )
-                        return
-                    backoff_factor = 2 ** min(consecutive_transient_failures - 1, 4)
-                    delay_seconds = min(
-                        self.max_backoff_seconds,
-                        max(1, self.poll_interval_seconds) * backoff_factor,
-                    )
-                    await asyncio.sleep(delay_seconds)
-                    continue
-
-                state = str(run.get("state") or "").lower()
-                metadata = build_run_metadata(run)
-                if state in SUCCESS_STATES:
-                    yield TriggerEvent(
-                        {
-                            "status": "success",
-                            "transient": False,
-                            "run": run,
-                            "metadata": metadata,
-                        }
-                    )
-                    return
-                if state in FAILURE_STATES:
+        while True:
+            try:
+                run = await poller.next_status(
+                    self.run_id,
+                    fetch_batch=fetch_batch,
+                    interval_seconds=self.poll_interval_seconds,
+                    open_event_stream=open_event_stream,
+                )
+                consecutive_transient_failures = 0
+            except SparkPilotPermanentError as exc:
+                yield TriggerEvent(
+                    {
+                        "status": "failed",
+                        "transient": False,
+                        "message": str(exc),
+                    }
+                )
+                return
+            except (SparkPilotTriggerTransientError, SparkPilotTransientError, httpx.RequestError) as exc:
+                consecutive_transient_failures += 1
+                if consecutive_transient_failures > self.max_transient_failures:
                     yield TriggerEvent(
                         {
-                            "status": "failed",
-                            "transient": False,
-                            "run": run,
-                            "metadata": metadata,
+                            "status": "error",
+                            "transient": True,
                             "message": (
-                                f"Run {self.run_id} reached terminal failure state '{state}'. "
-                                f"{run.get('error_message') or ''}".strip()
+                                f"Exceeded max transient failures ({self.max_transient_failures}) "
+                                f"while waiting for run {self.run_id}: {exc}"
                             ),
                         }
                     )
@@ -217,10 +221,52 @@ class SparkPilotRunTrigger(BaseTrigger):
                         {
                             "status": "error",
                             "transient": True,
-                            "run": run,
-                            "metadata": metadata,
-                            "message": f"Timed out waiting for run {self.run_id} terminal state.",
+                            "message": f"Timed out waiting for run {self.run_id}: {exc}",
                         }
                     )
                     return
-                await asyncio.sleep(max(1, self.poll_interval_seconds))
+                backoff_factor = 2 ** min(consecutive_transient_failures - 1, 4)
+                delay_seconds = min(
+                    self.max_backoff_seconds,
+                    max(1, self.poll_interval_seconds) * backoff_factor,
+                )
+                await asyncio.sleep(delay_seconds)
+                continue
+
+            state = str(run.get("state") or "").lower()
+            metadata = build_run_metadata(run)
+            if state in SUCCESS_STATES:
+                yield TriggerEvent(
+                    {
+                        "status": "success",
+                        "transient": False,
+                        "run": run,
+                        "metadata": metadata,
+                    }
+                )
+                return
+            if state in FAILURE_STATES:
+                yield TriggerEvent(
+                    {
+                        "status": "failed",
+                        "transient": False,
+                        "run": run,
+                        "metadata": metadata,
+                        "message": (
+                            f"Run {self.run_id} reached terminal failure state '{state}'. "
+                            f"{run.get('error_message') or ''}".strip()
+                        ),
+                    }
+                )
+                return
+            if time.monotonic() >= deadline:
+                yield TriggerEvent(
+                    {
+                        "status": "error",
+                        "transient": True,
+                        "run": run,
+                        "metadata": metadata,
+                        "message": f"Timed out waiting for run {self.run_id} terminal state.",
+                    }
+                )
+                return
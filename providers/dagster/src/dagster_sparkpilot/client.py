@@ -8,7 +8,14 @@ from uuid import uuid4
 
 import httpx
 
-from dagster_sparkpilot.common import FAILURE_STATES, SUCCESS_STATES, TERMINAL_STATES, error_detail_from_json
+from dagster_sparkpilot.common import (
+    FAILURE_STATES,
+    RUN_BATCH_CREATE_MAX_ITEMS,
+    RUN_WAIT_MAX_SECONDS,
+    SUCCESS_STATES,
+    TERMINAL_STATES,
+    error_detail_from_json,
+)
 from dagster_sparkpilot.errors import (
     SparkPilotPermanentError,
     SparkPilotRunFailedError,
@@ -16,6 +23,8 @@ from dagster_sparkpilot.errors import (
     is_transient_status_code,
 )
 
+_HTTP_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
 
 def _required_string(payload: Mapping[str, Any], key: str) -> str:
     value = payload.get(key)
@@ -60,6 +69,7 @@ class SparkPilotClientConfig:
     timeout_seconds: float = 30.0
     request_retries: int = 2
     request_backoff_seconds: float = 1.0
+    http2: bool = False
 
     @classmethod
     def from_mapping(cls, payload: Mapping[str, Any]) -> "SparkPilotClientConfig":
@@ -73,6 +83,9 @@ class SparkPilotClientConfig:
             raise ValueError("SparkPilot client config field 'timeout_seconds' must be > 0.")
         request_retries = _optional_positive_int(payload, "request_retries", 2)
         request_backoff_seconds = _optional_positive_float(payload, "request_backoff_seconds", 1.0)
+        http2 = payload.get("http2", False)
+        if not isinstance(http2, bool):
+            raise ValueError("SparkPilot client config field 'http2' must be a boolean.")
         return cls(
             base_url=base_url,
             oidc_issuer=_required_string(payload, "oidc_issuer"),
@@ -84,6 +97,7 @@ class SparkPilotClientConfig:
             timeout_seconds=timeout_seconds,
             request_retries=request_retries,
             request_backoff_seconds=request_backoff_seconds,
+            http2=http2,
         )
 
 
@@ -92,11 +106,35 @@ class SparkPilotClient:
         self.config = config
         self._cached_access_token: str | None = None
         self._cached_access_token_expiry: float = 0.0
+        self._http_client: httpx.Client | None = None
+
+    def _http(self) -> httpx.Client:
+        # One keep-alive pool for API and OIDC calls, so a resource that
+        # submits and waits on many runs reuses its connections.
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                timeout=self.config.timeout_seconds,
+                limits=_HTTP_POOL_LIMITS,
+                http2=self.config.http2,
+            )
+        return self._http_client
+
+    def close(self) -> None:
+        """Close pooled connections; the next request opens a new pool."""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    def __enter__(self) -> "SparkPilotClient":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
 
     def _discover_token_endpoint(self) -> str:
         metadata_url = f"{self.config.oidc_issuer.rstrip('/')}/.well-known/openid-configuration"
         try:
-            response = httpx.get(metadata_url, timeout=self.config.timeout_seconds)
+            response = self._http().get(metadata_url, timeout=self.config.timeout_seconds)
         except httpx.RequestError as exc:
             raise SparkPilotTransientError(
                 f"OIDC discovery request failed (transport): {exc}"
@@ -135,7 +173,7 @@ class SparkPilotClient:
             body["scope"] = self.config.oidc_scope
 
         try:
-            response = httpx.post(
+            response = self._http().post(
                 token_endpoint,
                 data=body,
                 auth=(self.config.oidc_client_id, self.config.oidc_client_secret),
@@ -175,6 +213,7 @@ class SparkPilotClient:
         json_body: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         extra_headers: dict[str, str] | None = None,
+        timeout_seconds: float | None = None,
     ) -> dict[str, Any]:
         url = f"{self.config.base_url}{path}"
         max_attempts = self.config.request_retries + 1
@@ -188,13 +227,13 @@ class SparkPilotClient:
                 }
                 if extra_headers:
                     headers.update(extra_headers)
-                response = httpx.request(
+                response = self._http().request(
                     method=method,
                     url=url,
                     headers=headers,
                     json=json_body,
                     params=params,
-                    timeout=self.config.timeout_seconds,
+                    timeout=timeout_seconds or self.config.timeout_seconds,
                 )
             except httpx.RequestError as exc:
                 if attempt >= max_attempts:
@@ -263,9 +302,56 @@ class SparkPilotClient:
             extra_headers={"Idempotency-Key": key},
         )
 
+    def submit_runs(self, submissions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Submit many runs through ``POST /v1/runs:batchCreate``.
+
+        Each submission is ``{"job_id", "run_payload", "idempotency_key"}``
+        (the last two optional).  Missing keys are generated before the first
+        request, so a retried batch replays instead of duplicating runs.
+        Returns one result per submission, in order, with ``status_code`` and
+        either ``run`` or ``detail``; failed items are not raised.
+        """
+        items: list[dict[str, Any]] = []
+        for submission in submissions:
+            item = dict(submission.get("run_payload") or {})
+            item["job_id"] = submission["job_id"]
+            item["idempotency_key"] = submission.get("idempotency_key") or f"dagster-{uuid4()}"
+            items.append(item)
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(items), RUN_BATCH_CREATE_MAX_ITEMS):
+            chunk = items[start : start + RUN_BATCH_CREATE_MAX_ITEMS]
+            payload = self._request_json("POST", "/v1/runs:batchCreate", json_body={"runs": chunk})
+            results.extend(payload.get("results") or [])
+        return results
+
     def get_run(self, run_id: str) -> dict[str, Any]:
         return self._request_json("GET", f"/v1/runs/{run_id}")
 
+    def get_runs(self, run_ids: list[str], *, changed_since: str | None = None) -> dict[str, Any]:
+        """Fetch several runs in one ``POST /v1/runs:batchGet`` call."""
+        body: dict[str, Any] = {"run_ids": list(run_ids)}
+        if changed_since:
+            body["changed_since"] = changed_since
+        return self._request_json("POST", "/v1/runs:batchGet", json_body=body)
+
+    def wait_run(
+        self,
+        run_id: str,
+        *,
+        timeout_seconds: float = RUN_WAIT_MAX_SECONDS,
+        state_in: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Long-poll ``GET /v1/runs/{id}/wait`` until the run leaves ``state_in`` or the timeout passes."""
+        params: dict[str, Any] = {"timeout": timeout_seconds}
+        if state_in:
+            params["state_in"] = state_in
+        return self._request_json(
+            "GET",
+            f"/v1/runs/{run_id}/wait",
+            params=params,
+            timeout_seconds=timeout_seconds + self.config.timeout_seconds,
+        )
+
     def cancel_run(
         self,
         *,
@@ -290,10 +376,13 @@ class SparkPilotClient:
             raise ValueError("poll_interval_seconds must be > 0.")
         if timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be > 0.")
+        # The wait endpoint returns as soon as the reconciler records a new
+        # state; poll_interval_seconds is only the backoff after transient errors.
         deadline = time.monotonic() + timeout_seconds
         while True:
+            remaining = max(0.0, deadline - time.monotonic())
             try:
-                run = self.get_run(run_id)
+                run = self.wait_run(run_id, timeout_seconds=min(RUN_WAIT_MAX_SECONDS, remaining))
             except SparkPilotTransientError:
                 if time.monotonic() >= deadline:
                     raise
@@ -316,5 +405,4 @@ class SparkPilotClient:
                 raise SparkPilotTransientError(
                     f"Timed out waiting for run {run_id} to reach terminal state."
                 )
-            time.sleep(max(1, poll_interval_seconds))
 
@@ -7,6 +7,9 @@ from typing import Any
 TERMINAL_STATES = {"succeeded", "failed", "cancelled", "timed_out"}
 SUCCESS_STATES = {"succeeded"}
 FAILURE_STATES = {"failed", "cancelled", "timed_out"}
+RUN_BATCH_CREATE_MAX_ITEMS = 500
+# Upper bound for one GET /v1/runs/{id}/wait long-poll; the API caps it at 60.
+RUN_WAIT_MAX_SECONDS = 30
 
 
 def normalize_op_config(raw_config: Any) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from dagster_sparkpilot._compat import Field, InitResourceContext, resource
@@ -56,6 +57,12 @@ SPARKPILOT_RESOURCE_CONFIG_SCHEMA = {
         default_value=1.0,
         description="Linear retry backoff multiplier in seconds.",
     ),
+    "http2": Field(
+        bool,
+        is_required=False,
+        default_value=False,
+        description="Negotiate HTTP/2 on the pooled connection (requires httpx[http2]).",
+    ),
 }
 
 
@@ -71,6 +78,10 @@ class SparkPilotResource:
             self._client = SparkPilotClient(self.config)
         return self._client
 
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+
 
 def sparkpilot_resource_from_config(config: dict[str, Any]) -> SparkPilotResource:
     normalized_config = dict(config)
@@ -81,6 +92,11 @@ def sparkpilot_resource_from_config(config: dict[str, Any]) -> SparkPilotResourc
 
 
 @resource(config_schema=SPARKPILOT_RESOURCE_CONFIG_SCHEMA)
-def sparkpilot_resource(init_context: InitResourceContext) -> SparkPilotResource:
-    return sparkpilot_resource_from_config(getattr(init_context, "resource_config", {}))
+def sparkpilot_resource(init_context: InitResourceContext) -> Iterator[SparkPilotResource]:
+    # Ops of one run share the client's connection pool; it closes at teardown.
+    sparkpilot = sparkpilot_resource_from_config(getattr(init_context, "resource_config", {}))
+    try:
+        yield sparkpilot
+    finally:
+        sparkpilot.close()
 
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark provider HTTP throughput against a local stub SparkPilot API.
+
+Compares the Dagster ``SparkPilotClient`` reusing its pooled keep-alive
+connection with the same client reconnecting for every call (the behaviour of
+the module-level ``httpx.request`` calls it used before).  The Airflow
+``SparkPilotHook`` uses the same transport setup.  Plain HTTP on localhost has
+no TLS handshake, so the real-world gain against an HTTPS API is larger.
+
+Usage:
+  python scripts/dev/bench_provider_http.py --calls 500
+"""
+from __future__ import annotations
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import socket
+import sys
+import threading
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "providers" / "dagster" / "src"))
+
+from dagster_sparkpilot.client import SparkPilotClient, SparkPilotClientConfig  # noqa: E402
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body are written separately; avoid Nagle/delayed-ACK stalls.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        type(self).connections += 1
+
+    def _send_json(self, payload: dict[str, object]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._send_json({"access_token": "bench-token", "expires_in": 3600})
+
+    def do_GET(self) -> None:  # noqa: N802
+        run_id = self.path.rsplit("/", 1)[-1]
+        self._send_json({"id": run_id, "state": "running"})
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SparkPilot provider HTTP benchmark")
+    parser.add_argument("--calls", type=int, default=500, help="API calls per scenario (default: 500)")
+    return parser.parse_args()
+
+
+def _run_scenario(base_url: str, calls: int, *, reuse_connections: bool) -> tuple[float, int]:
+    config = SparkPilotClientConfig.from_mapping(
+        {
+            "base_url": base_url,
+            "oidc_issuer": base_url,
+            "oidc_audience": "sparkpilot-api",
+            "oidc_client_id": "bench",
+            "oidc_client_secret": "bench",
+            "oidc_token_endpoint": f"{base_url}/oauth/token",
+        }
+    )
+    _StubHandler.connections = 0
+    client = SparkPilotClient(config)
+    started = time.perf_counter()
+    for index in range(calls):
+        client.get_run(f"run-{index}")
+        if not reuse_connections:
+            client.close()
+    elapsed = time.perf_counter() - started
+    client.close()
+    return elapsed, _StubHandler.connections
+
+
+def main() -> None:
+    args = _parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        print(f"{'scenario':<22}{'calls/sec':>12}{'connections':>14}")
+        for label, reuse in (("reconnect per call", False), ("pooled keep-alive", True)):
+            elapsed, connections = _run_scenario(base_url, args.calls, reuse_connections=reuse)
+            print(f"{label:<22}{args.calls / elapsed:>12.1f}{connections:>14}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
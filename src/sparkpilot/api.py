@@ -1,4 +1,6 @@
 from datetime import UTC, datetime, timedelta
+import asyncio
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import lru_cache
@@ -26,12 +28,14 @@ from fastapi import (
     Response,
     status,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
+from pydantic import BaseModel
 from sqlalchemy import and_, func, select, text
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from sparkpilot.aws_clients import parse_role_account_id_from_arn
@@ -42,9 +46,22 @@ from sparkpilot.config import (
     get_settings,
     validate_runtime_settings,
 )
-from sparkpilot.db import get_db, init_db
+from sparkpilot.db import SessionLocal, get_db, init_db
 from sparkpilot.exceptions import SparkPilotError
-from sparkpilot.idempotency import with_idempotency
+from sparkpilot.executors import run_blocking, shutdown_executors
+from sparkpilot.idempotency import (
+    add_idempotency_record,
+    load_idempotency_records,
+    payload_fingerprint,
+    replay_idempotency_record,
+    with_idempotency,
+)
+from sparkpilot.run_event_hub import (
+    RunEventHub,
+    RunStateChange,
+    read_run_state_changes,
+    run_event_hub,
+)
 from sparkpilot.crm_webhook import emit_tenant_lifecycle_event
 from sparkpilot.models import (
     AuditEvent,
@@ -74,7 +91,10 @@ from sparkpilot.schemas import (
     BootstrapStatusResponse,
     ContactRequestCreate,
     ContactRequestCreateResponse,
+    CostShowbackItem,
     CostShowbackResponse,
+    CostWhatIfRequest,
+    CostWhatIfResponse,
     DiagnosticItem,
     DiagnosticsResponse,
     EmrReleaseResponse,
@@ -99,8 +119,15 @@ from sparkpilot.schemas import (
     PreflightResponse,
     ProvisioningOperationResponse,
     QueueUtilizationResponse,
+    RunBatchCreateItem,
+    RunBatchCreateRequest,
+    RunBatchCreateResponse,
+    RunBatchCreateResult,
+    RunBatchGetRequest,
+    RunBatchGetResponse,
     RunCreateRequest,
     RunResponse,
+    RunState,
     ContactSubmissionApproveRequest,
     ContactSubmissionApproveResponse,
     ContactSubmissionCreateRequest,
@@ -122,7 +149,11 @@ from sparkpilot.schemas import (
 )
 from sparkpilot.invite_email import send_contact_request_email
 from sparkpilot.services import (
+    acquire_warm_endpoint,
     add_team_environment_scope,
+    get_cached_access_context,
+    identity_version,
+    store_access_context,
     apply_invite_identity_mapping,
     consume_invite_callback_state,
     consume_invite_token,
@@ -137,6 +168,7 @@ from sparkpilot.services import (
     create_team,
     create_tenant_with_admin_invite,
     create_run,
+    create_runs,
     create_tenant,
     fetch_run_logs,
     get_cost_showback,
@@ -148,19 +180,26 @@ from sparkpilot.services import (
     get_team_budget,
     get_provisioning_operation,
     get_run,
+    get_run_columns_by_ids,
+    get_runs_by_ids,
     get_usage,
     list_golden_paths,
+    list_environment_columns,
     list_environments,
+    list_job_columns,
     list_jobs,
     list_internal_tenant_summaries,
     list_run_diagnostics,
     list_team_environment_scopes,
     list_teams,
     list_user_identities,
-    list_runs,
+    list_run_versions,
     model_to_dict,
     regenerate_user_invite,
+    renew_endpoint_lease,
     retry_environment_provisioning,
+    run_cost_what_if,
+    RunSubmission,
     send_admin_invite_for_provisioned_tenant,
     _golden_path_to_response_payload,
 )
@@ -413,6 +452,7 @@ async def lifespan(_: FastAPI):
     validate_runtime_settings(get_settings())
     init_db()
     yield
+    shutdown_executors()
 
 
 _is_production = settings.environment.strip().lower() == "production"
@@ -477,8 +517,6 @@ async def _sparkpilot_error_handler(
     _request: Request, exc: SparkPilotError
 ) -> Response:
     """Map domain exceptions to JSON HTTP responses."""
-    from fastapi.responses import JSONResponse
-
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
@@ -530,11 +568,13 @@ def _oidc_verifiers() -> dict[PoolSource, OIDCTokenVerifier]:
             issuer=runtime_settings.customer_oidc_issuer_effective,
             audience=runtime_settings.customer_oidc_audience_effective,
             jwks_uri=runtime_settings.customer_oidc_jwks_uri_effective,
+            jwks_stale_grace_seconds=runtime_settings.oidc_jwks_stale_grace_seconds,
         ),
         "internal_pool": OIDCTokenVerifier(
             issuer=runtime_settings.internal_oidc_issuer_effective,
             audience=runtime_settings.internal_oidc_audience_effective,
             jwks_uri=runtime_settings.internal_oidc_jwks_uri_effective,
+            jwks_stale_grace_seconds=runtime_settings.oidc_jwks_stale_grace_seconds,
         ),
     }
 
@@ -570,6 +610,20 @@ def _unverified_token_issuer(token: str) -> str | None:
     return issuer or None
 
 
+def _accept_verified_identity(
+    request: Request,
+    *,
+    identity: OIDCIdentity,
+    pool_source: PoolSource,
+    expected_pools: set[PoolSource],
+) -> VerifiedOIDCIdentity:
+    if pool_source not in expected_pools:
+        raise _forbidden("Token issuer is not permitted for this endpoint.")
+    request.state.auth_pool_source = pool_source
+    request.state.auth_email = _normalized_email_from_identity(identity)
+    return VerifiedOIDCIdentity(identity=identity, pool_source=pool_source)
+
+
 def _require_verified_identity(
     request: Request, *, allowed_pools: set[PoolSource] | None = None
 ) -> VerifiedOIDCIdentity:
@@ -584,6 +638,17 @@ def _require_verified_identity(
 
     verifiers = _oidc_verifiers()
     expected_pools = allowed_pools or {"customer_pool"}
+    # Tokens verified earlier are memoized by their verifier until ``exp``; a hit
+    # skips both the unverified issuer decode and signature verification.
+    for pool_source, verifier in verifiers.items():
+        cached_identity = verifier.cached_identity(token)
+        if cached_identity is not None:
+            return _accept_verified_identity(
+                request,
+                identity=cached_identity,
+                pool_source=pool_source,
+                expected_pools=expected_pools,
+            )
     unverified_issuer = _unverified_token_issuer(token)
     candidate_pools: list[PoolSource] = []
     if unverified_issuer:
@@ -601,11 +666,12 @@ def _require_verified_identity(
         except (OIDCValidationError, OIDCKeyRotationError) as exc:
             last_error = exc
             continue
-        if pool_source not in expected_pools:
-            raise _forbidden("Token issuer is not permitted for this endpoint.")
-        request.state.auth_pool_source = pool_source
-        request.state.auth_email = _normalized_email_from_identity(identity)
-        return VerifiedOIDCIdentity(identity=identity, pool_source=pool_source)
+        return _accept_verified_identity(
+            request,
+            identity=identity,
+            pool_source=pool_source,
+            expected_pools=expected_pools,
+        )
 
     if isinstance(last_error, OIDCKeyRotationError):
         raise HTTPException(
@@ -905,6 +971,10 @@ def _has_any_identities(db: Session) -> bool:
 
 
 def _resolve_access_context(db: Session, actor: str) -> AccessContext:
+    cached = get_cached_access_context(actor)
+    if cached is not None:
+        return cached
+    version = identity_version()
     identity = db.execute(
         select(UserIdentity).where(
             UserIdentity.actor == actor, UserIdentity.active.is_(True)
@@ -928,13 +998,15 @@ def _resolve_access_context(db: Session, actor: str) -> AccessContext:
                 )
             ).all()
         }
-    return AccessContext(
+    access = AccessContext(
         actor=actor,
         role=identity.role,
         tenant_id=identity.tenant_id,
         team_id=identity.team_id,
         scoped_environment_ids=scoped_environment_ids,
     )
+    store_access_context(actor, version, access)
+    return access
 
 
 def _require_admin(access: AccessContext) -> None:
@@ -948,14 +1020,18 @@ def _require_role(access: AccessContext, allowed_roles: set[str], detail: str) -
 
 
 def _can_access_environment(access: AccessContext, env: Environment) -> bool:
+    return _can_access_environment_id(access, tenant_id=env.tenant_id, environment_id=env.id)
+
+
+def _can_access_environment_id(access: AccessContext, *, tenant_id: str, environment_id: str) -> bool:
     if access.role == "admin":
         return True
     if access.role not in {"operator", "user"}:
         return False
-    if access.tenant_id != env.tenant_id:
+    if access.tenant_id != tenant_id:
         return False
     # Team-scoped roles require explicit environment scope membership.
-    return env.id in access.scoped_environment_ids
+    return environment_id in access.scoped_environment_ids
 
 
 def _require_environment_access(access: AccessContext, env: Environment) -> None:
@@ -1063,6 +1139,62 @@ def _response(payload: dict[str, Any], model: type[ResponseModelT]) -> ResponseM
     return model(**payload)
 
 
+# Response fields whose value is stored under a different column name.
+_RUN_FIELD_COLUMNS = {
+    "requested_resources": "requested_resources_json",
+    "args": "args_overrides_json",
+    "spark_conf": "spark_conf_overrides_json",
+    # List responses carry no environment, so the history URL is the UI URI.
+    "spark_history_url": "spark_ui_uri",
+}
+_RUN_COMPUTED_FIELDS = frozenset({"preflight"})
+_JOB_FIELD_COLUMNS = {"args": "args_json", "spark_conf": "spark_conf_json"}
+_ENVIRONMENT_FIELD_COLUMNS = {"lf_data_access_scope": "lf_data_access_scope_json"}
+
+
+def _parse_fields(fields: str | None, model: type[BaseModel], *, key: str = "id") -> list[str] | None:
+    """Parse a ``fields=`` selector into response field names, *key* first."""
+    if fields is None:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    if not requested or not set(requested) <= model.model_fields.keys():
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"fields must be a comma-separated subset of: {', '.join(model.model_fields)}.",
+        )
+    return list(dict.fromkeys([key, *requested]))
+
+
+def _projected_columns(
+    fields: list[str],
+    field_columns: dict[str, str],
+    *,
+    computed: frozenset[str] = frozenset(),
+) -> list[str]:
+    return list(dict.fromkeys(field_columns.get(name, name) for name in fields if name not in computed))
+
+
+def _projected_payload(row: dict[str, Any], fields: list[str], field_columns: dict[str, str]) -> dict[str, Any]:
+    return {name: row.get(field_columns.get(name, name)) for name in fields}
+
+
+def _projected_json(
+    payloads: list[dict[str, Any]],
+    model: type[BaseModel],
+    fields: list[str],
+    *,
+    headers: dict[str, str] | None = None,
+) -> JSONResponse:
+    # Rows come straight from our own columns, so serialize them with the
+    # response model's encoders but without validating them again.
+    include = set(fields)
+    content = [
+        model.model_construct(**payload).model_dump(mode="json", include=include, warnings=False)
+        for payload in payloads
+    ]
+    return JSONResponse(content=content, headers=headers)
+
+
 def _job_response(payload: dict[str, Any]) -> JobResponse:
     return JobResponse(
         id=payload["id"],
@@ -1837,14 +1969,24 @@ def get_environments(
     tenant_id: str | None = Query(default=None),
     limit: int = Query(default=200, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(default=None),
     db: Session = Depends(get_db),
-) -> list[EnvironmentResponse]:
+) -> Any:
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
     if access.role != "admin":
         if tenant_id and tenant_id != access.tenant_id:
             raise _forbidden("Actor cannot access a different tenant.")
         tenant_id = access.tenant_id
+    projection = _parse_fields(fields, EnvironmentResponse)
+    if projection is not None:
+        columns = _projected_columns([*projection, "tenant_id"], _ENVIRONMENT_FIELD_COLUMNS)
+        payloads = [
+            _projected_payload(row, projection, _ENVIRONMENT_FIELD_COLUMNS)
+            for row in list_environment_columns(db, columns, tenant_id, limit=limit, offset=offset)
+            if _can_access_environment_id(access, tenant_id=row["tenant_id"], environment_id=row["id"])
+        ]
+        return _projected_json(payloads, EnvironmentResponse, projection)
     rows = [
         env
         for env in list_environments(db, tenant_id, limit=limit, offset=offset)
@@ -1914,12 +2056,31 @@ def _authorize_discovery(
 
 
 @app.get("/v1/aws/byoc-lite/discovery", response_model=AwsByocLiteDiscoveryResponse)
-def get_byoc_lite_discovery(
+async def get_byoc_lite_discovery(
     request: Request,
     customer_role_arn: str = Query(..., min_length=20, max_length=1024),
     region: str = Query(default="us-east-1", min_length=2, max_length=64),
     tenant_id: str | None = Query(default=None, min_length=1, max_length=128),
     db: Session = Depends(get_db),
+) -> AwsByocLiteDiscoveryResponse:
+    return await run_blocking(
+        "eks",
+        _byoc_lite_discovery,
+        request,
+        customer_role_arn=customer_role_arn,
+        region=region,
+        tenant_id=tenant_id,
+        db=db,
+    )
+
+
+def _byoc_lite_discovery(
+    request: Request,
+    *,
+    customer_role_arn: str,
+    region: str,
+    tenant_id: str | None,
+    db: Session,
 ) -> AwsByocLiteDiscoveryResponse:
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
@@ -2106,11 +2267,19 @@ def delete_environment_by_id(
 @app.get(
     "/v1/environments/{environment_id}/preflight", response_model=PreflightResponse
 )
-def get_environment_preflight_by_id(
+async def get_environment_preflight_by_id(
     environment_id: str,
     request: Request,
     run_id: str | None = Query(default=None),
     db: Session = Depends(get_db),
+) -> PreflightResponse:
+    return await run_blocking(
+        "preflight", _environment_preflight, environment_id, request, run_id=run_id, db=db
+    )
+
+
+def _environment_preflight(
+    environment_id: str, request: Request, *, run_id: str | None, db: Session
 ) -> PreflightResponse:
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
@@ -2175,8 +2344,9 @@ def get_jobs(
     environment_id: str | None = Query(default=None),
     limit: int = Query(default=200, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(default=None),
     db: Session = Depends(get_db),
-) -> list[JobResponse]:
+) -> Any:
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
     _require_role(
@@ -2186,6 +2356,18 @@ def get_jobs(
         env = get_environment(db, environment_id)
         _require_environment_access(access, env)
     env_ids_filter = None if access.role == "admin" else access.scoped_environment_ids
+    projection = _parse_fields(fields, JobResponse)
+    if projection is not None:
+        job_rows = list_job_columns(
+            db,
+            _projected_columns(projection, _JOB_FIELD_COLUMNS),
+            environment_id=environment_id,
+            limit=limit,
+            offset=offset,
+            environment_ids=env_ids_filter,
+        )
+        payloads = [_projected_payload(row, projection, _JOB_FIELD_COLUMNS) for row in job_rows]
+        return _projected_json(payloads, JobResponse, projection)
     rows = list_jobs(
         db,
         environment_id=environment_id,
@@ -2258,15 +2440,43 @@ def get_golden_path_by_id(
     return _response(_golden_path_to_response_payload(row), GoldenPathResponse)
 
 
+def _run_list_etag(versions: list[tuple[str, datetime]], fields: list[str] | None) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{','.join(fields or ())}\n".encode())
+    for run_id, updated_at in versions:
+        digest.update(f"{run_id}|{updated_at.isoformat()}\n".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @app.get("/v1/runs", response_model=list[RunResponse])
 def get_runs(
     request: Request,
+    response: Response,
     tenant_id: str | None = Query(default=None),
     state: str | None = Query(default=None),
     limit: int = Query(default=200, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    updated_since: str | None = Query(default=None),
+    fields: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     db: Session = Depends(get_db),
-) -> list[RunResponse]:
+) -> Any:
+    """List runs, newest first.
+
+    The ``ETag`` header versions the requested page from each run's id and
+    ``updated_at``; sending it back as ``If-None-Match`` returns ``304`` while
+    the page is unchanged.  With ``updated_since`` only runs on the page that
+    changed after that token are returned, and ``X-Next-Updated-Since``
+    carries the token for the next poll.  ``fields`` limits each run to the
+    named response fields and reads only the columns they need.
+    """
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
     if access.role != "admin":
@@ -2275,7 +2485,14 @@ def get_runs(
         tenant_id = access.tenant_id
     actor_filter = access.actor if access.role == "user" else None
     env_ids_filter = None if access.role == "admin" else access.scoped_environment_ids
-    run_rows = list_runs(
+    since = _parse_changed_since(
+        updated_since,
+        detail="updated_since must be an ISO 8601 timestamp such as a previous X-Next-Updated-Since value.",
+    )
+    # "Z" rather than "+00:00" so the token survives unencoded in a query string.
+    projection = _parse_fields(fields, RunResponse)
+    next_token = (datetime.now(UTC) - _RUN_CHANGED_SINCE_OVERLAP).isoformat().replace("+00:00", "Z")
+    versions = list_run_versions(
         db,
         tenant_id,
         state,
@@ -2284,7 +2501,32 @@ def get_runs(
         actor=actor_filter,
         environment_ids=env_ids_filter,
     )
-    return [_run_response(model_to_dict(run)) for run in run_rows]
+    etag = _run_list_etag(versions, projection)
+    headers = {"ETag": etag, "X-Next-Updated-Since": next_token, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    if since is not None:
+        changed_ids = [
+            run_id
+            for run_id, updated_at in versions
+            if (updated_at if updated_at.tzinfo else updated_at.replace(tzinfo=UTC)) > since
+        ]
+    else:
+        changed_ids = [run_id for run_id, _ in versions]
+    if not changed_ids:
+        return []
+    if projection is not None:
+        columns = _projected_columns(projection, _RUN_FIELD_COLUMNS, computed=_RUN_COMPUTED_FIELDS)
+        by_id = {row["id"]: row for row in get_run_columns_by_ids(db, changed_ids, columns)}
+        payloads = [
+            _projected_payload(by_id[run_id], projection, _RUN_FIELD_COLUMNS)
+            for run_id in changed_ids
+            if run_id in by_id
+        ]
+        return _projected_json(payloads, RunResponse, projection, headers=headers)
+    rows = {run.id: run for run, _ in get_runs_by_ids(db, changed_ids)}
+    return [_run_response(model_to_dict(rows[run_id])) for run_id in changed_ids if run_id in rows]
 
 
 @app.get("/v1/emr-releases", response_model=list[EmrReleaseResponse])
@@ -2351,6 +2593,358 @@ def post_run(
     return _run_response(result.body, preflight=preflight)
 
 
+def _run_batch_error(item: RunBatchCreateItem, status_code: int, detail: str) -> RunBatchCreateResult:
+    return RunBatchCreateResult(
+        job_id=item.job_id,
+        idempotency_key=item.idempotency_key,
+        status_code=status_code,
+        detail=detail,
+    )
+
+
+def _run_batch_create_results(
+    db: Session,
+    req: RunBatchCreateRequest,
+    access: AccessContext,
+    actor: str,
+    source_ip: str | None,
+) -> list[RunBatchCreateResult]:
+    items = req.runs
+    run_reqs = [
+        RunCreateRequest.model_validate(item.model_dump(exclude={"job_id", "idempotency_key"}))
+        for item in items
+    ]
+    scope_keys = [(f"POST:/v1/jobs/{item.job_id}/runs", item.idempotency_key) for item in items]
+    records = load_idempotency_records(db, scope_keys)
+    jobs = {
+        job.id: job
+        for job in db.execute(select(Job).where(Job.id.in_({item.job_id for item in items}))).scalars()
+    }
+    envs = {
+        env.id: env
+        for env in db.execute(
+            select(Environment).where(Environment.id.in_({job.environment_id for job in jobs.values()}))
+        ).scalars()
+    }
+
+    results: list[RunBatchCreateResult | None] = [None] * len(items)
+    first_index: dict[tuple[str, str], int] = {}
+    duplicates: list[tuple[int, int]] = []
+    submissions: list[RunSubmission] = []
+    submitted_indexes: list[int] = []
+    for index, (item, run_req, scope_key) in enumerate(zip(items, run_reqs, scope_keys)):
+        payload = run_req.model_dump()
+        record = records.get(scope_key)
+        if record is not None:
+            try:
+                replay = replay_idempotency_record(record, payload=payload)
+            except HTTPException as exc:
+                results[index] = _run_batch_error(item, exc.status_code, str(exc.detail))
+                continue
+            preflight = replay.body.get("preflight")
+            results[index] = RunBatchCreateResult(
+                job_id=item.job_id,
+                idempotency_key=item.idempotency_key,
+                status_code=replay.status_code,
+                replayed=True,
+                run=_run_response(replay.body, preflight=preflight if isinstance(preflight, dict) else None),
+            )
+            continue
+        if scope_key in first_index:
+            first = first_index[scope_key]
+            if payload_fingerprint(run_reqs[first].model_dump()) != payload_fingerprint(payload):
+                results[index] = _run_batch_error(
+                    item,
+                    status.HTTP_409_CONFLICT,
+                    "Idempotency-Key already used with a different request body.",
+                )
+            else:
+                duplicates.append((index, first))
+            continue
+        first_index[scope_key] = index
+        job = jobs.get(item.job_id)
+        if job is None:
+            results[index] = _run_batch_error(item, status.HTTP_404_NOT_FOUND, "Job not found.")
+            continue
+        env = envs.get(job.environment_id)
+        if env is None or not _can_access_environment(access, env):
+            results[index] = _run_batch_error(
+                item, status.HTTP_403_FORBIDDEN, "Actor is not authorized for this environment."
+            )
+            continue
+        submissions.append(
+            RunSubmission(job_id=item.job_id, req=run_req, idempotency_key=item.idempotency_key)
+        )
+        submitted_indexes.append(index)
+
+    outcomes = create_runs(db, submissions, actor=actor, source_ip=source_ip, commit=False)
+    for index, outcome in zip(submitted_indexes, outcomes):
+        item = items[index]
+        if isinstance(outcome, SparkPilotError):
+            # Failed items are not recorded, matching the single-run endpoint,
+            # so they can be retried with the same key.
+            results[index] = _run_batch_error(item, outcome.status_code, outcome.detail)
+            continue
+        # Runs admitted in this transaction have not been dispatched, so they
+        # have no preflight snapshot yet.
+        body = {**model_to_dict(outcome), "preflight": None}
+        scope, key = scope_keys[index]
+        add_idempotency_record(
+            db,
+            scope=scope,
+            key=key,
+            payload=run_reqs[index].model_dump(),
+            status_code=status.HTTP_201_CREATED,
+            body=body,
+            resource_type="run",
+            resource_id=outcome.id,
+        )
+        results[index] = RunBatchCreateResult(
+            job_id=item.job_id,
+            idempotency_key=item.idempotency_key,
+            status_code=status.HTTP_201_CREATED,
+            run=_run_response(body),
+        )
+    for index, first in duplicates:
+        original = results[first]
+        if original is not None:
+            results[index] = original.model_copy(update={"replayed": original.run is not None})
+    db.commit()
+    return [result for result in results if result is not None]
+
+
+@app.post("/v1/runs:batchCreate", response_model=RunBatchCreateResponse)
+def post_runs_batch_create(
+    req: RunBatchCreateRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> RunBatchCreateResponse:
+    """Submit up to ``RUN_BATCH_CREATE_MAX_ITEMS`` runs in one transaction.
+
+    Each item carries its own idempotency key, shared with
+    ``POST /v1/jobs/{job_id}/runs``: resubmitting an item, alone or in a
+    batch, replays its original result.  Results are returned in request
+    order with a per-item ``status_code``; one item failing validation,
+    policy or quota does not affect the others.
+    """
+    actor, source_ip = _actor_and_ip(request)
+    access = _resolve_access_context(db, actor)
+    _require_role(
+        access,
+        {"admin", "operator", "user"},
+        "Only admin/operator/user can submit runs.",
+    )
+    try:
+        results = _run_batch_create_results(db, req, access, actor, source_ip)
+    except IntegrityError:
+        # A concurrent request stored one of the keys first; rerunning the
+        # batch replays that item instead.
+        db.rollback()
+        results = _run_batch_create_results(db, req, access, actor, source_ip)
+    return RunBatchCreateResponse(results=results)
+
+
+# Overlap applied to changed_since tokens so a run whose updated_at was stamped
+# just before a read but committed just after it is still reported next time.
+_RUN_CHANGED_SINCE_OVERLAP = timedelta(seconds=2)
+
+
+def _parse_changed_since(
+    token: str | None,
+    *,
+    detail: str = "changed_since must be a token returned by a previous batchGet call.",
+) -> datetime | None:
+    if token is None:
+        return None
+    try:
+        value = datetime.fromisoformat(token.strip())
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=detail,
+        ) from None
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+@app.post("/v1/runs:batchGet", response_model=RunBatchGetResponse)
+def post_runs_batch_get(
+    req: RunBatchGetRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> RunBatchGetResponse:
+    """Return the current state of up to ``RUN_BATCH_GET_MAX_IDS`` runs in one call.
+
+    With ``changed_since`` only runs updated after that token are included.
+    Runs that do not exist or are not visible to the caller are listed in
+    ``missing_run_ids``.
+    """
+    actor, _ = _actor_and_ip(request)
+    access = _resolve_access_context(db, actor)
+    changed_since = _parse_changed_since(req.changed_since)
+    next_token = (datetime.now(UTC) - _RUN_CHANGED_SINCE_OVERLAP).isoformat()
+    found: set[str] = set()
+    runs: list[RunResponse] = []
+    for run, env in get_runs_by_ids(db, req.run_ids):
+        if not _can_access_run(access, run, env):
+            continue
+        found.add(run.id)
+        updated_at = run.updated_at if run.updated_at.tzinfo else run.updated_at.replace(tzinfo=UTC)
+        if changed_since is not None and updated_at <= changed_since:
+            continue
+        runs.append(_run_response(model_to_dict(run), env))
+    missing = [run_id for run_id in dict.fromkeys(req.run_ids) if run_id not in found]
+    return RunBatchGetResponse(runs=runs, missing_run_ids=missing, changed_since=next_token)
+
+
+_RUN_WAIT_DEFAULT_STATES = frozenset({"queued", "dispatching", "accepted", "running"})
+_RUN_EVENT_STREAM_KEEPALIVE_SECONDS = 15.0
+_RUN_EVENT_STREAM_MAX_SECONDS = 900.0
+_RUN_EVENT_STREAM_RETRY_MS = 1000
+
+
+def _run_wait_snapshot(run_id: str, request: Request) -> RunResponse:
+    # Long-polls open a short session per read instead of holding a pooled
+    # connection for the whole wait.
+    with SessionLocal() as db:
+        actor, _ = _actor_and_ip(request)
+        access = _resolve_access_context(db, actor)
+        run = get_run(db, run_id)
+        env = get_environment(db, run.environment_id)
+        _require_run_access(access, run, env)
+        return _run_response(model_to_dict(run), env)
+
+
+@app.get("/v1/runs/{run_id}/wait", response_model=RunResponse)
+async def get_run_wait(
+    run_id: str,
+    request: Request,
+    timeout: float = Query(default=30.0, ge=0, le=60),
+    state_in: list[RunState] | None = Query(default=None),
+) -> RunResponse:
+    """Hold the request until the run leaves ``state_in`` or ``timeout`` seconds pass.
+
+    ``state_in`` defaults to the non-terminal states, so a bare call returns as
+    soon as the run finishes.  The current run is returned either way; callers
+    compare its ``state`` to decide whether to wait again.
+    """
+    waiting_states = frozenset(state_in) if state_in else _RUN_WAIT_DEFAULT_STATES
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    hub = run_event_hub()
+    while True:
+        async with hub.watch_run(run_id) as changed:
+            run = await run_in_threadpool(_run_wait_snapshot, run_id, request)
+            remaining = deadline - loop.time()
+            if run.state not in waiting_states or remaining <= 0:
+                return run
+            try:
+                await asyncio.wait_for(changed, remaining)
+            except TimeoutError:
+                pass
+
+
+def _run_events_access(request: Request) -> AccessContext:
+    with SessionLocal() as db:
+        actor, _ = _actor_and_ip(request)
+        return _resolve_access_context(db, actor)
+
+
+def _can_see_run_state_change(access: AccessContext, tenant_id: str | None, change: RunStateChange) -> bool:
+    if tenant_id is not None and change.tenant_id != tenant_id:
+        return False
+    if access.role == "admin":
+        return True
+    if access.role not in {"operator", "user"} or change.tenant_id != access.tenant_id:
+        return False
+    if change.environment_id not in access.scoped_environment_ids:
+        return False
+    return access.role != "user" or change.created_by_actor == access.actor
+
+
+def _run_state_change_frame(change: RunStateChange) -> str:
+    payload = {
+        "run_id": change.run_id,
+        "environment_id": change.environment_id,
+        "tenant_id": change.tenant_id,
+        "state": change.state,
+        "occurred_at": change.created_at.isoformat(),
+    }
+    return f"id: {change.id}\nevent: run.state\ndata: {json.dumps(payload)}\n\n"
+
+
+async def _run_event_stream(
+    hub: RunEventHub,
+    access: AccessContext,
+    *,
+    tenant_id: str | None,
+    after_id: int | None,
+) -> AsyncIterator[str]:
+    async with hub.subscribe() as subscription:
+        yield f"retry: {_RUN_EVENT_STREAM_RETRY_MS}\n\n"
+        replayed: set[int] = set()
+        if after_id is not None:
+            backlog = await run_in_threadpool(
+                read_run_state_changes, after_id=after_id, tenant_id=tenant_id
+            )
+            for change in backlog:
+                replayed.add(change.id)
+                if _can_see_run_state_change(access, tenant_id, change):
+                    yield _run_state_change_frame(change)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _RUN_EVENT_STREAM_MAX_SECONDS
+        while True:
+            if subscription.overflowed and subscription.queue.empty():
+                return
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                change = await asyncio.wait_for(
+                    subscription.queue.get(),
+                    min(_RUN_EVENT_STREAM_KEEPALIVE_SECONDS, remaining),
+                )
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if change.id in replayed:
+                continue
+            if _can_see_run_state_change(access, tenant_id, change):
+                yield _run_state_change_frame(change)
+
+
+@app.get("/v1/run-events")
+async def get_run_events(
+    request: Request,
+    tenant_id: str | None = Query(default=None),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """Server-sent events stream of run state transitions visible to the caller.
+
+    Reconnecting clients send ``Last-Event-ID`` to replay transitions they
+    missed.  Streams end after ``_RUN_EVENT_STREAM_MAX_SECONDS`` so that the
+    client re-authenticates; EventSource reconnects automatically.
+    """
+    access = await run_in_threadpool(_run_events_access, request)
+    if access.role != "admin":
+        if tenant_id and tenant_id != access.tenant_id:
+            raise _forbidden("Actor cannot access a different tenant.")
+        tenant_id = access.tenant_id
+    after_id: int | None = None
+    if last_event_id:
+        try:
+            after_id = int(last_event_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Last-Event-ID must be an event id from this stream.",
+            ) from None
+    return StreamingResponse(
+        _run_event_stream(run_event_hub(), access, tenant_id=tenant_id, after_id=after_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/v1/runs/{run_id}", response_model=RunResponse)
 def get_run_by_id(
     run_id: str,
@@ -2399,12 +2993,16 @@ def post_cancel_run(
 
 
 @app.get("/v1/runs/{run_id}/logs", response_model=LogsResponse)
-def get_run_logs(
+async def get_run_logs(
     run_id: str,
     request: Request,
     limit: int = Query(default=200, ge=1, le=2000),
     db: Session = Depends(get_db),
 ) -> LogsResponse:
+    return await run_blocking("cloudwatch", _run_logs, run_id, request, limit=limit, db=db)
+
+
+def _run_logs(run_id: str, request: Request, *, limit: int, db: Session) -> LogsResponse:
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
     run = get_run(db, run_id)
@@ -2518,8 +3116,9 @@ def get_costs_showback(
     period: str = Query(..., pattern=r"^\d{4}-\d{2}$"),
     limit: int = Query(default=200, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    fields: str | None = Query(default=None),
     db: Session = Depends(get_db),
-) -> CostShowbackResponse:
+) -> Any:
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
     _require_role(
@@ -2527,7 +3126,30 @@ def get_costs_showback(
     )
     if access.role != "admin" and access.tenant_id != team:
         raise _forbidden("Operator can only view showback for assigned tenant key.")
-    return get_cost_showback(db, team=team, period=period, limit=limit, offset=offset)
+    item_fields = _parse_fields(fields, CostShowbackItem, key="run_id")
+    showback = get_cost_showback(
+        db, team=team, period=period, limit=limit, offset=offset, item_fields=item_fields
+    )
+    if item_fields is None:
+        return showback
+    # Partial items were built without validation; skip response-model checks too.
+    return JSONResponse(content=showback.model_dump(mode="json", warnings=False))
+
+
+@app.post("/v1/costs/what-if", response_model=CostWhatIfResponse)
+def post_costs_what_if(
+    req: CostWhatIfRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> CostWhatIfResponse:
+    actor, _ = _actor_and_ip(request)
+    access = _resolve_access_context(db, actor)
+    _require_role(
+        access, {"admin", "operator"}, "Only admin/operator can run cost what-if analysis."
+    )
+    if access.role != "admin" and access.tenant_id != req.team:
+        raise _forbidden("Operator can only run cost what-if analysis for assigned tenant key.")
+    return run_cost_what_if(db, req)
 
 
 @app.post(
@@ -2746,6 +3368,61 @@ def post_interactive_endpoint(
     return _interactive_endpoint_response(endpoint)
 
 
+@app.post(
+    "/v1/environments/{environment_id}/endpoints:acquire",
+    response_model=InteractiveEndpointResponse,
+)
+def acquire_interactive_endpoint(
+    environment_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> InteractiveEndpointResponse:
+    actor, _ = _actor_and_ip(request)
+    access = _resolve_access_context(db, actor)
+    _require_role(
+        access, {"admin", "operator", "user"}, "Only admin/operator/user can acquire endpoints."
+    )
+    env = get_environment(db, environment_id)
+    _require_environment_access(access, env)
+    endpoint = acquire_warm_endpoint(db, environment=env, actor=actor)
+    if endpoint is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                "No warm interactive endpoint is ready in this environment. "
+                "Retry shortly or create one with POST /v1/environments/{environment_id}/endpoints."
+            ),
+        )
+    return _interactive_endpoint_response(endpoint)
+
+
+@app.post(
+    "/v1/environments/{environment_id}/endpoints/{endpoint_id}:renew",
+    response_model=InteractiveEndpointResponse,
+)
+def renew_interactive_endpoint_lease(
+    environment_id: str,
+    endpoint_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> InteractiveEndpointResponse:
+    """Heartbeat for a leased warm-pool endpoint; resets its idle timer."""
+    actor, _ = _actor_and_ip(request)
+    access = _resolve_access_context(db, actor)
+    _require_role(
+        access, {"admin", "operator", "user"}, "Only admin/operator/user can renew endpoint leases."
+    )
+    env = get_environment(db, environment_id)
+    _require_environment_access(access, env)
+    endpoint = renew_endpoint_lease(db, environment=env, endpoint_id=endpoint_id, actor=actor)
+    if endpoint is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No active lease on this endpoint is held by the caller.",
+        )
+    return _interactive_endpoint_response(endpoint)
+
+
 @app.get(
     "/v1/environments/{environment_id}/endpoints",
     response_model=list[InteractiveEndpointResponse],
@@ -2948,6 +3625,10 @@ def _interactive_endpoint_response(
         certificate_arn=ep.certificate_arn,
         endpoint_url=ep.endpoint_url,
         created_by_actor=ep.created_by_actor,
+        pooled=ep.pooled,
+        leased_by_actor=ep.leased_by_actor,
+        leased_at=ep.leased_at,
+        last_activity_at=ep.last_activity_at,
         created_at=ep.created_at,
         updated_at=ep.updated_at,
     )
@@ -3214,11 +3895,19 @@ def describe_security_configuration_endpoint(
 
 
 @app.get("/v1/environments/{environment_id}/iam-validation")
-def validate_iam_credential_chain(
+async def validate_iam_credential_chain(
     environment_id: str,
     request: Request,
     db: Session = Depends(get_db),
 ) -> Any:
+    return await run_blocking(
+        "iam", _environment_iam_validation, environment_id, request, db=db
+    )
+
+
+def _environment_iam_validation(
+    environment_id: str, request: Request, *, db: Session
+) -> dict[str, Any]:
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
     _require_admin(access)
@@ -3236,11 +3925,15 @@ def validate_iam_credential_chain(
 
 
 @app.get("/v1/iam-validation")
-def validate_runtime_iam_identity(
+async def validate_runtime_iam_identity(
     request: Request,
     db: Session = Depends(get_db),
 ) -> Any:
     """Validate runtime identity without customer role assumption."""
+    return await run_blocking("iam", _runtime_iam_validation, request, db=db)
+
+
+def _runtime_iam_validation(request: Request, *, db: Session) -> dict[str, Any]:
     actor, _ = _actor_and_ip(request)
     access = _resolve_access_context(db, actor)
     _require_admin(access)
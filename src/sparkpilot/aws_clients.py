@@ -1,9 +1,16 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import copy
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
+import hashlib
 import json
 import logging
 import re
+import threading
+import time
 import uuid
 
 import boto3
@@ -46,6 +53,21 @@ _EMR_JOB_NAME_MAX_LENGTH = 64
 _EMR_JOB_NAME_RUN_ID_CHARS = 12
 _K8S_LABEL_VALUE_DISALLOWED_PATTERN = re.compile(r"[^A-Za-z0-9_.-]+")
 _K8S_LABEL_VALUE_MAX_LENGTH = 63
+_AWS_LOOKUP_CACHE_MAX_ENTRIES = 1024
+# Instance type specifications do not change, so their lookups are kept for a day.
+_INSTANCE_TYPE_CACHE_SECONDS = 86400
+_DESCRIBE_INSTANCE_TYPES_MAX = 100
+_DRY_RUN_INSTANCE_VCPUS = {"m7g.xlarge": 4, "m7i.xlarge": 4, "r7g.xlarge": 4}
+# emr-containers caps each jobTemplateParameters value at 1024 characters.
+_JOB_TEMPLATE_PARAMETER_MAX_LENGTH = 1024
+_JOB_TEMPLATE_NAME_PREFIX = "sparkpilot-auto-"
+
+_T = TypeVar("_T")
+_aws_lookup_cache: OrderedDict[tuple[str, ...], tuple[float, Any]] = OrderedDict()
+_aws_lookup_cache_lock = threading.Lock()
+# Auto job templates are content-addressed, so their ids never go stale
+# unless the template is deleted; dispatch forgets the id when that happens.
+_job_template_ids: dict[tuple[str, str, str], str] = {}
 
 
 def _base36_encode_name(name: str) -> str:
@@ -389,6 +411,86 @@ def _list_cluster_names(eks_client: Any, max_clusters: int) -> list[str]:
     return cluster_names
 
 
+def _reset_aws_lookup_cache() -> None:
+    with _aws_lookup_cache_lock:
+        _aws_lookup_cache.clear()
+        _job_template_ids.clear()
+
+
+def _cached_aws_lookup(
+    key: tuple[str, ...],
+    load: Callable[[], _T],
+    *,
+    ttl_seconds: int,
+    refresh: bool = False,
+) -> _T:
+    """Return a copy of the cached result for *key*, calling *load* once it has expired.
+
+    Keys start with the lookup kind and the customer role whose view of the
+    account they describe.  Failures are not cached, so a permission fix is
+    picked up on the next call.  *refresh* skips the cached value but stores
+    the fresh one, for read-modify-write paths that must not act on stale data.
+    """
+    if not refresh:
+        now = time.monotonic()
+        with _aws_lookup_cache_lock:
+            entry = _aws_lookup_cache.get(key)
+            if entry is not None and entry[0] > now:
+                _aws_lookup_cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+    value = load()
+    with _aws_lookup_cache_lock:
+        _aws_lookup_cache[key] = (time.monotonic() + ttl_seconds, value)
+        _aws_lookup_cache.move_to_end(key)
+        while len(_aws_lookup_cache) > _AWS_LOOKUP_CACHE_MAX_ENTRIES:
+            _aws_lookup_cache.popitem(last=False)
+    return copy.deepcopy(value)
+
+
+def _invalidate_aws_lookups(kind: str, name: str) -> None:
+    """Drop every cached *kind* lookup of *name*, whichever role it was read through."""
+    with _aws_lookup_cache_lock:
+        for key in [key for key in _aws_lookup_cache if key[0] == kind and key[-1] == name]:
+            del _aws_lookup_cache[key]
+
+
+def describe_eks_cluster(environment: Any, *, eks_client: Any, cluster_name: str) -> dict[str, Any]:
+    """``eks:DescribeCluster`` through the environment's role, shared by preflight and provisioning checks."""
+    return _cached_aws_lookup(
+        ("eks_cluster", environment.customer_role_arn, environment.region, cluster_name),
+        lambda: eks_client.describe_cluster(name=cluster_name).get("cluster", {}),
+        ttl_seconds=get_settings().aws_metadata_cache_seconds,
+    )
+
+
+def _get_iam_role(
+    environment: Any,
+    *,
+    iam_client: Any,
+    role_name: str,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    return _cached_aws_lookup(
+        ("iam_role", environment.customer_role_arn, role_name),
+        lambda: iam_client.get_role(RoleName=role_name),
+        ttl_seconds=get_settings().aws_metadata_cache_seconds,
+        refresh=refresh,
+    )
+
+
+def _describe_concurrently(describe: Callable[[str], _T], names: list[str]) -> list[_T]:
+    """Run *describe* for every name on a bounded pool, returning results in input order."""
+    if len(names) <= 1:
+        return [describe(name) for name in names]
+    max_workers = min(get_settings().aws_discovery_max_workers, len(names))
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sparkpilot-aws-describe")
+    try:
+        return list(pool.map(describe, names))
+    finally:
+        # On the first failure, skip describes that have not started yet.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 def _describe_and_normalize_cluster(
     eks_client: Any,
     cluster_name: str,
@@ -451,6 +553,19 @@ def discover_eks_clusters_for_role(
             ],
         }
 
+    return _cached_aws_lookup(
+        ("eks_clusters", role_arn, region_name, str(normalized_max_clusters)),
+        lambda: _discover_eks_clusters(role_arn, region_name, role_account_id, normalized_max_clusters),
+        ttl_seconds=get_settings().aws_discovery_cache_seconds,
+    )
+
+
+def _discover_eks_clusters(
+    role_arn: str,
+    region_name: str,
+    role_account_id: str | None,
+    max_clusters: int,
+) -> dict[str, Any]:
     session = _assume_customer_role_for_discovery(role_arn, region_name)
 
     sts_client = session.client("sts", region_name=region_name)
@@ -461,22 +576,21 @@ def discover_eks_clusters_for_role(
         account_id = role_account_id
 
     eks_client = session.client("eks", region_name=region_name)
-    cluster_names = _list_cluster_names(eks_client, normalized_max_clusters)
+    cluster_names = _list_cluster_names(eks_client, max_clusters)
 
-    discovered: list[dict[str, Any]] = []
-    for cluster_name in sorted(set(cluster_names)):
-        normalized = _describe_and_normalize_cluster(
+    described = _describe_concurrently(
+        lambda cluster_name: _describe_and_normalize_cluster(
             eks_client=eks_client,
             cluster_name=cluster_name,
             region_name=region_name,
             account_id=account_id,
-        )
-        if normalized is not None:
-            discovered.append(normalized)
+        ),
+        sorted(set(cluster_names)),
+    )
 
     return {
         "account_id": account_id,
-        "clusters": discovered,
+        "clusters": [item for item in described if item is not None],
     }
 
 
@@ -488,6 +602,44 @@ class EmrDispatchResult:
     driver_log_uri: str | None
     spark_ui_uri: str | None
     aws_request_id: str | None = None
+    job_template_id: str | None = None
+
+
+def _dispatch_spark_conf(
+    environment: Environment,
+    job: Job,
+    *,
+    run_id: str | None,
+    overrides: dict[str, Any] | None,
+    project: str,
+    cost_center: str,
+) -> dict[str, Any]:
+    """Build the Spark conf a run is submitted with; ``run_id=None`` leaves out the run-id labels."""
+    spark_conf = {**(job.spark_conf_json or {}), **(overrides or {})}
+    chargeback_labels = {
+        "sparkpilot-run-id": run_id,
+        "sparkpilot-team": environment.tenant_id,
+        "sparkpilot-project": project,
+        "sparkpilot-cost-center": cost_center,
+    }
+    for label_key, raw_value in chargeback_labels.items():
+        if label_key == "sparkpilot-run-id" and run_id is None:
+            continue
+        safe_value = _safe_k8s_label_value(raw_value)
+        spark_conf.setdefault(f"spark.kubernetes.driver.label.{label_key}", safe_value)
+        spark_conf.setdefault(f"spark.kubernetes.executor.label.{label_key}", safe_value)
+
+    _yunikorn_queue = getattr(environment, "yunikorn_queue", None)
+    if _yunikorn_queue:
+        spark_conf["spark.kubernetes.driver.annotation.yunikorn.apache.org/queue-name"] = _yunikorn_queue
+        spark_conf["spark.kubernetes.executor.annotation.yunikorn.apache.org/queue-name"] = _yunikorn_queue
+
+    _apply_event_log_defaults(spark_conf, environment)
+    return spark_conf
+
+
+def _spark_submit_parameters(spark_conf: dict[str, Any]) -> str:
+    return " ".join(f"--conf {k}={v}" for k, v in spark_conf.items())
 
 
 class EmrEksClient:
@@ -575,7 +727,7 @@ class EmrEksClient:
         session = session_for_environment(environment)
         eks_client = session.client("eks", region_name=environment.region)
         try:
-            cluster = eks_client.describe_cluster(name=cluster_name).get("cluster", {})
+            cluster = describe_eks_cluster(environment, eks_client=eks_client, cluster_name=cluster_name)
         except ClientError as exc:
             error = exc.response.get("Error", {})
             code = error.get("Code", "")
@@ -603,7 +755,11 @@ class EmrEksClient:
         provider_arn = f"arn:aws:iam::{account_id}:oidc-provider/{provider_path}"
         iam_client = session.client("iam")
         try:
-            iam_client.get_open_id_connect_provider(OpenIDConnectProviderArn=provider_arn)
+            _cached_aws_lookup(
+                ("iam_oidc_provider", environment.customer_role_arn, provider_arn),
+                lambda: iam_client.get_open_id_connect_provider(OpenIDConnectProviderArn=provider_arn),
+                ttl_seconds=self.settings.aws_metadata_cache_seconds,
+            )
         except ClientError as exc:
             error = exc.response.get("Error", {})
             code = error.get("Code", "")
@@ -641,7 +797,7 @@ class EmrEksClient:
         role_name: str,
     ) -> dict[str, Any]:
         try:
-            return eks_client.describe_cluster(name=cluster_name).get("cluster", {})
+            return describe_eks_cluster(environment, eks_client=eks_client, cluster_name=cluster_name)
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
             if code in {"AccessDeniedException", "AccessDenied", "UnauthorizedOperation"}:
@@ -666,7 +822,8 @@ class EmrEksClient:
         cluster_name: str,
     ) -> dict[str, Any]:
         try:
-            role_data = iam_client.get_role(RoleName=role_name)
+            # Read-modify-write: always start from the live policy, and refresh the cache with it.
+            role_data = _get_iam_role(environment, iam_client=iam_client, role_name=role_name, refresh=True)
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
             if code == "NoSuchEntity":
@@ -749,6 +906,8 @@ class EmrEksClient:
                 PolicyDocument=json.dumps(trust_policy),
             )
         except ClientError as exc:
+            # The write may have landed before the error surfaced.
+            _invalidate_aws_lookups("iam_role", role_name)
             code = exc.response.get("Error", {}).get("Code", "")
             message = exc.response.get("Error", {}).get("Message", "")
             if code in {"AccessDeniedException", "AccessDenied", "UnauthorizedOperation"}:
@@ -776,6 +935,7 @@ class EmrEksClient:
                     "execution role with a minimal trust policy and set SPARKPILOT_EMR_EXECUTION_ROLE_ARN to it."
                 ) from None
             raise
+        _invalidate_aws_lookups("iam_role", role_name)
 
     def update_execution_role_trust_policy(self, environment: Environment) -> dict[str, str | bool | None]:
         if not environment.eks_cluster_arn:
@@ -900,9 +1060,18 @@ class EmrEksClient:
                     "capacity_type": "SPOT",
                     "instance_types": ["m7g.xlarge", "m7i.xlarge", "r7g.xlarge"],
                     "desired_size": 2,
+                    "max_size": 10,
                 }
             ]
 
+        return _cached_aws_lookup(
+            ("eks_nodegroups", environment.customer_role_arn, environment.region, environment.eks_cluster_arn),
+            lambda: self._describe_nodegroups(environment, cluster_name),
+            ttl_seconds=self.settings.aws_discovery_cache_seconds,
+        )
+
+    @staticmethod
+    def _describe_nodegroups(environment: Environment, cluster_name: str) -> list[dict[str, Any]]:
         session = session_for_environment(environment)
         eks_client = session.client("eks", region_name=environment.region)
 
@@ -919,8 +1088,7 @@ class EmrEksClient:
                 ) from None
             raise
 
-        results: list[dict[str, Any]] = []
-        for nodegroup_name in nodegroup_names:
+        def _describe(nodegroup_name: str) -> dict[str, Any]:
             try:
                 detail = eks_client.describe_nodegroup(
                     clusterName=cluster_name,
@@ -937,16 +1105,46 @@ class EmrEksClient:
                     ) from None
                 raise
             scaling = detail.get("scalingConfig", {})
-            results.append(
-                {
-                    "name": nodegroup_name,
-                    "capacity_type": str(detail.get("capacityType") or "ON_DEMAND"),
-                    "instance_types": list(detail.get("instanceTypes") or []),
-                    "desired_size": int(scaling.get("desiredSize") or 0),
-                }
-            )
+            return {
+                "name": nodegroup_name,
+                "capacity_type": str(detail.get("capacityType") or "ON_DEMAND"),
+                "instance_types": list(detail.get("instanceTypes") or []),
+                "desired_size": int(scaling.get("desiredSize") or 0),
+                "max_size": int(scaling.get("maxSize") or scaling.get("desiredSize") or 0),
+            }
 
-        return results
+        return _describe_concurrently(_describe, list(nodegroup_names))
+
+    def describe_instance_type_vcpus(self, environment: Environment, instance_types: list[str]) -> dict[str, int]:
+        """Default vCPU count of each EC2 instance type, via ``ec2:DescribeInstanceTypes``.
+
+        Types that EC2 does not report are left out of the result.
+        """
+        names = sorted(set(instance_types))
+        if not names:
+            return {}
+        if self.settings.dry_run_mode:
+            return {name: _DRY_RUN_INSTANCE_VCPUS[name] for name in names if name in _DRY_RUN_INSTANCE_VCPUS}
+        return _cached_aws_lookup(
+            ("ec2_instance_vcpus", environment.customer_role_arn, environment.region, ",".join(names)),
+            lambda: self._describe_instance_type_vcpus(environment, names),
+            ttl_seconds=_INSTANCE_TYPE_CACHE_SECONDS,
+        )
+
+    @staticmethod
+    def _describe_instance_type_vcpus(environment: Environment, names: list[str]) -> dict[str, int]:
+        session = session_for_environment(environment)
+        ec2_client = session.client("ec2", region_name=environment.region)
+        vcpus: dict[str, int] = {}
+        for start in range(0, len(names), _DESCRIBE_INSTANCE_TYPES_MAX):
+            result = ec2_client.describe_instance_types(
+                InstanceTypes=names[start : start + _DESCRIBE_INSTANCE_TYPES_MAX]
+            )
+            for item in result.get("InstanceTypes", []):
+                default_vcpus = item.get("VCpuInfo", {}).get("DefaultVCpus")
+                if item.get("InstanceType") and default_vcpus:
+                    vcpus[str(item["InstanceType"])] = int(default_vcpus)
+        return vcpus
 
     def _list_release_labels_from_emr_containers(self, region: str) -> list[str] | None:
         labels: list[str] = []
@@ -1017,11 +1215,12 @@ class EmrEksClient:
     def _describe_cluster_for_trust_check(
         self,
         *,
+        environment: Environment,
         eks_client: Any,
         cluster_name: str,
     ) -> dict[str, Any]:
         try:
-            return eks_client.describe_cluster(name=cluster_name).get("cluster", {})
+            return describe_eks_cluster(environment, eks_client=eks_client, cluster_name=cluster_name)
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
             if code in {"AccessDeniedException", "AccessDenied", "UnauthorizedOperation"}:
@@ -1031,9 +1230,15 @@ class EmrEksClient:
                 ) from None
             raise
 
-    def _load_role_trust_policy_for_check(self, *, iam_client: Any, role_name: str) -> dict[str, Any]:
+    def _load_role_trust_policy_for_check(
+        self,
+        *,
+        environment: Environment,
+        iam_client: Any,
+        role_name: str,
+    ) -> dict[str, Any]:
         try:
-            role_data = iam_client.get_role(RoleName=role_name)
+            role_data = _get_iam_role(environment, iam_client=iam_client, role_name=role_name)
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
             if code == "NoSuchEntity":
@@ -1097,7 +1302,11 @@ class EmrEksClient:
         session = session_for_environment(environment)
 
         eks_client = session.client("eks", region_name=environment.region)
-        cluster = self._describe_cluster_for_trust_check(eks_client=eks_client, cluster_name=cluster_name)
+        cluster = self._describe_cluster_for_trust_check(
+            environment=environment,
+            eks_client=eks_client,
+            cluster_name=cluster_name,
+        )
         issuer = cluster.get("identity", {}).get("oidc", {}).get("issuer", "")
         if not issuer:
             raise ValueError(
@@ -1110,7 +1319,11 @@ class EmrEksClient:
         sa_pattern = _emr_sa_pattern(environment.eks_namespace, account_id, role_name)
 
         iam_client = session.client("iam")
-        trust_policy = self._load_role_trust_policy_for_check(iam_client=iam_client, role_name=role_name)
+        trust_policy = self._load_role_trust_policy_for_check(
+            environment=environment,
+            iam_client=iam_client,
+            role_name=role_name,
+        )
         statements = trust_policy.get("Statement", [])
 
         has_match = any(
@@ -1212,7 +1425,7 @@ class EmrEksClient:
         session = session_for_environment(environment)
         eks_client = session.client("eks", region_name=environment.region)
         try:
-            cluster = eks_client.describe_cluster(name=cluster_name).get("cluster", {})
+            cluster = describe_eks_cluster(environment, eks_client=eks_client, cluster_name=cluster_name)
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code", "")
             if code in {"AccessDeniedException", "AccessDenied", "UnauthorizedOperation"}:
@@ -1431,11 +1644,16 @@ class EmrEksClient:
     def _describe_virtual_cluster(
         self,
         *,
+        environment: Environment,
         client: Any,
         virtual_cluster_id: str,
     ) -> dict[str, Any]:
         try:
-            result = client.describe_virtual_cluster(id=virtual_cluster_id)
+            result = _cached_aws_lookup(
+                ("emr_virtual_cluster", environment.customer_role_arn, environment.region, virtual_cluster_id),
+                lambda: client.describe_virtual_cluster(id=virtual_cluster_id),
+                ttl_seconds=self.settings.aws_metadata_cache_seconds,
+            )
         except ClientError as exc:
             error = exc.response.get("Error", {})
             code = error.get("Code", "")
@@ -1537,6 +1755,7 @@ class EmrEksClient:
         session = session_for_environment(environment)
         client = session.client("emr-containers", region_name=environment.region)
         virtual_cluster = self._describe_virtual_cluster(
+            environment=environment,
             client=client,
             virtual_cluster_id=virtual_cluster_id,
         )
@@ -1589,58 +1808,25 @@ class EmrEksClient:
         validate_runtime_settings(self.settings)
         session = session_for_environment(environment)
         client = session.client("emr-containers", region_name=environment.region)
-        spark_conf = {**(job.spark_conf_json or {}), **(run.spark_conf_overrides_json or {})}
         project = environment.eks_namespace or environment.id
         cost_center = resolve_cost_center_for_environment(settings=self.settings, environment=environment)
-
-        chargeback_labels = {
-            "sparkpilot-run-id": run.id,
-            "sparkpilot-team": environment.tenant_id,
-            "sparkpilot-project": project,
-            "sparkpilot-cost-center": cost_center,
-        }
-        for label_key, raw_value in chargeback_labels.items():
-            safe_value = _safe_k8s_label_value(raw_value)
-            spark_conf.setdefault(f"spark.kubernetes.driver.label.{label_key}", safe_value)
-            spark_conf.setdefault(f"spark.kubernetes.executor.label.{label_key}", safe_value)
-
-        _yunikorn_queue = getattr(environment, "yunikorn_queue", None)
-        if _yunikorn_queue:
-            spark_conf["spark.kubernetes.driver.annotation.yunikorn.apache.org/queue-name"] = _yunikorn_queue
-            spark_conf["spark.kubernetes.executor.annotation.yunikorn.apache.org/queue-name"] = _yunikorn_queue
-
-        _apply_event_log_defaults(spark_conf, environment)
-
-        spark_submit_driver: dict[str, Any] = {
-            "entryPoint": job.artifact_uri,
-            "entryPointArguments": run.args_overrides_json or job.args_json,
-        }
-        if spark_conf:
-            spark_submit_driver["sparkSubmitParameters"] = " ".join(
-                f"--conf {k}={v}" for k, v in spark_conf.items()
-            )
+        spark_conf = _dispatch_spark_conf(
+            environment,
+            job,
+            run_id=run.id,
+            overrides=run.spark_conf_overrides_json,
+            project=project,
+            cost_center=cost_center,
+        )
 
         def _safe_tag_value(value: str | None) -> str:
             return str(value or "")[:256]
 
-        result = client.start_job_run(
-            virtualClusterId=environment.emr_virtual_cluster_id,
-            name=_emr_job_run_name(job.name, run.id),
-            executionRoleArn=self.settings.emr_execution_role_arn,
-            releaseLabel=self.settings.emr_release_label,
-            jobDriver={
-                "sparkSubmitJobDriver": spark_submit_driver,
-            },
-            configurationOverrides={
-                "monitoringConfiguration": {
-                    "cloudWatchMonitoringConfiguration": {
-                        "logGroupName": log_group,
-                        "logStreamNamePrefix": stream_prefix,
-                    }
-                }
-            },
-            retryPolicyConfiguration={"maxAttempts": job.retry_max_attempts},
-            tags={
+        run_request: dict[str, Any] = {
+            "virtualClusterId": environment.emr_virtual_cluster_id,
+            "name": _emr_job_run_name(job.name, run.id),
+            "retryPolicyConfiguration": {"maxAttempts": job.retry_max_attempts},
+            "tags": {
                 "sparkpilot:run_id": _safe_tag_value(run.id),
                 "sparkpilot:environment_id": _safe_tag_value(environment.id),
                 "sparkpilot:team": _safe_tag_value(environment.tenant_id),
@@ -1649,7 +1835,60 @@ class EmrEksClient:
                 "sparkpilot:namespace": _safe_tag_value(environment.eks_namespace),
                 "sparkpilot:virtual_cluster_id": _safe_tag_value(environment.emr_virtual_cluster_id),
             },
-        )
+        }
+
+        result: dict[str, Any] | None = None
+        job_template_id: str | None = None
+        if self.settings.emr_job_template_mode == "auto":
+            templated = self._job_template_request(
+                client,
+                environment=environment,
+                job=job,
+                run=run,
+                spark_conf=spark_conf,
+                project=project,
+                cost_center=cost_center,
+                log_group=log_group,
+                stream_prefix=stream_prefix,
+            )
+            if templated is not None:
+                job_template_id, template_parameters = templated
+                try:
+                    result = client.start_job_run(
+                        **run_request,
+                        jobTemplateId=job_template_id,
+                        jobTemplateParameters=template_parameters,
+                    )
+                except ClientError as exc:
+                    if exc.response.get("Error", {}).get("Code") != "ResourceNotFoundException":
+                        raise
+                    # Template deleted out of band: forget it and dispatch in full this time.
+                    self._forget_job_template(environment, job_template_id)
+                    job_template_id = None
+
+        if result is None:
+            spark_submit_driver: dict[str, Any] = {
+                "entryPoint": job.artifact_uri,
+                "entryPointArguments": run.args_overrides_json or job.args_json,
+            }
+            if spark_conf:
+                spark_submit_driver["sparkSubmitParameters"] = _spark_submit_parameters(spark_conf)
+            result = client.start_job_run(
+                **run_request,
+                executionRoleArn=self.settings.emr_execution_role_arn,
+                releaseLabel=self.settings.emr_release_label,
+                jobDriver={
+                    "sparkSubmitJobDriver": spark_submit_driver,
+                },
+                configurationOverrides={
+                    "monitoringConfiguration": {
+                        "cloudWatchMonitoringConfiguration": {
+                            "logGroupName": log_group,
+                            "logStreamNamePrefix": stream_prefix,
+                        }
+                    }
+                },
+            )
         metadata = result.get("ResponseMetadata", {})
         return EmrDispatchResult(
             emr_job_run_id=result["id"],
@@ -1658,8 +1897,124 @@ class EmrEksClient:
             driver_log_uri=f"cloudwatch://{log_group}/{stream_prefix}/driver",
             spark_ui_uri=None,
             aws_request_id=metadata.get("RequestId"),
+            job_template_id=job_template_id,
         )
 
+    def _job_template_request(
+        self,
+        client: Any,
+        *,
+        environment: Environment,
+        job: Job,
+        run: Run,
+        spark_conf: dict[str, Any],
+        project: str,
+        cost_center: str,
+        log_group: str,
+        stream_prefix: str,
+    ) -> tuple[str, dict[str, str]] | None:
+        """Return ``(template_id, parameters)`` for a templated dispatch, or None to send the full payload.
+
+        The template holds everything shared by the job's runs in this
+        environment.  Runs pass only the confs that differ from it, appended
+        last so they win exactly as in a full dispatch, plus the log stream
+        prefix.  Runs that override arguments fall back to the full payload.
+        """
+        if run.args_overrides_json and run.args_overrides_json != job.args_json:
+            return None
+        template_conf = _dispatch_spark_conf(
+            environment, job, run_id=None, overrides=None, project=project, cost_center=cost_center
+        )
+        run_conf = _spark_submit_parameters(
+            {key: value for key, value in spark_conf.items() if template_conf.get(key) != value}
+        )
+        if not run_conf or len(run_conf) > _JOB_TEMPLATE_PARAMETER_MAX_LENGTH:
+            return None
+        if "${" in json.dumps([job.artifact_uri, job.args_json, template_conf, spark_conf]):
+            # Literal ${...} in a conf or argument would be read as a template parameter.
+            return None
+
+        template_data: dict[str, Any] = {
+            "executionRoleArn": self.settings.emr_execution_role_arn,
+            "releaseLabel": self.settings.emr_release_label,
+            "jobDriver": {
+                "sparkSubmitJobDriver": {
+                    "entryPoint": job.artifact_uri,
+                    "entryPointArguments": job.args_json,
+                    "sparkSubmitParameters": f"{_spark_submit_parameters(template_conf)} ${{RunSparkConf}}".lstrip(),
+                }
+            },
+            "configurationOverrides": {
+                "monitoringConfiguration": {
+                    "cloudWatchMonitoringConfiguration": {
+                        "logGroupName": log_group,
+                        "logStreamNamePrefix": "${LogStreamPrefix}",
+                    }
+                }
+            },
+            "parameterConfiguration": {
+                "RunSparkConf": {"type": "STRING"},
+                "LogStreamPrefix": {"type": "STRING"},
+            },
+        }
+        template_id = self._ensure_job_template(client, environment=environment, job=job, template_data=template_data)
+        return template_id, {"RunSparkConf": run_conf, "LogStreamPrefix": stream_prefix}
+
+    def _ensure_job_template(
+        self,
+        client: Any,
+        *,
+        environment: Environment,
+        job: Job,
+        template_data: dict[str, Any],
+    ) -> str:
+        digest = hashlib.sha256(
+            json.dumps(
+                {"environment_id": environment.id, "job_id": job.id, "template": template_data},
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        name = f"{_JOB_TEMPLATE_NAME_PREFIX}{digest[:40]}"
+        key = (environment.customer_role_arn, environment.region, name)
+        with _aws_lookup_cache_lock:
+            template_id = _job_template_ids.get(key)
+        if template_id:
+            return template_id
+
+        # Another worker (or an earlier process) may already have registered this shape.
+        for page in client.get_paginator("list_job_templates").paginate():
+            for template in page.get("templates", []):
+                if template.get("name") == name:
+                    template_id = str(template["id"])
+                    break
+            if template_id:
+                break
+        if not template_id:
+            template_id = str(
+                client.create_job_template(
+                    name=name,
+                    clientToken=name,
+                    jobTemplateData=template_data,
+                    tags={
+                        "sparkpilot:environment_id": environment.id,
+                        "sparkpilot:job_id": job.id,
+                        "sparkpilot:managed_by": "sparkpilot-dispatch",
+                    },
+                )["id"]
+            )
+        with _aws_lookup_cache_lock:
+            _job_template_ids[key] = template_id
+        return template_id
+
+    def _forget_job_template(self, environment: Environment, template_id: str) -> None:
+        with _aws_lookup_cache_lock:
+            for key in [
+                key
+                for key, cached_id in _job_template_ids.items()
+                if cached_id == template_id and key[:2] == (environment.customer_role_arn, environment.region)
+            ]:
+                del _job_template_ids[key]
+
     def describe_job_run(self, environment: Environment, run: Run) -> tuple[str, str | None]:
         if run.cancellation_requested:
             return "CANCELLED", None
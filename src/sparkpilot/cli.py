@@ -8,6 +8,7 @@ import httpx
 import typer
 
 from sparkpilot.oidc import OIDCValidationError, fetch_client_credentials_token
+from sparkpilot.schemas import RUN_BATCH_CREATE_MAX_ITEMS
 
 app = typer.Typer(help="SparkPilot CLI")
 
@@ -314,6 +315,35 @@ def run_submit(
         _print_run_preflight(run_payload, err=True)
 
 
+@app.command("run-submit-batch")
+def run_submit_batch(
+    file: str = typer.Option(
+        ...,
+        "--file",
+        help="JSON list of run requests, each with job_id and optionally idempotency_key.",
+    ),
+    base_url: str = typer.Option("http://localhost:8000", "--base-url"),
+) -> None:
+    with open(file, encoding="utf-8") as handle:
+        items = json.load(handle)
+    if not isinstance(items, list) or not all(isinstance(item, dict) and item.get("job_id") for item in items):
+        raise typer.BadParameter("--file must contain a JSON list of objects with job_id.")
+    runs = [{**item, "idempotency_key": _idem(item.get("idempotency_key"))} for item in items]
+    results: list[object] = []
+    with _client(base_url) as c:
+        for start in range(0, len(runs), RUN_BATCH_CREATE_MAX_ITEMS):
+            r = c.post(
+                "/v1/runs:batchCreate",
+                json={"runs": runs[start : start + RUN_BATCH_CREATE_MAX_ITEMS]},
+                headers=_headers(),
+            )
+            r.raise_for_status()
+            results.extend(r.json()["results"])
+    _print_json({"results": results})
+    if any(not isinstance(item, dict) or item.get("status_code", 500) >= 400 for item in results):
+        raise typer.Exit(code=1)
+
+
 @app.command("run-list")
 def run_list(
     tenant_id: str | None = typer.Option(None, "--tenant-id"),
@@ -1,8 +1,11 @@
 """Databricks Jobs API dispatch client for SparkPilot."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import datetime
 import logging
+import threading
 from typing import Any
 
 import httpx
@@ -10,6 +13,15 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Connections are kept alive per workspace and shared by every dispatch and
+# reconcile call for that workspace; the bound keeps a burst of runs from
+# opening an unbounded number of sockets.
+_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+# runs/list returns at most 25 runs per page.  Past a few pages, fetching the
+# remaining runs one by one is cheaper than listing the whole workspace.
+_RUNS_LIST_PAGE_SIZE = 25
+_RUNS_LIST_MAX_PAGES = 8
+
 DATABRICKS_TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 
 DATABRICKS_TERMINAL_LIFECYCLE_STATES = {
@@ -17,6 +29,24 @@ DATABRICKS_TERMINAL_LIFECYCLE_STATES = {
 }
 DATABRICKS_SUCCESS_RESULT_STATES = {"SUCCESS"}
 DATABRICKS_FAILURE_RESULT_STATES = {"FAILED", "TIMEDOUT", "CANCELED", "MAXIMUM_CONCURRENT_RUNS_REACHED"}
+DATABRICKS_PENDING_LIFECYCLE_STATES = {"PENDING", "QUEUED", "BLOCKED", "WAITING_FOR_RETRY"}
+
+
+def databricks_run_state(run: dict[str, Any]) -> tuple[str, str | None]:
+    """Translate a runs/get or runs/list payload into the EMR state vocabulary the reconciler maps."""
+    state = run.get("state") or {}
+    life_cycle_state = str(state.get("life_cycle_state") or "")
+    result_state = str(state.get("result_state") or "")
+    message = state.get("state_message") or None
+    if life_cycle_state in DATABRICKS_PENDING_LIFECYCLE_STATES:
+        return "PENDING", None
+    if life_cycle_state not in DATABRICKS_TERMINAL_LIFECYCLE_STATES:
+        return "RUNNING", None
+    if result_state in DATABRICKS_SUCCESS_RESULT_STATES:
+        return "COMPLETED", None
+    if result_state == "CANCELED":
+        return "CANCELLED", message
+    return "FAILED", message or f"Databricks run ended in {life_cycle_state} {result_state}".strip()
 
 
 @dataclass(slots=True)
@@ -36,8 +66,12 @@ class DatabricksClient:
             base_url=self.workspace_url,
             headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
             timeout=30.0,
+            limits=_POOL_LIMITS,
         )
 
+    def close(self) -> None:
+        self._http.close()
+
     def _post(self, path: str, payload: dict) -> dict:
         response = self._http.post(path, json=payload)
         response.raise_for_status()
@@ -99,15 +133,66 @@ class DatabricksClient:
 
         response = self._post("/api/2.1/jobs/runs/submit", payload)
         run_id = int(response["run_id"])
-        run_details = self._get("/api/2.1/jobs/runs/get", {"run_id": run_id})
-        run_page_url = run_details.get("run_page_url", f"{self.workspace_url}/#job/{run_id}/run/{run_id}")
+        # runs/submit only returns the id.  The reconciler replaces this URL with
+        # the run_page_url Databricks reports once it polls the run.
+        run_page_url = f"{self.workspace_url}/#job/{run_id}/run/{run_id}"
         return DatabricksDispatchResult(databricks_run_id=run_id, run_page_url=run_page_url)
 
     def get_run(self, run_id: int) -> dict[str, Any]:
         return self._get("/api/2.1/jobs/runs/get", {"run_id": run_id})
 
+    def get_runs(self, run_ids: Iterable[int], *, started_after: datetime | None = None) -> dict[int, dict[str, Any]]:
+        """Return run payloads for *run_ids*, read from runs/list pages where possible.
+
+        Listing is bounded to one-time runs started after *started_after*; any
+        run not found within ``_RUNS_LIST_MAX_PAGES`` pages is fetched with runs/get.
+        """
+        wanted = set(run_ids)
+        found: dict[int, dict[str, Any]] = {}
+        params: dict[str, Any] = {"run_type": "SUBMIT_RUN", "limit": _RUNS_LIST_PAGE_SIZE}
+        if started_after is not None:
+            params["start_time_from"] = int(started_after.timestamp() * 1000)
+        for _page in range(_RUNS_LIST_MAX_PAGES):
+            if not wanted - found.keys():
+                break
+            page = self._get("/api/2.1/jobs/runs/list", params)
+            for item in page.get("runs") or []:
+                run_id = item.get("run_id")
+                if run_id in wanted:
+                    found[run_id] = item
+            next_page_token = page.get("next_page_token")
+            if not page.get("has_more") or not next_page_token:
+                break
+            params["page_token"] = next_page_token
+        for run_id in wanted - found.keys():
+            found[run_id] = self.get_run(run_id)
+        return found
+
     def cancel_run(self, run_id: int) -> None:
         self._post("/api/2.1/jobs/runs/cancel", {"run_id": run_id})
 
     def get_run_output(self, run_id: int) -> dict[str, Any]:
         return self._get("/api/2.1/jobs/runs/get-output", {"run_id": run_id})
+
+
+_clients: dict[tuple[str, str], DatabricksClient] = {}
+_clients_lock = threading.Lock()
+
+
+def databricks_client_for(workspace_url: str, token: str) -> DatabricksClient:
+    """Return the pooled client for *workspace_url*, creating it on first use."""
+    key = (workspace_url.rstrip("/"), token)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = DatabricksClient(workspace_url, token)
+            _clients[key] = client
+        return client
+
+
+def _reset_databricks_clients() -> None:
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
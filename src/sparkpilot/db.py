@@ -1,10 +1,13 @@
 from collections.abc import Generator
 import os
 from pathlib import Path
+from typing import Any
 
 from alembic.config import Config
 from alembic.script import ScriptDirectory
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import Table, create_engine, inspect, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from sparkpilot.config import get_settings
@@ -23,6 +26,18 @@ if settings.database_url.startswith("sqlite"):
 engine = create_engine(settings.database_url, **engine_kwargs)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
+_UPSERT_DIALECTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def upsert_insert(bind: Any, table: Table) -> Any | None:
+    """``INSERT`` for *table* that supports ``on_conflict_do_update``, or None.
+
+    *bind* is a connection or engine.  Callers fall back to UPDATE-then-INSERT
+    when the dialect has no upsert construct.
+    """
+    insert_fn = _UPSERT_DIALECTS.get(bind.dialect.name)
+    return insert_fn(table) if insert_fn is not None else None
+
 
 def _is_dev_like_environment() -> bool:
     env = settings.environment.strip().lower()
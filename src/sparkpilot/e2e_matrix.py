@@ -11,9 +11,10 @@ from typing import Any
 import uuid
 
 import httpx
+import numpy as np
 
 from sparkpilot.config import get_settings
-from sparkpilot.services.finops import PricingSnapshot, resolve_runtime_pricing
+from sparkpilot.services.finops import PricingSnapshot, estimate_run_costs_usd_micros, resolve_runtime_pricing
 
 TERMINAL_RUN_STATES = {"succeeded", "failed", "cancelled", "timed_out"}
 PREFLIGHT_STATUSES = {"pass", "warning", "fail"}
@@ -377,14 +378,6 @@ def _runtime_pricing_snapshot() -> PricingSnapshot:
     return resolve_runtime_pricing(get_settings())
 
 
-def _architecture_multiplier(architecture: str, pricing: PricingSnapshot) -> float:
-    if architecture == "arm64":
-        return max(0.0, 1.0 - (pricing.arm64_discount_pct / 100.0))
-    if architecture == "mixed":
-        return max(0.0, 1.0 - (pricing.mixed_discount_pct / 100.0))
-    return 1.0
-
-
 def estimate_run_cost_usd_micros(
     resources: RequestedResources,
     *,
@@ -393,13 +386,15 @@ def estimate_run_cost_usd_micros(
     pricing_snapshot: PricingSnapshot | None = None,
 ) -> int:
     pricing = pricing_snapshot or _runtime_pricing_snapshot()
-    vcpu_seconds = timeout_seconds * resources.total_vcpu()
-    memory_gb_seconds = timeout_seconds * resources.total_memory_gb()
-    estimated_cost_usd = (
-        (vcpu_seconds * pricing.vcpu_usd_per_second)
-        + (memory_gb_seconds * pricing.memory_gb_usd_per_second)
+    return int(
+        estimate_run_costs_usd_micros(
+            duration_seconds=timeout_seconds,
+            vcpu=resources.total_vcpu(),
+            memory_gb=resources.total_memory_gb(),
+            architectures=instance_architecture,
+            pricing=pricing,
+        )
     )
-    return int((estimated_cost_usd * 1_000_000) * _architecture_multiplier(instance_architecture, pricing))
 
 
 def estimate_scenario_cost_usd_micros(
@@ -427,15 +422,20 @@ def estimate_matrix_cost_usd_micros(
     pricing_snapshot: PricingSnapshot | None = None,
 ) -> int:
     snapshot = pricing_snapshot or _runtime_pricing_snapshot()
-    return sum(
-        estimate_scenario_cost_usd_micros(
-            scenario,
-            default_timeout_seconds=config.job_defaults.timeout_seconds,
-            instance_architecture=config.environment.instance_architecture,
-            pricing_snapshot=snapshot,
-        )
-        for scenario in config.scenarios
+    submitted = [scenario for scenario in config.scenarios if scenario.submit_run]
+    if not submitted:
+        return 0
+    per_run = estimate_run_costs_usd_micros(
+        duration_seconds=[
+            scenario.timeout_seconds or config.job_defaults.timeout_seconds for scenario in submitted
+        ],
+        vcpu=[scenario.requested_resources.total_vcpu() for scenario in submitted],
+        memory_gb=[scenario.requested_resources.total_memory_gb() for scenario in submitted],
+        architectures=config.environment.instance_architecture,
+        pricing=snapshot,
     )
+    repeats = np.asarray([scenario.repeat for scenario in submitted], dtype=np.int64)
+    return int((per_run * repeats).sum())
 
 
 def _current_billing_period() -> str:
@@ -0,0 +1,60 @@
+"""Bounded executors for slow, blocking dependencies called from async API handlers.
+
+Starlette runs synchronous ``def`` endpoints on one shared threadpool.  The
+AWS-bound endpoints are ``async def`` and hand their blocking work to a
+dedicated, bounded executor per dependency instead, so a burst of slow
+CloudWatch, IAM or EKS calls queues behind its own workers and cannot starve
+the threadpool that cheap endpoints such as ``GET /v1/runs/{id}`` rely on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
+import threading
+from typing import Any, Callable, Literal, TypeVar
+
+from sparkpilot.config import get_settings
+
+SlowDependency = Literal["cloudwatch", "eks", "iam", "preflight"]
+
+T = TypeVar("T")
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor(dependency: SlowDependency) -> ThreadPoolExecutor:
+    with _executors_lock:
+        executor = _executors.get(dependency)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=get_settings().api_slow_dependency_max_workers,
+                thread_name_prefix=f"sparkpilot-{dependency}",
+            )
+            _executors[dependency] = executor
+        return executor
+
+
+async def run_blocking(
+    dependency: SlowDependency,
+    fn: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Run ``fn(*args, **kwargs)`` on the executor for *dependency* and await it."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await loop.run_in_executor(_executor(dependency), call)
+
+
+def shutdown_executors() -> None:
+    """Stop all dependency executors; they are recreated lazily on next use."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
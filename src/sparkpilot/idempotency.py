@@ -46,6 +46,61 @@ def _replay_or_conflict(existing: IdempotencyRecord, *, fingerprint: str) -> Ide
     )
 
 
+def load_idempotency_records(
+    db: Session,
+    scope_keys: list[tuple[str, str]],
+) -> dict[tuple[str, str], IdempotencyRecord]:
+    """Load the records for many ``(scope, key)`` pairs in one query."""
+    if not scope_keys:
+        return {}
+    wanted = set(scope_keys)
+    rows = db.execute(
+        select(IdempotencyRecord).where(
+            IdempotencyRecord.scope.in_({scope for scope, _key in wanted}),
+            IdempotencyRecord.key.in_({key for _scope, key in wanted}),
+        )
+    ).scalars()
+    return {(row.scope, row.key): row for row in rows if (row.scope, row.key) in wanted}
+
+
+def replay_idempotency_record(existing: IdempotencyRecord, *, payload: Any) -> IdempotentResult:
+    """Replay *existing*, or raise 409 if it was stored for a different payload."""
+    return _replay_or_conflict(existing, fingerprint=_fingerprint(payload))
+
+
+def payload_fingerprint(payload: Any) -> str:
+    return _fingerprint(payload)
+
+
+def add_idempotency_record(
+    db: Session,
+    *,
+    scope: str,
+    key: str,
+    payload: Any,
+    status_code: int,
+    body: dict[str, Any],
+    resource_type: str | None,
+    resource_id: str | None,
+) -> None:
+    """Stage a completed result; the caller's commit makes it visible.
+
+    A concurrent request storing the same scope and key makes that commit
+    raise ``IntegrityError``.
+    """
+    db.add(
+        IdempotencyRecord(
+            scope=scope,
+            key=key,
+            fingerprint=_fingerprint(payload),
+            response_json=json.dumps(body, default=str),
+            status_code=status_code,
+            resource_type=resource_type,
+            resource_id=resource_id,
+        )
+    )
+
+
 def with_idempotency(
     db: Session,
     *,
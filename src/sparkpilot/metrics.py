@@ -125,7 +125,15 @@ def jwks_refresh_stats() -> dict[str, Any]:
         verifier = _oidc_verifier()
         return verifier.jwks_refresh_stats
     except Exception:
-        return {"total": 0, "forced": 0, "throttled": 0}
+        return {
+            "total": 0,
+            "forced": 0,
+            "throttled": 0,
+            "background": 0,
+            "failed": 0,
+            "last_refresh_latency_ms": 0,
+            "staleness_seconds": -1,
+        }
 
 
 def collect_all_kpis(db: Session, *, since: datetime | None = None) -> dict[str, Any]:
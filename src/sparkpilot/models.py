@@ -3,9 +3,11 @@ from datetime import UTC, datetime
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     CheckConstraint,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -332,6 +334,23 @@ class ProvisioningOperation(Base):
     )
 
 
+class ProvisioningCheckpoint(Base):
+    __tablename__ = "provisioning_checkpoints"
+
+    operation_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("provisioning_operations.id"), primary_key=True
+    )
+    environment_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    checkpoint_json: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=_utc_now,
+        onupdate=_utc_now,
+        nullable=False,
+    )
+
+
 class Job(Base):
     __tablename__ = "jobs"
 
@@ -482,6 +501,24 @@ class Run(Base):
     )
 
 
+class RunStateEvent(Base):
+    __tablename__ = "run_state_events"
+    __table_args__ = (
+        Index("ix_run_state_events_tenant_id_id", "tenant_id", "id"),
+        Index("ix_run_state_events_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    environment_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    tenant_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    created_by_actor: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    state: Mapped[str] = mapped_column(String(32), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utc_now, nullable=False
+    )
+
+
 class RunDiagnostic(Base):
     __tablename__ = "run_diagnostics"
 
@@ -525,6 +562,13 @@ class CostAllocation(Base):
     __tablename__ = "cost_allocations"
     __table_args__ = (
         Index("ix_cost_allocations_team_period", "team", "billing_period"),
+        Index(
+            "ix_cost_allocations_cur_pending",
+            "cur_next_attempt_at",
+            sqlite_where=text("actual_cost_usd_micros IS NULL"),
+            postgresql_where=text("actual_cost_usd_micros IS NULL"),
+        ),
+        Index("ix_cost_allocations_cur_query", "cur_query_execution_id"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_new_id)
@@ -553,6 +597,15 @@ class CostAllocation(Base):
     cur_reconciled_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    cur_reconcile_attempts: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    cur_next_attempt_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    cur_query_execution_id: Mapped[str | None] = mapped_column(
+        String(128), nullable=True
+    )
     spot_cost_usd_micros: Mapped[int | None] = mapped_column(Integer, nullable=True)
     ondemand_cost_usd_micros: Mapped[int | None] = mapped_column(Integer, nullable=True)
     spot_savings_usd_micros: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -567,6 +620,71 @@ class CostAllocation(Base):
     )
 
 
+class CostRollup(Base):
+    __tablename__ = "cost_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "team",
+            "cost_center",
+            "environment_id",
+            "billing_period",
+            "usage_date",
+            name="uq_cost_rollups_key",
+        ),
+        Index("ix_cost_rollups_team_period", "team", "billing_period"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_new_id)
+    team: Mapped[str] = mapped_column(String(255), nullable=False)
+    cost_center: Mapped[str] = mapped_column(String(255), nullable=False)
+    environment_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    tenant_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    billing_period: Mapped[str] = mapped_column(String(7), nullable=False)  # YYYY-MM
+    usage_date: Mapped[str] = mapped_column(String(10), nullable=False)  # YYYY-MM-DD
+    run_count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    reconciled_run_count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    estimated_vcpu_seconds: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    estimated_memory_gb_seconds: Mapped[int] = mapped_column(
+        BigInteger, default=0, nullable=False
+    )
+    estimated_cost_usd_micros: Mapped[int] = mapped_column(
+        BigInteger, default=0, nullable=False
+    )
+    actual_cost_usd_micros: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    effective_cost_usd_micros: Mapped[int] = mapped_column(
+        BigInteger, default=0, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=_utc_now,
+        onupdate=_utc_now,
+        nullable=False,
+    )
+
+
+class RegionPricingSnapshot(Base):
+    __tablename__ = "region_pricing_snapshots"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_new_id)
+    region: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
+    source: Mapped[str] = mapped_column(String(255), nullable=False)
+    vcpu_usd_per_second: Mapped[float] = mapped_column(Float, nullable=False)
+    memory_gb_usd_per_second: Mapped[float] = mapped_column(Float, nullable=False)
+    arm64_discount_pct: Mapped[float] = mapped_column(Float, nullable=False)
+    mixed_discount_pct: Mapped[float] = mapped_column(Float, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utc_now, nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=_utc_now,
+        onupdate=_utc_now,
+        nullable=False,
+    )
+
+
 class TeamBudget(Base):
     __tablename__ = "team_budgets"
 
@@ -675,6 +793,9 @@ class JobTemplate(Base):
 
 class InteractiveEndpoint(Base):
     __tablename__ = "interactive_endpoints"
+    __table_args__ = (
+        Index("ix_interactive_endpoints_pool", "environment_id", "pooled"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_new_id)
     environment_id: Mapped[str] = mapped_column(
@@ -694,6 +815,14 @@ class InteractiveEndpoint(Base):
     certificate_arn: Mapped[str | None] = mapped_column(String(1024), nullable=True)
     endpoint_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
     created_by_actor: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Warm-pool endpoints are created and torn down by the interactive-pool
+    # worker; a lease hands one to a single actor until it goes idle.
+    pooled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    leased_by_actor: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    leased_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_activity_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=_utc_now, nullable=False
     )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+import hashlib
 import json
 import logging
 import os
@@ -67,10 +69,19 @@ def _read_uri_json(uri: str, *, timeout_seconds: float) -> dict[str, Any]:
 _DEFAULT_JWKS_MIN_REFRESH_INTERVAL_SECONDS = 10  # min seconds between forced refreshes
 _DEFAULT_JWKS_THROTTLE_WINDOW_SECONDS = 60  # sliding window for counting forced refreshes
 _DEFAULT_JWKS_THROTTLE_MAX_REFRESHES = 5  # max forced refreshes per sliding window
+_JWKS_PREFETCH_LEAD_FRACTION = 0.2  # background refresh starts in the last 20% of the TTL
+_VERIFIED_TOKEN_CACHE_MAX_ENTRIES = 4096  # memoized verified tokens per verifier
 
 
 class OIDCTokenVerifier:
-    """JWT verification backed by OIDC JWKS with throttled refresh."""
+    """JWT verification backed by OIDC JWKS with throttled refresh.
+
+    The keyset is refreshed in the background once it enters the last
+    ``_JWKS_PREFETCH_LEAD_FRACTION`` of its TTL, and requests keep using the
+    current keys while that single refresh runs.  Past the TTL the last good
+    keyset is still served for ``jwks_stale_grace_seconds`` (covering IdP
+    outages); only after that does a request block on a synchronous fetch.
+    """
 
     def __init__(
         self,
@@ -83,6 +94,7 @@ class OIDCTokenVerifier:
         jwks_min_refresh_interval_seconds: float = _DEFAULT_JWKS_MIN_REFRESH_INTERVAL_SECONDS,
         jwks_throttle_window_seconds: float = _DEFAULT_JWKS_THROTTLE_WINDOW_SECONDS,
         jwks_throttle_max_refreshes: int = _DEFAULT_JWKS_THROTTLE_MAX_REFRESHES,
+        jwks_stale_grace_seconds: float = 0.0,
     ) -> None:
         self.issuer = issuer.strip()
         self.audience = audience.strip()
@@ -91,6 +103,12 @@ class OIDCTokenVerifier:
         self.http_timeout_seconds = max(1.0, http_timeout_seconds)
         self._cached_jwks: dict[str, jwt.PyJWK] = {}
         self._cached_at_monotonic: float = 0.0
+        self.jwks_stale_grace_seconds = max(0.0, jwks_stale_grace_seconds)
+
+        # Background (stale-while-revalidate) refresh state
+        self._background_refresh_thread: threading.Thread | None = None
+        self._background_retry_at_monotonic: float = 0.0
+        self._background_lock = threading.Lock()
 
         # Throttle state for forced JWKS refreshes
         self._jwks_min_refresh_interval = max(1.0, jwks_min_refresh_interval_seconds)
@@ -100,15 +118,74 @@ class OIDCTokenVerifier:
         self._forced_refresh_timestamps: list[float] = []
         self._refresh_lock = threading.Lock()
 
+        # Verified tokens keyed by SHA-256 digest, kept until their ``exp`` claim.
+        self._verified_tokens: OrderedDict[str, tuple[float, OIDCIdentity]] = OrderedDict()
+        self._verified_tokens_lock = threading.Lock()
+
         # Telemetry counters
         self.jwks_refresh_total: int = 0
         self.jwks_refresh_forced: int = 0
         self.jwks_refresh_throttled: int = 0
+        self.jwks_refresh_background: int = 0
+        self.jwks_refresh_failed: int = 0
+        self.jwks_last_refresh_latency_ms: int = 0
+
+    def _jwks_age_seconds(self) -> float:
+        return time.monotonic() - self._cached_at_monotonic
 
     def _jwks_stale(self) -> bool:
         if not self._cached_jwks:
             return True
-        return (time.monotonic() - self._cached_at_monotonic) >= self.jwks_cache_ttl_seconds
+        return self._jwks_age_seconds() >= self.jwks_cache_ttl_seconds
+
+    def _jwks_expired(self) -> bool:
+        """True when the keyset is missing or past its TTL plus the stale grace period."""
+        if not self._cached_jwks:
+            return True
+        return self._jwks_age_seconds() >= (
+            self.jwks_cache_ttl_seconds + self.jwks_stale_grace_seconds
+        )
+
+    def _jwks_due_for_prefetch(self) -> bool:
+        prefetch_at = self.jwks_cache_ttl_seconds * (1.0 - _JWKS_PREFETCH_LEAD_FRACTION)
+        return bool(self._cached_jwks) and self._jwks_age_seconds() >= prefetch_at
+
+    def _schedule_background_refresh(self) -> None:
+        """Start one background JWKS refresh unless one is running or backing off."""
+        with self._background_lock:
+            thread = self._background_refresh_thread
+            if thread is not None and thread.is_alive():
+                return
+            if time.monotonic() < self._background_retry_at_monotonic:
+                return
+            thread = threading.Thread(
+                target=self._background_refresh,
+                name="sparkpilot-jwks-refresh",
+                daemon=True,
+            )
+            self._background_refresh_thread = thread
+            thread.start()
+
+    def _background_refresh(self) -> None:
+        self.jwks_refresh_background += 1
+        try:
+            self._refresh_jwks()
+        except OIDCValidationError as exc:
+            # Keep serving the last good keyset; retry after the forced-refresh interval.
+            self._background_retry_at_monotonic = (
+                time.monotonic() + self._jwks_min_refresh_interval
+            )
+            logger.warning(
+                "Background JWKS refresh failed; serving cached keys (age=%.0fs): %s",
+                self._jwks_age_seconds(),
+                exc,
+            )
+
+    def _ensure_jwks(self) -> None:
+        if self._jwks_expired():
+            self._refresh_jwks(only_if_expired=True)
+        elif self._jwks_due_for_prefetch():
+            self._schedule_background_refresh()
 
     def _is_forced_refresh_allowed(self) -> bool:
         """Check whether a forced JWKS refresh is allowed by throttle policy.
@@ -135,13 +212,17 @@ class OIDCTokenVerifier:
         self._forced_refresh_timestamps.append(now)
         self.jwks_refresh_forced += 1
 
-    def _refresh_jwks(self, *, forced: bool = False) -> bool:
+    def _refresh_jwks(self, *, forced: bool = False, only_if_expired: bool = False) -> bool:
         """Refresh cached JWKS keys.
 
         When ``forced`` is True the throttle policy is checked first.
+        When ``only_if_expired`` is True the fetch is skipped if another thread
+        refreshed the keyset while this one waited for the lock.
         Returns True if a refresh was actually performed, False if throttled.
         """
         with self._refresh_lock:
+            if only_if_expired and not self._jwks_expired():
+                return True
             if forced:
                 if not self._is_forced_refresh_allowed():
                     self.jwks_refresh_throttled += 1
@@ -156,28 +237,19 @@ class OIDCTokenVerifier:
                     return False
                 self._record_forced_refresh()
 
+            started = time.monotonic()
             try:
-                payload = _read_uri_json(self.jwks_uri, timeout_seconds=self.http_timeout_seconds)
-            except (httpx.HTTPError, OSError, ValueError) as exc:
-                raise OIDCValidationError(f"OIDC JWKS retrieval failed: {exc}") from exc
-            keys = payload.get("keys")
-            if not isinstance(keys, list) or not keys:
-                raise OIDCValidationError("OIDC_JWKS_URI did not return a non-empty 'keys' array.")
-
-            parsed: dict[str, jwt.PyJWK] = {}
-            fallback_index = 0
-            for item in keys:
-                if not isinstance(item, dict):
-                    continue
-                kid = str(item.get("kid") or "")
-                if not kid:
-                    kid = f"__anon_{fallback_index}"
-                    fallback_index += 1
-                parsed[kid] = jwt.PyJWK.from_dict(item)
-            if not parsed:
-                raise OIDCValidationError("OIDC_JWKS_URI did not include usable JWK keys.")
+                parsed = self._fetch_jwks()
+            except OIDCValidationError:
+                self.jwks_refresh_failed += 1
+                raise
+            finally:
+                self.jwks_last_refresh_latency_ms = int((time.monotonic() - started) * 1000)
             self._cached_jwks = parsed
             self._cached_at_monotonic = time.monotonic()
+            # Re-verify memoized tokens against the freshly fetched keyset.
+            with self._verified_tokens_lock:
+                self._verified_tokens.clear()
             self.jwks_refresh_total += 1
             logger.info(
                 "JWKS refreshed (forced=%s, total=%d, forced_count=%d, throttled=%d)",
@@ -188,6 +260,29 @@ class OIDCTokenVerifier:
             )
             return True
 
+    def _fetch_jwks(self) -> dict[str, jwt.PyJWK]:
+        try:
+            payload = _read_uri_json(self.jwks_uri, timeout_seconds=self.http_timeout_seconds)
+        except (httpx.HTTPError, OSError, ValueError) as exc:
+            raise OIDCValidationError(f"OIDC JWKS retrieval failed: {exc}") from exc
+        keys = payload.get("keys")
+        if not isinstance(keys, list) or not keys:
+            raise OIDCValidationError("OIDC_JWKS_URI did not return a non-empty 'keys' array.")
+
+        parsed: dict[str, jwt.PyJWK] = {}
+        fallback_index = 0
+        for item in keys:
+            if not isinstance(item, dict):
+                continue
+            kid = str(item.get("kid") or "")
+            if not kid:
+                kid = f"__anon_{fallback_index}"
+                fallback_index += 1
+            parsed[kid] = jwt.PyJWK.from_dict(item)
+        if not parsed:
+            raise OIDCValidationError("OIDC_JWKS_URI did not include usable JWK keys.")
+        return parsed
+
     def _resolve_signing_key(self, token: str) -> tuple[str, jwt.PyJWK]:
         try:
             header = jwt.get_unverified_header(token)
@@ -197,8 +292,7 @@ class OIDCTokenVerifier:
         if algorithm not in SUPPORTED_JWT_ALGORITHMS:
             raise OIDCValidationError(f"Unsupported JWT signing algorithm '{algorithm}'.")
 
-        if self._jwks_stale():
-            self._refresh_jwks()
+        self._ensure_jwks()
 
         kid = str(header.get("kid") or "")
         if kid and kid in self._cached_jwks:
@@ -238,7 +332,48 @@ class OIDCTokenVerifier:
             return client_id == self.audience
         return False
 
+    @staticmethod
+    def _token_digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def cached_identity(self, token: str) -> OIDCIdentity | None:
+        """Return the identity for a previously verified, unexpired *token*.
+
+        Memoized results are only served while the JWKS cache is fresh, so key
+        rotation picked up by a refresh also invalidates them.
+        """
+        if self._jwks_stale():
+            return None
+        if self._jwks_due_for_prefetch():
+            self._schedule_background_refresh()
+        digest = self._token_digest(token)
+        with self._verified_tokens_lock:
+            entry = self._verified_tokens.get(digest)
+            if entry is None:
+                return None
+            expires_at, identity = entry
+            if expires_at <= time.time():
+                self._verified_tokens.pop(digest, None)
+                return None
+            self._verified_tokens.move_to_end(digest)
+            return identity
+
+    def _remember_identity(self, token: str, identity: OIDCIdentity) -> None:
+        try:
+            expires_at = float(identity.claims["exp"])
+        except (KeyError, TypeError, ValueError):
+            return
+        digest = self._token_digest(token)
+        with self._verified_tokens_lock:
+            self._verified_tokens[digest] = (expires_at, identity)
+            self._verified_tokens.move_to_end(digest)
+            while len(self._verified_tokens) > _VERIFIED_TOKEN_CACHE_MAX_ENTRIES:
+                self._verified_tokens.popitem(last=False)
+
     def verify_access_token(self, token: str) -> OIDCIdentity:
+        cached = self.cached_identity(token)
+        if cached is not None:
+            return cached
         algorithm, signing_key = self._resolve_signing_key(token)
         try:
             claims = jwt.decode(
@@ -289,15 +424,29 @@ class OIDCTokenVerifier:
         subject = str(claims.get("sub") or "").strip()
         if not subject:
             raise OIDCValidationError("OIDC JWT is missing required subject claim.")
-        return OIDCIdentity(subject=subject, claims=claims)
+        identity = OIDCIdentity(subject=subject, claims=claims)
+        self._remember_identity(token, identity)
+        return identity
 
     @property
     def jwks_refresh_stats(self) -> dict[str, int]:
-        """Return telemetry counters for JWKS refresh activity."""
+        """Return telemetry counters for JWKS refresh activity.
+
+        ``staleness_seconds`` is how far past its TTL the served keyset is
+        (0 while fresh, -1 before the first successful fetch).
+        """
+        if self._cached_jwks:
+            staleness = max(0, int(self._jwks_age_seconds() - self.jwks_cache_ttl_seconds))
+        else:
+            staleness = -1
         return {
             "total": self.jwks_refresh_total,
             "forced": self.jwks_refresh_forced,
             "throttled": self.jwks_refresh_throttled,
+            "background": self.jwks_refresh_background,
+            "failed": self.jwks_refresh_failed,
+            "last_refresh_latency_ms": self.jwks_last_refresh_latency_ms,
+            "staleness_seconds": staleness,
         }
 
 
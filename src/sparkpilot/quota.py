@@ -1,4 +1,4 @@
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from sparkpilot.exceptions import EntityNotFoundError, QuotaExceededError
@@ -24,27 +24,52 @@ def lock_environment_for_quota(db: Session, environment_id: str) -> Environment:
     return env
 
 
-def enforce_quota_for_run(db: Session, env: Environment, requested_resources: dict[str, int]) -> None:
-    active_count = db.execute(
-        select(func.count(Run.id)).where(
-            Run.environment_id == env.id,
-            Run.state.in_(ACTIVE_RUN_STATES),
-        )
-    ).scalar_one()
-    if active_count >= env.max_concurrent_runs:
-        raise QuotaExceededError(
-            f"Concurrent run limit reached ({env.max_concurrent_runs})."
-        )
-
-    active_runs = db.execute(
-        select(Run.requested_resources_json).where(
-            Run.environment_id == env.id,
-            Run.state.in_(ACTIVE_RUN_STATES),
-        )
+def lock_environments_for_quota(db: Session, environment_ids: set[str]) -> dict[str, Environment]:
+    """Lock several environments in one query, in id order so batches cannot deadlock."""
+    if not environment_ids:
+        return {}
+    rows = db.execute(
+        select(Environment)
+        .where(Environment.id.in_(environment_ids))
+        .order_by(Environment.id)
+        .with_for_update()
     ).scalars()
-    active_vcpu = sum(_run_vcpu(item or {}) for item in active_runs)
-    requested_vcpu = _run_vcpu(requested_resources)
-    if active_vcpu + requested_vcpu > env.max_vcpu:
-        raise QuotaExceededError(
-            f"vCPU quota exceeded ({env.max_vcpu})."
+    return {env.id: env for env in rows}
+
+
+class EnvironmentQuotaUsage:
+    """Active run count and vCPU of a locked environment.
+
+    ``admit`` checks one more run against the environment limits and counts
+    it, so a batch of submissions is admitted against a single usage read.
+    """
+
+    def __init__(self, db: Session, env: Environment) -> None:
+        self.env = env
+        active_runs = list(
+            db.execute(
+                select(Run.requested_resources_json).where(
+                    Run.environment_id == env.id,
+                    Run.state.in_(ACTIVE_RUN_STATES),
+                )
+            ).scalars()
         )
+        self.active_count = len(active_runs)
+        self.active_vcpu = sum(_run_vcpu(item or {}) for item in active_runs)
+
+    def admit(self, requested_resources: dict[str, int]) -> None:
+        if self.active_count >= self.env.max_concurrent_runs:
+            raise QuotaExceededError(
+                f"Concurrent run limit reached ({self.env.max_concurrent_runs})."
+            )
+        requested_vcpu = _run_vcpu(requested_resources)
+        if self.active_vcpu + requested_vcpu > self.env.max_vcpu:
+            raise QuotaExceededError(
+                f"vCPU quota exceeded ({self.env.max_vcpu})."
+            )
+        self.active_count += 1
+        self.active_vcpu += requested_vcpu
+
+
+def enforce_quota_for_run(db: Session, env: Environment, requested_resources: dict[str, int]) -> None:
+    EnvironmentQuotaUsage(db, env).admit(requested_resources)
@@ -0,0 +1,204 @@
+"""Per-process fan-out of run state events to long-poll and SSE clients.
+
+One task per event loop tails ``run_state_events`` every
+``SPARKPILOT_RUN_EVENTS_POLL_SECONDS`` while anyone is listening and hands each
+new event to the ``/v1/runs/{id}/wait`` requests and ``/v1/run-events`` streams
+it concerns.  The database query count is therefore independent of how many
+clients are waiting, and a state committed by the reconciler reaches them
+within one tail interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Collection
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import time
+import weakref
+
+from starlette.concurrency import run_in_threadpool
+
+from sparkpilot.config import get_settings
+from sparkpilot.db import SessionLocal
+from sparkpilot.services import latest_run_state_event_id, list_run_state_events
+
+logger = logging.getLogger(__name__)
+
+# Event ids are assigned at flush and become visible at commit, so the tail can
+# pass an id whose transaction is still open.  Skipped ids are re-read for this
+# long; ids still missing afterwards belong to rolled-back transactions.
+_LATE_COMMIT_WINDOW_SECONDS = 30.0
+_PENDING_EVENT_IDS_MAX = 1000
+_SEEN_EVENT_IDS_MAX = 100_000
+_SUBSCRIBER_QUEUE_MAX = 10_000
+
+
+@dataclass(frozen=True)
+class RunStateChange:
+    id: int
+    run_id: str
+    environment_id: str
+    tenant_id: str
+    created_by_actor: str | None
+    state: str
+    created_at: datetime
+
+
+def read_run_state_changes(
+    *,
+    after_id: int,
+    missing_ids: Collection[int] = (),
+    tenant_id: str | None = None,
+) -> list[RunStateChange]:
+    with SessionLocal() as db:
+        rows = list_run_state_events(db, after_id=after_id, missing_ids=missing_ids, tenant_id=tenant_id)
+        return [
+            RunStateChange(
+                id=row.id,
+                run_id=row.run_id,
+                environment_id=row.environment_id,
+                tenant_id=row.tenant_id,
+                created_by_actor=row.created_by_actor,
+                state=row.state,
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
+
+
+def _read_latest_event_id() -> int:
+    with SessionLocal() as db:
+        return latest_run_state_event_id(db)
+
+
+class RunEventSubscription:
+    """Queue of state changes for one event-stream client."""
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[RunStateChange] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_MAX)
+        # Set when the client fell too far behind; the stream ends and the
+        # client resumes from the database with Last-Event-ID.
+        self.overflowed = False
+
+
+class RunEventHub:
+    def __init__(self) -> None:
+        self._cursor = 0
+        self._seen: OrderedDict[int, None] = OrderedDict()
+        # id -> monotonic deadline for ids the tail skipped that may still commit.
+        self._pending: OrderedDict[int, float] = OrderedDict()
+        self._run_waiters: dict[str, set[asyncio.Future[RunStateChange]]] = {}
+        self._subscriptions: set[RunEventSubscription] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._start_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def watch_run(self, run_id: str) -> AsyncIterator[asyncio.Future[RunStateChange]]:
+        """Yield a future resolved by the next state change of *run_id*.
+
+        Register before reading the run so that a change committed between the
+        read and the wait is not missed.
+        """
+        future: asyncio.Future[RunStateChange] = asyncio.get_running_loop().create_future()
+        self._run_waiters.setdefault(run_id, set()).add(future)
+        try:
+            await self._ensure_tailing()
+            yield future
+        finally:
+            waiters = self._run_waiters.get(run_id)
+            if waiters is not None:
+                waiters.discard(future)
+                if not waiters:
+                    self._run_waiters.pop(run_id, None)
+            self._stop_if_idle()
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[RunEventSubscription]:
+        subscription = RunEventSubscription()
+        self._subscriptions.add(subscription)
+        try:
+            await self._ensure_tailing()
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+            self._stop_if_idle()
+
+    def _has_listeners(self) -> bool:
+        return bool(self._run_waiters or self._subscriptions)
+
+    def _stop_if_idle(self) -> None:
+        if not self._has_listeners() and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _ensure_tailing(self) -> None:
+        async with self._start_lock:
+            if self._task is not None and not self._task.done():
+                return
+            self._cursor = max(self._cursor, await run_in_threadpool(_read_latest_event_id))
+            self._task = asyncio.ensure_future(self._tail())
+
+    async def _tail(self) -> None:
+        poll_seconds = get_settings().run_events_poll_seconds
+        while True:
+            await asyncio.sleep(poll_seconds)
+            self._expire_pending(time.monotonic())
+            try:
+                changes = await run_in_threadpool(
+                    read_run_state_changes, after_id=self._cursor, missing_ids=list(self._pending)
+                )
+            except Exception:  # noqa: BLE001 -- keep tailing; waiters fall back to their timeouts
+                logger.exception("Failed to read run state events; retrying.")
+                continue
+            self._dispatch(changes)
+
+    def _expire_pending(self, now: float) -> None:
+        while self._pending and next(iter(self._pending.values())) <= now:
+            self._pending.popitem(last=False)
+
+    def _track_skipped_ids(self, next_id: int) -> None:
+        deadline = time.monotonic() + _LATE_COMMIT_WINDOW_SECONDS
+        first = max(self._cursor + 1, next_id - _PENDING_EVENT_IDS_MAX)
+        for skipped_id in range(first, next_id):
+            if skipped_id not in self._seen:
+                self._pending[skipped_id] = deadline
+        while len(self._pending) > _PENDING_EVENT_IDS_MAX:
+            self._pending.popitem(last=False)
+
+    def _dispatch(self, changes: list[RunStateChange]) -> None:
+        for change in changes:
+            if change.id in self._seen:
+                continue
+            self._seen[change.id] = None
+            if len(self._seen) > _SEEN_EVENT_IDS_MAX:
+                self._seen.popitem(last=False)
+            self._pending.pop(change.id, None)
+            if change.id > self._cursor + 1:
+                self._track_skipped_ids(change.id)
+            self._cursor = max(self._cursor, change.id)
+            for future in self._run_waiters.get(change.run_id, ()):
+                if not future.done():
+                    future.set_result(change)
+            for subscription in list(self._subscriptions):
+                try:
+                    subscription.queue.put_nowait(change)
+                except asyncio.QueueFull:
+                    subscription.overflowed = True
+                    self._subscriptions.discard(subscription)
+
+
+_hubs: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RunEventHub] = weakref.WeakKeyDictionary()
+
+
+def run_event_hub() -> RunEventHub:
+    """Return the hub for the running event loop."""
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = RunEventHub()
+        _hubs[loop] = hub
+    return hub
@@ -419,6 +419,45 @@ class RunResponse(BaseModel):
     updated_at: datetime
 
 
+RUN_BATCH_GET_MAX_IDS = 500
+
+
+class RunBatchGetRequest(BaseModel):
+    run_ids: list[str] = Field(min_length=1, max_length=RUN_BATCH_GET_MAX_IDS)
+    changed_since: str | None = Field(default=None, max_length=64)
+
+
+class RunBatchGetResponse(BaseModel):
+    runs: list[RunResponse]
+    missing_run_ids: list[str]
+    changed_since: str
+
+
+RUN_BATCH_CREATE_MAX_ITEMS = 500
+
+
+class RunBatchCreateItem(RunCreateRequest):
+    job_id: str
+    idempotency_key: str = Field(min_length=1, max_length=255)
+
+
+class RunBatchCreateRequest(BaseModel):
+    runs: list[RunBatchCreateItem] = Field(min_length=1, max_length=RUN_BATCH_CREATE_MAX_ITEMS)
+
+
+class RunBatchCreateResult(BaseModel):
+    job_id: str
+    idempotency_key: str
+    status_code: int
+    replayed: bool = False
+    run: RunResponse | None = None
+    detail: str | None = None
+
+
+class RunBatchCreateResponse(BaseModel):
+    results: list[RunBatchCreateResult]
+
+
 class LogsResponse(BaseModel):
     run_id: str
     log_group: str | None
@@ -507,9 +546,40 @@ class CostShowbackResponse(BaseModel):
     total_estimated_cost_usd_micros: int
     total_actual_cost_usd_micros: int
     total_effective_cost_usd_micros: int
+    active_run_reserved_cost_usd_micros: int | None = None
     items: list[CostShowbackItem]
 
 
+class CostWhatIfRequest(BaseModel):
+    team: str = Field(min_length=1, max_length=255)
+    period_start: str = Field(pattern=r"^\d{4}-\d{2}$")
+    period_end: str = Field(pattern=r"^\d{4}-\d{2}$")
+    instance_architecture: Literal["x86_64", "arm64", "mixed"] | None = None
+    vcpu_usd_per_second: float | None = Field(default=None, gt=0)
+    memory_gb_usd_per_second: float | None = Field(default=None, gt=0)
+    arm64_discount_pct: float | None = Field(default=None, ge=0, le=100)
+    mixed_discount_pct: float | None = Field(default=None, ge=0, le=100)
+
+
+class CostWhatIfPeriod(BaseModel):
+    billing_period: str
+    run_count: int
+    baseline_cost_usd_micros: int
+    scenario_cost_usd_micros: int
+
+
+class CostWhatIfResponse(BaseModel):
+    team: str
+    period_start: str
+    period_end: str
+    run_count: int
+    pricing_source: str
+    baseline_cost_usd_micros: int
+    scenario_cost_usd_micros: int
+    delta_cost_usd_micros: int
+    periods: list[CostWhatIfPeriod]
+
+
 class EmrReleaseResponse(BaseModel):
     id: str
     release_label: str
@@ -566,6 +636,10 @@ class InteractiveEndpointResponse(BaseModel):
     certificate_arn: str | None
     endpoint_url: str | None
     created_by_actor: str | None
+    pooled: bool = False
+    leased_by_actor: str | None = None
+    leased_at: datetime | None = None
+    last_activity_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
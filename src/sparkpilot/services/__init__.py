@@ -3,13 +3,18 @@
 Sub-modules
 -----------
 _helpers        Shared constants, time utilities, entity lookups.
+access_cache    Process-local cache of resolved API access contexts.
+cost_rollups    Incremental cost rollups (showback/budget totals) and Parquet export.
 crud            Entity CRUD operations (tenants, teams, environments, jobs, runs).
 diagnostics     Run diagnostic pattern matching and CloudWatch log analysis.
+dispatch_capacity  Per-environment vCPU headroom used to gate scheduler dispatch.
 emr_releases    EMR release label management and synchronisation.
 finops          Financial operations: budgets, cost allocation, CUR reconciliation.
 golden_paths    Golden path template management and seeding.
+interactive_pool  Warm pool of EMR on EKS managed endpoints for interactive sessions.
 preflight           Environment and run preflight checks with TTL caching.
 preflight_byoc      BYOC-Lite specific preflight checks (split from preflight).
+run_events      Run state transition log for run wait and event-stream endpoints.
 workers             Background worker processes — thin re-export facade.
 workers_common      Shared worker claim/release helpers and transient error detection.
 workers_provisioning  Provisioning worker.
@@ -31,6 +36,21 @@ from sparkpilot.terraform_orchestrator import TerraformOrchestrator  # noqa: F40
 # --- _helpers (only externally-consumed names) ---
 from sparkpilot.services._helpers import model_to_dict  # noqa: F401
 
+# --- access_cache ---
+from sparkpilot.services.access_cache import (  # noqa: F401
+    get_cached_access_context,
+    identity_version,
+    invalidate_access_contexts,
+    store_access_context,
+)
+
+# --- cost_rollups ---
+from sparkpilot.services.cost_rollups import (  # noqa: F401
+    export_cost_rollups_once,
+    export_cost_rollups_parquet,
+    rebuild_cost_rollups,
+)
+
 # --- crud ---
 from sparkpilot.services.crud import (  # noqa: F401
     add_team_environment_scope,
@@ -41,6 +61,7 @@ from sparkpilot.services.crud import (  # noqa: F401
     create_job,
     create_or_update_user_identity,
     create_run,
+    create_runs,
     create_team,
     create_tenant,
     fetch_run_logs,
@@ -48,14 +69,20 @@ from sparkpilot.services.crud import (  # noqa: F401
     get_environment_preflight,
     get_provisioning_operation,
     get_run,
+    get_run_columns_by_ids,
+    get_runs_by_ids,
     get_usage,
+    list_environment_columns,
     list_environments,
+    list_job_columns,
     list_jobs,
+    list_run_versions,
     list_runs,
     list_team_environment_scopes,
     list_teams,
     list_user_identities,
     retry_environment_provisioning,
+    RunSubmission,
 )
 
 # --- internal_admin ---
@@ -81,9 +108,17 @@ from sparkpilot.services.diagnostics import (  # noqa: F401
 # --- emr_releases ---
 from sparkpilot.services.emr_releases import (  # noqa: F401
     list_emr_releases,
+    lookup_emr_release,
     sync_emr_releases_once,
 )
 
+# --- interactive_pool ---
+from sparkpilot.services.interactive_pool import (  # noqa: F401
+    acquire_warm_endpoint,
+    process_interactive_pool_once,
+    renew_endpoint_lease,
+)
+
 # --- finops ---
 from sparkpilot.services.finops import (  # noqa: F401
     _record_usage_if_needed,
@@ -91,6 +126,8 @@ from sparkpilot.services.finops import (  # noqa: F401
     get_cost_showback,
     get_team_budget,
     process_cur_reconciliation_once,
+    refresh_pricing_snapshots_once,
+    run_cost_what_if,
 )
 
 # --- golden_paths ---
@@ -105,6 +142,12 @@ from sparkpilot.services.golden_paths import (  # noqa: F401
 # --- preflight ---
 from sparkpilot.services.preflight import _build_preflight  # noqa: F401
 
+# --- run_events ---
+from sparkpilot.services.run_events import (  # noqa: F401
+    latest_run_state_event_id,
+    list_run_state_events,
+)
+
 # --- workers ---
 from sparkpilot.services.workers import (  # noqa: F401
     process_provisioning_once,
@@ -0,0 +1,74 @@
+"""Process-local cache of resolved API access contexts.
+
+Entries are keyed by ``(actor, identity_version)``.  Every committed write to
+``user_identities`` or ``team_environment_scopes`` made through the service
+layer bumps the identity version, so stale authorization state in this process
+is never served.  Writes made by other API processes are bounded by
+``SPARKPILOT_ACCESS_CONTEXT_CACHE_SECONDS``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from sparkpilot.config import get_settings
+
+_ACCESS_CONTEXT_CACHE_MAX_ENTRIES = 4096
+
+_access_context_cache: OrderedDict[tuple[str, int], tuple[float, Any]] = OrderedDict()
+_access_context_lock = threading.Lock()
+_identity_version = 0
+
+
+def _reset_access_context_cache() -> None:
+    global _identity_version
+    with _access_context_lock:
+        _access_context_cache.clear()
+        _identity_version += 1
+
+
+def identity_version() -> int:
+    return _identity_version
+
+
+def invalidate_access_contexts() -> None:
+    """Drop every cached access context after an identity or scope write."""
+    _reset_access_context_cache()
+
+
+def invalidate_access_contexts_on_commit(db: Session) -> None:
+    """Invalidate once *db* commits, for writers that leave the commit to their caller."""
+    event.listen(db, "after_commit", lambda _session: invalidate_access_contexts(), once=True)
+
+
+def get_cached_access_context(actor: str) -> Any | None:
+    key = (actor, _identity_version)
+    now = time.monotonic()
+    with _access_context_lock:
+        entry = _access_context_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            _access_context_cache.pop(key, None)
+            return None
+        _access_context_cache.move_to_end(key)
+        return value
+
+
+def store_access_context(actor: str, version: int, value: Any) -> None:
+    """Cache *value* for *actor* if no identity write happened since *version* was read."""
+    ttl_seconds = get_settings().access_context_cache_seconds
+    with _access_context_lock:
+        if version != _identity_version:
+            return
+        _access_context_cache[(actor, version)] = (time.monotonic() + ttl_seconds, value)
+        _access_context_cache.move_to_end((actor, version))
+        while len(_access_context_cache) > _ACCESS_CONTEXT_CACHE_MAX_ENTRIES:
+            _access_context_cache.popitem(last=False)
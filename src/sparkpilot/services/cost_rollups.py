@@ -0,0 +1,394 @@
+"""Incrementally maintained cost rollups and optional Parquet export.
+
+Every ``CostAllocation`` insert (``_record_usage_if_needed``) and update (CUR
+reconciliation) is folded into the ``cost_rollups`` row for its
+(team, cost_center, environment, billing_period, day) key inside the same
+flush, so rollup totals never drift from the allocations they summarise.
+Showback totals and budget checks read these rollup rows instead of running
+``SUM(CASE ...)`` scans over ``cost_allocations``, through a short-lived
+per-(team, period) spend cache that the same hooks invalidate.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import and_, event, func, insert, inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper, Session, object_session
+
+from sparkpilot.config import get_settings
+from sparkpilot.db import upsert_insert
+from sparkpilot.models import CostAllocation, CostRollup, _new_id
+from sparkpilot.services._helpers import _as_utc, _now
+
+ROLLUP_KEY_COLUMNS = ("team", "cost_center", "environment_id", "billing_period", "usage_date")
+ROLLUP_SUM_COLUMNS = (
+    "run_count",
+    "reconciled_run_count",
+    "estimated_vcpu_seconds",
+    "estimated_memory_gb_seconds",
+    "estimated_cost_usd_micros",
+    "actual_cost_usd_micros",
+    "effective_cost_usd_micros",
+)
+_ALLOCATION_TRACKED_ATTRS = (
+    "team",
+    "cost_center",
+    "environment_id",
+    "tenant_id",
+    "billing_period",
+    "created_at",
+    "estimated_vcpu_seconds",
+    "estimated_memory_gb_seconds",
+    "estimated_cost_usd_micros",
+    "actual_cost_usd_micros",
+)
+_SESSION_DIRTY_SPEND_KEY = "sparkpilot_dirty_team_spend"
+
+
+# ---------------------------------------------------------------------------
+# Rollup deltas
+# ---------------------------------------------------------------------------
+
+def _usage_date(created_at: datetime | None) -> str:
+    return _as_utc(created_at or _now()).date().isoformat()
+
+
+def _allocation_rollup_entry(values: dict[str, Any]) -> tuple[tuple[str, ...], str, dict[str, int]]:
+    """Return ``(key, tenant_id, contribution)`` for one allocation's column values."""
+    key = (
+        str(values["team"]),
+        str(values["cost_center"]),
+        str(values["environment_id"]),
+        str(values["billing_period"]),
+        _usage_date(values["created_at"]),
+    )
+    estimated = int(values["estimated_cost_usd_micros"] or 0)
+    actual = values["actual_cost_usd_micros"]
+    contribution = {
+        "run_count": 1,
+        "reconciled_run_count": 1 if actual is not None else 0,
+        "estimated_vcpu_seconds": int(values["estimated_vcpu_seconds"] or 0),
+        "estimated_memory_gb_seconds": int(values["estimated_memory_gb_seconds"] or 0),
+        "estimated_cost_usd_micros": estimated,
+        "actual_cost_usd_micros": int(actual) if actual is not None else 0,
+        "effective_cost_usd_micros": int(actual) if actual is not None else estimated,
+    }
+    return key, str(values["tenant_id"]), contribution
+
+
+def _negated(contribution: dict[str, int]) -> dict[str, int]:
+    return {name: -value for name, value in contribution.items()}
+
+
+def _apply_rollup_delta(
+    connection: Connection,
+    *,
+    key: tuple[str, ...],
+    tenant_id: str,
+    delta: dict[str, int],
+) -> None:
+    if not any(delta.values()):
+        return
+    table = CostRollup.__table__
+    key_values = dict(zip(ROLLUP_KEY_COLUMNS, key))
+    now = _now()
+    upsert = upsert_insert(connection, table)
+    if upsert is not None:
+        stmt = upsert.values(
+            id=_new_id(),
+            tenant_id=tenant_id,
+            updated_at=now,
+            **key_values,
+            **delta,
+        )
+        set_: dict[str, Any] = {name: table.c[name] + stmt.excluded[name] for name in delta}
+        set_["updated_at"] = now
+        connection.execute(stmt.on_conflict_do_update(index_elements=list(ROLLUP_KEY_COLUMNS), set_=set_))
+        return
+    # Generic fallback for dialects without an upsert construct.
+    key_filter = and_(*(table.c[name] == value for name, value in key_values.items()))
+    result = connection.execute(
+        update(table)
+        .where(key_filter)
+        .values(updated_at=now, **{name: table.c[name] + value for name, value in delta.items()})
+    )
+    if result.rowcount == 0:
+        connection.execute(
+            insert(table).values(
+                id=_new_id(),
+                tenant_id=tenant_id,
+                updated_at=now,
+                **key_values,
+                **delta,
+            )
+        )
+
+
+def _allocation_values_for_flush(
+    connection: Connection,
+    target: CostAllocation,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(previous, current)`` tracked values for a persistent allocation."""
+    state = inspect(target)
+    previous: dict[str, Any] = {}
+    current: dict[str, Any] = {}
+    needs_persisted_row = False
+    for name in _ALLOCATION_TRACKED_ATTRS:
+        if name in state.unloaded:
+            needs_persisted_row = True
+            continue
+        history = state.attrs[name].history
+        current[name] = getattr(target, name)
+        if history.deleted:
+            previous[name] = history.deleted[0]
+        elif history.unchanged:
+            previous[name] = history.unchanged[0]
+        else:
+            needs_persisted_row = True
+    if needs_persisted_row:
+        # Expired attributes, or ones overwritten before their prior value was
+        # loaded: read the persisted row so the delta stays exact without
+        # triggering ORM lazy loads mid-flush.
+        table = CostAllocation.__table__
+        persisted = connection.execute(
+            select(*(table.c[name] for name in _ALLOCATION_TRACKED_ATTRS)).where(table.c.id == target.id)
+        ).one()._mapping
+        previous = {name: persisted[name] for name in _ALLOCATION_TRACKED_ATTRS}
+        for name in _ALLOCATION_TRACKED_ATTRS:
+            current.setdefault(name, persisted[name])
+    return previous, current
+
+
+# ---------------------------------------------------------------------------
+# CostAllocation mapper hooks
+# ---------------------------------------------------------------------------
+
+@event.listens_for(CostAllocation, "after_insert")
+def _rollup_allocation_insert(_mapper: Mapper, connection: Connection, target: CostAllocation) -> None:
+    values = {name: getattr(target, name) for name in _ALLOCATION_TRACKED_ATTRS}
+    key, tenant_id, contribution = _allocation_rollup_entry(values)
+    _apply_rollup_delta(connection, key=key, tenant_id=tenant_id, delta=contribution)
+    _mark_team_spend_dirty(target, key)
+
+
+@event.listens_for(CostAllocation, "before_update")
+def _rollup_allocation_update(_mapper: Mapper, connection: Connection, target: CostAllocation) -> None:
+    previous, current = _allocation_values_for_flush(connection, target)
+    old_key, old_tenant, old_contribution = _allocation_rollup_entry(previous)
+    new_key, new_tenant, new_contribution = _allocation_rollup_entry(current)
+    if old_key == new_key:
+        delta = {name: new_contribution[name] - old_contribution[name] for name in ROLLUP_SUM_COLUMNS}
+        if any(delta.values()):
+            _apply_rollup_delta(connection, key=new_key, tenant_id=new_tenant, delta=delta)
+            _mark_team_spend_dirty(target, new_key)
+        return
+    _apply_rollup_delta(connection, key=old_key, tenant_id=old_tenant, delta=_negated(old_contribution))
+    _apply_rollup_delta(connection, key=new_key, tenant_id=new_tenant, delta=new_contribution)
+    _mark_team_spend_dirty(target, old_key)
+    _mark_team_spend_dirty(target, new_key)
+
+
+@event.listens_for(CostAllocation, "before_delete")
+def _rollup_allocation_delete(_mapper: Mapper, connection: Connection, target: CostAllocation) -> None:
+    previous, _current = _allocation_values_for_flush(connection, target)
+    key, tenant_id, contribution = _allocation_rollup_entry(previous)
+    _apply_rollup_delta(connection, key=key, tenant_id=tenant_id, delta=_negated(contribution))
+    _mark_team_spend_dirty(target, key)
+
+
+# ---------------------------------------------------------------------------
+# Team spend cache
+# ---------------------------------------------------------------------------
+
+_TEAM_SPEND_CACHE_MAX_ENTRIES = 4096
+_team_spend_cache: OrderedDict[tuple[str, str], tuple[float, tuple[int, int, int]]] = OrderedDict()
+_team_spend_cache_lock = threading.Lock()
+
+
+def _reset_team_spend_cache() -> None:
+    with _team_spend_cache_lock:
+        _team_spend_cache.clear()
+
+
+def _invalidate_team_spend(keys: set[tuple[str, str]]) -> None:
+    with _team_spend_cache_lock:
+        for cache_key in keys:
+            _team_spend_cache.pop(cache_key, None)
+
+
+def _mark_team_spend_dirty(target: CostAllocation, rollup_key: tuple[str, ...]) -> None:
+    team, _cost_center, _environment_id, billing_period, _usage_date = rollup_key
+    cache_key = (team, billing_period)
+    _invalidate_team_spend({cache_key})
+    # Invalidate again once the transaction ends: a concurrent reader may have
+    # re-cached the pre-commit totals in between.
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_SESSION_DIRTY_SPEND_KEY, set()).add(cache_key)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _flush_dirty_team_spend(session: Session, *_args: Any) -> None:
+    dirty = session.info.pop(_SESSION_DIRTY_SPEND_KEY, None)
+    if dirty:
+        _invalidate_team_spend(dirty)
+
+
+# ---------------------------------------------------------------------------
+# Rollup reads
+# ---------------------------------------------------------------------------
+
+def cost_rollup_totals(db: Session, *, team: str, period: str) -> tuple[int, int, int]:
+    """Return ``(estimated, actual, effective)`` micros for a team and billing period."""
+    # Aggregate query without GROUP BY always returns exactly one row; `.one()` is safe.
+    estimated, actual, effective = db.execute(
+        select(
+            func.coalesce(func.sum(CostRollup.estimated_cost_usd_micros), 0),
+            func.coalesce(func.sum(CostRollup.actual_cost_usd_micros), 0),
+            func.coalesce(func.sum(CostRollup.effective_cost_usd_micros), 0),
+        ).where(
+            and_(
+                CostRollup.team == team,
+                CostRollup.billing_period == period,
+            )
+        )
+    ).one()
+    return int(estimated), int(actual), int(effective)
+
+
+def cached_team_spend(db: Session, *, team: str, period: str) -> tuple[int, int, int]:
+    """``cost_rollup_totals`` behind a TTL cache shared by preflight, the scheduler, and showback.
+
+    Allocation writes in this process invalidate the entry immediately; writes
+    from other worker processes become visible within
+    ``SPARKPILOT_TEAM_SPEND_CACHE_SECONDS``.
+    """
+    ttl_seconds = get_settings().team_spend_cache_seconds
+    cache_key = (team, period)
+    now = time.monotonic()
+    with _team_spend_cache_lock:
+        entry = _team_spend_cache.get(cache_key)
+        if entry is not None and now - entry[0] < ttl_seconds:
+            _team_spend_cache.move_to_end(cache_key)
+            return entry[1]
+    totals = cost_rollup_totals(db, team=team, period=period)
+    if cache_key in db.info.get(_SESSION_DIRTY_SPEND_KEY, ()):
+        # Totals include this session's uncommitted allocation writes.
+        return totals
+    with _team_spend_cache_lock:
+        _team_spend_cache[cache_key] = (now, totals)
+        _team_spend_cache.move_to_end(cache_key)
+        while len(_team_spend_cache) > _TEAM_SPEND_CACHE_MAX_ENTRIES:
+            _team_spend_cache.popitem(last=False)
+    return totals
+
+
+def rebuild_cost_rollups(db: Session) -> int:
+    """Recompute every rollup row from ``cost_allocations``; returns rows written.
+
+    Only needed to repair rollups after allocations were changed outside the
+    ORM (bulk SQL, manual fixes); normal writes keep rollups current.
+    """
+    totals: dict[tuple[str, ...], tuple[str, dict[str, int]]] = {}
+    rows = db.execute(
+        select(*(getattr(CostAllocation, name) for name in _ALLOCATION_TRACKED_ATTRS))
+    ).yield_per(1000)
+    for row in rows:
+        key, tenant_id, contribution = _allocation_rollup_entry(dict(row._mapping))
+        _, summed = totals.setdefault(key, (tenant_id, dict.fromkeys(ROLLUP_SUM_COLUMNS, 0)))
+        for name, value in contribution.items():
+            summed[name] += value
+    db.execute(CostRollup.__table__.delete())
+    now = _now()
+    for key, (tenant_id, summed) in totals.items():
+        db.add(CostRollup(tenant_id=tenant_id, updated_at=now, **dict(zip(ROLLUP_KEY_COLUMNS, key)), **summed))
+    db.commit()
+    _reset_team_spend_cache()
+    return len(totals)
+
+
+# ---------------------------------------------------------------------------
+# Parquet export
+# ---------------------------------------------------------------------------
+
+_EXPORT_COLUMNS = ("tenant_id", *ROLLUP_KEY_COLUMNS, *ROLLUP_SUM_COLUMNS)
+
+
+def _previous_billing_period(period: str) -> str:
+    year, month = (int(part) for part in period.split("-"))
+    if month == 1:
+        return f"{year - 1:04d}-12"
+    return f"{year:04d}-{month - 1:02d}"
+
+
+def _s3_export_filesystem(region: str) -> Any:
+    from pyarrow import fs as pafs
+
+    return pafs.S3FileSystem(region=region)
+
+
+def export_cost_rollups_parquet(db: Session, *, output_dir: str, periods: list[str]) -> int:
+    """Write one Parquet file per billing period under ``output_dir``.
+
+    Files land at ``<output_dir>/billing_period=<YYYY-MM>/cost_rollups.parquet``
+    (Hive-style partitioning, readable by Athena, Spark, and DuckDB) and are
+    replaced atomically.  ``output_dir`` is a local directory or an
+    ``s3://bucket/prefix`` URI.  Requires the optional ``pyarrow`` dependency
+    (``pip install sparkpilot[analytics]``).  Returns the number of rows written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ValueError(
+            "Cost rollup Parquet export requires pyarrow. Install sparkpilot[analytics]."
+        ) from exc
+
+    s3_prefix = output_dir.removeprefix("s3://").rstrip("/") if output_dir.startswith("s3://") else None
+    s3 = _s3_export_filesystem(get_settings().aws_region) if s3_prefix is not None else None
+    written = 0
+    for period in sorted(set(periods)):
+        rows = list(
+            db.execute(
+                select(*(getattr(CostRollup, name) for name in _EXPORT_COLUMNS))
+                .where(CostRollup.billing_period == period)
+                .order_by(CostRollup.usage_date, CostRollup.team, CostRollup.cost_center)
+            )
+        )
+        columns = {name: [row._mapping[name] for row in rows] for name in _EXPORT_COLUMNS}
+        table = pa.Table.from_pydict(columns)
+        if s3 is not None:
+            # S3 replaces the object atomically once the upload completes.
+            pq.write_table(table, f"{s3_prefix}/billing_period={period}/cost_rollups.parquet", filesystem=s3)
+            written += len(rows)
+            continue
+        partition_dir = Path(output_dir) / f"billing_period={period}"
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        target = partition_dir / "cost_rollups.parquet"
+        staging = partition_dir / f".cost_rollups.{os.getpid()}.parquet"
+        pq.write_table(table, staging)
+        os.replace(staging, target)
+        written += len(rows)
+    return written
+
+
+def export_cost_rollups_once(db: Session) -> int:
+    """Export the current and previous billing periods when an export directory is set."""
+    settings = get_settings()
+    output_dir = settings.cost_rollup_export_dir.strip()
+    if not output_dir:
+        return 0
+    current = _now().strftime("%Y-%m")
+    # CUR data lands days after month end, so the previous period keeps changing.
+    return export_cost_rollups_parquet(
+        db,
+        output_dir=output_dir,
+        periods=[current, _previous_billing_period(current)],
+    )
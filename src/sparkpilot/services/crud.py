@@ -1,6 +1,9 @@
 """Entity CRUD operations: tenants, teams, users, environments, jobs, runs."""
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
+import json
 import logging
 import uuid
 from typing import Any
@@ -11,7 +14,12 @@ from sqlalchemy.orm import Session
 from sparkpilot.config import get_settings
 from sparkpilot.audit import write_audit_event
 from sparkpilot.aws_clients import CloudWatchLogsProxy
-from sparkpilot.exceptions import ConflictError, EntityNotFoundError, ValidationError
+from sparkpilot.exceptions import (
+    ConflictError,
+    EntityNotFoundError,
+    SparkPilotError,
+    ValidationError,
+)
 from sparkpilot.models import (
     Environment,
     GoldenPath,
@@ -24,7 +32,12 @@ from sparkpilot.models import (
     UserIdentity,
     UsageRecord,
 )
-from sparkpilot.quota import enforce_quota_for_run, lock_environment_for_quota
+from sparkpilot.quota import (
+    EnvironmentQuotaUsage,
+    enforce_quota_for_run,
+    lock_environment_for_quota,
+    lock_environments_for_quota,
+)
 from sparkpilot.schemas import (
     EnvironmentCreateRequest,
     JobCreateRequest,
@@ -45,6 +58,7 @@ from sparkpilot.services._helpers import (
     _require_tenant,
     _validate_custom_spark_conf_policy,
 )
+from sparkpilot.services.access_cache import invalidate_access_contexts
 from sparkpilot.services.golden_paths import _resolve_golden_path_for_run
 from sparkpilot.services.preflight import _build_preflight
 
@@ -208,6 +222,7 @@ def create_or_update_user_identity(
         },
     )
     db.commit()
+    invalidate_access_contexts()
     db.refresh(row)
     return row
 
@@ -269,6 +284,7 @@ def add_team_environment_scope(
             },
         )
         db.commit()
+        invalidate_access_contexts()
         db.refresh(row)
     return row
 
@@ -310,6 +326,7 @@ def remove_team_environment_scope(
         },
     )
     db.commit()
+    invalidate_access_contexts()
 
 
 def list_team_environment_scopes(
@@ -336,16 +353,41 @@ def list_team_environment_scopes(
 # ---------------------------------------------------------------------------
 
 
+def _column_dicts(db: Session, stmt: Any) -> list[dict[str, Any]]:
+    return [dict(row._mapping) for row in db.execute(stmt)]
+
+
+def _list_environments_stmt(
+    columns: Any, tenant_id: str | None, *, limit: int, offset: int
+) -> Any:
+    stmt = select(*columns).order_by(Environment.created_at.desc())
+    if tenant_id:
+        stmt = stmt.where(Environment.tenant_id == tenant_id)
+    return stmt.limit(limit).offset(offset)
+
+
 def list_environments(
     db: Session, tenant_id: str | None, *, limit: int = 200, offset: int = 0
 ) -> list[Environment]:
-    stmt = select(Environment).order_by(Environment.created_at.desc())
-    if tenant_id:
-        stmt = stmt.where(Environment.tenant_id == tenant_id)
-    stmt = stmt.limit(limit).offset(offset)
+    stmt = _list_environments_stmt((Environment,), tenant_id, limit=limit, offset=offset)
     return list(db.execute(stmt).scalars())
 
 
+def list_environment_columns(
+    db: Session,
+    columns: Sequence[str],
+    tenant_id: str | None,
+    *,
+    limit: int = 200,
+    offset: int = 0,
+) -> list[dict[str, Any]]:
+    """Like ``list_environments`` but read only *columns*, one dict per row."""
+    stmt = _list_environments_stmt(
+        [getattr(Environment, name) for name in columns], tenant_id, limit=limit, offset=offset
+    )
+    return _column_dicts(db, stmt)
+
+
 def create_environment(
     db: Session,
     req: EnvironmentCreateRequest,
@@ -648,6 +690,22 @@ def create_job(
     return job
 
 
+def _list_jobs_stmt(
+    columns: Any,
+    environment_id: str | None,
+    *,
+    limit: int,
+    offset: int,
+    environment_ids: set[str] | None,
+) -> Any:
+    stmt = select(*columns).order_by(Job.created_at.desc())
+    if environment_id:
+        stmt = stmt.where(Job.environment_id == environment_id)
+    if environment_ids is not None:
+        stmt = stmt.where(Job.environment_id.in_(environment_ids))
+    return stmt.limit(limit).offset(offset)
+
+
 def list_jobs(
     db: Session,
     environment_id: str | None = None,
@@ -656,15 +714,32 @@ def list_jobs(
     offset: int = 0,
     environment_ids: set[str] | None = None,
 ) -> list[Job]:
-    stmt = select(Job).order_by(Job.created_at.desc())
-    if environment_id:
-        stmt = stmt.where(Job.environment_id == environment_id)
-    if environment_ids is not None:
-        stmt = stmt.where(Job.environment_id.in_(environment_ids))
-    stmt = stmt.limit(limit).offset(offset)
+    stmt = _list_jobs_stmt(
+        (Job,), environment_id, limit=limit, offset=offset, environment_ids=environment_ids
+    )
     return list(db.execute(stmt).scalars())
 
 
+def list_job_columns(
+    db: Session,
+    columns: Sequence[str],
+    environment_id: str | None = None,
+    *,
+    limit: int = 200,
+    offset: int = 0,
+    environment_ids: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Like ``list_jobs`` but read only *columns*, one dict per row."""
+    stmt = _list_jobs_stmt(
+        [getattr(Job, name) for name in columns],
+        environment_id,
+        limit=limit,
+        offset=offset,
+        environment_ids=environment_ids,
+    )
+    return _column_dicts(db, stmt)
+
+
 # ---------------------------------------------------------------------------
 # Run
 # ---------------------------------------------------------------------------
@@ -727,28 +802,16 @@ def _resolve_timeout_seconds(
     return timeout_seconds
 
 
-def create_run(
+def _enforce_run_policies(
     db: Session,
+    env: Environment,
     *,
-    job_id: str,
     req: RunCreateRequest,
+    requested: dict[str, int],
+    run_spark_conf: dict[str, str],
     actor: str,
     source_ip: str | None,
-    idempotency_key: str,
-    commit: bool = True,
-) -> Run:
-    runtime_settings = get_settings()
-    job = _require_job(db, job_id)
-    env = lock_environment_for_quota(db, job.environment_id)
-    if env.status != "ready":
-        raise ConflictError("Environment is not ready.")
-
-    selected_golden_path, requested, run_spark_conf = _resolve_run_configuration(
-        db,
-        environment=env,
-        req=req,
-    )
-
+) -> None:
     policy_violations = _validate_custom_spark_conf_policy(run_spark_conf)
     if policy_violations:
         raise ValidationError(
@@ -778,23 +841,21 @@ def create_run(
         )
         raise ValidationError(f"Policy violation(s): {messages}")
 
-    enforce_quota_for_run(db, env, requested)
-    timeout_seconds = _resolve_timeout_seconds(
-        req=req,
-        job=job,
-        environment=env,
-        selected_golden_path=selected_golden_path,
-    )
 
-    existing = db.execute(
-        select(Run).where(
-            and_(Run.job_id == job_id, Run.idempotency_key == idempotency_key)
-        )
-    ).scalar_one_or_none()
-    if existing:
-        return existing
-
-    run = Run(
+def _new_run(
+    *,
+    job: Job,
+    env: Environment,
+    req: RunCreateRequest,
+    idempotency_key: str,
+    requested: dict[str, int],
+    run_spark_conf: dict[str, str],
+    timeout_seconds: int,
+    actor: str,
+) -> Run:
+    return Run(
+        # Assigned up front so audit rows can reference runs before the flush.
+        id=str(uuid.uuid4()),
         job_id=job.id,
         environment_id=env.id,
         state="queued",
@@ -806,8 +867,17 @@ def create_run(
         timeout_seconds=timeout_seconds,
         created_by_actor=actor,
     )
-    db.add(run)
-    db.flush()
+
+
+def _write_run_create_audit(
+    db: Session,
+    run: Run,
+    *,
+    env: Environment,
+    selected_golden_path: GoldenPath | None,
+    actor: str,
+    source_ip: str | None,
+) -> None:
     write_audit_event(
         db,
         actor=actor,
@@ -817,38 +887,119 @@ def create_run(
         entity_id=run.id,
         tenant_id=env.tenant_id,
         details={
-            "job_id": job.id,
-            "requested_resources": requested,
+            "job_id": run.job_id,
+            "requested_resources": run.requested_resources_json,
             "golden_path": selected_golden_path.name if selected_golden_path else None,
         },
     )
 
-    # Record LF permission context for audit trail (#38)
-    if getattr(env, "lake_formation_enabled", False):
-        try:
-            from sparkpilot.services.lake_formation import get_lf_permission_context
 
-            lf_context = get_lf_permission_context(
-                env.region,
-                runtime_settings.emr_execution_role_arn,
-                catalog_id=getattr(env, "lf_catalog_id", None),
-            )
-            write_audit_event(
-                db,
-                actor=actor,
-                source_ip=source_ip,
-                action="run.lf_permission_context",
-                entity_type="run",
-                entity_id=run.id,
-                tenant_id=env.tenant_id,
-                details=lf_context,
-            )
-        except Exception:
-            logger.warning(
-                "Failed to record LF permission context for run %s",
-                run.id,
-                exc_info=True,
-            )
+def _record_lf_permission_context(
+    db: Session,
+    env: Environment,
+    runs: list[Run],
+    *,
+    actor: str,
+    source_ip: str | None,
+) -> None:
+    """Record the LF permission context for the audit trail (#38)."""
+    if not runs or not getattr(env, "lake_formation_enabled", False):
+        return
+    try:
+        from sparkpilot.services.lake_formation import get_lf_permission_context
+
+        lf_context = get_lf_permission_context(
+            env.region,
+            get_settings().emr_execution_role_arn,
+            catalog_id=getattr(env, "lf_catalog_id", None),
+        )
+    except Exception:
+        logger.warning(
+            "Failed to record LF permission context for run(s) %s",
+            ", ".join(run.id for run in runs),
+            exc_info=True,
+        )
+        return
+    for run in runs:
+        write_audit_event(
+            db,
+            actor=actor,
+            source_ip=source_ip,
+            action="run.lf_permission_context",
+            entity_type="run",
+            entity_id=run.id,
+            tenant_id=env.tenant_id,
+            details=lf_context,
+        )
+
+
+def create_run(
+    db: Session,
+    *,
+    job_id: str,
+    req: RunCreateRequest,
+    actor: str,
+    source_ip: str | None,
+    idempotency_key: str,
+    commit: bool = True,
+) -> Run:
+    job = _require_job(db, job_id)
+    env = lock_environment_for_quota(db, job.environment_id)
+    if env.status != "ready":
+        raise ConflictError("Environment is not ready.")
+
+    selected_golden_path, requested, run_spark_conf = _resolve_run_configuration(
+        db,
+        environment=env,
+        req=req,
+    )
+    _enforce_run_policies(
+        db,
+        env,
+        req=req,
+        requested=requested,
+        run_spark_conf=run_spark_conf,
+        actor=actor,
+        source_ip=source_ip,
+    )
+
+    enforce_quota_for_run(db, env, requested)
+    timeout_seconds = _resolve_timeout_seconds(
+        req=req,
+        job=job,
+        environment=env,
+        selected_golden_path=selected_golden_path,
+    )
+
+    existing = db.execute(
+        select(Run).where(
+            and_(Run.job_id == job_id, Run.idempotency_key == idempotency_key)
+        )
+    ).scalar_one_or_none()
+    if existing:
+        return existing
+
+    run = _new_run(
+        job=job,
+        env=env,
+        req=req,
+        idempotency_key=idempotency_key,
+        requested=requested,
+        run_spark_conf=run_spark_conf,
+        timeout_seconds=timeout_seconds,
+        actor=actor,
+    )
+    db.add(run)
+    db.flush()
+    _write_run_create_audit(
+        db,
+        run,
+        env=env,
+        selected_golden_path=selected_golden_path,
+        actor=actor,
+        source_ip=source_ip,
+    )
+    _record_lf_permission_context(db, env, [run], actor=actor, source_ip=source_ip)
 
     if commit:
         db.commit()
@@ -858,17 +1009,160 @@ def create_run(
     return run
 
 
-def list_runs(
+@dataclass(frozen=True)
+class RunSubmission:
+    job_id: str
+    req: RunCreateRequest
+    idempotency_key: str
+
+
+_RunShape = tuple[GoldenPath | None, dict[str, int], dict[str, str]]
+
+
+def _run_shape_key(env: Environment, req: RunCreateRequest) -> str:
+    return json.dumps(
+        [
+            env.id,
+            req.golden_path,
+            req.spark_conf,
+            req.requested_resources.model_dump(),
+            req.timeout_seconds,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def create_runs(
     db: Session,
+    submissions: list[RunSubmission],
+    *,
+    actor: str,
+    source_ip: str | None,
+    commit: bool = True,
+) -> list[Run | SparkPilotError]:
+    """Admit a batch of runs in one transaction; one result per submission.
+
+    Each environment is locked once and its quota usage read once, then every
+    admitted run is counted against it.  Configuration and policies are
+    evaluated once per distinct (environment, run configuration) shape.  A
+    submission that fails validation, policy or quota gets its error in place
+    of a run without affecting the others; a submission whose idempotency key
+    already has a run for that job gets the existing run.
+    """
+    results: list[Run | SparkPilotError] = []
+    if not submissions:
+        return results
+    job_ids = {item.job_id for item in submissions}
+    jobs = {job.id: job for job in db.execute(select(Job).where(Job.id.in_(job_ids))).scalars()}
+    envs = lock_environments_for_quota(db, {job.environment_id for job in jobs.values()})
+    existing_runs = {
+        (run.job_id, run.idempotency_key): run
+        for run in db.execute(
+            select(Run).where(
+                Run.job_id.in_(job_ids),
+                Run.idempotency_key.in_({item.idempotency_key for item in submissions}),
+            )
+        ).scalars()
+    }
+    usage: dict[str, EnvironmentQuotaUsage] = {}
+    shapes: dict[str, _RunShape | SparkPilotError] = {}
+    admitted: list[tuple[Run, Environment, GoldenPath | None]] = []
+
+    for item in submissions:
+        existing = existing_runs.get((item.job_id, item.idempotency_key))
+        if existing is not None:
+            results.append(existing)
+            continue
+        try:
+            job = jobs.get(item.job_id)
+            if job is None:
+                raise EntityNotFoundError("Job not found.")
+            env = envs.get(job.environment_id)
+            if env is None:
+                raise EntityNotFoundError("Environment not found.")
+            if env.status != "ready":
+                raise ConflictError("Environment is not ready.")
+            shape_key = _run_shape_key(env, item.req)
+            shape = shapes.get(shape_key)
+            if shape is None:
+                try:
+                    shape = _resolve_run_configuration(db, environment=env, req=item.req)
+                    _enforce_run_policies(
+                        db,
+                        env,
+                        req=item.req,
+                        requested=shape[1],
+                        run_spark_conf=shape[2],
+                        actor=actor,
+                        source_ip=source_ip,
+                    )
+                except SparkPilotError as exc:
+                    shape = exc
+                shapes[shape_key] = shape
+            if isinstance(shape, SparkPilotError):
+                raise shape
+            selected_golden_path, requested, run_spark_conf = shape
+            timeout_seconds = _resolve_timeout_seconds(
+                req=item.req,
+                job=job,
+                environment=env,
+                selected_golden_path=selected_golden_path,
+            )
+            if env.id not in usage:
+                usage[env.id] = EnvironmentQuotaUsage(db, env)
+            usage[env.id].admit(requested)
+        except SparkPilotError as exc:
+            results.append(exc)
+            continue
+        run = _new_run(
+            job=job,
+            env=env,
+            req=item.req,
+            idempotency_key=item.idempotency_key,
+            requested=dict(requested),
+            run_spark_conf=dict(run_spark_conf),
+            timeout_seconds=timeout_seconds,
+            actor=actor,
+        )
+        # Later duplicates of this key within the batch resolve to this run.
+        existing_runs[(item.job_id, item.idempotency_key)] = run
+        admitted.append((run, env, selected_golden_path))
+        results.append(run)
+
+    db.add_all([run for run, _env, _golden_path in admitted])
+    runs_by_env: dict[str, list[Run]] = {}
+    for run, env, selected_golden_path in admitted:
+        _write_run_create_audit(
+            db,
+            run,
+            env=env,
+            selected_golden_path=selected_golden_path,
+            actor=actor,
+            source_ip=source_ip,
+        )
+        runs_by_env.setdefault(env.id, []).append(run)
+    for env_id, env_runs in runs_by_env.items():
+        _record_lf_permission_context(db, envs[env_id], env_runs, actor=actor, source_ip=source_ip)
+
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+    return results
+
+
+def _list_runs_stmt(
+    columns: Any,
     tenant_id: str | None,
     state: str | None,
     *,
-    limit: int = 200,
-    offset: int = 0,
-    actor: str | None = None,
-    environment_ids: set[str] | None = None,
-) -> list[Run]:
-    stmt = select(Run).join(Environment, Environment.id == Run.environment_id)
+    limit: int,
+    offset: int,
+    actor: str | None,
+    environment_ids: set[str] | None,
+) -> Any:
+    stmt = select(*columns).join(Environment, Environment.id == Run.environment_id)
     if tenant_id:
         stmt = stmt.where(Environment.tenant_id == tenant_id)
     if state:
@@ -877,14 +1171,84 @@ def list_runs(
         stmt = stmt.where(Run.created_by_actor == actor)
     if environment_ids is not None:
         stmt = stmt.where(Environment.id.in_(environment_ids))
-    stmt = stmt.order_by(Run.created_at.desc()).limit(limit).offset(offset)
+    return stmt.order_by(Run.created_at.desc(), Run.id).limit(limit).offset(offset)
+
+
+def list_runs(
+    db: Session,
+    tenant_id: str | None,
+    state: str | None,
+    *,
+    limit: int = 200,
+    offset: int = 0,
+    actor: str | None = None,
+    environment_ids: set[str] | None = None,
+) -> list[Run]:
+    stmt = _list_runs_stmt(
+        (Run,),
+        tenant_id,
+        state,
+        limit=limit,
+        offset=offset,
+        actor=actor,
+        environment_ids=environment_ids,
+    )
     return list(db.execute(stmt).scalars())
 
 
+def list_run_versions(
+    db: Session,
+    tenant_id: str | None,
+    state: str | None,
+    *,
+    limit: int = 200,
+    offset: int = 0,
+    actor: str | None = None,
+    environment_ids: set[str] | None = None,
+) -> list[tuple[str, datetime]]:
+    """Return ``(id, updated_at)`` for the page ``list_runs`` would return.
+
+    Only two columns are read, so callers can tell whether a page changed
+    without loading and serializing full run rows.
+    """
+    stmt = _list_runs_stmt(
+        (Run.id, Run.updated_at),
+        tenant_id,
+        state,
+        limit=limit,
+        offset=offset,
+        actor=actor,
+        environment_ids=environment_ids,
+    )
+    return [(run_id, updated_at) for run_id, updated_at in db.execute(stmt).all()]
+
+
 def get_run(db: Session, run_id: str) -> Run:
     return _require_run(db, run_id)
 
 
+def get_runs_by_ids(db: Session, run_ids: list[str]) -> list[tuple[Run, Environment]]:
+    """Load the requested runs and their environments in a single query."""
+    if not run_ids:
+        return []
+    stmt = (
+        select(Run, Environment)
+        .join(Environment, Environment.id == Run.environment_id)
+        .where(Run.id.in_(set(run_ids)))
+    )
+    return [(run, env) for run, env in db.execute(stmt).all()]
+
+
+def get_run_columns_by_ids(
+    db: Session, run_ids: list[str], columns: Sequence[str]
+) -> list[dict[str, Any]]:
+    """Read only *columns* of the requested runs, one dict per run."""
+    if not run_ids:
+        return []
+    stmt = select(*[getattr(Run, name) for name in columns]).where(Run.id.in_(set(run_ids)))
+    return _column_dicts(db, stmt)
+
+
 def cancel_run(
     db: Session,
     run_id: str,
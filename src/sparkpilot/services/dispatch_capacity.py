@@ -0,0 +1,184 @@
+"""Per-environment vCPU headroom used to gate scheduler dispatch.
+
+With ``SPARKPILOT_DISPATCH_CAPACITY_MODE=enforce`` the scheduler only
+dispatches a queued run when the vCPU SparkPilot already has in flight in
+that environment (``dispatching``, ``accepted`` and ``running`` runs) plus
+the run's request fits the environment limit.  The limit is the tighter of
+the YuniKorn queue maximum and the EKS managed node groups' ``maxSize``
+capacity, scaled by ``SPARKPILOT_DISPATCH_CAPACITY_HEADROOM_PCT``.  Runs that
+do not fit stay ``queued``; an environment whose oldest queued run does not
+fit is left out of the claim, except for runs with a pending cancel, so it
+cannot take scheduler slots from others.
+
+Instance vCPU comes from ``ec2:DescribeInstanceTypes``.  When that cannot be
+read, only ``large`` and ``Nxlarge`` sizes are derived from the type name;
+an environment with any other node size is gated on its queue limit only.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+import logging
+import re
+from typing import Any
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from sparkpilot.aws_clients import EmrEksClient
+from sparkpilot.models import Environment, Run
+from sparkpilot.quota import _run_vcpu
+
+logger = logging.getLogger(__name__)
+
+IN_FLIGHT_RUN_STATES = ("dispatching", "accepted", "running")
+# Only these sizes have the same vCPU count in every instance family; smaller
+# sizes differ between families (e.g. t3.micro has 2 vCPU, t2.micro has 1).
+_INSTANCE_SIZE_RE = re.compile(r"^(\d*)(large|xlarge)$")
+_SIZE_VCPU = {"large": 2, "xlarge": 4}
+
+
+def _instance_type_vcpu(instance_type: str, described: dict[str, int]) -> int | None:
+    """vCPU of an EC2 instance type, or None when it is unknown (e.g. ``metal`` without a lookup)."""
+    if instance_type in described:
+        return described[instance_type]
+    _, _, size = instance_type.partition(".")
+    match = _INSTANCE_SIZE_RE.match(size)
+    if match is None:
+        return None
+    return int(match.group(1) or 1) * _SIZE_VCPU[match.group(2)]
+
+
+def _nodegroup_vcpu(nodegroups: list[dict[str, Any]], described: dict[str, int]) -> int | None:
+    """Schedulable vCPU of the node groups at ``max_size``, or None when any group's size is unknown.
+
+    *described* maps instance types to their vCPU count from EC2.  A node
+    group with several instance types is counted at its smallest one.
+    """
+    total = 0
+    for nodegroup in nodegroups:
+        sizes = [_instance_type_vcpu(str(item), described) for item in nodegroup.get("instance_types") or []]
+        if not sizes or None in sizes:
+            return None
+        total += min(sizes) * int(nodegroup.get("max_size") or nodegroup.get("desired_size") or 0)
+    return total
+
+
+@dataclass
+class EnvironmentCapacity:
+    environment_id: str
+    in_flight_vcpu: int = 0
+    limit_vcpu: int | None = None
+    limited_by: str | None = None
+
+    def fits(self, requested_vcpu: int) -> bool:
+        # An idle environment always takes its oldest run, so a request larger
+        # than the limit is still dispatched instead of blocking the queue.
+        if self.limit_vcpu is None or self.in_flight_vcpu == 0:
+            return True
+        return self.in_flight_vcpu + requested_vcpu <= self.limit_vcpu
+
+    def reserve(self, requested_vcpu: int) -> None:
+        self.in_flight_vcpu += requested_vcpu
+
+
+def _environment_limit(
+    env: Environment,
+    capacity: EnvironmentCapacity,
+    *,
+    emr: EmrEksClient,
+    headroom_pct: float,
+) -> None:
+    limits: list[tuple[int, str]] = []
+    if env.yunikorn_queue and env.yunikorn_queue_max_vcpu:
+        limits.append((int(env.yunikorn_queue_max_vcpu), "yunikorn_queue"))
+    if env.engine == "emr_on_eks" and env.eks_cluster_arn:
+        try:
+            nodegroups = emr.describe_nodegroups(env)
+        except Exception:  # noqa: BLE001 — an unreadable cluster must not stop dispatch
+            logger.warning(
+                "Node group capacity unavailable for environment_id=%s; gating on queue limits only.",
+                env.id,
+                exc_info=True,
+            )
+            nodegroups = []
+        instance_types = [str(item) for nodegroup in nodegroups for item in nodegroup.get("instance_types") or []]
+        try:
+            described = emr.describe_instance_type_vcpus(env, instance_types)
+        except Exception:  # noqa: BLE001 — fall back to the sizes readable from the type names
+            logger.warning(
+                "Instance type vCPU unavailable for environment_id=%s; using type names only.",
+                env.id,
+                exc_info=True,
+            )
+            described = {}
+        nodegroup_vcpu = _nodegroup_vcpu(nodegroups, described) if nodegroups else None
+        if nodegroup_vcpu:
+            limits.append((int(nodegroup_vcpu * headroom_pct / 100), "nodegroups"))
+    if limits:
+        capacity.limit_vcpu, capacity.limited_by = min(limits)
+
+
+def load_dispatch_capacity(db: Session, *, settings: Any) -> dict[str, EnvironmentCapacity]:
+    """Capacity of every environment with queued runs, keyed by environment id."""
+    environment_ids = list(
+        db.execute(select(Run.environment_id).where(Run.state == "queued").distinct()).scalars()
+    )
+    if not environment_ids:
+        return {}
+    capacities = {env_id: EnvironmentCapacity(env_id) for env_id in environment_ids}
+    for env_id, resources in db.execute(
+        select(Run.environment_id, Run.requested_resources_json).where(
+            and_(
+                Run.environment_id.in_(environment_ids),
+                Run.state.in_(IN_FLIGHT_RUN_STATES),
+            )
+        )
+    ).all():
+        capacities[env_id].reserve(_run_vcpu(resources or {}))
+
+    emr = EmrEksClient()
+    for env in db.execute(select(Environment).where(Environment.id.in_(environment_ids))).scalars():
+        _environment_limit(env, capacities[env.id], emr=emr, headroom_pct=settings.dispatch_capacity_headroom_pct)
+    return capacities
+
+
+def blocked_environment_ids(db: Session, capacities: dict[str, EnvironmentCapacity]) -> set[str]:
+    """Environments whose oldest queued run does not fit their remaining capacity.
+
+    Runs with a pending cancel are never dispatched, so they do not count as
+    an environment's oldest run.
+    """
+    gated = [env_id for env_id, capacity in capacities.items() if capacity.limit_vcpu is not None]
+    if not gated:
+        return set()
+    waiting = and_(Run.state == "queued", Run.cancellation_requested.is_(False))
+    heads = (
+        select(Run.environment_id, func.min(Run.created_at).label("created_at"))
+        .where(and_(waiting, Run.environment_id.in_(gated)))
+        .group_by(Run.environment_id)
+        .subquery()
+    )
+    head_vcpu: dict[str, int] = defaultdict(int)
+    for env_id, resources in db.execute(
+        select(Run.environment_id, Run.requested_resources_json)
+        .join(
+            heads,
+            and_(Run.environment_id == heads.c.environment_id, Run.created_at == heads.c.created_at),
+        )
+        .where(waiting)
+    ).all():
+        head_vcpu[env_id] = max(head_vcpu[env_id], _run_vcpu(resources or {}))
+    blocked = {env_id for env_id, vcpu in head_vcpu.items() if not capacities[env_id].fits(vcpu)}
+    for env_id in sorted(blocked):
+        capacity = capacities[env_id]
+        logger.info(
+            "Holding queued runs for environment_id=%s: %s vCPU in flight, limit %s (%s), oldest run needs %s.",
+            env_id,
+            capacity.in_flight_vcpu,
+            capacity.limit_vcpu,
+            capacity.limited_by,
+            head_vcpu[env_id],
+        )
+    return blocked
@@ -1,16 +1,30 @@
 """EMR release label management and synchronisation."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import re
+import threading
+import time
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import event, insert, select, update
 from sqlalchemy.orm import Session
 
 from sparkpilot.audit import write_audit_event
 from sparkpilot.aws_clients import EmrEksClient
 from sparkpilot.config import get_settings
-from sparkpilot.models import EmrRelease
+from sparkpilot.db import SessionLocal, upsert_insert
+from sparkpilot.models import EmrRelease, _new_id
 from sparkpilot.services._helpers import _now
 
+_SESSION_DIRTY_RELEASES_KEY = "sparkpilot_dirty_emr_releases"
+_SYNCED_COLUMNS = (
+    "lifecycle_status",
+    "graviton_supported",
+    "lake_formation_supported",
+    "upgrade_target",
+)
+
 
 # ---------------------------------------------------------------------------
 # Release label utilities
@@ -56,21 +70,23 @@ def list_emr_releases(db: Session, *, limit: int = 200, offset: int = 0) -> list
     return ordered[offset:offset + limit]
 
 
-def sync_emr_releases_once(db: Session, *, actor: str = "worker:emr-release-sync") -> int:
-    settings = get_settings()
-    client = EmrEksClient()
-    labels = sorted(set(client.list_release_labels(settings.aws_region)), reverse=True)
-    if not labels:
-        return 0
+def _list_labels_by_region(client: EmrEksClient, regions: list[str]) -> set[str]:
+    if len(regions) == 1:
+        return set(client.list_release_labels(regions[0]))
+    with ThreadPoolExecutor(max_workers=len(regions), thread_name_prefix="sparkpilot-emr-releases") as pool:
+        per_region = list(pool.map(client.list_release_labels, regions))
+    return {label for labels in per_region for label in labels}
+
 
+def _desired_release_values(labels: list[str]) -> tuple[str, dict[str, dict[str, Any]]]:
+    """Return ``(latest_label, {label: synced column values})`` for the listed labels."""
     parsed = [(label, _parse_release_version(label)) for label in labels]
     valid = [item for item in parsed if item[1] is not None]
     valid.sort(key=lambda item: item[1], reverse=True)
     latest_label = valid[0][0] if valid else labels[0]
 
     current_labels = {item[0] for item in valid[:3]}
-    changed = 0
-    now = _now()
+    desired: dict[str, dict[str, Any]] = {}
     for label, version in parsed:
         status_value = "deprecated"
         if label in current_labels:
@@ -79,33 +95,80 @@ def sync_emr_releases_once(db: Session, *, actor: str = "worker:emr-release-sync
             newest = valid[0][1]
             if newest and version[0] < newest[0]:
                 status_value = "end_of_life"
+        desired[label] = {
+            "lifecycle_status": status_value,
+            "graviton_supported": _graviton_supported_for_label(label),
+            "lake_formation_supported": _lake_formation_supported_for_label(label),
+            "upgrade_target": None if status_value == "current" else latest_label,
+        }
+    return latest_label, desired
 
-        row = db.execute(select(EmrRelease).where(EmrRelease.release_label == label)).scalar_one_or_none()
-        is_new = row is None
-        if is_new:
-            row = EmrRelease(release_label=label)
-            db.add(row)
-
-        previous = (
-            row.lifecycle_status,
-            row.graviton_supported,
-            row.lake_formation_supported,
-            row.upgrade_target,
+
+def _upsert_releases(
+    db: Session,
+    desired: dict[str, dict[str, Any]],
+    existing_ids: dict[str, str],
+) -> None:
+    now = _now()
+    table = EmrRelease.__table__
+    upsert = upsert_insert(db.get_bind(), table)
+    if upsert is not None:
+        stmt = upsert.values(
+            [
+                {
+                    "id": _new_id(),
+                    "release_label": label,
+                    "source": "emr-containers",
+                    "last_synced_at": now,
+                    "created_at": now,
+                    "updated_at": now,
+                    **values,
+                }
+                for label, values in desired.items()
+            ]
         )
-        row.lifecycle_status = status_value
-        row.graviton_supported = _graviton_supported_for_label(label)
-        row.lake_formation_supported = _lake_formation_supported_for_label(label)
-        row.upgrade_target = None if status_value == "current" else latest_label
-        row.source = "emr-containers"
-        row.last_synced_at = now
-        current = (
-            row.lifecycle_status,
-            row.graviton_supported,
-            row.lake_formation_supported,
-            row.upgrade_target,
+        set_ = {name: stmt.excluded[name] for name in (*_SYNCED_COLUMNS, "source", "last_synced_at", "updated_at")}
+        db.execute(stmt.on_conflict_do_update(index_elements=["release_label"], set_=set_))
+        return
+    # Generic fallback for dialects without an upsert construct.
+    updates = [
+        {"id": existing_ids[label], "source": "emr-containers", "last_synced_at": now, **values}
+        for label, values in desired.items()
+        if label in existing_ids
+    ]
+    inserts = [
+        {"release_label": label, "source": "emr-containers", "last_synced_at": now, **values}
+        for label, values in desired.items()
+        if label not in existing_ids
+    ]
+    if updates:
+        db.execute(update(EmrRelease), updates)
+    if inserts:
+        db.execute(insert(EmrRelease), inserts)
+
+
+def sync_emr_releases_once(db: Session, *, actor: str = "worker:emr-release-sync") -> int:
+    settings = get_settings()
+    client = EmrEksClient()
+    regions = settings.emr_release_sync_region_list
+    labels = sorted(_list_labels_by_region(client, regions), reverse=True)
+    if not labels:
+        return 0
+
+    latest_label, desired = _desired_release_values(labels)
+    existing = {
+        row.release_label: row
+        for row in db.execute(
+            select(EmrRelease.id, EmrRelease.release_label, *(getattr(EmrRelease, name) for name in _SYNCED_COLUMNS))
         )
-        if is_new or current != previous:
-            changed += 1
+    }
+    changed = sum(
+        1
+        for label, values in desired.items()
+        if label not in existing or tuple(getattr(existing[label], name) for name in _SYNCED_COLUMNS)
+        != tuple(values[name] for name in _SYNCED_COLUMNS)
+    )
+    _upsert_releases(db, desired, {label: row.id for label, row in existing.items()})
 
     write_audit_event(
         db,
@@ -115,9 +178,83 @@ def sync_emr_releases_once(db: Session, *, actor: str = "worker:emr-release-sync
         entity_id="emr_releases",
         details={
             "region": settings.aws_region,
+            "regions": regions,
             "release_count": len(labels),
             "latest_release_label": latest_label,
         },
     )
+    db.info[_SESSION_DIRTY_RELEASES_KEY] = True
     db.commit()
     return changed
+
+
+# ---------------------------------------------------------------------------
+# In-memory release index
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class EmrReleaseInfo:
+    release_label: str
+    lifecycle_status: str
+    graviton_supported: bool
+    lake_formation_supported: bool
+    upgrade_target: str | None
+
+
+_release_index: dict[str, EmrReleaseInfo] | None = None
+_release_index_loaded_at = 0.0
+_release_index_lock = threading.Lock()
+
+
+def _reset_release_index() -> None:
+    global _release_index
+    with _release_index_lock:
+        _release_index = None
+
+
+def _load_release_index(db: Session) -> dict[str, EmrReleaseInfo]:
+    rows = db.execute(
+        select(EmrRelease.release_label, *(getattr(EmrRelease, name) for name in _SYNCED_COLUMNS))
+    )
+    return {row.release_label: EmrReleaseInfo(**row._asdict()) for row in rows}
+
+
+def lookup_emr_release(label: str, *, db: Session | None = None) -> EmrReleaseInfo | None:
+    """Return the catalog entry for *label* (or its ``-latest``-less form) from the release index.
+
+    The whole catalog is loaded in one query and reused by every preflight.
+    Release writes committed in this process reload it on the next lookup;
+    syncs run by other worker processes become visible within
+    ``SPARKPILOT_EMR_RELEASE_INDEX_SECONDS``.
+    """
+    global _release_index, _release_index_loaded_at
+    ttl_seconds = get_settings().emr_release_index_seconds
+    with _release_index_lock:
+        index = _release_index
+        if index is not None and time.monotonic() - _release_index_loaded_at >= ttl_seconds:
+            index = None
+    if index is None:
+        loaded_at = time.monotonic()
+        if db is not None:
+            index = _load_release_index(db)
+        else:
+            with SessionLocal() as index_db:
+                index = _load_release_index(index_db)
+        if db is None or not db.info.get(_SESSION_DIRTY_RELEASES_KEY):
+            with _release_index_lock:
+                _release_index = index
+                _release_index_loaded_at = loaded_at
+    return index.get(label) or index.get(_canonical_release_label(label))
+
+
+@event.listens_for(Session, "before_flush")
+def _mark_releases_dirty(session: Session, *_args: Any) -> None:
+    if any(isinstance(obj, EmrRelease) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info[_SESSION_DIRTY_RELEASES_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _flush_dirty_releases(session: Session, *_args: Any) -> None:
+    if session.info.pop(_SESSION_DIRTY_RELEASES_KEY, None):
+        _reset_release_index()
@@ -1,20 +1,23 @@
 """Financial operations: budgets, cost allocation, CUR reconciliation, and usage recording."""
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 import json
 import logging
 import re
+import threading
 import time
 import uuid
 from typing import Any
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 from sparkpilot.cost_center import resolve_cost_center_for_environment
 from sparkpilot.exceptions import EntityNotFoundError, ValidationError
-from sqlalchemy import and_, case, func, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
 from sparkpilot.audit import write_audit_event
@@ -22,16 +25,21 @@ from sparkpilot.config import get_settings
 from sparkpilot.models import (
     CostAllocation,
     Environment,
+    RegionPricingSnapshot,
     Run,
     TeamBudget,
     UsageRecord,
 )
 from sparkpilot.schemas import (
+    CostShowbackItem,
     CostShowbackResponse,
+    CostWhatIfRequest,
+    CostWhatIfResponse,
     RequestedResources,
     TeamBudgetCreateRequest,
 )
-from sparkpilot.services._helpers import _as_utc, _now
+from sparkpilot.services._helpers import ACTIVE_RUN_STATES, _as_utc, _now
+from sparkpilot.services.cost_rollups import cached_team_spend
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +48,7 @@ from sparkpilot.services._helpers import _as_utc, _now
 
 ATHENA_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 EC2_MEMORY_RE = re.compile(r"([0-9]+(?:\.[0-9]+)?)")
+BILLING_PERIOD_RE = re.compile(r"^([0-9]{4})-([0-9]{2})$")
 X86_INSTANCE_PAIR_CANDIDATES = [
     ("c6i.xlarge", "r6i.xlarge"),
     ("c7i.xlarge", "r7i.xlarge"),
@@ -66,7 +75,15 @@ class PricingSnapshot:
 
 
 _PRICING_CACHE: dict[str, tuple[float, PricingSnapshot]] = {}
+# region -> (recheck_at_epoch, snapshot); hot-path view of region_pricing_snapshots.
+_REGION_PRICING_CACHE: dict[str, tuple[float, PricingSnapshot]] = {}
+_REGION_PRICING_LOCK = threading.Lock()
+# region -> earliest epoch for the next Pricing API attempt after a failure.
+_PRICING_REFRESH_RETRY_AT: dict[str, float] = {}
+PRICING_DB_RECHECK_SECONDS = 300
+PRICING_REFRESH_LEAD_FRACTION = 0.25
 ATHENA_RESULT_PAGE_SIZE = 1000
+ATHENA_TERMINAL_QUERY_STATES = {"SUCCEEDED", "FAILED", "CANCELLED"}
 
 
 def _validate_athena_identifier(value: str, setting_name: str) -> str:
@@ -108,6 +125,9 @@ def _quote_athena_literal(value: str) -> str:
 
 def _reset_pricing_cache() -> None:
     _PRICING_CACHE.clear()
+    with _REGION_PRICING_LOCK:
+        _REGION_PRICING_CACHE.clear()
+        _PRICING_REFRESH_RETRY_AT.clear()
 
 
 def _clamp_discount(value: float) -> float:
@@ -231,16 +251,17 @@ def _derive_architecture_rates(
     )
 
 
-def _fetch_pricing_api_snapshot(settings: Any) -> PricingSnapshot:
+def _fetch_pricing_api_snapshot(settings: Any, *, region: str | None = None) -> PricingSnapshot:
     pricing_client = boto3.client("pricing", region_name="us-east-1")
+    target_region = region or settings.aws_region
     x86_vcpu_hour, x86_memory_hour, x86_pair = _derive_architecture_rates(
         pricing_client,
-        region=settings.aws_region,
+        region=target_region,
         candidates=X86_INSTANCE_PAIR_CANDIDATES,
     )
     arm_vcpu_hour, arm_memory_hour, arm_pair = _derive_architecture_rates(
         pricing_client,
-        region=settings.aws_region,
+        region=target_region,
         candidates=ARM64_INSTANCE_PAIR_CANDIDATES,
     )
     x86_reference_hour = (
@@ -267,20 +288,30 @@ def _fetch_pricing_api_snapshot(settings: Any) -> PricingSnapshot:
     )
 
 
-def _resolve_runtime_pricing(settings: Any) -> PricingSnapshot:
-    cache_key = f"{settings.pricing_source}:{settings.aws_region}"
+def _live_pricing_enabled(settings: Any) -> bool:
+    if settings.pricing_source == "static":
+        return False
+    return not (settings.pricing_source == "auto" and settings.dry_run_mode)
+
+
+def _resolve_runtime_pricing(settings: Any, *, region: str | None = None) -> PricingSnapshot:
+    """Resolve pricing, calling the AWS Pricing API on a cache miss.
+
+    Only for offline callers (matrix planning, the pricing refresher).  Request
+    and worker hot paths use ``pricing_for_region``, which never calls AWS.
+    """
+    target_region = region or settings.aws_region
+    cache_key = f"{settings.pricing_source}:{target_region}"
     now_epoch = time.time()
     cached = _PRICING_CACHE.get(cache_key)
     if cached and cached[0] > now_epoch:
         return cached[1]
 
-    if settings.pricing_source == "static":
-        snapshot = _static_pricing_snapshot(settings)
-    elif settings.pricing_source == "auto" and settings.dry_run_mode:
+    if not _live_pricing_enabled(settings):
         snapshot = _static_pricing_snapshot(settings)
     else:
         try:
-            snapshot = _fetch_pricing_api_snapshot(settings)
+            snapshot = _fetch_pricing_api_snapshot(settings, region=target_region)
         except (ValueError, ClientError) as exc:
             if settings.pricing_source == "aws_pricing_api":
                 raise
@@ -299,6 +330,129 @@ def resolve_runtime_pricing(settings: Any | None = None) -> PricingSnapshot:
     return _resolve_runtime_pricing(runtime_settings)
 
 
+# ---------------------------------------------------------------------------
+# Persisted regional pricing (hot path + background refresh)
+# ---------------------------------------------------------------------------
+
+def _snapshot_from_record(record: RegionPricingSnapshot) -> PricingSnapshot:
+    return PricingSnapshot(
+        vcpu_usd_per_second=record.vcpu_usd_per_second,
+        memory_gb_usd_per_second=record.memory_gb_usd_per_second,
+        arm64_discount_pct=record.arm64_discount_pct,
+        mixed_discount_pct=record.mixed_discount_pct,
+        source=record.source,
+    )
+
+
+def pricing_for_region(db: Session, region: str | None) -> PricingSnapshot:
+    """Pricing for cost estimates in ``region`` without ever calling the Pricing API.
+
+    Serves the last good snapshot persisted by ``refresh_pricing_snapshots_once``
+    (re-read from the database every ``PRICING_DB_RECHECK_SECONDS`` so other
+    processes pick up refreshes) and falls back to the static rates until the
+    refresher has stored one for the region.  With
+    ``SPARKPILOT_PRICING_SOURCE=aws_pricing_api`` there is no static fallback:
+    a region without a persisted snapshot raises ``ValueError``.
+    """
+    settings = get_settings()
+    if not _live_pricing_enabled(settings):
+        return _static_pricing_snapshot(settings)
+    region_key = (region or "").strip() or settings.aws_region
+    now_epoch = time.time()
+    with _REGION_PRICING_LOCK:
+        cached = _REGION_PRICING_CACHE.get(region_key)
+    if cached and cached[0] > now_epoch:
+        return cached[1]
+
+    record = db.execute(
+        select(RegionPricingSnapshot).where(RegionPricingSnapshot.region == region_key)
+    ).scalar_one_or_none()
+    if record is not None:
+        snapshot = _snapshot_from_record(record)
+    elif cached is not None:
+        snapshot = cached[1]
+    elif settings.pricing_source == "aws_pricing_api":
+        raise ValueError(
+            f"No persisted AWS pricing snapshot for region {region_key}. "
+            "SPARKPILOT_PRICING_SOURCE=aws_pricing_api requires live pricing; run the "
+            "pricing-refresh worker or set SPARKPILOT_PRICING_SOURCE=auto to allow static rates."
+        )
+    else:
+        logger.warning(
+            "No persisted pricing snapshot for region %s yet; using static pricing until the "
+            "pricing-refresh worker stores one.",
+            region_key,
+        )
+        snapshot = _static_pricing_snapshot(settings, source="static-cold-start")
+    with _REGION_PRICING_LOCK:
+        _REGION_PRICING_CACHE[region_key] = (now_epoch + PRICING_DB_RECHECK_SECONDS, snapshot)
+    return snapshot
+
+
+def refresh_pricing_snapshots_once(db: Session) -> int:
+    """Fetch and persist pricing for every environment region nearing expiry.
+
+    Snapshots are refreshed once less than ``PRICING_REFRESH_LEAD_FRACTION`` of
+    ``SPARKPILOT_PRICING_CACHE_SECONDS`` remains, so readers never see an
+    expired entry while AWS is reachable.  A failed lookup keeps the last good
+    snapshot and is retried after ``PRICING_DB_RECHECK_SECONDS``.
+    """
+    settings = get_settings()
+    if not _live_pricing_enabled(settings):
+        return 0
+    regions = {settings.aws_region}
+    regions.update(
+        region for region in db.execute(select(Environment.region).distinct()).scalars() if region
+    )
+    records = {
+        record.region: record
+        for record in db.execute(
+            select(RegionPricingSnapshot).where(RegionPricingSnapshot.region.in_(regions))
+        ).scalars()
+    }
+    now = _now()
+    now_epoch = time.time()
+    refresh_before = now + timedelta(seconds=settings.pricing_cache_seconds * PRICING_REFRESH_LEAD_FRACTION)
+    refreshed = 0
+    for region in sorted(regions):
+        record = records.get(region)
+        if record is not None and _as_utc(record.expires_at) > refresh_before:
+            continue
+        with _REGION_PRICING_LOCK:
+            if _PRICING_REFRESH_RETRY_AT.get(region, 0.0) > now_epoch:
+                continue
+        try:
+            snapshot = _fetch_pricing_api_snapshot(settings, region=region)
+        except (ValueError, ClientError) as exc:
+            logger.warning(
+                "Pricing refresh failed for region %s; keeping the last good snapshot.",
+                region,
+                exc_info=exc,
+            )
+            with _REGION_PRICING_LOCK:
+                _PRICING_REFRESH_RETRY_AT[region] = now_epoch + PRICING_DB_RECHECK_SECONDS
+            if record is not None:
+                record.last_error = str(exc)[:2000]
+            continue
+        if record is None:
+            record = RegionPricingSnapshot(region=region)
+            db.add(record)
+        record.source = snapshot.source
+        record.vcpu_usd_per_second = snapshot.vcpu_usd_per_second
+        record.memory_gb_usd_per_second = snapshot.memory_gb_usd_per_second
+        record.arm64_discount_pct = snapshot.arm64_discount_pct
+        record.mixed_discount_pct = snapshot.mixed_discount_pct
+        record.fetched_at = now
+        record.expires_at = now + timedelta(seconds=settings.pricing_cache_seconds)
+        record.last_error = None
+        with _REGION_PRICING_LOCK:
+            _PRICING_REFRESH_RETRY_AT.pop(region, None)
+            _REGION_PRICING_CACHE[region] = (now_epoch + PRICING_DB_RECHECK_SECONDS, snapshot)
+        refreshed += 1
+    db.commit()
+    return refreshed
+
+
 # ---------------------------------------------------------------------------
 # Billing / cost helpers
 # ---------------------------------------------------------------------------
@@ -316,37 +470,86 @@ def _cost_center_for_environment(env: Environment, settings: Any) -> str:
     return resolve_cost_center_for_environment(settings=settings, environment=env)
 
 
+def _architecture_cost_multiplier(instance_architecture: str | None, pricing: PricingSnapshot) -> float:
+    if instance_architecture == "arm64":
+        return max(0.0, 1.0 - (pricing.arm64_discount_pct / 100.0))
+    if instance_architecture == "mixed":
+        return max(0.0, 1.0 - (pricing.mixed_discount_pct / 100.0))
+    return 1.0
+
+
+def _estimate_usage(
+    resources: RequestedResources,
+    *,
+    duration_seconds: int,
+    instance_architecture: str | None,
+    pricing: PricingSnapshot,
+) -> tuple[int, int, int]:
+    """Return ``(vcpu_seconds, memory_gb_seconds, estimated_cost_usd_micros)``."""
+    vcpu_seconds = duration_seconds * resources.total_vcpu()
+    memory_total = resources.driver_memory_gb + (resources.executor_memory_gb * resources.executor_instances)
+    memory_gb_seconds = duration_seconds * memory_total
+    estimated_cost_usd = (
+        (vcpu_seconds * pricing.vcpu_usd_per_second) +
+        (memory_gb_seconds * pricing.memory_gb_usd_per_second)
+    ) * _architecture_cost_multiplier(instance_architecture, pricing)
+    return vcpu_seconds, memory_gb_seconds, int(estimated_cost_usd * 1_000_000)
+
+
 def _team_spend_for_period(db: Session, team: str, period: str) -> tuple[int, int, int]:
-    # Aggregate query without GROUP BY always returns exactly one row; `.one()` is safe.
-    estimated, actual, effective = db.execute(
+    return cached_team_spend(db, team=team, period=period)
+
+
+def _active_run_reserved_cost_usd_micros(db: Session, team: str) -> int:
+    """Worst-case cost of the team's queued and running runs.
+
+    Reads the same ledger quota enforcement uses (active runs and their
+    requested resources) and reserves each run's cost at its full
+    ``timeout_seconds``, which bounds what it can bill before the reconciler
+    times it out.  Active runs have no ``CostAllocation`` yet, so this never
+    double counts recorded spend.
+    """
+    rows = db.execute(
         select(
-            func.coalesce(func.sum(CostAllocation.estimated_cost_usd_micros), 0),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (CostAllocation.actual_cost_usd_micros.is_not(None), CostAllocation.actual_cost_usd_micros),
-                        else_=0,
-                    )
-                ),
-                0,
-            ),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (CostAllocation.actual_cost_usd_micros.is_not(None), CostAllocation.actual_cost_usd_micros),
-                        else_=CostAllocation.estimated_cost_usd_micros,
-                    )
-                ),
-                0,
-            ),
-        ).where(
-            and_(
-                CostAllocation.team == team,
-                CostAllocation.billing_period == period,
-            )
+            Run.requested_resources_json,
+            Run.timeout_seconds,
+            Environment.instance_architecture,
+            Environment.region,
+        )
+        .join(Environment, Environment.id == Run.environment_id)
+        .where(
+            # Team keys are tenant ids; see _team_key_for_environment.
+            Environment.tenant_id == team,
+            Run.state.in_(ACTIVE_RUN_STATES),
         )
-    ).one()
-    return int(estimated), int(actual), int(effective)
+    )
+    pricing_by_region: dict[str, PricingSnapshot] = {}
+    reserved = 0
+    for resources_json, timeout_seconds, instance_architecture, region in rows:
+        if region not in pricing_by_region:
+            pricing_by_region[region] = pricing_for_region(db, region)
+        _, _, cost_micros = _estimate_usage(
+            RequestedResources(**(resources_json or {})),
+            duration_seconds=max(0, int(timeout_seconds or 0)),
+            instance_architecture=instance_architecture,
+            pricing=pricing_by_region[region],
+        )
+        reserved += cost_micros
+    return reserved
+
+
+def _team_budget_spend(db: Session, team: str, period: str) -> tuple[int, int | None]:
+    """Return ``(spend, active_run_reserved)`` used for budget enforcement.
+
+    ``SPARKPILOT_TEAM_BUDGET_SPEND_MODE=projected`` adds the reserved cost of
+    active runs so bursts of submissions cannot overshoot the budget before
+    their usage is recorded; ``active_run_reserved`` is ``None`` otherwise.
+    """
+    _, _, effective = _team_spend_for_period(db, team, period)
+    if get_settings().team_budget_spend_mode != "projected":
+        return effective, None
+    reserved = _active_run_reserved_cost_usd_micros(db, team)
+    return effective + reserved, reserved
 
 
 # ---------------------------------------------------------------------------
@@ -379,6 +582,13 @@ def get_team_budget(db: Session, team: str) -> TeamBudget:
 # Cost showback
 # ---------------------------------------------------------------------------
 
+_COST_SHOWBACK_ITEM_COLUMNS: dict[str, tuple[str, ...]] = {
+    "estimated_cost_usd_micros": ("estimated_cost_usd_micros",),
+    "actual_cost_usd_micros": ("actual_cost_usd_micros",),
+    "effective_cost_usd_micros": ("estimated_cost_usd_micros", "actual_cost_usd_micros"),
+}
+
+
 def get_cost_showback(
     db: Session,
     *,
@@ -386,71 +596,206 @@ def get_cost_showback(
     period: str,
     limit: int = 200,
     offset: int = 0,
+    item_fields: list[str] | None = None,
 ) -> CostShowbackResponse:
+    """Return showback totals and allocation items for *team* in *period*.
+
+    With *item_fields* only those ``CostShowbackItem`` fields are read and
+    returned per item; the response is then built without validation because
+    its items are partial.
+    """
     filters = and_(
         CostAllocation.team == team,
         CostAllocation.billing_period == period,
     )
-    total_estimated, total_actual, total_effective = db.execute(
-        select(
-            func.coalesce(func.sum(CostAllocation.estimated_cost_usd_micros), 0),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (CostAllocation.actual_cost_usd_micros.is_not(None), CostAllocation.actual_cost_usd_micros),
-                        else_=0,
-                    )
-                ),
-                0,
-            ),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (CostAllocation.actual_cost_usd_micros.is_not(None), CostAllocation.actual_cost_usd_micros),
-                        else_=CostAllocation.estimated_cost_usd_micros,
-                    )
-                ),
-                0,
-            ),
-        ).where(filters)
-    ).one()
-    rows = list(
-        db.execute(
-            select(CostAllocation)
-            .where(filters)
-            .order_by(CostAllocation.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-        ).scalars()
+    total_estimated, total_actual, total_effective = _team_spend_for_period(db, team, period)
+    active_reserved = None
+    if get_settings().team_budget_spend_mode == "projected":
+        active_reserved = _active_run_reserved_cost_usd_micros(db, team)
+    fields = item_fields or list(CostShowbackItem.model_fields)
+    columns = dict.fromkeys(
+        column
+        for field in fields
+        for column in _COST_SHOWBACK_ITEM_COLUMNS.get(field, (field,))
     )
+    rows = db.execute(
+        select(*[getattr(CostAllocation, column) for column in columns])
+        .where(filters)
+        .order_by(CostAllocation.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    ).all()
     items: list[dict[str, Any]] = []
-    for item in rows:
-        estimated = int(item.estimated_cost_usd_micros or 0)
-        actual = int(item.actual_cost_usd_micros) if item.actual_cost_usd_micros is not None else None
-        effective = actual if actual is not None else estimated
-        items.append(
-            {
-                "run_id": item.run_id,
-                "environment_id": item.environment_id,
-                "team": item.team,
-                "cost_center": item.cost_center,
-                "estimated_cost_usd_micros": estimated,
-                "actual_cost_usd_micros": actual,
-                "effective_cost_usd_micros": effective,
-                "billing_period": item.billing_period,
-                "cur_reconciled_at": item.cur_reconciled_at,
-            }
-        )
-    return CostShowbackResponse(
+    for row in rows:
+        values = dict(row._mapping)
+        if "estimated_cost_usd_micros" in values:
+            values["estimated_cost_usd_micros"] = int(values["estimated_cost_usd_micros"] or 0)
+        if values.get("actual_cost_usd_micros") is not None:
+            values["actual_cost_usd_micros"] = int(values["actual_cost_usd_micros"])
+        if "effective_cost_usd_micros" in fields:
+            actual = values["actual_cost_usd_micros"]
+            values["effective_cost_usd_micros"] = actual if actual is not None else values["estimated_cost_usd_micros"]
+        items.append({field: values[field] for field in fields})
+    build = CostShowbackResponse.model_construct if item_fields else CostShowbackResponse
+    return build(
         team=team,
         period=period,
         total_estimated_cost_usd_micros=int(total_estimated),
         total_actual_cost_usd_micros=int(total_actual),
         total_effective_cost_usd_micros=int(total_effective),
+        active_run_reserved_cost_usd_micros=active_reserved,
         items=items,
     )
 
 
+# ---------------------------------------------------------------------------
+# Batch cost estimation / what-if
+# ---------------------------------------------------------------------------
+
+def _architecture_multipliers(architectures: ArrayLike, pricing: PricingSnapshot) -> NDArray[np.float64]:
+    labels = np.asarray(architectures, dtype=object)
+    return np.select(
+        [labels == "arm64", labels == "mixed"],
+        [
+            _architecture_cost_multiplier("arm64", pricing),
+            _architecture_cost_multiplier("mixed", pricing),
+        ],
+        default=1.0,
+    )
+
+
+def estimate_usage_costs_usd_micros(
+    *,
+    vcpu_seconds: ArrayLike,
+    memory_gb_seconds: ArrayLike,
+    architectures: ArrayLike,
+    pricing: PricingSnapshot,
+) -> NDArray[np.int64]:
+    """Vectorised ``_estimate_usage`` cost over aligned usage arrays.
+
+    ``architectures`` may be an array of labels or a single label applied to
+    every row.  Operation order matches the scalar path, so each element is
+    identical to what ``_record_usage_if_needed`` would record.
+    """
+    cost_usd = (
+        (np.asarray(vcpu_seconds, dtype=np.float64) * pricing.vcpu_usd_per_second) +
+        (np.asarray(memory_gb_seconds, dtype=np.float64) * pricing.memory_gb_usd_per_second)
+    ) * _architecture_multipliers(architectures, pricing)
+    return np.trunc(cost_usd * 1_000_000).astype(np.int64)
+
+
+def estimate_run_costs_usd_micros(
+    *,
+    duration_seconds: ArrayLike,
+    vcpu: ArrayLike,
+    memory_gb: ArrayLike,
+    architectures: ArrayLike,
+    pricing: PricingSnapshot,
+) -> NDArray[np.int64]:
+    """Batch cost estimate for runs described by duration, total vCPU and total memory."""
+    durations = np.asarray(duration_seconds, dtype=np.float64)
+    return estimate_usage_costs_usd_micros(
+        vcpu_seconds=durations * np.asarray(vcpu, dtype=np.float64),
+        memory_gb_seconds=durations * np.asarray(memory_gb, dtype=np.float64),
+        architectures=architectures,
+        pricing=pricing,
+    )
+
+
+def run_cost_what_if(db: Session, req: CostWhatIfRequest) -> CostWhatIfResponse:
+    """Re-price a team's recorded usage under alternative pricing or architecture.
+
+    The baseline re-prices every allocation in the period range at its
+    environment region's current pricing and architecture; the scenario
+    applies the request's overrides.  Each region is one vectorised pass.
+    """
+    if req.period_start > req.period_end:
+        raise ValidationError("period_start must be less than or equal to period_end.")
+    overrides = {
+        field: value
+        for field in (
+            "vcpu_usd_per_second",
+            "memory_gb_usd_per_second",
+            "arm64_discount_pct",
+            "mixed_discount_pct",
+        )
+        if (value := getattr(req, field)) is not None
+    }
+    rows = db.execute(
+        select(
+            CostAllocation.billing_period,
+            CostAllocation.estimated_vcpu_seconds,
+            CostAllocation.estimated_memory_gb_seconds,
+            Environment.instance_architecture,
+            Environment.region,
+        )
+        .join(Environment, Environment.id == CostAllocation.environment_id)
+        .where(
+            and_(
+                CostAllocation.team == req.team,
+                CostAllocation.billing_period >= req.period_start,
+                CostAllocation.billing_period <= req.period_end,
+            )
+        )
+    ).all()
+    periods: list[dict[str, Any]] = []
+    pricing_sources: set[str] = set()
+    baseline_total = 0
+    scenario_total = 0
+    if rows:
+        billing_periods, vcpu_seconds, memory_gb_seconds, architectures, regions = (
+            np.asarray(column) for column in zip(*rows)
+        )
+        baseline = np.zeros(len(rows), dtype=np.int64)
+        scenario = np.zeros(len(rows), dtype=np.int64)
+        for region in np.unique(regions):
+            mask = regions == region
+            baseline_pricing = pricing_for_region(db, str(region))
+            pricing_sources.add(baseline_pricing.source)
+            baseline[mask] = estimate_usage_costs_usd_micros(
+                vcpu_seconds=vcpu_seconds[mask],
+                memory_gb_seconds=memory_gb_seconds[mask],
+                architectures=architectures[mask],
+                pricing=baseline_pricing,
+            )
+            scenario[mask] = estimate_usage_costs_usd_micros(
+                vcpu_seconds=vcpu_seconds[mask],
+                memory_gb_seconds=memory_gb_seconds[mask],
+                architectures=req.instance_architecture or architectures[mask],
+                pricing=replace(baseline_pricing, **overrides) if overrides else baseline_pricing,
+            )
+        labels, inverse = np.unique(billing_periods, return_inverse=True)
+        run_counts = np.bincount(inverse, minlength=len(labels))
+        baseline_by_period = np.zeros(len(labels), dtype=np.int64)
+        scenario_by_period = np.zeros(len(labels), dtype=np.int64)
+        np.add.at(baseline_by_period, inverse, baseline)
+        np.add.at(scenario_by_period, inverse, scenario)
+        for index, label in enumerate(labels):
+            periods.append(
+                {
+                    "billing_period": str(label),
+                    "run_count": int(run_counts[index]),
+                    "baseline_cost_usd_micros": int(baseline_by_period[index]),
+                    "scenario_cost_usd_micros": int(scenario_by_period[index]),
+                }
+            )
+        baseline_total = int(baseline.sum())
+        scenario_total = int(scenario.sum())
+    else:
+        pricing_sources.add(pricing_for_region(db, None).source)
+    return CostWhatIfResponse(
+        team=req.team,
+        period_start=req.period_start,
+        period_end=req.period_end,
+        run_count=len(rows),
+        pricing_source=", ".join(sorted(pricing_sources)),
+        baseline_cost_usd_micros=baseline_total,
+        scenario_cost_usd_micros=scenario_total,
+        delta_cost_usd_micros=scenario_total - baseline_total,
+        periods=periods,
+    )
+
+
 # ---------------------------------------------------------------------------
 # CUR reconciliation
 # ---------------------------------------------------------------------------
@@ -463,61 +808,126 @@ def _cur_reconciliation_configured(settings: Any) -> bool:
     )
 
 
-def _load_pending_cost_allocations(db: Session, *, limit: int) -> list[CostAllocation]:
+def _cur_query_identifiers(settings: Any) -> tuple[str, str, str, str]:
+    return (
+        _validate_athena_identifier(settings.cur_run_id_column, "cur_run_id_column"),
+        _validate_athena_identifier(settings.cur_cost_column, "cur_cost_column"),
+        _validate_athena_identifier(settings.cur_athena_database, "cur_athena_database"),
+        _validate_athena_identifier(settings.cur_athena_table, "cur_athena_table"),
+    )
+
+
+def _load_pending_cost_allocations(
+    db: Session,
+    *,
+    limit: int,
+    now: datetime,
+    max_attempts: int,
+) -> list[CostAllocation]:
+    """Load allocations that are due for a CUR lookup.
+
+    Rows that were already looked up and not found are pushed back via
+    ``cur_next_attempt_at`` so they no longer starve newer allocations.
+    Never-attempted rows sort first, then the longest-overdue retries.
+    """
     return list(
         db.execute(
             select(CostAllocation)
-            .where(CostAllocation.actual_cost_usd_micros.is_(None))
-            .order_by(CostAllocation.created_at.asc())
+            .where(
+                and_(
+                    CostAllocation.actual_cost_usd_micros.is_(None),
+                    CostAllocation.cur_query_execution_id.is_(None),
+                    CostAllocation.cur_reconcile_attempts < max_attempts,
+                    or_(
+                        CostAllocation.cur_next_attempt_at.is_(None),
+                        CostAllocation.cur_next_attempt_at <= now,
+                    ),
+                )
+            )
+            .order_by(
+                CostAllocation.cur_next_attempt_at.is_not(None).asc(),
+                CostAllocation.cur_next_attempt_at.asc(),
+                CostAllocation.created_at.asc(),
+            )
             .limit(limit)
         ).scalars()
     )
 
 
+def _load_in_flight_cur_queries(db: Session) -> dict[str, list[CostAllocation]]:
+    rows = db.execute(
+        select(CostAllocation).where(
+            and_(
+                CostAllocation.actual_cost_usd_micros.is_(None),
+                CostAllocation.cur_query_execution_id.is_not(None),
+            )
+        )
+    ).scalars()
+    in_flight: dict[str, list[CostAllocation]] = {}
+    for item in rows:
+        in_flight.setdefault(str(item.cur_query_execution_id), []).append(item)
+    return in_flight
+
+
+def _partition_cur_batches(
+    pending: list[CostAllocation],
+    *,
+    max_run_ids: int,
+) -> list[tuple[str, list[CostAllocation]]]:
+    """Group pending allocations by billing period, then chunk each group.
+
+    One Athena query per (billing period, chunk) lets the query prune CUR
+    partitions instead of scanning every month of the report.
+    """
+    by_period: dict[str, list[CostAllocation]] = {}
+    for item in pending:
+        by_period.setdefault(item.billing_period, []).append(item)
+    batches: list[tuple[str, list[CostAllocation]]] = []
+    for period in sorted(by_period):
+        items = by_period[period]
+        for start in range(0, len(items), max_run_ids):
+            batches.append((period, items[start:start + max_run_ids]))
+    return batches
+
+
+def _cur_partition_predicate(settings: Any, billing_period: str | None) -> str:
+    style = settings.cur_partition_style
+    if style == "none" or not billing_period:
+        return ""
+    match = BILLING_PERIOD_RE.match(billing_period)
+    if not match:
+        raise ValueError(f"Invalid billing period for CUR reconciliation: {billing_period!r}.")
+    year, month = match.group(1), match.group(2)
+    if style == "year_month":
+        # Legacy CUR Athena integration partitions on unpadded year/month strings.
+        return f"year = {_quote_athena_literal(year)} AND month = {_quote_athena_literal(str(int(month)))} AND "
+    return f"billing_period = {_quote_athena_literal(billing_period)} AND "
+
+
 def _build_cur_reconciliation_query(
     *,
     settings: Any,
     pending: list[CostAllocation],
+    billing_period: str | None = None,
 ) -> tuple[str, str, str]:
-    run_id_column = _validate_athena_identifier(settings.cur_run_id_column, "cur_run_id_column")
-    cost_column = _validate_athena_identifier(settings.cur_cost_column, "cur_cost_column")
-    athena_database = _validate_athena_identifier(settings.cur_athena_database, "cur_athena_database")
-    athena_table = _validate_athena_identifier(settings.cur_athena_table, "cur_athena_table")
+    run_id_column, cost_column, athena_database, athena_table = _cur_query_identifiers(settings)
 
     run_ids = _validate_uuid_run_ids(sorted({item.run_id for item in pending}))
     if not run_ids:
         return "", athena_database, athena_table
 
     quoted_ids = ", ".join(_quote_athena_literal(item) for item in run_ids)
+    partition_predicate = _cur_partition_predicate(settings, billing_period)
     sql = (
         f"SELECT {run_id_column} AS run_id, "
         f"SUM(CAST({cost_column} AS DOUBLE)) AS cost_usd "
         f"FROM {athena_database}.{athena_table} "
-        f"WHERE {run_id_column} IN ({quoted_ids}) "
+        f"WHERE {partition_predicate}{run_id_column} IN ({quoted_ids}) "
         "GROUP BY 1"
     )
     return sql, athena_database, athena_table
 
 
-def _wait_for_athena_query(
-    *,
-    athena: Any,
-    query_execution_id: str,
-    timeout_seconds: int,
-    poll_seconds: int,
-) -> None:
-    deadline = time.time() + timeout_seconds
-    state = "QUEUED"
-    while time.time() < deadline:
-        execution = athena.get_query_execution(QueryExecutionId=query_execution_id)
-        state = execution["QueryExecution"]["Status"]["State"]
-        if state in {"SUCCEEDED", "FAILED", "CANCELLED"}:
-            break
-        time.sleep(max(1, poll_seconds))
-    if state != "SUCCEEDED":
-        raise ValueError(f"CUR Athena reconciliation query failed with state={state}.")
-
-
 def _parse_athena_cost_rows(rows: list[dict[str, Any]]) -> dict[str, int]:
     cost_by_run_id: dict[str, int] = {}
     for row in rows:
@@ -561,59 +971,218 @@ def _collect_athena_result_rows(
     return rows
 
 
+def _cur_retry_delay_seconds(settings: Any, attempts: int) -> int:
+    exponent = max(0, attempts - 1)
+    # Cap the exponent before shifting so large attempt counts cannot overflow.
+    delay = settings.cur_retry_base_seconds * (2 ** min(exponent, 20))
+    return int(min(delay, settings.cur_retry_max_seconds))
+
+
+def _release_cur_query(items: list[CostAllocation], *, settings: Any, now: datetime) -> None:
+    """Count a failed lookup and back the allocations off like an unmatched result.
+
+    Queries that fail, are cancelled or time out use up an attempt, so an
+    allocation whose query never succeeds stops at ``cur_max_attempts``.
+    """
+    for item in items:
+        item.cur_query_execution_id = None
+        item.cur_reconcile_attempts = int(item.cur_reconcile_attempts or 0) + 1
+        item.cur_next_attempt_at = now + timedelta(
+            seconds=_cur_retry_delay_seconds(settings, item.cur_reconcile_attempts)
+        )
+
+
 def _apply_cur_cost_updates(
     *,
     pending: list[CostAllocation],
     cost_by_run_id: dict[str, int],
+    settings: Any,
 ) -> int:
+    """Write CUR actuals onto matched allocations and back off the misses.
+
+    Unmatched allocations are retried with exponential backoff (CUR lands
+    with a delay and is restated until month close) and stop being queried
+    once ``cur_max_attempts`` is reached.
+    """
     changed = 0
     reconciled_at = _now()
     for item in pending:
+        item.cur_query_execution_id = None
         if item.run_id not in cost_by_run_id:
+            item.cur_reconcile_attempts = int(item.cur_reconcile_attempts or 0) + 1
+            item.cur_next_attempt_at = reconciled_at + timedelta(
+                seconds=_cur_retry_delay_seconds(settings, item.cur_reconcile_attempts)
+            )
             continue
         item.actual_cost_usd_micros = cost_by_run_id[item.run_id]
         item.cur_reconciled_at = reconciled_at
+        item.cur_reconcile_attempts = int(item.cur_reconcile_attempts or 0) + 1
+        item.cur_next_attempt_at = None
         changed += 1
     return changed
 
 
-def process_cur_reconciliation_once(db: Session, *, actor: str = "worker:cur-reconciliation", limit: int = 200) -> int:
-    settings = get_settings()
-    if not _cur_reconciliation_configured(settings):
-        return 0
+def _start_cur_queries(
+    *,
+    athena: Any,
+    settings: Any,
+    batches: list[tuple[str, list[CostAllocation]]],
+    now: datetime,
+) -> dict[str, list[CostAllocation]]:
+    """Start one Athena query per batch and lease its allocations to it.
+
+    If a start fails, the queries already started are still returned so the
+    caller persists their ids; the failed batch is backed off and the rest
+    wait for the next cycle.
+    """
+    started: dict[str, list[CostAllocation]] = {}
+    # While a query is in flight, cur_next_attempt_at doubles as its lease deadline.
+    lease_deadline = now + timedelta(seconds=settings.cur_query_timeout_seconds)
+    for billing_period, items in batches:
+        sql, athena_database, _ = _build_cur_reconciliation_query(
+            settings=settings,
+            pending=items,
+            billing_period=billing_period,
+        )
+        if not sql:
+            continue
+        try:
+            start = athena.start_query_execution(
+                QueryString=sql,
+                QueryExecutionContext={"Database": athena_database},
+                ResultConfiguration={"OutputLocation": settings.cur_athena_output_location},
+                WorkGroup=settings.cur_athena_workgroup,
+            )
+        except (ClientError, BotoCoreError):
+            logger.warning(
+                "Unable to start CUR Athena reconciliation query for billing_period=%s; %s allocations rescheduled.",
+                billing_period,
+                len(items),
+                exc_info=True,
+            )
+            _release_cur_query(items, settings=settings, now=now)
+            break
+        query_execution_id = str(start["QueryExecutionId"])
+        for item in items:
+            item.cur_query_execution_id = query_execution_id
+            item.cur_next_attempt_at = lease_deadline
+        started.setdefault(query_execution_id, []).extend(items)
+    return started
 
-    pending = _load_pending_cost_allocations(db, limit=limit)
-    if not pending:
-        return 0
 
-    sql, athena_database, athena_table = _build_cur_reconciliation_query(
-        settings=settings,
-        pending=pending,
-    )
-    if not sql:
+def _collect_cur_query_results(
+    *,
+    athena: Any,
+    settings: Any,
+    in_flight: dict[str, list[CostAllocation]],
+    now: datetime,
+) -> tuple[int, list[str], int]:
+    """Poll each in-flight query once and apply the ones that have finished.
+
+    Queries still running are left for the next cycle instead of sleeping on
+    them, so one slow scan never holds up the rest of the batch.  Returns the
+    number of reconciled allocations, the completed query ids, and the number
+    of queries that are still running.
+    """
+    changed = 0
+    completed: list[str] = []
+    running = 0
+    for query_execution_id, items in in_flight.items():
+        execution = athena.get_query_execution(QueryExecutionId=query_execution_id)
+        state = execution["QueryExecution"]["Status"]["State"]
+        if state == "SUCCEEDED":
+            rows = _collect_athena_result_rows(
+                athena=athena,
+                query_execution_id=query_execution_id,
+            )
+            changed += _apply_cur_cost_updates(
+                pending=items,
+                cost_by_run_id=_parse_athena_cost_rows(rows),
+                settings=settings,
+            )
+            completed.append(query_execution_id)
+            continue
+        if state in ATHENA_TERMINAL_QUERY_STATES:
+            logger.warning(
+                "CUR Athena reconciliation query %s finished with state=%s; %s allocations rescheduled.",
+                query_execution_id,
+                state,
+                len(items),
+            )
+            _release_cur_query(items, settings=settings, now=now)
+            continue
+        lease_deadline = items[0].cur_next_attempt_at
+        if lease_deadline is not None and _as_utc(lease_deadline) <= now:
+            logger.warning(
+                "CUR Athena reconciliation query %s exceeded %ss; stopping and rescheduling.",
+                query_execution_id,
+                settings.cur_query_timeout_seconds,
+            )
+            try:
+                athena.stop_query_execution(QueryExecutionId=query_execution_id)
+            except ClientError:
+                logger.warning("Unable to stop CUR Athena query %s.", query_execution_id, exc_info=True)
+            _release_cur_query(items, settings=settings, now=now)
+            continue
+        running += 1
+    return changed, completed, running
+
+
+def process_cur_reconciliation_once(
+    db: Session,
+    *,
+    actor: str = "worker:cur-reconciliation",
+    limit: int | None = None,
+) -> int:
+    """Advance the CUR reconciliation pipeline by one non-blocking step.
+
+    Each cycle collects queries started by earlier cycles, fills free query
+    slots (up to ``cur_max_concurrent_queries``) with due allocations grouped
+    by billing period, then polls the new queries once.
+    """
+    settings = get_settings()
+    if not _cur_reconciliation_configured(settings):
         return 0
+    _, _, athena_database, athena_table = _cur_query_identifiers(settings)
 
+    now = _now()
     athena = boto3.client("athena", region_name=settings.aws_region)
-    start = athena.start_query_execution(
-        QueryString=sql,
-        QueryExecutionContext={"Database": athena_database},
-        ResultConfiguration={"OutputLocation": settings.cur_athena_output_location},
-        WorkGroup=settings.cur_athena_workgroup,
-    )
-    query_execution_id = start["QueryExecutionId"]
-    _wait_for_athena_query(
-        athena=athena,
-        query_execution_id=query_execution_id,
-        timeout_seconds=settings.cur_query_timeout_seconds,
-        poll_seconds=settings.cur_poll_seconds,
-    )
+    changed = 0
+    completed: list[str] = []
+    running = 0
+    in_flight = _load_in_flight_cur_queries(db)
+    if in_flight:
+        changed, completed, running = _collect_cur_query_results(
+            athena=athena,
+            settings=settings,
+            in_flight=in_flight,
+            now=now,
+        )
 
-    rows = _collect_athena_result_rows(
-        athena=athena,
-        query_execution_id=query_execution_id,
-    )
-    cost_by_run_id = _parse_athena_cost_rows(rows)
-    changed = _apply_cur_cost_updates(pending=pending, cost_by_run_id=cost_by_run_id)
+    capacity = settings.cur_max_concurrent_queries - running
+    if capacity > 0:
+        max_allocations = capacity * settings.cur_query_max_run_ids
+        if limit is not None:
+            max_allocations = min(max_allocations, limit)
+        pending = _load_pending_cost_allocations(
+            db,
+            limit=max_allocations,
+            now=now,
+            max_attempts=settings.cur_max_attempts,
+        )
+        batches = _partition_cur_batches(pending, max_run_ids=settings.cur_query_max_run_ids)[:capacity]
+        started = _start_cur_queries(athena=athena, settings=settings, batches=batches, now=now)
+        if started:
+            # Persist query ids before polling so a crash cannot orphan running scans.
+            db.commit()
+            started_changed, started_completed, _ = _collect_cur_query_results(
+                athena=athena,
+                settings=settings,
+                in_flight=started,
+                now=now,
+            )
+            changed += started_changed
+            completed.extend(started_completed)
 
     if changed:
         write_audit_event(
@@ -624,12 +1193,12 @@ def process_cur_reconciliation_once(db: Session, *, actor: str = "worker:cur-rec
             entity_id="cost_allocations",
             details={
                 "changed": changed,
-                "query_execution_id": query_execution_id,
+                "query_execution_ids": completed,
                 "database": athena_database,
                 "table": athena_table,
             },
         )
-        db.commit()
+    db.commit()
     return changed
 
 
@@ -645,21 +1214,12 @@ def _record_usage_if_needed(db: Session, run: Run, env: Environment) -> None:
     duration_seconds = 0
     if run.started_at and run.ended_at:
         duration_seconds = max(0, int((_as_utc(run.ended_at) - _as_utc(run.started_at)).total_seconds()))
-    resources = RequestedResources(**(run.requested_resources_json or {}))
-    pricing = _resolve_runtime_pricing(settings)
-    vcpu_seconds = duration_seconds * resources.total_vcpu()
-    memory_total = resources.driver_memory_gb + (resources.executor_memory_gb * resources.executor_instances)
-    memory_gb_seconds = duration_seconds * memory_total
-    architecture_multiplier = 1.0
-    if env.instance_architecture == "arm64":
-        architecture_multiplier = max(0.0, 1.0 - (pricing.arm64_discount_pct / 100.0))
-    elif env.instance_architecture == "mixed":
-        architecture_multiplier = max(0.0, 1.0 - (pricing.mixed_discount_pct / 100.0))
-    estimated_cost_usd = (
-        (vcpu_seconds * pricing.vcpu_usd_per_second) +
-        (memory_gb_seconds * pricing.memory_gb_usd_per_second)
-    ) * architecture_multiplier
-    estimated_cost_usd_micros = int(estimated_cost_usd * 1_000_000)
+    vcpu_seconds, memory_gb_seconds, estimated_cost_usd_micros = _estimate_usage(
+        RequestedResources(**(run.requested_resources_json or {})),
+        duration_seconds=duration_seconds,
+        instance_architecture=env.instance_architecture,
+        pricing=pricing_for_region(db, env.region),
+    )
     db.add(
         UsageRecord(
             tenant_id=env.tenant_id,
@@ -0,0 +1,412 @@
+"""Warm pool of EMR on EKS managed endpoints for interactive sessions.
+
+A cold managed endpoint spends minutes on pod scheduling and image pulls
+before it accepts a kernel.  The ``interactive-pool`` worker keeps ready
+endpoints per environment during ``SPARKPILOT_INTERACTIVE_POOL_HOURS_UTC``
+and sizes the pool from recent short-run demand in ``runs``.
+``acquire_warm_endpoint`` leases one to an actor in a single conditional
+UPDATE, and ``renew_endpoint_lease`` is the holder's heartbeat.  The worker
+tears down leases not renewed within the endpoint's idle timeout, and warm
+endpoints beyond the current target.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+import uuid
+
+from botocore.exceptions import ClientError
+from sqlalchemy import and_, delete, distinct, func, or_, select, true, update
+from sqlalchemy.orm import Session
+
+from sparkpilot.audit import write_audit_event
+from sparkpilot.aws_clients import EmrEksClient
+from sparkpilot.config import get_settings
+from sparkpilot.models import Environment, InteractiveEndpoint, Run
+from sparkpilot.services._helpers import _as_utc, _now
+
+logger = logging.getLogger(__name__)
+
+POOL_ENDPOINT_NAME_PREFIX = "sparkpilot-warm-"
+_ENDPOINT_READY_STATES = {"ACTIVE"}
+_ENDPOINT_FAILED_STATES = {"TERMINATED", "TERMINATED_WITH_ERRORS", "TERMINATING"}
+_CREATE_GRACE = timedelta(minutes=10)
+
+
+def _in_pool_hours(now: datetime, hours: tuple[int, int]) -> bool:
+    start, end = hours
+    return now.weekday() < 5 and start <= now.hour < end
+
+
+def _pool_targets(db: Session, environment_ids: list[str], *, settings: Any, now: datetime) -> dict[str, int]:
+    """Warm endpoints to keep per environment: one per recent interactive user, within the size bounds."""
+    if settings.interactive_pool_max_size <= 0 or not _in_pool_hours(now, settings.interactive_pool_hours):
+        return {}
+    window_start = now - timedelta(minutes=settings.interactive_pool_demand_window_minutes)
+    demand = dict(
+        db.execute(
+            select(Run.environment_id, func.count(distinct(Run.created_by_actor)))
+            .where(
+                and_(
+                    Run.environment_id.in_(environment_ids),
+                    Run.created_at >= window_start,
+                    Run.timeout_seconds <= settings.interactive_pool_short_run_seconds,
+                )
+            )
+            .group_by(Run.environment_id)
+        ).all()
+    )
+    return {
+        environment_id: min(
+            settings.interactive_pool_max_size,
+            max(settings.interactive_pool_min_size, int(demand.get(environment_id, 0))),
+        )
+        for environment_id in environment_ids
+    }
+
+
+def _refresh_endpoint_status(
+    endpoint: InteractiveEndpoint,
+    *,
+    env: Environment,
+    emr: EmrEksClient,
+    now: datetime,
+) -> None:
+    if endpoint.status not in {"creating", "active"}:
+        return
+    if not endpoint.emr_endpoint_id:
+        # The row is written before CreateManagedEndpoint; one still without an
+        # id after the grace period belongs to a worker that died mid-create.
+        if _as_utc(endpoint.created_at) <= now - _CREATE_GRACE:
+            endpoint.status = "failed"
+        return
+    described = emr.describe_managed_endpoint(env, endpoint.emr_endpoint_id)
+    state = str(described.get("state") or "").upper()
+    if state in _ENDPOINT_READY_STATES:
+        endpoint.status = "active"
+        endpoint.endpoint_url = described.get("serverUrl") or endpoint.endpoint_url
+    elif state in _ENDPOINT_FAILED_STATES:
+        endpoint.status = "failed"
+
+
+def _delete_endpoint(
+    db: Session,
+    *,
+    endpoint: InteractiveEndpoint,
+    env: Environment,
+    emr: EmrEksClient,
+) -> None:
+    """Delete a ``deleting`` endpoint in AWS, then its row."""
+    if endpoint.emr_endpoint_id and not emr.settings.dry_run_mode:
+        try:
+            emr.delete_managed_endpoint(env, endpoint.emr_endpoint_id)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") != "ResourceNotFoundException":
+                raise
+    db.execute(
+        delete(InteractiveEndpoint)
+        .where(InteractiveEndpoint.id == endpoint.id)
+        .execution_options(synchronize_session=False)
+    )
+    db.expunge(endpoint)
+    db.commit()
+
+
+def _teardown_endpoint(
+    db: Session,
+    *,
+    endpoint: InteractiveEndpoint,
+    env: Environment,
+    emr: EmrEksClient,
+    actor: str,
+    reason: str,
+    only_if: Any,
+) -> bool:
+    # Conditional claim so a lease taken since the pool was read survives.  It
+    # is committed before the AWS call, so a failed delete is retried on the
+    # next pass instead of the row being restored by a rollback.  Flush first
+    # so a pending status refresh cannot overwrite the claim at commit.
+    db.flush()
+    claimed = db.execute(
+        update(InteractiveEndpoint)
+        .where(
+            and_(
+                InteractiveEndpoint.id == endpoint.id,
+                InteractiveEndpoint.status != "deleting",
+                only_if,
+            )
+        )
+        .values(status="deleting")
+        .execution_options(synchronize_session=False)
+    )
+    if claimed.rowcount != 1:
+        return False
+    write_audit_event(
+        db,
+        actor=actor,
+        action="interactive_endpoint.pool_teardown",
+        entity_type="interactive_endpoint",
+        entity_id=endpoint.id,
+        tenant_id=env.tenant_id,
+        details={"environment_id": env.id, "reason": reason, "emr_endpoint_id": endpoint.emr_endpoint_id},
+    )
+    db.commit()
+    _delete_endpoint(db, endpoint=endpoint, env=env, emr=emr)
+    return True
+
+
+def _create_pool_endpoint(
+    db: Session,
+    *,
+    env: Environment,
+    emr: EmrEksClient,
+    settings: Any,
+    actor: str,
+) -> None:
+    name = f"{POOL_ENDPOINT_NAME_PREFIX}{uuid.uuid4().hex[:12]}"
+    endpoint = InteractiveEndpoint(
+        environment_id=env.id,
+        tenant_id=env.tenant_id,
+        name=name,
+        execution_role_arn=settings.emr_execution_role_arn,
+        release_label=settings.emr_release_label,
+        idle_timeout_minutes=settings.interactive_pool_idle_minutes,
+        status="active" if settings.dry_run_mode else "creating",
+        created_by_actor=actor,
+        pooled=True,
+    )
+    db.add(endpoint)
+    # Commit the row before calling AWS so a created endpoint always has one.
+    db.commit()
+    if not settings.dry_run_mode:
+        try:
+            endpoint.emr_endpoint_id = emr.create_managed_endpoint(
+                env,
+                name=name,
+                execution_role_arn=settings.emr_execution_role_arn,
+                release_label=settings.emr_release_label,
+            )
+        except Exception:
+            db.rollback()
+            db.execute(
+                delete(InteractiveEndpoint)
+                .where(InteractiveEndpoint.id == endpoint.id)
+                .execution_options(synchronize_session=False)
+            )
+            db.expunge(endpoint)
+            db.commit()
+            raise
+    write_audit_event(
+        db,
+        actor=actor,
+        action="interactive_endpoint.pool_created",
+        entity_type="interactive_endpoint",
+        entity_id=endpoint.id,
+        tenant_id=env.tenant_id,
+        details={"environment_id": env.id, "emr_endpoint_id": endpoint.emr_endpoint_id},
+    )
+    db.commit()
+
+
+def _reconcile_environment_pool(
+    db: Session,
+    *,
+    env: Environment,
+    endpoints: list[InteractiveEndpoint],
+    target: int,
+    emr: EmrEksClient,
+    settings: Any,
+    actor: str,
+    now: datetime,
+) -> int:
+    changed = 0
+    warm: list[InteractiveEndpoint] = []
+    for endpoint in endpoints:
+        if endpoint.status == "deleting":
+            # A previous teardown claimed it but its AWS delete failed.
+            _delete_endpoint(db, endpoint=endpoint, env=env, emr=emr)
+            changed += 1
+            continue
+        if not settings.dry_run_mode:
+            _refresh_endpoint_status(endpoint, env=env, emr=emr, now=now)
+        if endpoint.status == "failed":
+            changed += _teardown_endpoint(
+                db, endpoint=endpoint, env=env, emr=emr, actor=actor, reason="failed",
+                only_if=true(),
+            )
+            continue
+        if endpoint.leased_at is None:
+            warm.append(endpoint)
+            continue
+        last_activity = _as_utc(endpoint.last_activity_at or endpoint.leased_at)
+        idle_cutoff = now - timedelta(minutes=endpoint.idle_timeout_minutes)
+        if last_activity <= idle_cutoff:
+            changed += _teardown_endpoint(
+                db, endpoint=endpoint, env=env, emr=emr, actor=actor, reason="idle",
+                only_if=or_(
+                    InteractiveEndpoint.last_activity_at.is_(None),
+                    InteractiveEndpoint.last_activity_at <= idle_cutoff,
+                ),
+            )
+
+    # Shed endpoints still starting before ready ones, newest first.
+    warm.sort(key=lambda item: (item.status == "active", -_as_utc(item.created_at).timestamp()))
+    surplus = len(warm) - target
+    for endpoint in warm[:max(surplus, 0)]:
+        changed += _teardown_endpoint(
+            db, endpoint=endpoint, env=env, emr=emr, actor=actor, reason="surplus",
+            only_if=InteractiveEndpoint.leased_at.is_(None),
+        )
+    for _ in range(max(-surplus, 0)):
+        _create_pool_endpoint(db, env=env, emr=emr, settings=settings, actor=actor)
+        changed += 1
+    return changed
+
+
+def process_interactive_pool_once(db: Session, *, actor: str = "worker:interactive-pool") -> int:
+    """Refresh, scale and tear down warm-pool endpoints; returns the number of endpoints changed."""
+    settings = get_settings()
+    now = _now()
+    pooled_by_env: dict[str, list[InteractiveEndpoint]] = defaultdict(list)
+    for endpoint in db.execute(
+        select(InteractiveEndpoint).where(InteractiveEndpoint.pooled.is_(True))
+    ).scalars():
+        pooled_by_env[endpoint.environment_id].append(endpoint)
+
+    eligible = {
+        env.id: env
+        for env in db.execute(
+            select(Environment).where(
+                and_(
+                    Environment.engine == "emr_on_eks",
+                    Environment.status == "ready",
+                    Environment.emr_virtual_cluster_id.is_not(None),
+                )
+            )
+        ).scalars()
+    }
+    targets = _pool_targets(db, list(eligible), settings=settings, now=now)
+    environment_ids = {env_id for env_id, target in targets.items() if target > 0} | set(pooled_by_env)
+    if not environment_ids:
+        return 0
+
+    emr = EmrEksClient()
+    changed = 0
+    for env_id in sorted(environment_ids):
+        env = eligible.get(env_id) or db.get(Environment, env_id)
+        if env is None:
+            continue
+        try:
+            changed += _reconcile_environment_pool(
+                db,
+                env=env,
+                endpoints=pooled_by_env.get(env_id, []),
+                target=targets.get(env_id, 0),
+                emr=emr,
+                settings=settings,
+                actor=actor,
+                now=now,
+            )
+            db.commit()
+        except Exception:  # noqa: BLE001 — one environment's AWS failure must not starve the others
+            db.rollback()
+            logger.exception("Interactive pool reconcile failed for environment_id=%s.", env_id)
+    return changed
+
+
+def acquire_warm_endpoint(db: Session, *, environment: Environment, actor: str) -> InteractiveEndpoint | None:
+    """Lease a ready warm-pool endpoint to *actor*, or return None when none is ready.
+
+    An actor that already holds a lease gets the same endpoint back with its
+    idle timer reset.
+    """
+    now = _now()
+    held = db.execute(
+        select(InteractiveEndpoint).where(
+            and_(
+                InteractiveEndpoint.environment_id == environment.id,
+                InteractiveEndpoint.pooled.is_(True),
+                InteractiveEndpoint.leased_by_actor == actor,
+                InteractiveEndpoint.status == "active",
+            )
+        )
+    ).scalars().first()
+    if held is not None:
+        held.last_activity_at = now
+        db.commit()
+        return held
+
+    candidate_ids = db.execute(
+        select(InteractiveEndpoint.id)
+        .where(
+            and_(
+                InteractiveEndpoint.environment_id == environment.id,
+                InteractiveEndpoint.pooled.is_(True),
+                InteractiveEndpoint.status == "active",
+                InteractiveEndpoint.leased_at.is_(None),
+            )
+        )
+        .order_by(InteractiveEndpoint.created_at.asc())
+        .limit(5)
+    ).scalars().all()
+    for endpoint_id in candidate_ids:
+        leased = db.execute(
+            update(InteractiveEndpoint)
+            .where(
+                and_(
+                    InteractiveEndpoint.id == endpoint_id,
+                    InteractiveEndpoint.status == "active",
+                    InteractiveEndpoint.leased_at.is_(None),
+                )
+            )
+            .values(leased_by_actor=actor, leased_at=now, last_activity_at=now)
+        )
+        if leased.rowcount != 1:
+            continue
+        write_audit_event(
+            db,
+            actor=actor,
+            action="interactive_endpoint.leased",
+            entity_type="interactive_endpoint",
+            entity_id=endpoint_id,
+            tenant_id=environment.tenant_id,
+            details={"environment_id": environment.id},
+        )
+        db.commit()
+        return db.get(InteractiveEndpoint, endpoint_id, populate_existing=True)
+    return None
+
+
+def renew_endpoint_lease(
+    db: Session,
+    *,
+    environment: Environment,
+    endpoint_id: str,
+    actor: str,
+) -> InteractiveEndpoint | None:
+    """Reset the idle timer of a lease held by *actor*, or return None when it holds none.
+
+    EMR does not report kernel activity, so clients keep a lease by calling
+    this at least once per ``idle_timeout_minutes`` while a session is open.
+    """
+    renewed = db.execute(
+        update(InteractiveEndpoint)
+        .where(
+            and_(
+                InteractiveEndpoint.id == endpoint_id,
+                InteractiveEndpoint.environment_id == environment.id,
+                InteractiveEndpoint.pooled.is_(True),
+                InteractiveEndpoint.leased_by_actor == actor,
+                InteractiveEndpoint.status == "active",
+            )
+        )
+        .values(last_activity_at=_now())
+    )
+    if renewed.rowcount != 1:
+        db.rollback()
+        return None
+    db.commit()
+    return db.get(InteractiveEndpoint, endpoint_id, populate_existing=True)
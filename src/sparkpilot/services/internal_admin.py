@@ -24,6 +24,10 @@ from sparkpilot.exceptions import (
 from sparkpilot.invite_email import InviteEmailDelivery, send_invite_email
 from sparkpilot.models import MagicLinkLog, MagicLinkToken, Tenant, User, UserIdentity
 from sparkpilot.schemas import InternalTenantCreateRequest, TenantCreateRequest
+from sparkpilot.services.access_cache import (
+    invalidate_access_contexts,
+    invalidate_access_contexts_on_commit,
+)
 from sparkpilot.services.crud import create_tenant
 
 logger = logging.getLogger(__name__)
@@ -734,7 +738,9 @@ def apply_invite_identity_mapping(
     )
     if commit:
         db.commit()
+        invalidate_access_contexts()
         db.refresh(row)
     else:
         db.flush()
+        invalidate_access_contexts_on_commit(db)
     return row
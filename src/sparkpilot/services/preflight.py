@@ -8,15 +8,15 @@ import threading
 import time
 from typing import Any, Callable
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from sparkpilot.config import get_settings, is_valid_iam_role_arn, validate_runtime_settings
 from sparkpilot.db import SessionLocal
-from sparkpilot.models import AuditEvent, EmrRelease, Environment, Run, TeamBudget
+from sparkpilot.models import AuditEvent, Environment, Run, TeamBudget
 from sparkpilot.services._helpers import _now, _validate_custom_spark_conf_policy
-from sparkpilot.services.emr_releases import _canonical_release_label
-from sparkpilot.services.finops import _billing_period, _team_key_for_environment, _team_spend_for_period
+from sparkpilot.services.emr_releases import EmrReleaseInfo, lookup_emr_release
+from sparkpilot.services.finops import _billing_period, _team_budget_spend, _team_key_for_environment
 from sparkpilot.services.preflight_byoc import _add_byoc_lite_configuration_checks  # noqa: F401
 from sparkpilot.services.preflight_checks import _add_issue3_dispatch_gate_checks
 
@@ -238,29 +238,14 @@ def _add_log_group_prefix_check(*, settings: Any, add_check: Callable[..., None]
         )
 
 
-def _lookup_release_row(*, configured_release_label: str, db: Session | None) -> EmrRelease | None:
-    canonical_release_label = _canonical_release_label(configured_release_label)
-
-    def _load(session: Session) -> EmrRelease | None:
-        return session.execute(
-            select(EmrRelease).where(
-                or_(
-                    EmrRelease.release_label == configured_release_label,
-                    EmrRelease.release_label == canonical_release_label,
-                )
-            )
-        ).scalar_one_or_none()
-
-    if db is not None:
-        return _load(db)
-    with SessionLocal() as check_db:
-        return _load(check_db)
+def _lookup_release_row(*, configured_release_label: str, db: Session | None) -> EmrReleaseInfo | None:
+    return lookup_emr_release(configured_release_label, db=db)
 
 
 def _add_release_currency_check(
     *,
     configured_release_label: str,
-    release_row: EmrRelease | None,
+    release_row: EmrReleaseInfo | None,
     add_check: Callable[..., None],
 ) -> None:
     if release_row is None:
@@ -312,7 +297,7 @@ def _add_release_currency_check(
 def _add_graviton_support_check(
     *,
     instance_architecture: str,
-    release_row: EmrRelease | None,
+    release_row: EmrReleaseInfo | None,
     add_check: Callable[..., None],
 ) -> None:
     if instance_architecture not in {"arm64", "mixed"}:
@@ -410,7 +395,14 @@ def _add_team_budget_preflight_checks(
             )
             return
 
-        _, _, effective_spend = _team_spend_for_period(session, team_key, current_period)
+        effective_spend, active_reserved = _team_budget_spend(session, team_key, current_period)
+        spend_details: dict[str, Any] = {
+            "team": team_key,
+            "period": current_period,
+            "effective_spend_usd_micros": effective_spend,
+        }
+        if active_reserved is not None:
+            spend_details["active_run_reserved_usd_micros"] = active_reserved
         warn_threshold = int(budget.monthly_budget_usd_micros * budget.warn_threshold_pct / 100)
         block_threshold = int(budget.monthly_budget_usd_micros * budget.block_threshold_pct / 100)
         if effective_spend >= block_threshold:
@@ -419,12 +411,7 @@ def _add_team_budget_preflight_checks(
                 status_value="fail",
                 message="Team budget block threshold exceeded for the current billing period.",
                 remediation="Increase team budget or reduce run volume/resource usage before submitting new runs.",
-                details={
-                    "team": team_key,
-                    "period": current_period,
-                    "effective_spend_usd_micros": effective_spend,
-                    "block_threshold_usd_micros": block_threshold,
-                },
+                details={**spend_details, "block_threshold_usd_micros": block_threshold},
             )
         elif effective_spend >= warn_threshold:
             add_check(
@@ -432,24 +419,14 @@ def _add_team_budget_preflight_checks(
                 status_value="warning",
                 message="Team budget warning threshold reached for the current billing period.",
                 remediation="Review spend and planned workloads before submitting large runs.",
-                details={
-                    "team": team_key,
-                    "period": current_period,
-                    "effective_spend_usd_micros": effective_spend,
-                    "warn_threshold_usd_micros": warn_threshold,
-                },
+                details={**spend_details, "warn_threshold_usd_micros": warn_threshold},
             )
         else:
             add_check(
                 code="team_budget",
                 status_value="pass",
                 message="Team budget check passed for the current billing period.",
-                details={
-                    "team": team_key,
-                    "period": current_period,
-                    "effective_spend_usd_micros": effective_spend,
-                    "budget_usd_micros": budget.monthly_budget_usd_micros,
-                },
+                details={**spend_details, "budget_usd_micros": budget.monthly_budget_usd_micros},
             )
 
     if db is not None:
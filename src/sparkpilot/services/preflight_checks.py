@@ -14,7 +14,13 @@ from typing import Callable
 
 from botocore.exceptions import ClientError
 
-from sparkpilot.aws_clients import DISPATCH_SIMULATION_ACTIONS, EmrEksClient, assume_role_session, session_for_environment
+from sparkpilot.aws_clients import (
+    DISPATCH_SIMULATION_ACTIONS,
+    EmrEksClient,
+    assume_role_session,
+    describe_eks_cluster,
+    session_for_environment,
+)
 from sparkpilot.config import get_settings
 from sparkpilot.models import Environment
 from sparkpilot.services.iam_validation import validate_assume_role_chain
@@ -260,7 +266,7 @@ def _add_issue3_eks_describe_cluster_check(*, environment: Environment, add_chec
     try:
         session = session_for_environment(environment)
         eks_client = session.client("eks", region_name=environment.region)
-        cluster = eks_client.describe_cluster(name=cluster_name).get("cluster", {})
+        cluster = describe_eks_cluster(environment, eks_client=eks_client, cluster_name=cluster_name)
     except ClientError as exc:
         code = exc.response.get("Error", {}).get("Code", "")
         if code in {"AccessDeniedException", "AccessDenied", "UnauthorizedOperation"}:
@@ -0,0 +1,94 @@
+"""Run state transition log feeding the run wait and event-stream endpoints.
+
+Every flush that creates a run or changes ``Run.state`` — reconciler,
+scheduler and cancel paths alike — appends a ``RunStateEvent`` row in the same
+transaction, so API processes can tail one table instead of each client
+polling individual runs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime, timedelta
+from typing import Any
+import uuid
+
+from sqlalchemy import delete, event, func, inspect, select
+from sqlalchemy.orm import Session
+
+from sparkpilot.config import get_settings
+from sparkpilot.models import Environment, Run, RunStateEvent
+from sparkpilot.services._helpers import _now
+
+
+def _record_run_state_changes(session: Session, _flush_context: Any, _instances: Any) -> None:
+    changed: list[Run] = [obj for obj in session.new if isinstance(obj, Run)]
+    for obj in session.dirty:
+        if isinstance(obj, Run) and inspect(obj).attrs.state.history.has_changes():
+            changed.append(obj)
+    if not changed:
+        return
+    with session.no_autoflush:
+        for run in changed:
+            if run.id is None:
+                # Primary keys default at INSERT time; the event needs it now.
+                run.id = str(uuid.uuid4())
+            env = session.get(Environment, run.environment_id)
+            if env is None:
+                continue
+            session.add(
+                RunStateEvent(
+                    run_id=run.id,
+                    environment_id=run.environment_id,
+                    tenant_id=env.tenant_id,
+                    created_by_actor=run.created_by_actor,
+                    state=run.state or "queued",
+                )
+            )
+
+
+event.listen(Session, "before_flush", _record_run_state_changes)
+
+
+def latest_run_state_event_id(db: Session) -> int:
+    return int(db.execute(select(func.max(RunStateEvent.id))).scalar() or 0)
+
+
+def list_run_state_events(
+    db: Session,
+    *,
+    after_id: int,
+    missing_ids: Collection[int] = (),
+    tenant_id: str | None = None,
+    limit: int = 1000,
+) -> list[RunStateEvent]:
+    """Return up to *limit* events with ``id > after_id``, plus any of *missing_ids*.
+
+    Event ids are assigned at flush but become visible at commit, so a slow
+    transaction can commit an id below the caller's cursor.  Callers tailing
+    the log pass the ids they skipped below their cursor as *missing_ids* to
+    pick those up late; the cursor itself always advances with the tail.
+    """
+    tenant_filter = [] if tenant_id is None else [RunStateEvent.tenant_id == tenant_id]
+    rows = list(
+        db.execute(
+            select(RunStateEvent)
+            .where(RunStateEvent.id > after_id, *tenant_filter)
+            .order_by(RunStateEvent.id)
+            .limit(limit)
+        ).scalars()
+    )
+    if missing_ids:
+        late = db.execute(
+            select(RunStateEvent).where(RunStateEvent.id.in_(list(missing_ids)), *tenant_filter)
+        ).scalars()
+        rows = sorted([*late, *rows], key=lambda row: row.id)
+    return rows
+
+
+def prune_run_state_events(db: Session, *, now: datetime | None = None) -> int:
+    """Delete events older than ``SPARKPILOT_RUN_STATE_EVENT_RETENTION_HOURS``."""
+    retention = timedelta(hours=get_settings().run_state_event_retention_hours)
+    cutoff = (now or _now()) - retention
+    result = db.execute(delete(RunStateEvent).where(RunStateEvent.created_at < cutoff))
+    return int(result.rowcount or 0)
@@ -10,10 +10,14 @@ from sparkpilot.models import ProvisioningOperation, Run
 from sparkpilot.services._helpers import _now
 
 WORKER_CLAIM_TTL_SECONDS = 1800
+# Provisioning claims are renewed by a heartbeat while their operation is
+# processed, so a crashed provisioner's operations are picked up quickly.
+PROVISIONING_CLAIM_TTL_SECONDS = 300
+PROVISIONING_CLAIM_HEARTBEAT_SECONDS = 60
 
 
-def _claim_cutoff_time():
-    return _now() - timedelta(seconds=WORKER_CLAIM_TTL_SECONDS)
+def _claim_cutoff_time(ttl_seconds: int = WORKER_CLAIM_TTL_SECONDS):
+    return _now() - timedelta(seconds=ttl_seconds)
 
 
 def _provisioning_claim_available(cutoff_time):
@@ -37,9 +41,10 @@ def _claim_provisioning_operations(
     *,
     actor: str,
     provisioning_steps: list[str],
+    limit: int,
 ) -> list[ProvisioningOperation]:
     claim_token = f"{actor}:{uuid.uuid4().hex[:16]}"
-    cutoff_time = _claim_cutoff_time()
+    cutoff_time = _claim_cutoff_time(PROVISIONING_CLAIM_TTL_SECONDS)
     candidate_ids = [
         row[0]
         for row in db.execute(
@@ -51,6 +56,7 @@ def _claim_provisioning_operations(
                 )
             )
             .order_by(ProvisioningOperation.created_at.asc())
+            .limit(limit)
         ).all()
     ]
     claimed_ids: list[str] = []
@@ -87,19 +93,24 @@ def _claim_runs(
     states: list[str],
     limit: int,
     order_by_column,
+    held_environment_ids: set[str] | None = None,
 ) -> list[Run]:
     claim_token = f"{actor}:{uuid.uuid4().hex[:16]}"
     cutoff_time = _claim_cutoff_time()
+    criteria = [Run.state.in_(states), _run_claim_available(cutoff_time)]
+    if held_environment_ids:
+        # Runs in held environments are only claimed to act on a pending cancel.
+        criteria.append(
+            or_(
+                Run.environment_id.not_in(held_environment_ids),
+                Run.cancellation_requested.is_(True),
+            )
+        )
     candidate_ids = [
         row[0]
         for row in db.execute(
             select(Run.id)
-            .where(
-                and_(
-                    Run.state.in_(states),
-                    _run_claim_available(cutoff_time),
-                )
-            )
+            .where(and_(*criteria))
             .order_by(order_by_column.asc())
             .limit(limit)
         ).all()
@@ -131,6 +142,27 @@ def _claim_runs(
     )
 
 
+def _renew_provisioning_claims(db: Session, claims: dict[str, str]) -> int:
+    """Refresh ``worker_claimed_at`` for operations still held under their claim token."""
+    ids_by_token: dict[str, list[str]] = {}
+    for op_id, claim_token in claims.items():
+        ids_by_token.setdefault(claim_token, []).append(op_id)
+    renewed = 0
+    for claim_token, op_ids in ids_by_token.items():
+        result = db.execute(
+            update(ProvisioningOperation)
+            .where(
+                and_(
+                    ProvisioningOperation.id.in_(op_ids),
+                    ProvisioningOperation.worker_claim_token == claim_token,
+                )
+            )
+            .values(worker_claimed_at=_now())
+        )
+        renewed += result.rowcount
+    return renewed
+
+
 def _release_operation_claim(operation: ProvisioningOperation) -> None:
     operation.worker_claim_token = None
     operation.worker_claimed_at = None
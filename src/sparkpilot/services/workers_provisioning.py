@@ -1,17 +1,23 @@
 """Provisioning worker: brings environments from 'queued' to 'ready'."""
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
 from typing import Any
 
 from botocore.exceptions import BotoCoreError, ClientError
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 
 from sparkpilot.audit import write_audit_event
 from sparkpilot.aws_clients import EmrEksClient
 from sparkpilot.config import get_settings
+from sparkpilot.db import upsert_insert
 from sparkpilot.error_handling import error_details, error_message
 from sparkpilot.exceptions import ProvisioningPermanentError
-from sparkpilot.models import Environment, ProvisioningOperation
+from sparkpilot.models import Environment, ProvisioningCheckpoint, ProvisioningOperation
 from sparkpilot.terraform_orchestrator import TerraformApplyResult, TerraformOrchestrator, TerraformPlanResult
 from sparkpilot.services._helpers import _now
 from sparkpilot.services.preflight import (
@@ -19,8 +25,10 @@ from sparkpilot.services.preflight import (
     _preflight_summary,
 )
 from sparkpilot.services.workers_common import (
+    PROVISIONING_CLAIM_HEARTBEAT_SECONDS,
     _claim_provisioning_operations,
     _release_operation_claim,
+    _renew_provisioning_claims,
 )
 
 logger = logging.getLogger(__name__)
@@ -180,33 +188,64 @@ def _record_full_byoc_validation_artifact(
     return updated
 
 
-def _load_full_byoc_checkpoint(db: Session, op_id: str, env_id: str) -> dict[str, Any]:
-    from sqlalchemy import and_, select
-    from sparkpilot.models import AuditEvent
-    events = list(
-        db.execute(
-            select(AuditEvent)
-            .where(
-                and_(
-                    AuditEvent.action == FULL_BYOC_CHECKPOINT_AUDIT_ACTION,
-                    AuditEvent.entity_type == "environment",
-                    AuditEvent.entity_id == env_id,
-                )
-            )
-            .order_by(AuditEvent.created_at.desc())
-            .limit(25)
-        ).scalars()
-    )
-    for event in events:
-        details = event.details_json if isinstance(event.details_json, dict) else {}
-        if details.get("operation_id") != op_id:
-            continue
-        checkpoint = details.get("checkpoint")
-        if isinstance(checkpoint, dict):
-            return checkpoint
+def _load_full_byoc_checkpoint(db: Session, op_id: str) -> dict[str, Any]:
+    checkpoint = db.execute(
+        select(ProvisioningCheckpoint.checkpoint_json).where(ProvisioningCheckpoint.operation_id == op_id)
+    ).scalar_one_or_none()
+    if isinstance(checkpoint, dict):
+        return checkpoint
     return _new_full_byoc_checkpoint()
 
 
+def _upsert_full_byoc_checkpoint(
+    db: Session,
+    *,
+    env: Environment,
+    op_id: str,
+    checkpoint: dict[str, Any],
+) -> int:
+    """Store the operation's checkpoint and return its new version."""
+    table = ProvisioningCheckpoint.__table__
+    now = _now()
+    upsert = upsert_insert(db.get_bind(), table)
+    if upsert is not None:
+        stmt = upsert.values(
+            operation_id=op_id,
+            environment_id=env.id,
+            checkpoint_json=checkpoint,
+            version=1,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["operation_id"],
+            set_={
+                "checkpoint_json": stmt.excluded.checkpoint_json,
+                "version": table.c.version + 1,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(table.c.version)
+        return int(db.execute(stmt).scalar_one())
+    # Generic fallback for dialects without an upsert construct.
+    result = db.execute(
+        update(table)
+        .where(table.c.operation_id == op_id)
+        .values(checkpoint_json=checkpoint, version=table.c.version + 1, updated_at=now)
+        .returning(table.c.version)
+    ).scalar_one_or_none()
+    if result is not None:
+        return int(result)
+    db.execute(
+        insert(table).values(
+            operation_id=op_id,
+            environment_id=env.id,
+            checkpoint_json=checkpoint,
+            version=1,
+            updated_at=now,
+        )
+    )
+    return 1
+
+
 def _write_full_byoc_checkpoint(
     db: Session,
     *,
@@ -215,6 +254,7 @@ def _write_full_byoc_checkpoint(
     op_id: str,
     checkpoint: dict[str, Any],
 ) -> None:
+    version = _upsert_full_byoc_checkpoint(db, env=env, op_id=op_id, checkpoint=checkpoint)
     write_audit_event(
         db,
         actor=actor,
@@ -225,7 +265,7 @@ def _write_full_byoc_checkpoint(
         details={
             "operation_id": op_id,
             "stage": checkpoint.get("last_successful_stage"),
-            "checkpoint": checkpoint,
+            "checkpoint_version": version,
         },
     )
 
@@ -824,7 +864,7 @@ def _run_full_byoc_provisioning(
     terraform: TerraformOrchestrator,
     emr: EmrEksClient,
 ) -> None:
-    checkpoint = _load_full_byoc_checkpoint(db, operation.id, environment.id)
+    checkpoint = _load_full_byoc_checkpoint(db, operation.id)
     start_idx = _checkpoint_resume_index(checkpoint, operation)
     terraform_outputs: dict[str, Any] = {}
     for step in PROVISIONING_STEPS[start_idx:]:
@@ -858,112 +898,232 @@ def _run_full_byoc_provisioning(
 # Public API
 # ---------------------------------------------------------------------------
 
-def process_provisioning_once(db: Session, *, actor: str = "worker:provisioner") -> int:
+class _ProvisioningClaimHeartbeat:
+    """Renew claims on a background thread while their operations are processed.
+
+    A Terraform stage can run for up to ``TerraformOrchestrator.timeout_seconds``;
+    renewing every ``PROVISIONING_CLAIM_HEARTBEAT_SECONDS`` keeps the claim
+    well inside ``PROVISIONING_CLAIM_TTL_SECONDS`` for as long as this worker
+    is alive, and lets it lapse soon after the worker dies.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        claims: dict[str, str],
+        *,
+        interval_seconds: float = PROVISIONING_CLAIM_HEARTBEAT_SECONDS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._claims = dict(claims)
+        self._interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="sparkpilot-provisioning-heartbeat", daemon=True
+        )
+
+    def __enter__(self) -> "_ProvisioningClaimHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def release(self, op_id: str) -> None:
+        with self._lock:
+            self._claims.pop(op_id, None)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval_seconds):
+            with self._lock:
+                claims = dict(self._claims)
+            if not claims:
+                continue
+            try:
+                with self._session_factory() as db:
+                    _renew_provisioning_claims(db, claims)
+                    db.commit()
+            except SQLAlchemyError:
+                logger.warning("Provisioning claim heartbeat failed op_ids=%s", sorted(claims), exc_info=True)
+
+
+def _terraform_output_logger(operation_id: str) -> Callable[[str, str], None]:
+    def _log(stream: str, line: str) -> None:
+        logger.info("terraform operation_id=%s %s: %s", operation_id, stream, line)
+
+    return _log
+
+
+def _provision_operation(db: Session, *, actor: str, operation: ProvisioningOperation) -> None:
     emr = EmrEksClient()
-    terraform = TerraformOrchestrator()
+    terraform = TerraformOrchestrator(output_sink=_terraform_output_logger(operation.id))
     settings = get_settings()
-    pending = _claim_provisioning_operations(db, actor=actor, provisioning_steps=PROVISIONING_STEPS)
-    processed = 0
-    for operation in pending:
-        environment = operation.environment
-        try:
-            _validate_customer_role_arn(environment)
-            if settings.dry_run_mode and environment.engine in {"emr_serverless", "emr_on_ec2"}:
-                _set_provisioning_ready(
-                    db,
-                    actor=actor,
-                    environment=environment,
-                    operation=operation,
-                    action="environment.dry_run_provisioned",
-                    message=f"{environment.engine} dry-run environment ready.",
-                    details={
-                        "engine": environment.engine,
-                        "dry_run_mode": True,
-                        "preflight": "skipped",
-                    },
-                )
-                continue
-            if environment.provisioning_mode == "byoc_lite":
-                _run_byoc_lite_provisioning(
-                    db,
-                    actor=actor,
-                    environment=environment,
-                    operation=operation,
-                    emr=emr,
-                )
-            else:
-                if environment.provisioning_mode == "full":
-                    _run_full_byoc_provisioning(
-                        db,
-                        actor=actor,
-                        environment=environment,
-                        operation=operation,
-                        terraform=terraform,
-                        emr=emr,
-                    )
-                else:
-                    raise ValueError(f"Unsupported provisioning_mode '{environment.provisioning_mode}'.")
-                _set_provisioning_ready(
-                    db,
-                    actor=actor,
-                    environment=environment,
-                    operation=operation,
-                    action="environment.provisioned",
-                    message="Environment provisioning complete.",
-                    details={
-                        "eks_cluster_arn": environment.eks_cluster_arn,
-                        "emr_virtual_cluster_id": environment.emr_virtual_cluster_id,
-                        "validated_vpc_endpoints": KNOWN_GOOD_VPC_ENDPOINTS,
-                    },
-                )
-        except (ClientError, BotoCoreError) as exc:
-            logger.exception(
-                "AWS error during provisioning environment_id=%s operation_id=%s error_type=%s",
-                environment.id,
-                operation.id,
-                type(exc).__name__,
-            )
-            _set_provisioning_failed(
+    environment = operation.environment
+    try:
+        _validate_customer_role_arn(environment)
+        if settings.dry_run_mode and environment.engine in {"emr_serverless", "emr_on_ec2"}:
+            _set_provisioning_ready(
                 db,
                 actor=actor,
                 environment=environment,
                 operation=operation,
-                exc=exc,
-                include_error_type=True,
-            )
-        except (ValueError, ProvisioningPermanentError) as exc:
-            logger.exception(
-                "Provisioning validation/permanent failure environment_id=%s operation_id=%s error_type=%s",
-                environment.id,
-                operation.id,
-                type(exc).__name__,
+                action="environment.dry_run_provisioned",
+                message=f"{environment.engine} dry-run environment ready.",
+                details={
+                    "engine": environment.engine,
+                    "dry_run_mode": True,
+                    "preflight": "skipped",
+                },
             )
-            _set_provisioning_failed(
+            return
+        if environment.provisioning_mode == "byoc_lite":
+            _run_byoc_lite_provisioning(
                 db,
                 actor=actor,
                 environment=environment,
                 operation=operation,
-                exc=exc,
-                include_error_type=True,
-            )
-        except Exception as exc:  # noqa: BLE001 — final fallback; prevents stuck operations on truly unexpected errors
-            logger.exception(
-                "Unexpected error during provisioning environment_id=%s operation_id=%s error_type=%s",
-                environment.id,
-                operation.id,
-                type(exc).__name__,
+                emr=emr,
             )
-            _set_provisioning_failed(
+        else:
+            if environment.provisioning_mode == "full":
+                _run_full_byoc_provisioning(
+                    db,
+                    actor=actor,
+                    environment=environment,
+                    operation=operation,
+                    terraform=terraform,
+                    emr=emr,
+                )
+            else:
+                raise ValueError(f"Unsupported provisioning_mode '{environment.provisioning_mode}'.")
+            _set_provisioning_ready(
                 db,
                 actor=actor,
                 environment=environment,
                 operation=operation,
-                exc=exc,
-                include_error_type=False,
+                action="environment.provisioned",
+                message="Environment provisioning complete.",
+                details={
+                    "eks_cluster_arn": environment.eks_cluster_arn,
+                    "emr_virtual_cluster_id": environment.emr_virtual_cluster_id,
+                    "validated_vpc_endpoints": KNOWN_GOOD_VPC_ENDPOINTS,
+                },
             )
-        finally:
+    except (ClientError, BotoCoreError) as exc:
+        logger.exception(
+            "AWS error during provisioning environment_id=%s operation_id=%s error_type=%s",
+            environment.id,
+            operation.id,
+            type(exc).__name__,
+        )
+        _set_provisioning_failed(
+            db,
+            actor=actor,
+            environment=environment,
+            operation=operation,
+            exc=exc,
+            include_error_type=True,
+        )
+    except (ValueError, ProvisioningPermanentError) as exc:
+        logger.exception(
+            "Provisioning validation/permanent failure environment_id=%s operation_id=%s error_type=%s",
+            environment.id,
+            operation.id,
+            type(exc).__name__,
+        )
+        _set_provisioning_failed(
+            db,
+            actor=actor,
+            environment=environment,
+            operation=operation,
+            exc=exc,
+            include_error_type=True,
+        )
+    except Exception as exc:  # noqa: BLE001 — final fallback; prevents stuck operations on truly unexpected errors
+        logger.exception(
+            "Unexpected error during provisioning environment_id=%s operation_id=%s error_type=%s",
+            environment.id,
+            operation.id,
+            type(exc).__name__,
+        )
+        _set_provisioning_failed(
+            db,
+            actor=actor,
+            environment=environment,
+            operation=operation,
+            exc=exc,
+            include_error_type=False,
+        )
+
+
+def _process_claimed_operation(
+    session_factory: sessionmaker[Session],
+    op_id: str,
+    *,
+    actor: str,
+    claim_token: str,
+    heartbeat: _ProvisioningClaimHeartbeat,
+) -> None:
+    try:
+        with session_factory() as db:
+            operation = db.execute(
+                select(ProvisioningOperation)
+                .where(ProvisioningOperation.id == op_id)
+                .options(selectinload(ProvisioningOperation.environment))
+            ).scalar_one()
+            if operation.worker_claim_token != claim_token:
+                logger.warning("Provisioning claim lost before processing operation_id=%s", op_id)
+                return
+            _provision_operation(db, actor=actor, operation=operation)
             _release_operation_claim(operation)
-            processed += 1
-    if processed:
-        db.commit()
-    return processed
+            db.commit()
+    finally:
+        heartbeat.release(op_id)
+
+
+def process_provisioning_once(
+    db: Session,
+    *,
+    actor: str = "worker:provisioner",
+    limit: int | None = None,
+) -> int:
+    """Claim up to *limit* operations and provision them concurrently.
+
+    Each operation runs on a thread from a pool of ``provisioning_max_workers``
+    with its own session, so one slow Terraform apply no longer holds up every
+    other tenant's onboarding.
+    """
+    settings = get_settings()
+    pending = _claim_provisioning_operations(
+        db,
+        actor=actor,
+        provisioning_steps=PROVISIONING_STEPS,
+        limit=limit or settings.provisioning_batch_size,
+    )
+    if not pending:
+        return 0
+    claims = {operation.id: operation.worker_claim_token or "" for operation in pending}
+    # Commit the claims so other provisioners skip these operations and the
+    # heartbeat's separate session can renew them.
+    db.commit()
+    session_factory = sessionmaker(bind=db.get_bind(), autoflush=False)
+    with _ProvisioningClaimHeartbeat(session_factory, claims) as heartbeat, ThreadPoolExecutor(
+        max_workers=min(settings.provisioning_max_workers, len(claims)),
+        thread_name_prefix="sparkpilot-provisioner",
+    ) as pool:
+        futures = [
+            pool.submit(
+                _process_claimed_operation,
+                session_factory,
+                op_id,
+                actor=actor,
+                claim_token=claim_token,
+                heartbeat=heartbeat,
+            )
+            for op_id, claim_token in claims.items()
+        ]
+        for future in futures:
+            future.result()
+    return len(claims)
@@ -1,13 +1,17 @@
 """Reconciler worker: polls EMR for run state and records terminal results."""
 
+from collections import defaultdict
+from datetime import timedelta
 import logging
 from typing import Any
 
+import httpx
 from sqlalchemy.orm import Session
 
 from sparkpilot.audit import write_audit_event
 from sparkpilot.aws_clients import EmrEksClient
 from sparkpilot.config import get_settings
+from sparkpilot.databricks_client import databricks_client_for, databricks_run_state
 from sparkpilot.models import Environment, Run
 from sparkpilot.services._helpers import TERMINAL_RUN_STATES, _as_utc, _now
 from sparkpilot.services.diagnostics import _record_run_diagnostics_if_needed
@@ -17,6 +21,7 @@ from sparkpilot.services.preflight import (
     _has_preflight_audit,
     _preflight_summary,
 )
+from sparkpilot.services.run_events import prune_run_state_events
 from sparkpilot.services.workers_common import _claim_runs, _release_run_claim
 
 logger = logging.getLogger(__name__)
@@ -31,6 +36,10 @@ EMR_TO_PLATFORM_STATE = {
     "CANCEL_PENDING": "running",
 }
 
+# SparkPilot stamps started_at after runs/submit returns; list from a little
+# earlier so clock skew with the workspace cannot hide a run.
+_DATABRICKS_LIST_SLACK = timedelta(minutes=10)
+
 
 def _emit_reconciler_preflight_diagnostic_if_missing(
     *,
@@ -188,6 +197,59 @@ def _record_reconciled_run_state(
     )
 
 
+def _has_databricks_run_id(run: Run) -> bool:
+    return bool(run.backend_job_run_id and run.backend_job_run_id.isdigit())
+
+
+def _prefetch_databricks_runs(runs: list[Run], *, settings: Any) -> dict[str, dict[str, Any]]:
+    """Read Databricks run payloads with one runs/list scan per workspace, keyed by SparkPilot run id."""
+    if settings.dry_run_mode:
+        return {}
+    by_workspace: dict[str, list[Run]] = defaultdict(list)
+    for run in runs:
+        env = run.environment
+        if env.engine == "databricks" and env.databricks_workspace_url and _has_databricks_run_id(run):
+            by_workspace[env.databricks_workspace_url].append(run)
+    payloads: dict[str, dict[str, Any]] = {}
+    for workspace_url, workspace_runs in by_workspace.items():
+        started = [_as_utc(run.started_at) for run in workspace_runs if run.started_at]
+        try:
+            found = databricks_client_for(workspace_url, settings.databricks_token).get_runs(
+                [int(run.backend_job_run_id) for run in workspace_runs],
+                started_after=min(started) - _DATABRICKS_LIST_SLACK if started else None,
+            )
+        except httpx.HTTPError:
+            # Leave these runs to the per-run lookup, whose failure is logged per run.
+            logger.warning("Databricks runs/list failed for workspace=%s.", workspace_url, exc_info=True)
+            continue
+        for run in workspace_runs:
+            payload = found.get(int(run.backend_job_run_id))
+            if payload is not None:
+                payloads[run.id] = payload
+    return payloads
+
+
+def _describe_databricks_run(
+    *,
+    run: Run,
+    env: Environment,
+    settings: Any,
+    prefetched: dict[str, dict[str, Any]],
+) -> tuple[str, str | None]:
+    if run.cancellation_requested:
+        return "CANCELLED", None
+    if not _has_databricks_run_id(run):
+        return "FAILED", "Missing Databricks run id."
+    payload = prefetched.get(run.id)
+    if payload is None:
+        client = databricks_client_for(env.databricks_workspace_url, settings.databricks_token)
+        payload = client.get_run(int(run.backend_job_run_id))
+    run_page_url = payload.get("run_page_url")
+    if run_page_url:
+        run.spark_ui_uri = run_page_url
+    return databricks_run_state(payload)
+
+
 def process_reconciler_once(db: Session, *, actor: str = "worker:reconciler", limit: int = 20) -> int:
     emr = EmrEksClient()
     settings = get_settings()
@@ -198,6 +260,7 @@ def process_reconciler_once(db: Session, *, actor: str = "worker:reconciler", li
         limit=limit,
         order_by_column=Run.updated_at,
     )
+    databricks_runs = _prefetch_databricks_runs(active_runs, settings=settings)
     processed = 0
     for run in active_runs:
         env = run.environment
@@ -208,7 +271,12 @@ def process_reconciler_once(db: Session, *, actor: str = "worker:reconciler", li
                     continue
 
                 _dispatch_run_cancel_if_requested(db=db, run=run, env=env, emr=emr, actor=actor)
-                emr_state, error = emr.describe_job_run(env, run)
+                if env.engine == "databricks" and not settings.dry_run_mode:
+                    emr_state, error = _describe_databricks_run(
+                        run=run, env=env, settings=settings, prefetched=databricks_runs
+                    )
+                else:
+                    emr_state, error = emr.describe_job_run(env, run)
                 mapped_state = EMR_TO_PLATFORM_STATE.get(emr_state, "failed")
                 mapped_state, error = _apply_reconciler_stale_overrides(
                     run=run,
@@ -235,6 +303,7 @@ def process_reconciler_once(db: Session, *, actor: str = "worker:reconciler", li
         finally:
             _release_run_claim(run)
             processed += 1
-    if processed:
+    pruned = prune_run_state_events(db)
+    if processed or pruned:
         db.commit()
     return processed
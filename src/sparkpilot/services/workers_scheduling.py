@@ -8,9 +8,12 @@ from sqlalchemy.orm import Session
 
 from sparkpilot.audit import write_audit_event
 from sparkpilot.aws_clients import EmrEc2Client, EmrEksClient, EmrServerlessClient
+from sparkpilot.config import get_settings
 from sparkpilot.error_handling import error_details, error_message, error_type
 from sparkpilot.models import Environment, Run
+from sparkpilot.quota import _run_vcpu
 from sparkpilot.services._helpers import _now
+from sparkpilot.services.dispatch_capacity import blocked_environment_ids, load_dispatch_capacity
 from sparkpilot.services.preflight import _build_preflight_cached, _preflight_summary
 from sparkpilot.services.workers_common import (
     _claim_runs,
@@ -107,14 +110,10 @@ def _dispatch_run(env: Environment, job: Any, run: Run) -> Any:
     if engine == "emr_on_ec2":
         return EmrEc2Client().start_job_run(env, job, run)
     if engine == "databricks":
-        from sparkpilot.databricks_client import DatabricksClient
+        from sparkpilot.databricks_client import databricks_client_for
         from sparkpilot.config import get_settings
         settings = get_settings()
-        db_token = settings.databricks_token
-        db_client = DatabricksClient(
-            workspace_url=env.databricks_workspace_url,
-            token=db_token,
-        )
+        db_client = databricks_client_for(env.databricks_workspace_url, settings.databricks_token)
         result = db_client.submit_run(
             job_artifact_uri=job.artifact_uri,
             entrypoint=job.entrypoint,
@@ -158,17 +157,34 @@ def _apply_dispatch_result(run: Run, env: Environment, dispatch: Any) -> None:
 
 
 def process_scheduler_once(db: Session, *, actor: str = "worker:scheduler", limit: int = 20) -> int:
+    settings = get_settings()
+    capacities = None
+    blocked: set[str] = set()
+    if settings.dispatch_capacity_mode == "enforce":
+        capacities = load_dispatch_capacity(db, settings=settings)
+        blocked = blocked_environment_ids(db, capacities)
     queued_runs = _claim_runs(
         db,
         actor=actor,
         states=["queued"],
         limit=limit,
         order_by_column=Run.created_at,
+        held_environment_ids=blocked,
     )
     processed = 0
+    held = 0
     for run in queued_runs:
         job = run.job
         env = run.environment
+        requested_vcpu = _run_vcpu(run.requested_resources_json or {})
+        if capacities is not None and not run.cancellation_requested:
+            capacity = capacities.get(env.id)
+            if env.id in blocked or (capacity is not None and not capacity.fits(requested_vcpu)):
+                # Hold younger runs behind it too, so the environment keeps age order.
+                blocked.add(env.id)
+                _release_run_claim(run)
+                held += 1
+                continue
         try:
             spark_conf = {**(job.spark_conf_json or {}), **(run.spark_conf_overrides_json or {})}
             if run.cancellation_requested:
@@ -215,6 +231,12 @@ def process_scheduler_once(db: Session, *, actor: str = "worker:scheduler", limi
             run.state = "dispatching"
             dispatch = _dispatch_run(env, job, run)
             _apply_dispatch_result(run, env, dispatch)
+            if capacities is not None and env.id in capacities:
+                capacities[env.id].reserve(requested_vcpu)
+            dispatch_details = {"backend_job_run_id": run.backend_job_run_id, "engine": env.engine}
+            job_template_id = getattr(dispatch, "job_template_id", None)
+            if job_template_id:
+                dispatch_details["job_template_id"] = job_template_id
             write_audit_event(
                 db,
                 actor=actor,
@@ -223,7 +245,7 @@ def process_scheduler_once(db: Session, *, actor: str = "worker:scheduler", limi
                 entity_id=run.id,
                 tenant_id=env.tenant_id,
                 aws_request_id=dispatch.aws_request_id,
-                details={"backend_job_run_id": run.backend_job_run_id, "engine": env.engine},
+                details=dispatch_details,
             )
         except Exception as exc:  # noqa: BLE001 — scheduler must handle all errors per-run, not crash the batch
             _handle_dispatch_failure(
@@ -237,6 +259,6 @@ def process_scheduler_once(db: Session, *, actor: str = "worker:scheduler", limi
         finally:
             _release_run_claim(run)
             processed += 1
-    if processed:
+    if processed or held:
         db.commit()
     return processed
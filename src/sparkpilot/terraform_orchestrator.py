@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+import hashlib
 import json
 import os
 from pathlib import Path
+import queue
 import shutil
 import subprocess
-from typing import Any
+import threading
+import time
+from typing import IO, Any
 
 from sparkpilot.config import get_settings
 from sparkpilot.models import Environment, ProvisioningOperation
@@ -50,6 +55,115 @@ class TerraformApplyResult:
     outputs: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class TerraformWorkingCopy:
+    """A Terraform data directory prepared for one working dir, workspace and backend."""
+
+    key: str
+    working_dir: Path
+    workspace: str
+    data_dir: Path
+    plugin_cache_dir: Path
+
+    @property
+    def marker_path(self) -> Path:
+        return self.data_dir / "sparkpilot-init.json"
+
+    def env(self) -> dict[str, str]:
+        return {
+            **os.environ,
+            "TF_DATA_DIR": str(self.data_dir),
+            "TF_PLUGIN_CACHE_DIR": str(self.plugin_cache_dir),
+            "TF_IN_AUTOMATION": "1",
+        }
+
+
+def _configuration_digest(working_dir: Path, *, skip: Path) -> str:
+    """Digest of the root module, its local modules and the dependency lock file.
+
+    Module sources and versions, provider requirements and the backend block
+    all live in these files, so any change to them needs a fresh ``init``.
+    Hidden directories (``.terraform`` and the default work dir) and *skip*
+    are not read.
+    """
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(working_dir):
+        current = Path(dirpath)
+        dirnames[:] = sorted(
+            name for name in dirnames if not name.startswith(".") and current / name != skip
+        )
+        for name in sorted(filenames):
+            if name.endswith((".tf", ".tf.json")) or (current == working_dir and name == ".terraform.lock.hcl"):
+                path = current / name
+                digest.update(str(path.relative_to(working_dir)).encode() + b"\0")
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+class TerraformWorkspaceManager:
+    """Initialized Terraform working copies shared by every orchestrator in a process.
+
+    Each (working dir, workspace, backend config, module configuration)
+    combination gets its own ``TF_DATA_DIR``, so environments provisioned
+    concurrently never share backend or workspace selection state, and
+    providers are installed once into a shared plugin cache.  A marker file
+    written after a successful ``init`` and workspace selection lets later
+    cycles and restarted workers reuse the working copy without re-running
+    them.
+    """
+
+    def __init__(self) -> None:
+        self._initialized: set[str] = set()
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        # Terraform does not guarantee that concurrent inits can share a plugin cache.
+        self.init_lock = threading.Lock()
+
+    def working_copy(
+        self, working_dir: Path, workspace: str, backend_config: list[str]
+    ) -> TerraformWorkingCopy:
+        working_dir = working_dir.resolve()
+        configured_root = os.getenv("SPARKPILOT_TERRAFORM_WORK_DIR", "").strip()
+        root = Path(configured_root).resolve() if configured_root else working_dir / ".sparkpilot-terraform"
+        configured_cache = os.getenv("SPARKPILOT_TERRAFORM_PLUGIN_CACHE_DIR", "").strip()
+        plugin_cache_dir = Path(configured_cache).resolve() if configured_cache else root / "plugin-cache"
+        config_digest = _configuration_digest(working_dir, skip=root)
+        key = hashlib.sha256(
+            json.dumps([str(working_dir), workspace, backend_config, config_digest]).encode()
+        ).hexdigest()[:24]
+        return TerraformWorkingCopy(
+            key=key,
+            working_dir=working_dir,
+            workspace=workspace,
+            data_dir=root / "data" / key,
+            plugin_cache_dir=plugin_cache_dir,
+        )
+
+    def is_initialized(self, copy: TerraformWorkingCopy) -> bool:
+        with self._lock:
+            if copy.key in self._initialized:
+                return True
+            if copy.marker_path.exists():
+                self._initialized.add(copy.key)
+                return True
+            return False
+
+    def lock_for(self, copy: TerraformWorkingCopy) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(copy.key, threading.Lock())
+
+    def mark_initialized(self, copy: TerraformWorkingCopy) -> None:
+        copy.marker_path.write_text(
+            json.dumps({"working_dir": str(copy.working_dir), "workspace": copy.workspace}),
+            encoding="utf-8",
+        )
+        with self._lock:
+            self._initialized.add(copy.key)
+
+
+_DEFAULT_WORKSPACE_MANAGER = TerraformWorkspaceManager()
+
+
 class TerraformOrchestrator:
     def __init__(
         self,
@@ -57,16 +171,21 @@ class TerraformOrchestrator:
         terraform_binary: str = "terraform",
         enable_subprocess: bool | None = None,
         timeout_seconds: int = 900,
+        output_sink: Callable[[str, str], None] | None = None,
+        workspaces: TerraformWorkspaceManager | None = None,
     ) -> None:
         settings = get_settings()
         self.terraform_binary = terraform_binary
         self.enable_subprocess = (not settings.dry_run_mode) if enable_subprocess is None else enable_subprocess
         self.timeout_seconds = timeout_seconds
+        # Called as ``output_sink(stream, line)`` for each stdout/stderr line
+        # while a command runs; without it output is only captured.
+        self.output_sink = output_sink
         self.backend_bucket = os.getenv("SPARKPILOT_TERRAFORM_STATE_BUCKET", "").strip()
         self.backend_region = os.getenv("SPARKPILOT_TERRAFORM_STATE_REGION", "").strip() or settings.aws_region
         self.backend_lock_table = os.getenv("SPARKPILOT_TERRAFORM_STATE_LOCK_TABLE", "").strip()
         self.backend_role_arn = os.getenv("SPARKPILOT_TERRAFORM_STATE_ROLE_ARN", "").strip()
-        self._initialized_contexts: set[tuple[str, str]] = set()
+        self.workspaces = workspaces or _DEFAULT_WORKSPACE_MANAGER
 
     def build_stage_context(
         self,
@@ -116,8 +235,8 @@ class TerraformOrchestrator:
             )
 
         self._validate_runtime_prerequisites(context)
-        self._ensure_initialized(context)
-        completed = self._run(command, cwd=context.working_dir)
+        working_copy = self._ensure_initialized(context)
+        completed = self._run(command, cwd=context.working_dir, env=working_copy.env())
         return TerraformPlanResult(
             ok=completed.returncode == 0,
             command=command,
@@ -153,11 +272,11 @@ class TerraformOrchestrator:
             )
 
         self._validate_runtime_prerequisites(context)
-        self._ensure_initialized(context)
-        completed = self._run(command, cwd=context.working_dir)
+        working_copy = self._ensure_initialized(context)
+        completed = self._run(command, cwd=context.working_dir, env=working_copy.env())
         outputs: dict[str, Any] = {}
         if completed.returncode == 0:
-            outputs = self._collect_outputs(context.working_dir)
+            outputs = self._collect_outputs(context.working_dir, env=working_copy.env())
         return TerraformApplyResult(
             ok=completed.returncode == 0,
             command=command,
@@ -192,53 +311,84 @@ class TerraformOrchestrator:
                 "Add full-BYOC Terraform modules before enabling live full-mode provisioning."
             )
 
-    def _ensure_initialized(self, context: ProvisioningStageContext) -> None:
-        cache_key = (str(context.working_dir.resolve()), context.workspace)
-        if cache_key in self._initialized_contexts:
-            return
+    def _backend_config(self, context: ProvisioningStageContext) -> list[str]:
+        if not self.backend_bucket:
+            return ["-backend=false"]
+        config = [
+            "-backend-config",
+            f"bucket={self.backend_bucket}",
+            "-backend-config",
+            f"key={context.state_key}",
+            "-backend-config",
+            f"region={self.backend_region}",
+        ]
+        if self.backend_lock_table:
+            config.extend(["-backend-config", f"dynamodb_table={self.backend_lock_table}"])
+        if self.backend_role_arn:
+            config.extend(["-backend-config", f"role_arn={self.backend_role_arn}"])
+        return config
 
+    def _ensure_initialized(self, context: ProvisioningStageContext) -> TerraformWorkingCopy:
+        backend_config = self._backend_config(context)
+        working_copy = self.workspaces.working_copy(context.working_dir, context.workspace, backend_config)
+        if self.workspaces.is_initialized(working_copy):
+            return working_copy
+        with self.workspaces.lock_for(working_copy):
+            if self.workspaces.is_initialized(working_copy):
+                return working_copy
+            self._initialize(context, working_copy, backend_config)
+            self.workspaces.mark_initialized(working_copy)
+        return working_copy
+
+    def _initialize(
+        self,
+        context: ProvisioningStageContext,
+        working_copy: TerraformWorkingCopy,
+        backend_config: list[str],
+    ) -> None:
+        working_copy.data_dir.mkdir(parents=True, exist_ok=True)
+        working_copy.plugin_cache_dir.mkdir(parents=True, exist_ok=True)
+        env = working_copy.env()
         init_command = [
             self.terraform_binary,
             "init",
             "-input=false",
             "-no-color",
             "-reconfigure",
+            *backend_config,
         ]
-        if self.backend_bucket:
-            init_command.extend(["-backend-config", f"bucket={self.backend_bucket}"])
-            init_command.extend(["-backend-config", f"key={context.state_key}"])
-            init_command.extend(["-backend-config", f"region={self.backend_region}"])
-            if self.backend_lock_table:
-                init_command.extend(["-backend-config", f"dynamodb_table={self.backend_lock_table}"])
-            if self.backend_role_arn:
-                init_command.extend(["-backend-config", f"role_arn={self.backend_role_arn}"])
-        else:
-            init_command.append("-backend=false")
-
-        init_result = self._run(init_command, cwd=context.working_dir)
+        with self.workspaces.init_lock:
+            init_result = self._run(init_command, cwd=context.working_dir, env=env)
         if init_result.returncode != 0:
             raise ValueError(
                 "Terraform init failed: " + self._excerpt(init_result.stderr or init_result.stdout)
             )
 
         select_workspace_command = [self.terraform_binary, "workspace", "select", context.workspace]
-        select_result = self._run(select_workspace_command, cwd=context.working_dir)
+        select_result = self._run(select_workspace_command, cwd=context.working_dir, env=env)
         if select_result.returncode != 0:
             create_workspace_command = [self.terraform_binary, "workspace", "new", context.workspace]
-            create_result = self._run(create_workspace_command, cwd=context.working_dir)
+            create_result = self._run(create_workspace_command, cwd=context.working_dir, env=env)
             if create_result.returncode != 0:
                 raise ValueError(
                     "Terraform workspace setup failed: "
                     + self._excerpt(create_result.stderr or create_result.stdout)
                 )
 
-        self._initialized_contexts.add(cache_key)
-
-    def _run(self, command: list[str], *, cwd: Path) -> subprocess.CompletedProcess[str]:
+    def _run(
+        self,
+        command: list[str],
+        *,
+        cwd: Path,
+        env: dict[str, str] | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        if self.output_sink is not None:
+            return self._run_streaming(command, cwd=cwd, env=env, sink=self.output_sink)
         try:
             return subprocess.run(
                 command,
                 cwd=str(cwd),
+                env=env,
                 capture_output=True,
                 text=True,
                 timeout=self.timeout_seconds,
@@ -251,9 +401,63 @@ class TerraformOrchestrator:
                 f"Terraform command timed out after {self.timeout_seconds} seconds: {' '.join(command)}"
             ) from exc
 
-    def _collect_outputs(self, cwd: Path) -> dict[str, Any]:
+    def _run_streaming(
+        self,
+        command: list[str],
+        *,
+        cwd: Path,
+        env: dict[str, str] | None,
+        sink: Callable[[str, str], None],
+    ) -> subprocess.CompletedProcess[str]:
+        try:
+            process = subprocess.Popen(
+                command,
+                cwd=str(cwd),
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            )
+        except FileNotFoundError as exc:
+            raise ValueError(f"Terraform command failed to start: {exc}") from exc
+
+        lines: queue.Queue[tuple[str, str | None]] = queue.Queue()
+        for stream, pipe in (("stdout", process.stdout), ("stderr", process.stderr)):
+            threading.Thread(
+                target=_pump_lines, args=(stream, pipe, lines), name=f"terraform-{stream}", daemon=True
+            ).start()
+        captured: dict[str, list[str]] = {"stdout": [], "stderr": []}
+        deadline = time.monotonic() + self.timeout_seconds
+        open_streams = 2
+        try:
+            while open_streams:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(command, self.timeout_seconds)
+                try:
+                    stream, line = lines.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+                if line is None:
+                    open_streams -= 1
+                    continue
+                captured[stream].append(line)
+                sink(stream, line.rstrip("\n"))
+            returncode = process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired as exc:
+            process.kill()
+            process.wait()
+            raise ValueError(
+                f"Terraform command timed out after {self.timeout_seconds} seconds: {' '.join(command)}"
+            ) from exc
+        return subprocess.CompletedProcess(
+            command, returncode, "".join(captured["stdout"]), "".join(captured["stderr"])
+        )
+
+    def _collect_outputs(self, cwd: Path, *, env: dict[str, str] | None = None) -> dict[str, Any]:
         command = [self.terraform_binary, "output", "-json"]
-        completed = self._run(command, cwd=cwd)
+        completed = self._run(command, cwd=cwd, env=env)
         if completed.returncode != 0:
             raise ValueError(
                 "Terraform apply succeeded, but `terraform output -json` failed: "
@@ -274,3 +478,13 @@ class TerraformOrchestrator:
         if len(text) <= limit:
             return text
         return text[:limit] + "...[truncated]"
+
+
+def _pump_lines(stream: str, pipe: IO[str] | None, lines: queue.Queue[tuple[str, str | None]]) -> None:
+    """Forward *pipe* to *lines* line by line, then signal end of stream with ``None``."""
+    try:
+        if pipe is not None:
+            for line in pipe:
+                lines.put((stream, line))
+    finally:
+        lines.put((stream, None))
@@ -5,10 +5,13 @@ import time
 from sparkpilot.config import get_settings, validate_runtime_settings
 from sparkpilot.db import SessionLocal, init_db
 from sparkpilot.services import (
+    export_cost_rollups_once,
+    process_interactive_pool_once,
     process_provisioning_once,
     process_cur_reconciliation_once,
     process_reconciler_once,
     process_scheduler_once,
+    refresh_pricing_snapshots_once,
     sync_emr_releases_once,
 )
 
@@ -30,6 +33,12 @@ def _run_forever(worker: str, once: bool) -> None:
                     processed = sync_emr_releases_once(db)
                 elif worker == "cur-reconciliation":
                     processed = process_cur_reconciliation_once(db)
+                elif worker == "cost-rollup-export":
+                    processed = export_cost_rollups_once(db)
+                elif worker == "pricing-refresh":
+                    processed = refresh_pricing_snapshots_once(db)
+                elif worker == "interactive-pool":
+                    processed = process_interactive_pool_once(db)
                 else:
                     raise ValueError(f"Unsupported worker type: {worker}")
             logger.info("[%s] processed=%s", worker, processed)
@@ -46,7 +55,16 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="SparkPilot worker process")
     parser.add_argument(
         "worker",
-        choices=["provisioner", "scheduler", "reconciler", "emr-release-sync", "cur-reconciliation"],
+        choices=[
+            "provisioner",
+            "scheduler",
+            "reconciler",
+            "emr-release-sync",
+            "cur-reconciliation",
+            "cost-rollup-export",
+            "pricing-refresh",
+            "interactive-pool",
+        ],
         help="Worker type to run.",
     )
     parser.add_argument("--once", action="store_true", help="Run one iteration and exit.")
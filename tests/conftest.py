@@ -28,7 +28,10 @@ os.environ.setdefault(
 os.environ.setdefault("SPARKPILOT_BOOTSTRAP_FLOW", "enabled")
 
 from sparkpilot.api import _oidc_verifier, _oidc_verifiers
+from sparkpilot.aws_clients import _reset_aws_lookup_cache
 from sparkpilot.config import get_settings
+from sparkpilot.databricks_client import _reset_databricks_clients
+from sparkpilot.services.emr_releases import _reset_release_index
 
 
 TEST_OIDC_ISSUER = "https://sparkpilot.test-issuer"
@@ -210,6 +213,9 @@ def clear_settings_cache(
     get_settings.cache_clear()
     _oidc_verifier.cache_clear()
     _oidc_verifiers.cache_clear()
+    _reset_aws_lookup_cache()
+    _reset_release_index()
+    _reset_databricks_clients()
     yield
     get_settings.cache_clear()
     _oidc_verifier.cache_clear()
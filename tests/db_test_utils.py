@@ -5,6 +5,8 @@ from typing import Any
 def reset_sqlite_test_db(*, base: Any, engine: Any, session_local: Any) -> None:
     import sparkpilot.models  # noqa: F401 -- register all tables before recreation
     from sparkpilot.services import ensure_default_golden_paths
+    from sparkpilot.services.access_cache import _reset_access_context_cache
+    from sparkpilot.services.cost_rollups import _reset_team_spend_cache
 
     engine.dispose()
     url_str = str(engine.url)
@@ -14,5 +16,7 @@ def reset_sqlite_test_db(*, base: Any, engine: Any, session_local: Any) -> None:
             if file_path.exists():
                 file_path.unlink()
     base.metadata.create_all(bind=engine)
+    _reset_team_spend_cache()
+    _reset_access_context_cache()
     with session_local() as db:
         ensure_default_golden_paths(db)
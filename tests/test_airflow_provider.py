@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 import sys
+import time
 
 import httpx
 import pytest
@@ -15,11 +16,16 @@ if str(PROVIDER_SRC) not in sys.path:
 from airflow.providers.sparkpilot._compat import AirflowException, AirflowFailException  # noqa: E402
 from airflow.providers.sparkpilot.common import SparkPilotPermanentError, SparkPilotTransientError  # noqa: E402
 from airflow.providers.sparkpilot.hooks.sparkpilot import SparkPilotHook  # noqa: E402
+from airflow.providers.sparkpilot.pollers import AsyncRunStatusPoller, iter_sse_events  # noqa: E402
 from airflow.providers.sparkpilot.operators.sparkpilot import SparkPilotCancelRunOperator, SparkPilotSubmitRunOperator  # noqa: E402
 from airflow.providers.sparkpilot.sensors.sparkpilot import SparkPilotRunSensor  # noqa: E402
 from airflow.providers.sparkpilot.triggers.sparkpilot import SparkPilotRunTrigger  # noqa: E402
 
 
+def _patch_http_client(monkeypatch: pytest.MonkeyPatch, method: str, fake) -> None:  # noqa: ANN001
+    monkeypatch.setattr(httpx.Client, method, lambda _client, *args, **kwargs: fake(*args, **kwargs))
+
+
 class _Conn:
     def __init__(
         self,
@@ -59,7 +65,7 @@ def test_hook_submit_run_uses_oidc_bearer_headers(monkeypatch: pytest.MonkeyPatc
         request = httpx.Request("POST", "http://sparkpilot.local:8000/v1/jobs/job-1/runs")
         return httpx.Response(201, json={"id": "run-1", "state": "queued"}, request=request)
 
-    monkeypatch.setattr("httpx.request", _fake_request)
+    _patch_http_client(monkeypatch, "request", _fake_request)
     hook = SparkPilotHook(sparkpilot_conn_id="sparkpilot_default")
     payload = hook.submit_run(job_id="job-1", run_payload={"golden_path": "small"}, idempotency_key="idem-1")
 
@@ -103,6 +109,47 @@ def test_hook_raises_when_required_oidc_fields_missing(monkeypatch: pytest.Monke
         hook.resolve_connection()
 
 
+def test_hook_submit_runs_chunks_batch_create_with_stable_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    conn = _Conn(
+        extra_dejson={
+            "sparkpilot_url": "http://sparkpilot.local:8000",
+            "oidc_issuer": "https://issuer.local",
+            "oidc_audience": "sparkpilot-api",
+        },
+        login="airflow-client",
+        password="airflow-secret",
+    )
+    monkeypatch.setattr(SparkPilotHook, "get_connection", classmethod(lambda _cls, _conn_id: conn))
+    monkeypatch.setattr(SparkPilotHook, "_get_access_token", lambda _self, _resolved, force_refresh=False: "access-1")
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+    bodies: list[list[dict[str, object]]] = []
+
+    def _fake_request(**kwargs):  # noqa: ANN001, ANN202
+        runs = kwargs["json"]["runs"]
+        bodies.append(runs)
+        request = httpx.Request("POST", kwargs["url"])
+        if len(bodies) == 1:
+            return httpx.Response(503, json={"detail": "temporary outage"}, request=request)
+        results = [
+            {"job_id": run["job_id"], "idempotency_key": run["idempotency_key"], "status_code": 201}
+            for run in runs
+        ]
+        return httpx.Response(200, json={"results": results}, request=request)
+
+    _patch_http_client(monkeypatch, "request", _fake_request)
+    submissions = [{"job_id": "job-1", "run_payload": {"args": [str(i)]}} for i in range(501)]
+    submissions[0]["idempotency_key"] = "backfill-0"
+    results = SparkPilotHook().submit_runs(submissions)
+
+    assert [len(body) for body in bodies] == [500, 500, 1]
+    # The retried chunk reuses the keys generated for the first attempt.
+    assert bodies[0] == bodies[1]
+    assert bodies[1][0]["idempotency_key"] == "backfill-0"
+    assert bodies[1][1]["args"] == ["1"]
+    assert len(results) == 501
+    assert len({result["idempotency_key"] for result in results}) == 501
+
+
 def test_hook_raises_transient_error_for_retryable_status(monkeypatch: pytest.MonkeyPatch) -> None:
     conn = _Conn(
         extra_dejson={
@@ -120,7 +167,7 @@ def test_hook_raises_transient_error_for_retryable_status(monkeypatch: pytest.Mo
         request = httpx.Request("GET", "http://sparkpilot.local:8000/v1/runs/run-1")
         return httpx.Response(503, json={"detail": "temporary outage"}, request=request)
 
-    monkeypatch.setattr("httpx.request", _fake_request)
+    _patch_http_client(monkeypatch, "request", _fake_request)
     hook = SparkPilotHook()
     with pytest.raises(SparkPilotTransientError):
         hook.get_run("run-1")
@@ -143,7 +190,7 @@ def test_hook_raises_permanent_error_for_non_retryable_status(monkeypatch: pytes
         request = httpx.Request("GET", "http://sparkpilot.local:8000/v1/runs/run-1")
         return httpx.Response(403, json={"detail": "forbidden"}, request=request)
 
-    monkeypatch.setattr("httpx.request", _fake_request)
+    _patch_http_client(monkeypatch, "request", _fake_request)
     hook = SparkPilotHook()
     with pytest.raises(SparkPilotPermanentError):
         hook.get_run("run-1")
@@ -163,13 +210,15 @@ def test_hook_wait_for_terminal_state_retries_transient_then_succeeds(monkeypatc
 
     calls = {"count": 0}
 
-    def _fake_get_run(_self, _run_id: str) -> dict[str, object]:
+    def _fake_wait_run(_self, run_id: str, *, timeout_seconds: float) -> dict[str, object]:
         calls["count"] += 1
+        assert run_id == "run-1"
+        assert 0 < timeout_seconds <= 10
         if calls["count"] == 1:
             raise SparkPilotTransientError("temporary outage")
         return {"id": "run-1", "state": "succeeded"}
 
-    monkeypatch.setattr(SparkPilotHook, "get_run", _fake_get_run)
+    monkeypatch.setattr(SparkPilotHook, "wait_run", _fake_wait_run)
     monkeypatch.setattr("time.sleep", lambda _seconds: None)
     hook = SparkPilotHook()
     run = hook.wait_for_terminal_state(run_id="run-1", poll_interval_seconds=1, timeout_seconds=10)
@@ -177,6 +226,44 @@ def test_hook_wait_for_terminal_state_retries_transient_then_succeeds(monkeypatc
     assert calls["count"] == 2
 
 
+
+def test_async_poller_ticks_early_when_event_stream_reports_change() -> None:
+    batches: list[list[str]] = []
+    states = {"run-evt": "running"}
+
+    async def _fetch_batch(run_ids: list[str]) -> dict[str, object]:
+        batches.append(list(run_ids))
+        return {"runs": [{"id": run_id, "state": states[run_id]} for run_id in run_ids]}
+
+    async def _lines():  # noqa: ANN202
+        await asyncio.sleep(0.1)
+        states["run-evt"] = "succeeded"
+        yield "id: 7"
+        yield "event: run.state"
+        yield 'data: {"run_id": "run-evt", "state": "succeeded"}'
+        yield ""
+        await asyncio.sleep(30)
+
+    async def _open_stream(last_event_id: str | None):  # noqa: ANN202
+        assert last_event_id is None
+        async for event in iter_sse_events(_lines()):
+            yield event
+
+    async def _wait() -> tuple[str, str, float]:
+        poller = AsyncRunStatusPoller()
+        first = await poller.next_status("run-evt", fetch_batch=_fetch_batch, interval_seconds=30)
+        started = time.monotonic()
+        second = await poller.next_status(
+            "run-evt", fetch_batch=_fetch_batch, interval_seconds=30, open_event_stream=_open_stream
+        )
+        return str(first["state"]), str(second["state"]), time.monotonic() - started
+
+    first_state, second_state, elapsed = asyncio.run(_wait())
+    assert (first_state, second_state) == ("running", "succeeded")
+    assert elapsed < 5
+    assert batches == [["run-evt"], ["run-evt"]]
+
+
 def test_operator_supports_golden_path_and_xcom_metadata() -> None:
     class _FakeHook:
         def __init__(self) -> None:
@@ -363,7 +450,11 @@ def test_trigger_async_run_yields_success_event(monkeypatch: pytest.MonkeyPatch)
         password="airflow-secret",
     )
     monkeypatch.setattr(SparkPilotHook, "get_connection", classmethod(lambda _cls, _conn_id: conn))
-    monkeypatch.setattr(SparkPilotHook, "get_access_token", lambda _self, force_refresh=False: "access-async")
+
+    async def _async_token(_self, _resolved, *, rejected_token=None):  # noqa: ANN001, ANN202
+        return "access-async"
+
+    monkeypatch.setattr(SparkPilotHook, "async_get_access_token", _async_token)
 
     class _FakeAsyncClient:
         def __init__(self, **_kwargs) -> None:  # noqa: ANN003
@@ -375,12 +466,14 @@ def test_trigger_async_run_yields_success_event(monkeypatch: pytest.MonkeyPatch)
         async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001, ANN204
             return None
 
-        async def get(self, _url: str, headers: dict[str, str]):  # noqa: ANN001, ANN202
+        async def post(self, url: str, json: dict[str, object], headers: dict[str, str]):  # noqa: ANN001, ANN202
+            assert url == "http://sparkpilot.local:8000/v1/runs:batchGet"
+            assert json == {"run_ids": ["run-async"]}
             assert headers["Authorization"] == "Bearer access-async"
-            request = httpx.Request("GET", "http://sparkpilot.local:8000/v1/runs/run-async")
+            request = httpx.Request("POST", url)
             return httpx.Response(
                 200,
-                json={"id": "run-async", "state": "succeeded"},
+                json={"runs": [{"id": "run-async", "state": "succeeded"}], "missing_run_ids": []},
                 request=request,
             )
 
@@ -397,6 +490,66 @@ def test_trigger_async_run_yields_success_event(monkeypatch: pytest.MonkeyPatch)
     assert event["metadata"]["id"] == "run-async"
 
 
+def test_shared_async_token_cache_refreshes_once_for_concurrent_triggers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = _Conn(
+        extra_dejson={
+            "sparkpilot_url": "http://sparkpilot.local:8000",
+            "oidc_issuer": "https://issuer.local",
+            "oidc_audience": "sparkpilot-api",
+        },
+        login="airflow-client",
+        password="airflow-secret",
+    )
+    monkeypatch.setattr(SparkPilotHook, "get_connection", classmethod(lambda _cls, _conn_id: conn))
+    requests: list[str] = []
+
+    class _FakeAsyncClient:
+        def __init__(self, **_kwargs) -> None:  # noqa: ANN003
+            pass
+
+        async def get(self, url: str, **_kwargs):  # noqa: ANN003, ANN202
+            requests.append(url)
+            await asyncio.sleep(0.05)
+            return httpx.Response(
+                200,
+                json={"token_endpoint": "https://issuer.local/oauth/token"},
+                request=httpx.Request("GET", url),
+            )
+
+        async def post(self, url: str, **_kwargs):  # noqa: ANN003, ANN202
+            requests.append(url)
+            await asyncio.sleep(0.05)
+            return httpx.Response(
+                200,
+                json={"access_token": f"token-{len(requests)}", "expires_in": 3600},
+                request=httpx.Request("POST", url),
+            )
+
+    monkeypatch.setattr("httpx.AsyncClient", _FakeAsyncClient)
+
+    async def _tokens() -> tuple[set[str], str]:
+        hooks = [SparkPilotHook() for _ in range(50)]
+        resolved = hooks[0].resolve_connection()
+        first = await asyncio.gather(*(hook.async_get_access_token(resolved) for hook in hooks))
+        rejected = first[0]
+        refreshed = await asyncio.gather(
+            *(hook.async_get_access_token(resolved, rejected_token=rejected) for hook in hooks)
+        )
+        assert len(set(refreshed)) == 1
+        return set(first), refreshed[0]
+
+    first_tokens, refreshed_token = asyncio.run(_tokens())
+    assert first_tokens == {"token-2"}
+    assert refreshed_token == "token-3"
+    assert requests == [
+        "https://issuer.local/.well-known/openid-configuration",
+        "https://issuer.local/oauth/token",
+        "https://issuer.local/oauth/token",
+    ]
+
+
 # ---------- Hook cancel_run ----------
 
 
@@ -420,7 +573,7 @@ def _prepare_cancel_run_test(monkeypatch: pytest.MonkeyPatch) -> tuple[SparkPilo
         request = httpx.Request("POST", "http://sparkpilot.local:8000/v1/runs/run-cancel/cancel")
         return httpx.Response(200, json={"id": "run-cancel", "state": "cancelled"}, request=request)
 
-    monkeypatch.setattr("httpx.request", _fake_request)
+    _patch_http_client(monkeypatch, "request", _fake_request)
     return SparkPilotHook(), captured
 
 
@@ -1,5 +1,9 @@
 from datetime import UTC, datetime, timedelta
+import asyncio
+import json
 import os
+import threading
+import time
 
 import pytest
 from botocore.exceptions import ClientError, EndpointConnectionError, ParamValidationError
@@ -8,12 +12,14 @@ from sqlalchemy import and_, select
 
 os.environ.setdefault("SPARKPILOT_DATABASE_URL", "sqlite:///./sparkpilot_test.db")
 
-from sparkpilot.api import app  # noqa: E402
+from sparkpilot.api import AccessContext, _run_event_stream, app  # noqa: E402
 from sparkpilot.aws_clients import EmrDispatchResult  # noqa: E402
 from sparkpilot.config import get_settings  # noqa: E402
 from sparkpilot.db import Base, SessionLocal, engine  # noqa: E402
-from sparkpilot.models import AuditEvent, EmrRelease, Environment, ProvisioningOperation, Run, UsageRecord  # noqa: E402
-from sparkpilot.services import _record_usage_if_needed, process_provisioning_once, process_reconciler_once, process_scheduler_once, sync_emr_releases_once  # noqa: E402
+from sparkpilot.models import AuditEvent, EmrRelease, Environment, ProvisioningCheckpoint, ProvisioningOperation, Run, RunStateEvent, UsageRecord  # noqa: E402
+from sparkpilot.run_event_hub import RunEventHub, RunStateChange  # noqa: E402
+from sparkpilot.services import _record_usage_if_needed, latest_run_state_event_id, process_provisioning_once, process_reconciler_once, process_scheduler_once, sync_emr_releases_once  # noqa: E402
+from sparkpilot.services.workers_common import _renew_provisioning_claims  # noqa: E402
 from sparkpilot.terraform_orchestrator import TerraformApplyResult, TerraformPlanResult  # noqa: E402
 
 
@@ -340,6 +346,65 @@ def test_byoc_lite_discovery_omits_namespace_suggestion_without_target_tenant(mo
     assert payload["namespace_suggestion"] is None
 
 
+def test_slow_aws_discovery_runs_on_bounded_executor_without_blocking_cheap_endpoints(
+    monkeypatch,
+) -> None:
+    import threading
+
+    from sparkpilot.executors import shutdown_executors
+
+    monkeypatch.setenv("SPARKPILOT_API_SLOW_DEPENDENCY_MAX_WORKERS", "1")
+    get_settings.cache_clear()
+    shutdown_executors()
+
+    release = threading.Event()
+    entered = threading.Event()
+    state = {"active": 0, "max_active": 0}
+    state_lock = threading.Lock()
+
+    def _slow_discovery(*, customer_role_arn: str, region: str) -> dict[str, object]:
+        with state_lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        entered.set()
+        assert release.wait(timeout=10)
+        with state_lock:
+            state["active"] -= 1
+        return {"account_id": "123456789012", "clusters": []}
+
+    monkeypatch.setattr("sparkpilot.aws_clients.discover_eks_clusters_for_role", _slow_discovery)
+
+    discovery_url = (
+        "/v1/aws/byoc-lite/discovery?"
+        "customer_role_arn=arn:aws:iam::123456789012:role/SparkPilotByocLiteRole&region=us-east-1"
+    )
+    with TestClient(app) as client:
+        assert client.get("/v1/environments", headers=_admin_auth_headers()).status_code == 200
+        statuses: list[int] = []
+        workers = [
+            threading.Thread(
+                target=lambda: statuses.append(
+                    client.get(discovery_url, headers=_admin_auth_headers()).status_code
+                )
+            )
+            for _ in range(3)
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            assert entered.wait(timeout=10)
+            # AWS-bound requests are parked on their own executor; cheap endpoints still answer.
+            assert client.get("/v1/environments", headers=_admin_auth_headers()).status_code == 200
+        finally:
+            release.set()
+            for worker in workers:
+                worker.join(timeout=10)
+
+    assert statuses == [200, 200, 200]
+    assert state["max_active"] == 1
+    shutdown_executors()
+
+
 def test_byoc_lite_discovery_translates_validation_value_error(monkeypatch) -> None:
     client = TestClient(app)
 
@@ -859,6 +924,42 @@ def test_emr_release_sync_and_list_endpoint(monkeypatch) -> None:
     assert len(paged.json()) == 2
 
 
+def test_emr_release_sync_merges_regions_and_upserts_in_place(monkeypatch) -> None:
+    from sparkpilot.services import lookup_emr_release
+
+    listed: dict[str, list[str]] = {
+        "us-east-1": ["emr-7.10.0-latest", "emr-7.9.0-latest"],
+        "eu-west-1": ["emr-7.9.0-latest", "emr-7.8.0-latest", "emr-6.15.0-latest"],
+    }
+    monkeypatch.setattr(
+        "sparkpilot.services.EmrEksClient.list_release_labels",
+        lambda _self, region: list(listed[region]),
+    )
+    monkeypatch.setenv("SPARKPILOT_EMR_RELEASE_SYNC_REGIONS", "us-east-1, eu-west-1")
+    get_settings.cache_clear()
+
+    with SessionLocal() as db:
+        assert sync_emr_releases_once(db) == 4
+        assert sync_emr_releases_once(db) == 0
+        ids = {row.release_label: row.id for row in db.execute(select(EmrRelease)).scalars()}
+    assert set(ids) == {"emr-7.10.0-latest", "emr-7.9.0-latest", "emr-7.8.0-latest", "emr-6.15.0-latest"}
+    assert lookup_emr_release("emr-7.8.0-latest").lifecycle_status == "current"
+
+    listed["us-east-1"].append("emr-7.11.0-latest")
+    with SessionLocal() as db:
+        assert sync_emr_releases_once(db) == 3
+        rows = {row.release_label: row for row in db.execute(select(EmrRelease)).scalars()}
+        audits = db.execute(select(AuditEvent).where(AuditEvent.action == "emr_release.sync")).scalars().all()
+    assert {label: rows[label].id for label in ids} == ids
+    assert rows["emr-7.8.0-latest"].upgrade_target == "emr-7.11.0-latest"
+    assert [audit.details_json["regions"] for audit in audits] == [["us-east-1", "eu-west-1"]] * 3
+    # The sync's commit invalidates the index, so preflight sees the new lifecycle at once.
+    release = lookup_emr_release("emr-7.8.0-latest")
+    assert release.lifecycle_status == "deprecated"
+    assert release.upgrade_target == "emr-7.11.0-latest"
+    assert lookup_emr_release("emr-7.11.0") is None
+
+
 def test_preflight_warns_for_deprecated_release_label() -> None:
     with SessionLocal() as db:
         db.add(
@@ -1056,7 +1157,14 @@ def test_full_byoc_provisioning_records_checkpoint_audit(monkeypatch) -> None:
         assert len(checkpoints) >= 5
         latest = checkpoints[-1].details_json
         assert latest.get("operation_id") == op["id"]
-        checkpoint = latest.get("checkpoint")
+        assert "checkpoint" not in latest
+        stored = db.get(ProvisioningCheckpoint, op["id"])
+        assert stored is not None
+        assert stored.version == len(checkpoints)
+        assert sorted(event.details_json["checkpoint_version"] for event in checkpoints) == list(
+            range(1, len(checkpoints) + 1)
+        )
+        checkpoint = stored.checkpoint_json
         assert isinstance(checkpoint, dict)
         attempts = checkpoint.get("attempt_count_by_stage")
         assert isinstance(attempts, dict)
@@ -1148,8 +1256,7 @@ def test_full_byoc_plan_failure_preserves_prior_checkpoint(monkeypatch) -> None:
             ).scalars()
         )
         assert len(checkpoints) >= 1
-        latest = checkpoints[0].details_json
-        checkpoint = latest.get("checkpoint")
+        checkpoint = db.get(ProvisioningCheckpoint, op["id"]).checkpoint_json
         assert isinstance(checkpoint, dict)
         assert checkpoint.get("last_successful_stage") == "provisioning_network"
         attempts = checkpoint.get("attempt_count_by_stage", {})
@@ -1228,8 +1335,7 @@ def test_full_byoc_apply_failure_persists_attempt_count(monkeypatch) -> None:
             ).scalars()
         )
         assert len(checkpoints) >= 1
-        latest = checkpoints[0].details_json
-        checkpoint = latest.get("checkpoint")
+        checkpoint = db.get(ProvisioningCheckpoint, op["id"]).checkpoint_json
         assert isinstance(checkpoint, dict)
         assert checkpoint.get("last_successful_stage") == "provisioning_network"
         attempts = checkpoint.get("attempt_count_by_stage", {})
@@ -1396,8 +1502,7 @@ def test_full_byoc_per_stage_commit_survives_crash(monkeypatch) -> None:
             ).scalars()
         )
         assert len(checkpoints) >= 1
-        latest = checkpoints[-1]
-        checkpoint = latest.details_json.get("checkpoint")
+        checkpoint = db.get(ProvisioningCheckpoint, op["id"]).checkpoint_json
         assert isinstance(checkpoint, dict)
         assert checkpoint.get("last_successful_stage") == "provisioning_network"
 
@@ -1482,7 +1587,7 @@ def test_full_byoc_bootstrap_validation_failure_is_actionable(monkeypatch) -> No
             ).scalars()
         )
         assert len(checkpoints) >= 1
-        checkpoint = checkpoints[0].details_json.get("checkpoint")
+        checkpoint = db.get(ProvisioningCheckpoint, op["id"]).checkpoint_json
         assert isinstance(checkpoint, dict)
         assert checkpoint.get("last_successful_stage") == "provisioning_emr"
         attempts = checkpoint.get("attempt_count_by_stage", {})
@@ -1581,7 +1686,7 @@ def test_full_byoc_runtime_validation_failure_resumes_without_replaying_terrafor
             ).scalars()
         )
         assert len(checkpoints) >= 1
-        checkpoint = checkpoints[0].details_json.get("checkpoint")
+        checkpoint = db.get(ProvisioningCheckpoint, op["id"]).checkpoint_json
         assert isinstance(checkpoint, dict)
         assert checkpoint.get("last_successful_stage") == "validating_bootstrap"
 
@@ -1686,6 +1791,78 @@ def test_byoc_lite_environment_flow() -> None:
     assert env["emr_virtual_cluster_id"] is not None
 
 
+def _queue_byoc_lite_environments(client: TestClient, suffix: str, count: int) -> list[str]:
+    tenant = client.post(
+        "/v1/tenants",
+        json={"name": f"Parallel Provisioning Tenant {suffix}"},
+        headers={"Idempotency-Key": f"tenant-{suffix}", "X-Actor": "test-user"},
+    ).json()
+    operation_ids = []
+    for index in range(count):
+        op = client.post(
+            "/v1/environments",
+            json={
+                "tenant_id": tenant["id"],
+                "provisioning_mode": "byoc_lite",
+                "region": "us-east-1",
+                "customer_role_arn": "arn:aws:iam::123456789012:role/SparkPilotCustomerRole",
+                "eks_cluster_arn": "arn:aws:eks:us-east-1:123456789012:cluster/customer-shared",
+                "eks_namespace": f"sparkpilot-{suffix}-{index}",
+                "quotas": {"max_concurrent_runs": 5, "max_vcpu": 128, "max_run_seconds": 7200},
+            },
+            headers={"Idempotency-Key": f"env-{suffix}-{index}", "X-Actor": "test-user"},
+        )
+        assert op.status_code == 201
+        operation_ids.append(op.json()["id"])
+    return operation_ids
+
+
+def test_provisioning_runs_claimed_operations_concurrently(monkeypatch) -> None:
+    client = TestClient(app)
+    operation_ids = _queue_byoc_lite_environments(client, "parallel", 2)
+    # Both operations must be in flight at once for the barrier to open.
+    barrier = threading.Barrier(2, timeout=10)
+    threads: set[str] = set()
+
+    def _slow_provisioning(_db, **_kwargs) -> None:
+        threads.add(threading.current_thread().name)
+        barrier.wait()
+
+    monkeypatch.setattr(
+        "sparkpilot.services.workers_provisioning._run_byoc_lite_provisioning", _slow_provisioning
+    )
+    with SessionLocal() as db:
+        assert process_provisioning_once(db) == 2
+    assert len(threads) == 2
+    with SessionLocal() as db:
+        for op_id in operation_ids:
+            assert db.get(ProvisioningOperation, op_id).worker_claim_token is None
+
+
+def test_provisioning_claims_are_bounded_and_renewed(monkeypatch) -> None:
+    client = TestClient(app)
+    first_id, second_id = _queue_byoc_lite_environments(client, "bounded", 2)
+    monkeypatch.setattr(
+        "sparkpilot.services.workers_provisioning._run_byoc_lite_provisioning", lambda _db, **_kwargs: None
+    )
+    with SessionLocal() as db:
+        assert process_provisioning_once(db, limit=1) == 1
+    with SessionLocal() as db:
+        assert db.get(ProvisioningOperation, second_id).state == "queued"
+        stale = datetime.now(UTC) - timedelta(minutes=4)
+        row = db.get(ProvisioningOperation, second_id)
+        row.worker_claim_token = "worker:provisioner:held"
+        row.worker_claimed_at = stale
+        db.commit()
+        renewed = _renew_provisioning_claims(
+            db, {second_id: "worker:provisioner:held", first_id: "worker:provisioner:other"}
+        )
+        db.commit()
+        assert renewed == 1
+        refreshed = db.get(ProvisioningOperation, second_id).worker_claimed_at
+        assert refreshed.replace(tzinfo=refreshed.tzinfo or UTC) > stale
+
+
 def test_byoc_lite_provisioning_records_trust_policy_update_audit(monkeypatch) -> None:
     monkeypatch.setattr(
         "sparkpilot.services.EmrEksClient.check_oidc_provider_association",
@@ -2488,6 +2665,92 @@ def test_reconciler_marks_submitted_run_stale(monkeypatch) -> None:
     get_settings.cache_clear()
 
 
+def test_reconciler_reads_databricks_runs_with_one_list_call_per_workspace(monkeypatch) -> None:
+    import httpx
+
+    client = TestClient(app)
+    tenant = client.post(
+        "/v1/tenants",
+        json={"name": "Databricks Reconcile Tenant"},
+        headers={"Idempotency-Key": "tenant-dbx-reconcile", "X-Actor": "test-user"},
+    ).json()
+    op = client.post(
+        "/v1/environments",
+        json={
+            "tenant_id": tenant["id"],
+            "region": "us-east-1",
+            "customer_role_arn": "arn:aws:iam::123456789012:role/SparkPilotCustomerRole",
+            "quotas": {"max_concurrent_runs": 5, "max_vcpu": 128, "max_run_seconds": 7200},
+        },
+        headers={"Idempotency-Key": "env-dbx-reconcile", "X-Actor": "test-user"},
+    ).json()
+    with SessionLocal() as db:
+        process_provisioning_once(db)
+    job = client.post(
+        "/v1/jobs",
+        json={
+            "environment_id": op["environment_id"],
+            "name": "job-dbx-reconcile",
+            "artifact_uri": "s3://bucket/jobs",
+            "artifact_digest": "sha256:abc123",
+            "entrypoint": "main.py",
+        },
+        headers={"Idempotency-Key": "job-dbx-reconcile", "X-Actor": "test-user"},
+    ).json()
+    run_ids = [
+        client.post(
+            f"/v1/jobs/{job['id']}/runs",
+            json={"requested_resources": {"driver_vcpu": 1, "driver_memory_gb": 4, "executor_vcpu": 1, "executor_memory_gb": 4, "executor_instances": 1}},
+            headers={"Idempotency-Key": f"run-dbx-reconcile-{index}", "X-Actor": "test-user"},
+        ).json()["id"]
+        for index in range(2)
+    ]
+    with SessionLocal() as db:
+        env = db.get(Environment, op["environment_id"])
+        env.engine = "databricks"
+        env.databricks_workspace_url = "https://dbc-test.cloud.databricks.com"
+        for index, run_id in enumerate(run_ids):
+            row = db.get(Run, run_id)
+            row.state = "accepted"
+            row.backend_job_run_id = str(100 + index)
+            row.started_at = datetime.now(UTC)
+        db.commit()
+
+    requested: list[str] = []
+
+    def _fake_send(_self, request, **_kwargs):
+        requested.append(request.url.path)
+        return httpx.Response(
+            200,
+            json={
+                "runs": [
+                    {
+                        "run_id": 100,
+                        "state": {"life_cycle_state": "RUNNING"},
+                        "run_page_url": "https://dbc-test.cloud.databricks.com/?o=1#job/9/run/100",
+                    },
+                    {"run_id": 101, "state": {"life_cycle_state": "PENDING"}},
+                ],
+                "has_more": False,
+            },
+            request=request,
+        )
+
+    monkeypatch.setattr("httpx.Client.send", _fake_send)
+    monkeypatch.setattr(
+        "sparkpilot.services.workers_reconciliation._emit_reconciler_preflight_diagnostic_if_missing",
+        lambda **_kwargs: None,
+    )
+    monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
+    get_settings.cache_clear()
+    with SessionLocal() as db:
+        assert process_reconciler_once(db) == 2
+        running, pending = (db.get(Run, run_id) for run_id in run_ids)
+        assert (running.state, pending.state) == ("running", "accepted")
+        assert running.spark_ui_uri == "https://dbc-test.cloud.databricks.com/?o=1#job/9/run/100"
+    assert requested == ["/api/2.1/jobs/runs/list"]
+
+
 def test_reconciler_marks_accepted_run_stale(monkeypatch) -> None:
     monkeypatch.setenv("SPARKPILOT_ACCEPTED_STALE_MINUTES", "1")
     get_settings.cache_clear()
@@ -3142,6 +3405,310 @@ def test_run_response_includes_spark_history_url() -> None:
         )
 
 
+# ---------------------------------------------------------------------------
+# Batch run status for orchestrators
+# ---------------------------------------------------------------------------
+
+def test_runs_batch_get_returns_states_and_honours_changed_since() -> None:
+    client = TestClient(app)
+    _, _, _, first = _create_ready_environment_and_run(client, suffix="batch1")
+    _, _, _, second = _create_ready_environment_and_run(client, suffix="batch2")
+    with SessionLocal() as db:
+        for run_id in (first["id"], second["id"]):
+            db.get(Run, run_id).updated_at = datetime.now(UTC) - timedelta(minutes=1)
+        db.commit()
+
+    response = client.post(
+        "/v1/runs:batchGet",
+        json={"run_ids": [first["id"], second["id"], "missing-run"]},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert {item["id"]: item["state"] for item in payload["runs"]} == {
+        first["id"]: "queued",
+        second["id"]: "queued",
+    }
+    assert payload["missing_run_ids"] == ["missing-run"]
+
+    with SessionLocal() as db:
+        row = db.get(Run, first["id"])
+        row.state = "running"
+        row.updated_at = datetime.now(UTC) + timedelta(seconds=5)
+        db.commit()
+
+    delta = client.post(
+        "/v1/runs:batchGet",
+        json={"run_ids": [first["id"], second["id"]], "changed_since": payload["changed_since"]},
+    )
+    assert delta.status_code == 200
+    assert [(item["id"], item["state"]) for item in delta.json()["runs"]] == [(first["id"], "running")]
+    assert delta.json()["missing_run_ids"] == []
+
+    invalid = client.post(
+        "/v1/runs:batchGet",
+        json={"run_ids": [first["id"]], "changed_since": "not-a-token"},
+    )
+    assert invalid.status_code == 422
+
+
+def test_runs_list_honours_etag_and_updated_since() -> None:
+    client = TestClient(app)
+    tenant, _, _, run = _create_ready_environment_and_run(client, suffix="listdelta")
+    with SessionLocal() as db:
+        db.get(Run, run["id"]).updated_at = datetime.now(UTC) - timedelta(minutes=1)
+        db.commit()
+
+    listing = client.get("/v1/runs", params={"tenant_id": tenant["id"]})
+    assert listing.status_code == 200
+    assert [item["id"] for item in listing.json()] == [run["id"]]
+    etag = listing.headers["ETag"]
+    next_token = listing.headers["X-Next-Updated-Since"]
+    assert etag.startswith('"')
+
+    unchanged = client.get(
+        "/v1/runs",
+        params={"tenant_id": tenant["id"], "updated_since": next_token},
+        headers={"If-None-Match": etag},
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["ETag"] == etag
+
+    no_changes = client.get("/v1/runs", params={"tenant_id": tenant["id"], "updated_since": next_token})
+    assert no_changes.status_code == 200
+    assert no_changes.json() == []
+
+    with SessionLocal() as db:
+        row = db.get(Run, run["id"])
+        row.state = "running"
+        row.updated_at = datetime.now(UTC) + timedelta(seconds=5)
+        db.commit()
+
+    delta = client.get(
+        "/v1/runs",
+        params={"tenant_id": tenant["id"], "updated_since": next_token},
+        headers={"If-None-Match": etag},
+    )
+    assert delta.status_code == 200
+    assert [(item["id"], item["state"]) for item in delta.json()] == [(run["id"], "running")]
+    assert delta.headers["ETag"] != etag
+
+    invalid = client.get("/v1/runs", params={"updated_since": "not-a-timestamp"})
+    assert invalid.status_code == 422
+
+
+def test_list_endpoints_project_requested_fields() -> None:
+    client = TestClient(app)
+    tenant, op, job, run = _create_ready_environment_and_run(client, suffix="fields")
+
+    runs = client.get("/v1/runs", params={"tenant_id": tenant["id"], "fields": "state,requested_resources"})
+    assert runs.status_code == 200
+    assert runs.json() == [
+        {"id": run["id"], "state": "queued", "requested_resources": run["requested_resources"]}
+    ]
+    full = client.get("/v1/runs", params={"tenant_id": tenant["id"]})
+    assert runs.headers["ETag"] != full.headers["ETag"]
+
+    environments = client.get(
+        "/v1/environments", params={"tenant_id": tenant["id"], "fields": "status,created_at"}
+    )
+    assert environments.status_code == 200
+    [environment] = environments.json()
+    assert set(environment) == {"id", "status", "created_at"}
+    assert environment["id"] == op["environment_id"]
+
+    jobs = client.get("/v1/jobs", params={"environment_id": op["environment_id"], "fields": "name,args"})
+    assert jobs.status_code == 200
+    assert jobs.json() == [{"id": job["id"], "name": job["name"], "args": job["args"]}]
+
+    unknown = client.get("/v1/runs", params={"fields": "state,args_overrides_json"})
+    assert unknown.status_code == 422
+
+
+def test_runs_batch_create_admits_items_with_per_item_idempotency() -> None:
+    client = TestClient(app)
+    _, _, job, single = _create_ready_environment_and_run(client, suffix="bulk1")
+    resources = {
+        "driver_vcpu": 1,
+        "driver_memory_gb": 4,
+        "executor_vcpu": 1,
+        "executor_memory_gb": 4,
+        "executor_instances": 1,
+    }
+
+    def _item(key: str, job_id: str = job["id"], **overrides: object) -> dict[str, object]:
+        return {"job_id": job_id, "idempotency_key": key, "requested_resources": resources, **overrides}
+
+    batch = {
+        "runs": [
+            _item("bulk-a"),
+            _item("bulk-b", args=["--partition", "2"]),
+            _item("bulk-a"),
+            _item("run-bulk1"),
+            _item("bulk-c"),
+            _item("bulk-d"),
+            _item("bulk-e"),
+            _item("bulk-b", args=["--partition", "9"]),
+            _item("bulk-x", job_id="missing-job"),
+        ]
+    }
+    response = client.post("/v1/runs:batchCreate", json=batch, headers={"X-Actor": "test-user"})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["status_code"] for item in results] == [201, 201, 201, 201, 201, 201, 429, 409, 404]
+    assert results[2]["replayed"] is True
+    assert results[2]["run"]["id"] == results[0]["run"]["id"]
+    # The single-run endpoint and the batch share idempotency keys.
+    assert results[3]["replayed"] is True
+    assert results[3]["run"]["id"] == single["id"]
+    assert results[1]["run"]["args"] == ["--partition", "2"]
+    assert "Concurrent run limit" in results[6]["detail"]
+
+    with SessionLocal() as db:
+        created_ids = {results[index]["run"]["id"] for index in (0, 1, 4, 5)}
+        assert len(created_ids) == 4
+        audited = db.execute(
+            select(AuditEvent.entity_id).where(
+                AuditEvent.action == "run.create", AuditEvent.entity_id.in_(created_ids)
+            )
+        ).scalars().all()
+        assert set(audited) == created_ids
+
+    replay = client.post(
+        f"/v1/jobs/{job['id']}/runs",
+        json={"requested_resources": resources},
+        headers={"Idempotency-Key": "bulk-a", "X-Actor": "test-user"},
+    )
+    assert replay.status_code == 201
+    assert replay.headers["X-Idempotent-Replay"] == "true"
+    assert replay.json()["id"] == results[0]["run"]["id"]
+
+    retried = client.post("/v1/runs:batchCreate", json=batch, headers={"X-Actor": "test-user"})
+    retried_results = retried.json()["results"]
+    assert [item["replayed"] for item in retried_results[:6]] == [True] * 6
+    assert [item["run"]["id"] for item in retried_results[:6]] == [item["run"]["id"] for item in results[:6]]
+    assert retried_results[6]["status_code"] == 429
+
+
+def test_run_wait_returns_when_run_leaves_waiting_states() -> None:
+    client = TestClient(app)
+    _, _, _, run = _create_ready_environment_and_run(client, suffix="wait1")
+
+    immediate = client.get(f"/v1/runs/{run['id']}/wait", params={"timeout": 0})
+    assert immediate.status_code == 200
+    assert immediate.json()["state"] == "queued"
+
+    def _finish_run() -> None:
+        time.sleep(0.3)
+        with SessionLocal() as db:
+            db.get(Run, run["id"]).state = "succeeded"
+            db.commit()
+
+    writer = threading.Thread(target=_finish_run)
+    started = time.monotonic()
+    writer.start()
+    waited = client.get(f"/v1/runs/{run['id']}/wait", params={"timeout": 20})
+    writer.join()
+    assert waited.status_code == 200
+    assert waited.json()["state"] == "succeeded"
+    assert time.monotonic() - started < 5
+
+    # Already outside the requested states: returns without waiting.
+    running_only = client.get(
+        f"/v1/runs/{run['id']}/wait", params={"timeout": 20, "state_in": "running"}
+    )
+    assert running_only.json()["state"] == "succeeded"
+
+    invalid = client.get(f"/v1/runs/{run['id']}/wait", params={"state_in": "bogus"})
+    assert invalid.status_code == 422
+
+
+def test_run_event_stream_replays_state_changes_after_last_event_id() -> None:
+    client = TestClient(app)
+    tenant, _, _, run = _create_ready_environment_and_run(client, suffix="events1")
+    with SessionLocal() as db:
+        last_event_id = latest_run_state_event_id(db)
+        db.get(Run, run["id"]).state = "running"
+        db.commit()
+
+    access = AccessContext(
+        actor="admin", role="admin", tenant_id=None, team_id=None, scoped_environment_ids=set()
+    )
+
+    async def _first_frames() -> list[str]:
+        stream = _run_event_stream(
+            RunEventHub(), access, tenant_id=tenant["id"], after_id=last_event_id
+        )
+        try:
+            return [await anext(stream), await anext(stream)]
+        finally:
+            await stream.aclose()
+
+    retry_frame, event_frame = asyncio.run(_first_frames())
+    assert retry_frame.startswith("retry:")
+    lines = event_frame.strip().splitlines()
+    assert lines[0] == f"id: {last_event_id + 1}"
+    assert lines[1] == "event: run.state"
+    data = json.loads(lines[2].removeprefix("data: "))
+    assert data["run_id"] == run["id"]
+    assert data["state"] == "running"
+    assert data["tenant_id"] == tenant["id"]
+
+
+def test_run_event_hub_keeps_tailing_through_event_bursts(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_RUN_EVENTS_POLL_SECONDS", "0.05")
+    get_settings.cache_clear()
+    client = TestClient(app)
+    tenant, op, _, run = _create_ready_environment_and_run(client, suffix="burst1")
+
+    def _burst_then_change() -> None:
+        # More events inside the late-commit window than one tail read returns.
+        with SessionLocal() as db:
+            db.add_all(
+                RunStateEvent(
+                    run_id=f"burst-{index}",
+                    environment_id=op["environment_id"],
+                    tenant_id=tenant["id"],
+                    state="running",
+                )
+                for index in range(1200)
+            )
+            db.commit()
+            db.get(Run, run["id"]).state = "running"
+            db.commit()
+
+    async def _next_change() -> RunStateChange:
+        async with RunEventHub().watch_run(run["id"]) as future:
+            await asyncio.to_thread(_burst_then_change)
+            return await asyncio.wait_for(future, 10)
+
+    change = asyncio.run(_next_change())
+    assert change.run_id == run["id"]
+    assert change.state == "running"
+
+    # Ids skipped by the tail are re-read until they commit or expire.
+    hub = RunEventHub()
+    hub._cursor = 10
+
+    def _change(event_id: int) -> RunStateChange:
+        return RunStateChange(
+            id=event_id,
+            run_id=run["id"],
+            environment_id=op["environment_id"],
+            tenant_id=tenant["id"],
+            created_by_actor=None,
+            state="running",
+            created_at=datetime.now(UTC),
+        )
+
+    hub._dispatch([_change(13)])
+    assert list(hub._pending) == [11, 12]
+    hub._dispatch([_change(11)])
+    assert list(hub._pending) == [12]
+    assert hub._cursor == 13
+    get_settings.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Issue #42 – YuniKorn queue scheduling
 # ---------------------------------------------------------------------------
@@ -3206,6 +3773,91 @@ def test_queue_utilization_endpoint() -> None:
     assert "max_vcpu" in body
 
 
+def test_scheduler_holds_queued_runs_until_queue_capacity_frees(monkeypatch) -> None:
+    from sparkpilot.services.dispatch_capacity import blocked_environment_ids, load_dispatch_capacity
+
+    monkeypatch.setenv("SPARKPILOT_DISPATCH_CAPACITY_MODE", "enforce")
+    get_settings.cache_clear()
+    client = TestClient(app)
+    _, op, job, first = _create_ready_environment_and_run(client, suffix="cap1")
+    with SessionLocal() as db:
+        env = db.get(Environment, op["environment_id"])
+        env.yunikorn_queue = "root.analytics"
+        env.yunikorn_queue_max_vcpu = 4
+        db.commit()
+    run_ids = [first["id"]]
+    for index in (2, 3):
+        run_ids.append(
+            client.post(
+                f"/v1/jobs/{job['id']}/runs",
+                json={
+                    "requested_resources": {
+                        "driver_vcpu": 1,
+                        "driver_memory_gb": 4,
+                        "executor_vcpu": 1,
+                        "executor_memory_gb": 4,
+                        "executor_instances": 1,
+                    }
+                },
+                headers={"Idempotency-Key": f"run-cap1-{index}", "X-Actor": "test-user"},
+            ).json()["id"]
+        )
+
+    with SessionLocal() as db:
+        # Two 2-vCPU runs fill the 4-vCPU queue; the youngest waits.
+        assert process_scheduler_once(db) == 2
+        states = {run_id: db.get(Run, run_id).state for run_id in run_ids}
+        assert states == {run_ids[0]: "accepted", run_ids[1]: "accepted", run_ids[2]: "queued"}
+        held = db.get(Run, run_ids[2])
+        assert held.worker_claim_token is None
+
+        assert process_scheduler_once(db) == 0
+
+        # A pending cancel is not the environment's oldest run and is still
+        # claimed, and cancelled, while the environment is held.
+        held.cancellation_requested = True
+        db.commit()
+        capacities = load_dispatch_capacity(db, settings=get_settings())
+        assert blocked_environment_ids(db, capacities) == set()
+        fourth = client.post(
+            f"/v1/jobs/{job['id']}/runs",
+            json={
+                "requested_resources": {
+                    "driver_vcpu": 1,
+                    "driver_memory_gb": 4,
+                    "executor_vcpu": 1,
+                    "executor_memory_gb": 4,
+                    "executor_instances": 1,
+                }
+            },
+            headers={"Idempotency-Key": "run-cap1-4", "X-Actor": "test-user"},
+        ).json()["id"]
+        assert blocked_environment_ids(db, capacities) == {op["environment_id"]}
+        assert process_scheduler_once(db) == 1
+        db.refresh(held)
+        assert held.state == "cancelled"
+
+        db.get(Run, run_ids[0]).state = "succeeded"
+        db.commit()
+        assert process_scheduler_once(db) == 1
+        assert db.get(Run, fourth, populate_existing=True).state == "accepted"
+    get_settings.cache_clear()
+
+
+def test_dispatch_capacity_only_guesses_vcpu_for_uniform_instance_sizes() -> None:
+    from sparkpilot.services.dispatch_capacity import _nodegroup_vcpu
+
+    nodegroups = [
+        {"instance_types": ["m7i.2xlarge", "m7g.xlarge"], "max_size": 3},
+        {"instance_types": ["t3.micro"], "max_size": 4},
+    ]
+    # Small sizes differ between families, so without EC2 data the cluster is not gated.
+    assert _nodegroup_vcpu(nodegroups, {}) is None
+    assert _nodegroup_vcpu(nodegroups[:1], {}) == 12
+    assert _nodegroup_vcpu(nodegroups, {"t3.micro": 2}) == 20
+    assert _nodegroup_vcpu(nodegroups, {"t3.micro": 2, "m7g.xlarge": 4, "m7i.2xlarge": 8}) == 20
+
+
 # ---------------------------------------------------------------------------
 # Issue #41 – Interactive Endpoints (Managed Endpoints)
 # ---------------------------------------------------------------------------
@@ -3272,6 +3924,146 @@ def test_list_interactive_endpoints_returns_created() -> None:
     assert items[0]["name"] == "endpoint-beta"
 
 
+def test_interactive_pool_scales_from_demand_leases_and_tears_down_idle(monkeypatch) -> None:
+    from sparkpilot.models import InteractiveEndpoint
+    from sparkpilot.services import process_interactive_pool_once, renew_endpoint_lease
+
+    monkeypatch.setenv("SPARKPILOT_INTERACTIVE_POOL_MAX_SIZE", "2")
+    monkeypatch.setenv("SPARKPILOT_INTERACTIVE_POOL_HOURS_UTC", "8-18")
+    monkeypatch.setenv("SPARKPILOT_INTERACTIVE_POOL_IDLE_MINUTES", "30")
+    get_settings.cache_clear()
+    wednesday_noon = datetime(2026, 10, 21, 12, 0, tzinfo=UTC)
+    clock = {"now": wednesday_noon}
+    monkeypatch.setattr("sparkpilot.services.interactive_pool._now", lambda: clock["now"])
+
+    client = TestClient(app)
+    _, op, _, run = _create_ready_environment_and_run(client, suffix="pool1")
+    environment_id = op["environment_id"]
+    acquire_url = f"/v1/environments/{environment_id}/endpoints:acquire"
+
+    with SessionLocal() as db:
+        # No recent short runs and no minimum size: nothing to keep warm.
+        assert process_interactive_pool_once(db) == 0
+    assert client.post(acquire_url, headers={"X-Actor": "test-user"}).status_code == 409
+
+    with SessionLocal() as db:
+        row = db.get(Run, run["id"])
+        row.timeout_seconds = 600
+        row.created_at = wednesday_noon - timedelta(minutes=5)
+        db.commit()
+        assert process_interactive_pool_once(db) == 1
+
+    leased = client.post(acquire_url, headers={"X-Actor": "test-user"})
+    assert leased.status_code == 200
+    body = leased.json()
+    assert body["pooled"] is True
+    assert body["status"] == "active"
+    assert body["leased_by_actor"] == "test-user"
+    assert client.post(acquire_url, headers={"X-Actor": "test-user"}).json()["id"] == body["id"]
+    renew_url = f"/v1/environments/{environment_id}/endpoints/{body['id']}:renew"
+    renewed = client.post(renew_url, headers={"X-Actor": "test-user"})
+    assert renewed.status_code == 200
+    assert renewed.json()["last_activity_at"] is not None
+    missing_url = f"/v1/environments/{environment_id}/endpoints/missing:renew"
+    assert client.post(missing_url, headers={"X-Actor": "test-user"}).status_code == 404
+    with SessionLocal() as db:
+        env = db.get(Environment, environment_id)
+        assert renew_endpoint_lease(db, environment=env, endpoint_id=body["id"], actor="other-user") is None
+
+    with SessionLocal() as db:
+        # The lease no longer counts as warm, so a replacement is started.
+        assert process_interactive_pool_once(db) == 1
+        clock["now"] = wednesday_noon + timedelta(minutes=45)
+        assert process_interactive_pool_once(db) == 1
+        remaining = db.execute(select(InteractiveEndpoint)).scalars().all()
+        assert [(item.pooled, item.leased_at) for item in remaining] == [(True, None)]
+
+        # Outside pool hours the warm endpoint is shed as surplus.
+        clock["now"] = wednesday_noon + timedelta(hours=8)
+        assert process_interactive_pool_once(db) == 1
+        assert db.execute(select(InteractiveEndpoint)).scalars().all() == []
+        reasons = [
+            event.details_json["reason"]
+            for event in db.execute(
+                select(AuditEvent).where(AuditEvent.action == "interactive_endpoint.pool_teardown")
+            ).scalars()
+        ]
+    assert sorted(reasons) == ["idle", "surplus"]
+    get_settings.cache_clear()
+
+
+def test_interactive_pool_keeps_rows_for_endpoints_already_changed_in_aws(monkeypatch) -> None:
+    from sparkpilot.models import InteractiveEndpoint
+    from sparkpilot.services import process_interactive_pool_once
+
+    monkeypatch.setenv("SPARKPILOT_INTERACTIVE_POOL_MIN_SIZE", "2")
+    monkeypatch.setenv("SPARKPILOT_INTERACTIVE_POOL_MAX_SIZE", "2")
+    get_settings.cache_clear()
+    monkeypatch.setattr(
+        "sparkpilot.services.interactive_pool._now",
+        lambda: datetime(2026, 10, 21, 12, 0, tzinfo=UTC),
+    )
+    client = TestClient(app)
+    _, op, _, _ = _create_ready_environment_and_run(client, suffix="pool2")
+    monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
+    monkeypatch.setenv("SPARKPILOT_EMR_EXECUTION_ROLE_ARN", "arn:aws:iam::123456789012:role/SparkPilotExecRole")
+    get_settings.cache_clear()
+
+    created: list[str] = []
+    deleted: list[str] = []
+    aws_states: dict[str, str] = {}
+    failures = {"create": [False, True], "delete": [True]}
+
+    def _create(_self, _env, **_kwargs):
+        if failures["create"] and failures["create"].pop(0):
+            raise ClientError({"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "CreateManagedEndpoint")
+        endpoint_id = f"ep-{len(created) + 1}"
+        created.append(endpoint_id)
+        aws_states[endpoint_id] = "CREATING"
+        return endpoint_id
+
+    def _delete(_self, _env, endpoint_id):
+        if failures["delete"] and failures["delete"].pop(0):
+            raise ClientError({"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "DeleteManagedEndpoint")
+        deleted.append(endpoint_id)
+
+    monkeypatch.setattr("sparkpilot.services.interactive_pool.EmrEksClient.create_managed_endpoint", _create)
+    monkeypatch.setattr("sparkpilot.services.interactive_pool.EmrEksClient.delete_managed_endpoint", _delete)
+    monkeypatch.setattr(
+        "sparkpilot.services.interactive_pool.EmrEksClient.describe_managed_endpoint",
+        lambda _self, _env, endpoint_id: {"state": aws_states[endpoint_id], "serverUrl": f"https://{endpoint_id}"},
+    )
+
+    def _pool_rows(db) -> list[tuple[str | None, str]]:
+        return sorted(
+            (row.emr_endpoint_id, row.status)
+            for row in db.execute(
+                select(InteractiveEndpoint).where(InteractiveEndpoint.environment_id == op["environment_id"])
+            ).scalars()
+        )
+
+    with SessionLocal() as db:
+        # The second create fails; the first endpoint's row survives the rollback.
+        process_interactive_pool_once(db)
+        assert _pool_rows(db) == [("ep-1", "creating")]
+
+        process_interactive_pool_once(db)
+        assert _pool_rows(db) == [("ep-1", "creating"), ("ep-2", "creating")]
+
+        # An active endpoint that terminates in AWS is not left leasable; its
+        # delete fails once and is retried from the committed "deleting" row.
+        aws_states.update({"ep-1": "ACTIVE", "ep-2": "ACTIVE"})
+        process_interactive_pool_once(db)
+        aws_states["ep-1"] = "TERMINATED"
+        process_interactive_pool_once(db)
+        assert _pool_rows(db) == [("ep-1", "deleting"), ("ep-2", "active")]
+
+        process_interactive_pool_once(db)
+        assert deleted == ["ep-1"]
+        assert _pool_rows(db) == [("ep-2", "active"), ("ep-3", "creating")]
+    get_settings.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # RBAC permission matrix unit tests (#35)
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 from botocore.exceptions import ClientError
 import json
 import pytest
+import threading
 from types import SimpleNamespace
 
 from sparkpilot.aws_clients import (
@@ -337,6 +338,60 @@ def test_discover_eks_clusters_for_role_returns_sorted_clusters(monkeypatch) ->
     get_settings.cache_clear()
 
 
+def test_discover_eks_clusters_for_role_describes_concurrently_and_caches(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
+    monkeypatch.setenv("SPARKPILOT_AWS_DISCOVERY_MAX_WORKERS", "4")
+    get_settings.cache_clear()
+    cluster_names = [f"cluster-{index}" for index in range(4)]
+    barrier = threading.Barrier(len(cluster_names), timeout=5)
+    assumed: list[str] = []
+    described: list[str] = []
+
+    class _FakeEksPaginator:
+        def paginate(self):
+            return [{"clusters": list(reversed(cluster_names))}]
+
+    class _FakeEksClient:
+        def get_paginator(self, operation_name: str):
+            return _FakeEksPaginator()
+
+        def describe_cluster(self, name: str):
+            described.append(name)
+            # Every describe must be in flight at once for the barrier to release.
+            barrier.wait()
+            return {"cluster": {"arn": f"arn:aws:eks:us-east-1:123456789012:cluster/{name}", "status": "ACTIVE"}}
+
+    class _FakeStsClient:
+        def get_caller_identity(self):
+            return {"Account": "123456789012"}
+
+    class _FakeSession:
+        def client(self, service_name: str, region_name: str | None = None):
+            return _FakeEksClient() if service_name == "eks" else _FakeStsClient()
+
+    def _assume(role_arn, region, external_id=None):
+        assumed.append(role_arn)
+        return _FakeSession()
+
+    monkeypatch.setattr("sparkpilot.aws_clients.assume_role_session", _assume)
+
+    first = discover_eks_clusters_for_role(
+        customer_role_arn="arn:aws:iam::123456789012:role/SparkPilotByocLiteRole",
+        region="us-east-1",
+    )
+    assert [item["name"] for item in first["clusters"]] == cluster_names
+    first["clusters"].clear()
+
+    second = discover_eks_clusters_for_role(
+        customer_role_arn="arn:aws:iam::123456789012:role/SparkPilotByocLiteRole",
+        region="us-east-1",
+    )
+    assert [item["name"] for item in second["clusters"]] == cluster_names
+    assert len(assumed) == 1
+    assert sorted(described) == cluster_names
+    get_settings.cache_clear()
+
+
 def test_discover_eks_clusters_for_role_non_positive_max_clusters_returns_empty_in_dry_run(monkeypatch) -> None:
     monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "true")
     get_settings.cache_clear()
@@ -1187,6 +1242,105 @@ def test_start_job_run_adds_chargeback_tags_and_labels(monkeypatch) -> None:
     get_settings.cache_clear()
 
 
+def test_start_job_run_auto_template_mode_reuses_template_and_sends_run_overrides(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
+    monkeypatch.setenv("SPARKPILOT_EMR_JOB_TEMPLATE_MODE", "auto")
+    monkeypatch.setenv(
+        "SPARKPILOT_EMR_EXECUTION_ROLE_ARN",
+        "arn:aws:iam::123456789012:role/SparkPilotEmrExecutionRole",
+    )
+    get_settings.cache_clear()
+
+    calls: list[tuple[str, dict]] = []
+
+    class _FakePaginator:
+        def paginate(self):
+            calls.append(("list_job_templates", {}))
+            return [{"templates": [{"id": "jt-other", "name": "someone-elses-template"}]}]
+
+    class _FakeEmrClient:
+        def get_paginator(self, name):
+            assert name == "list_job_templates"
+            return _FakePaginator()
+
+        def create_job_template(self, **kwargs):
+            calls.append(("create_job_template", kwargs))
+            return {"id": "jt-auto-1"}
+
+        def start_job_run(self, **kwargs):
+            calls.append(("start_job_run", kwargs))
+            return {"id": f"jr-{len(calls)}", "ResponseMetadata": {"RequestId": "req-1"}}
+
+    class _FakeSession:
+        def client(self, service_name, region_name=None):
+            return _FakeEmrClient()
+
+    monkeypatch.setattr("sparkpilot.aws_clients.assume_role_session", lambda *_args, **_kwargs: _FakeSession())
+
+    environment = SimpleNamespace(
+        id="env-123",
+        emr_virtual_cluster_id="vc-123",
+        customer_role_arn="arn:aws:iam::123456789012:role/SparkPilotCustomerRole",
+        region="us-east-1",
+        tenant_id="tenant-123",
+        eks_namespace="sparkpilot-team-a",
+        event_log_s3_uri=None,
+    )
+    job = SimpleNamespace(
+        id="job-123",
+        name="demo-job",
+        artifact_uri="s3://bucket/jobs/demo.py",
+        args_json=["--date", "today"],
+        spark_conf_json={"spark.executor.memory": "4g"},
+        retry_max_attempts=1,
+    )
+
+    def _run(run_id: str, **overrides):
+        return SimpleNamespace(
+            id=run_id,
+            attempt=1,
+            args_overrides_json=overrides.get("args", []),
+            spark_conf_overrides_json=overrides.get("conf", {}),
+        )
+
+    client = EmrEksClient()
+    first = client.start_job_run(environment, job, _run("run-1"))
+    second = client.start_job_run(environment, job, _run("run-2", conf={"spark.executor.memory": "8g"}))
+    full = client.start_job_run(environment, job, _run("run-3", args=["--date", "yesterday"]))
+
+    assert [name for name, _ in calls] == [
+        "list_job_templates",
+        "create_job_template",
+        "start_job_run",
+        "start_job_run",
+        "start_job_run",
+    ]
+    template = calls[1][1]
+    assert template["name"].startswith("sparkpilot-auto-")
+    driver = template["jobTemplateData"]["jobDriver"]["sparkSubmitJobDriver"]
+    assert driver["entryPointArguments"] == ["--date", "today"]
+    assert driver["sparkSubmitParameters"].startswith("--conf spark.executor.memory=4g ")
+    assert driver["sparkSubmitParameters"].endswith(" ${RunSparkConf}")
+    assert "sparkpilot-run-id" not in driver["sparkSubmitParameters"]
+
+    first_request, second_request, full_request = (kwargs for name, kwargs in calls[2:])
+    assert (first.job_template_id, second.job_template_id, full.job_template_id) == ("jt-auto-1", "jt-auto-1", None)
+    assert "jobDriver" not in first_request
+    assert first_request["jobTemplateParameters"] == {
+        "RunSparkConf": (
+            "--conf spark.kubernetes.driver.label.sparkpilot-run-id=run-1 "
+            "--conf spark.kubernetes.executor.label.sparkpilot-run-id=run-1"
+        ),
+        "LogStreamPrefix": "run-1/attempt-1",
+    }
+    assert second_request["jobTemplateParameters"]["RunSparkConf"].startswith("--conf spark.executor.memory=8g ")
+    assert second_request["tags"]["sparkpilot:run_id"] == "run-2"
+    assert full_request["jobDriver"]["sparkSubmitJobDriver"]["entryPointArguments"] == ["--date", "yesterday"]
+    assert "jobTemplateId" not in full_request
+
+    get_settings.cache_clear()
+
+
 def test_serverless_start_job_run_applies_event_log_defaults(monkeypatch) -> None:
     monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
     monkeypatch.setenv("SPARKPILOT_LOG_GROUP_PREFIX", "/sparkpilot/runs")
@@ -1384,6 +1538,68 @@ def test_check_execution_role_trust_policy_missing_statement_is_actionable(monke
     get_settings.cache_clear()
 
 
+def test_cluster_and_role_lookups_are_shared_across_checks_until_trust_policy_write(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
+    monkeypatch.setenv(
+        "SPARKPILOT_EMR_EXECUTION_ROLE_ARN",
+        "arn:aws:iam::123456789012:role/SparkPilotEmrExecutionRole",
+    )
+    get_settings.cache_clear()
+    calls: list[str] = []
+    trust_policy = {"Version": "2012-10-17", "Statement": []}
+
+    class _FakeEksClient:
+        def describe_cluster(self, **kwargs):
+            calls.append("eks:DescribeCluster")
+            return {
+                "cluster": {
+                    "accessConfig": {"authenticationMode": "API"},
+                    "identity": {"oidc": {"issuer": "https://oidc.eks.us-east-1.amazonaws.com/id/ABC123"}},
+                }
+            }
+
+    class _FakeIamClient:
+        def get_open_id_connect_provider(self, **kwargs):
+            calls.append("iam:GetOpenIDConnectProvider")
+            return {}
+
+        def get_role(self, **kwargs):
+            calls.append("iam:GetRole")
+            return {"Role": {"AssumeRolePolicyDocument": json.loads(json.dumps(trust_policy))}}
+
+        def update_assume_role_policy(self, **kwargs):
+            calls.append("iam:UpdateAssumeRolePolicy")
+            trust_policy.update(json.loads(kwargs["PolicyDocument"]))
+
+    class _FakeSession:
+        def client(self, service_name, region_name=None):
+            return _FakeEksClient() if service_name == "eks" else _FakeIamClient()
+
+    monkeypatch.setattr("sparkpilot.aws_clients.assume_role_session", lambda *_args, **_kwargs: _FakeSession())
+    environment = SimpleNamespace(
+        eks_cluster_arn="arn:aws:eks:us-east-1:123456789012:cluster/customer-shared",
+        eks_namespace="sparkpilot-team",
+        customer_role_arn="arn:aws:iam::123456789012:role/SparkPilotCustomerRole",
+        region="us-east-1",
+    )
+    emr = EmrEksClient()
+
+    for _ in range(2):
+        assert emr.check_oidc_provider_association(environment)["associated"] is True
+        assert emr.check_cluster_access_mode(environment)["access_entries_supported"] is True
+        with pytest.raises(ValueError, match="missing required EMR on EKS web-identity statement"):
+            emr.check_execution_role_trust_policy(environment)
+    assert calls == ["eks:DescribeCluster", "iam:GetOpenIDConnectProvider", "iam:GetRole"]
+
+    calls.clear()
+    emr.update_execution_role_trust_policy(environment)
+    # The read-modify-write reads the live role; the write drops the cached copy.
+    assert calls == ["iam:GetRole", "iam:UpdateAssumeRolePolicy"]
+    assert emr.check_execution_role_trust_policy(environment)["valid"] is True
+    assert calls == ["iam:GetRole", "iam:UpdateAssumeRolePolicy", "iam:GetRole"]
+    get_settings.cache_clear()
+
+
 def test_check_customer_role_dispatch_permissions_detects_denies(monkeypatch) -> None:
     monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
     monkeypatch.setenv(
@@ -1603,7 +1819,7 @@ def test_describe_nodegroups_returns_capacity_metadata(monkeypatch) -> None:
                     "nodegroup": {
                         "capacityType": "SPOT",
                         "instanceTypes": ["m7g.xlarge", "m7i.xlarge", "r7g.xlarge"],
-                        "scalingConfig": {"desiredSize": 3},
+                        "scalingConfig": {"desiredSize": 3, "maxSize": 12},
                     }
                 }
             return {
@@ -1632,6 +1848,8 @@ def test_describe_nodegroups_returns_capacity_metadata(monkeypatch) -> None:
     assert results[0]["name"] == "spot-ng"
     assert results[0]["capacity_type"] == "SPOT"
     assert results[0]["desired_size"] == 3
+    assert results[0]["max_size"] == 12
+    assert results[1]["max_size"] == 2
     assert "m7g.xlarge" in results[0]["instance_types"]
     get_settings.cache_clear()
 
@@ -1674,6 +1892,41 @@ def test_describe_nodegroups_access_denied_is_actionable(monkeypatch) -> None:
     get_settings.cache_clear()
 
 
+def test_describe_instance_type_vcpus_reads_ec2_once_per_type_set(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
+    get_settings.cache_clear()
+    calls: list[list[str]] = []
+
+    class _FakeEc2Client:
+        def describe_instance_types(self, **kwargs):
+            calls.append(kwargs["InstanceTypes"])
+            return {
+                "InstanceTypes": [
+                    {"InstanceType": "t3.micro", "VCpuInfo": {"DefaultVCpus": 2}},
+                    {"InstanceType": "m7i.metal-24xl", "VCpuInfo": {"DefaultVCpus": 96}},
+                ]
+            }
+
+    class _FakeSession:
+        def client(self, service_name, region_name=None):
+            assert service_name == "ec2"
+            assert region_name == "us-east-1"
+            return _FakeEc2Client()
+
+    monkeypatch.setattr("sparkpilot.aws_clients.assume_role_session", lambda *_args, **_kwargs: _FakeSession())
+
+    environment = SimpleNamespace(
+        customer_role_arn="arn:aws:iam::123456789012:role/SparkPilotCustomerRole",
+        region="us-east-1",
+    )
+    client = EmrEksClient()
+    expected = {"t3.micro": 2, "m7i.metal-24xl": 96}
+    assert client.describe_instance_type_vcpus(environment, ["t3.micro", "m7i.metal-24xl", "t3.micro"]) == expected
+    assert client.describe_instance_type_vcpus(environment, ["m7i.metal-24xl", "t3.micro"]) == expected
+    assert calls == [["m7i.metal-24xl", "t3.micro"]]
+    get_settings.cache_clear()
+
+
 def test_list_release_labels_uses_pagination(monkeypatch) -> None:
     monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
     get_settings.cache_clear()
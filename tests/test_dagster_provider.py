@@ -35,6 +35,10 @@ from dagster_sparkpilot.ops import (  # noqa: E402
 from dagster_sparkpilot.resource import sparkpilot_resource_from_config  # noqa: E402
 
 
+def _patch_http_client(monkeypatch: pytest.MonkeyPatch, method: str, fake) -> None:  # noqa: ANN001
+    monkeypatch.setattr(httpx.Client, method, lambda _client, *args, **kwargs: fake(*args, **kwargs))
+
+
 def _client_config() -> SparkPilotClientConfig:
     return SparkPilotClientConfig.from_mapping(
         {
@@ -67,8 +71,8 @@ def test_client_submit_run_retries_transient_status(monkeypatch: pytest.MonkeyPa
             return httpx.Response(503, json={"detail": "temporary outage"}, request=request)
         return httpx.Response(201, json={"id": "run-1", "state": "queued"}, request=request)
 
-    monkeypatch.setattr("httpx.post", _fake_token)
-    monkeypatch.setattr("httpx.request", _fake_request)
+    _patch_http_client(monkeypatch, "post", _fake_token)
+    _patch_http_client(monkeypatch, "request", _fake_request)
 
     submitted = client.submit_run(
         job_id="job-1",
@@ -81,17 +85,59 @@ def test_client_submit_run_retries_transient_status(monkeypatch: pytest.MonkeyPa
     assert submitted["state"] == "queued"
 
 
+def test_client_reuses_one_pooled_http_client_until_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    used_clients: list[httpx.Client] = []
+
+    def _fake_token(http_client: httpx.Client, url: str, **_kwargs: object) -> httpx.Response:
+        used_clients.append(http_client)
+        return httpx.Response(200, json={"access_token": "token-1", "expires_in": 300}, request=httpx.Request("POST", url))
+
+    def _fake_request(http_client: httpx.Client, **kwargs: object) -> httpx.Response:
+        used_clients.append(http_client)
+        request = httpx.Request(str(kwargs["method"]), str(kwargs["url"]))
+        return httpx.Response(200, json={"id": "run-1", "state": "running"}, request=request)
+
+    monkeypatch.setattr(httpx.Client, "post", _fake_token)
+    monkeypatch.setattr(httpx.Client, "request", _fake_request)
+
+    with SparkPilotClient(_client_config()) as client:
+        for _ in range(3):
+            client.get_run("run-1")
+        assert len(used_clients) == 4
+        assert all(used is used_clients[0] for used in used_clients)
+        assert not used_clients[0].is_closed
+    assert used_clients[0].is_closed
+
+
 def test_client_wait_for_terminal_state_raises_terminal_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     client = SparkPilotClient(_client_config())
 
-    def _fake_get_run(_run_id: str) -> dict[str, object]:
+    def _fake_wait_run(run_id: str, *, timeout_seconds: float) -> dict[str, object]:
+        assert run_id == "run-fail"
+        assert 0 < timeout_seconds <= 5
         return {"id": "run-fail", "state": "failed", "error_message": "driver pod OOM"}
 
-    monkeypatch.setattr(client, "get_run", _fake_get_run)
+    monkeypatch.setattr(client, "wait_run", _fake_wait_run)
     with pytest.raises(SparkPilotRunFailedError, match="terminal failure state 'failed'"):
         client.wait_for_terminal_state(run_id="run-fail", poll_interval_seconds=1, timeout_seconds=5)
 
 
+def test_client_wait_run_long_polls_with_extended_request_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = SparkPilotClient(_client_config())
+    captured: dict[str, object] = {}
+
+    def _fake_request_json(method: str, path: str, **kwargs: object) -> dict[str, object]:
+        captured.update(kwargs, method=method, path=path)
+        return {"id": "run-1", "state": "succeeded"}
+
+    monkeypatch.setattr(client, "_request_json", _fake_request_json)
+    client.wait_run("run-1", timeout_seconds=20, state_in=["queued", "running"])
+    assert captured["method"] == "GET"
+    assert captured["path"] == "/v1/runs/run-1/wait"
+    assert captured["params"] == {"timeout": 20, "state_in": ["queued", "running"]}
+    assert captured["timeout_seconds"] == 20 + client.config.timeout_seconds
+
+
 def test_submit_and_wait_helpers_happy_path() -> None:
     class _FakeClient:
         def submit_run(  # noqa: ANN201
@@ -280,7 +326,7 @@ def test_discovery_401_raises_permanent_error(monkeypatch: pytest.MonkeyPatch) -
         req = httpx.Request("GET", url)
         return httpx.Response(401, request=req)
 
-    monkeypatch.setattr("httpx.get", _bad_get)
+    _patch_http_client(monkeypatch, "get", _bad_get)
     with pytest.raises(SparkPilotPermanentError, match="HTTP 401"):
         client._discover_token_endpoint()
 
@@ -301,7 +347,7 @@ def test_discovery_503_raises_transient_error(monkeypatch: pytest.MonkeyPatch) -
         req = httpx.Request("GET", url)
         return httpx.Response(503, request=req)
 
-    monkeypatch.setattr("httpx.get", _bad_get)
+    _patch_http_client(monkeypatch, "get", _bad_get)
     with pytest.raises(SparkPilotTransientError, match="HTTP 503"):
         client._discover_token_endpoint()
 
@@ -323,7 +369,7 @@ def test_token_401_raises_permanent_error(monkeypatch: pytest.MonkeyPatch) -> No
         req = httpx.Request("POST", url)
         return httpx.Response(401, request=req)
 
-    monkeypatch.setattr("httpx.post", _bad_post)
+    _patch_http_client(monkeypatch, "post", _bad_post)
     with pytest.raises(SparkPilotPermanentError, match="HTTP 401"):
         client._fetch_access_token()
 
@@ -345,7 +391,7 @@ def test_token_429_raises_transient_error(monkeypatch: pytest.MonkeyPatch) -> No
         req = httpx.Request("POST", url)
         return httpx.Response(429, request=req)
 
-    monkeypatch.setattr("httpx.post", _bad_post)
+    _patch_http_client(monkeypatch, "post", _bad_post)
     with pytest.raises(SparkPilotTransientError, match="HTTP 429"):
         client._fetch_access_token()
 
@@ -365,7 +411,7 @@ def test_discovery_transport_failure_raises_transient_error(monkeypatch: pytest.
     def _network_fail(url: str, **_kw: object) -> httpx.Response:
         raise httpx.ConnectError("connection refused")
 
-    monkeypatch.setattr("httpx.get", _network_fail)
+    _patch_http_client(monkeypatch, "get", _network_fail)
     with pytest.raises(SparkPilotTransientError, match="transport"):
         client._discover_token_endpoint()
 
@@ -1,14 +1,24 @@
 """Tests for Databricks dispatch client."""
+from datetime import UTC, datetime
+
 import httpx
-from sparkpilot.databricks_client import DatabricksClient, DatabricksDispatchResult
+from sparkpilot.databricks_client import (
+    DatabricksClient,
+    DatabricksDispatchResult,
+    _reset_databricks_clients,
+    databricks_client_for,
+    databricks_run_state,
+)
 
 
-def _mock_client(monkeypatch, responses: list[dict]) -> DatabricksClient:
+def _mock_client(monkeypatch, responses: list[dict], requests: list[httpx.Request] | None = None) -> DatabricksClient:
     call_idx = {"n": 0}
 
     def _fake_send(self, request, **kwargs):
         idx = call_idx["n"]
         call_idx["n"] += 1
+        if requests is not None:
+            requests.append(request)
         resp_data = responses[idx % len(responses)]
         return httpx.Response(200, json=resp_data, request=request)
 
@@ -17,11 +27,8 @@ def _mock_client(monkeypatch, responses: list[dict]) -> DatabricksClient:
 
 
 def test_submit_run_returns_dispatch_result(monkeypatch):
-    responses = [
-        {"run_id": 42},
-        {"run_page_url": "https://adb-12345.azuredatabricks.net/#job/42/run/42", "run_id": 42},
-    ]
-    client = _mock_client(monkeypatch, responses)
+    requests: list[httpx.Request] = []
+    client = _mock_client(monkeypatch, [{"run_id": 42}], requests)
     result = client.submit_run(
         job_artifact_uri="s3://my-bucket/jobs/",
         entrypoint="s3://my-bucket/jobs/main.py",
@@ -31,6 +38,8 @@ def test_submit_run_returns_dispatch_result(monkeypatch):
     )
     assert isinstance(result, DatabricksDispatchResult)
     assert result.databricks_run_id == 42
+    assert result.run_page_url == "https://adb-12345.azuredatabricks.net/#job/42/run/42"
+    assert [request.url.path for request in requests] == ["/api/2.1/jobs/runs/submit"]
 
 
 def test_get_run_returns_lifecycle_state(monkeypatch):
@@ -44,3 +53,54 @@ def test_cancel_run_posts_cancel(monkeypatch):
     responses = [{}]
     client = _mock_client(monkeypatch, responses)
     client.cancel_run(42)  # should not raise
+
+
+def test_get_runs_reads_runs_list_pages_and_falls_back_to_runs_get(monkeypatch):
+    requests: list[httpx.Request] = []
+    responses = [
+        {
+            "runs": [
+                {"run_id": 7, "state": {"life_cycle_state": "RUNNING"}},
+                {"run_id": 42, "state": {"life_cycle_state": "PENDING"}},
+            ],
+            "has_more": True,
+            "next_page_token": "page-2",
+        },
+        {"runs": [{"run_id": 43, "state": {"life_cycle_state": "RUNNING"}}], "has_more": False},
+        {"run_id": 44, "state": {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"}},
+    ]
+    client = _mock_client(monkeypatch, responses, requests)
+    runs = client.get_runs([42, 43, 44], started_after=datetime(2026, 1, 1, tzinfo=UTC))
+
+    assert {run_id: databricks_run_state(run)[0] for run_id, run in runs.items()} == {
+        42: "PENDING",
+        43: "RUNNING",
+        44: "COMPLETED",
+    }
+    assert [request.url.path for request in requests] == [
+        "/api/2.1/jobs/runs/list",
+        "/api/2.1/jobs/runs/list",
+        "/api/2.1/jobs/runs/get",
+    ]
+    assert requests[0].url.params["start_time_from"] == "1767225600000"
+    assert requests[1].url.params["page_token"] == "page-2"
+
+
+def test_databricks_run_state_reports_failure_message():
+    assert databricks_run_state(
+        {"state": {"life_cycle_state": "TERMINATED", "result_state": "CANCELED", "state_message": "by user"}}
+    ) == ("CANCELLED", "by user")
+    assert databricks_run_state({"state": {"life_cycle_state": "INTERNAL_ERROR"}}) == (
+        "FAILED",
+        "Databricks run ended in INTERNAL_ERROR",
+    )
+
+
+def test_databricks_client_for_pools_one_client_per_workspace():
+    try:
+        client = databricks_client_for("https://adb-1.cloud.databricks.com/", "dapi-a")
+        assert databricks_client_for("https://adb-1.cloud.databricks.com", "dapi-a") is client
+        assert databricks_client_for("https://adb-2.cloud.databricks.com", "dapi-a") is not client
+    finally:
+        _reset_databricks_clients()
+    assert client._http.is_closed
@@ -4,6 +4,7 @@ import os
 from types import SimpleNamespace
 import uuid
 
+from botocore.exceptions import ClientError
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import select
@@ -13,15 +14,17 @@ os.environ.setdefault("SPARKPILOT_DATABASE_URL", "sqlite:///./sparkpilot_test.db
 from sparkpilot.api import app  # noqa: E402
 from sparkpilot.config import get_settings  # noqa: E402
 from sparkpilot.db import Base, SessionLocal, engine  # noqa: E402
-from sparkpilot.models import CostAllocation, Environment, Run, TeamBudget  # noqa: E402
+from sparkpilot.models import CostAllocation, CostRollup, Environment, Run, TeamBudget  # noqa: E402
 from sparkpilot.cost_center import resolve_cost_center_for_environment  # noqa: E402
 from sparkpilot.services.finops import (
+    PricingSnapshot,
     _fetch_pricing_api_snapshot,
     _parse_athena_cost_rows,
     _reset_pricing_cache,
     _resolve_runtime_pricing,
+    get_cost_showback,
 )  # noqa: E402
-from sparkpilot.services import _build_preflight, process_cur_reconciliation_once, process_provisioning_once, process_reconciler_once, process_scheduler_once  # noqa: E402
+from sparkpilot.services import _build_preflight, export_cost_rollups_once, process_cur_reconciliation_once, process_provisioning_once, process_reconciler_once, process_scheduler_once, rebuild_cost_rollups  # noqa: E402
 from tests.db_test_utils import reset_sqlite_test_db  # noqa: E402
 
 
@@ -149,6 +152,14 @@ def test_showback_endpoint_returns_allocations_from_run_usage() -> None:
     assert paged.status_code == 200
     assert len(paged.json()["items"]) == 1
 
+    projected = client.get(
+        f"/v1/costs?team={tenant['id']}&period={period}&fields=effective_cost_usd_micros"
+    )
+    assert projected.status_code == 200
+    item = next(item for item in projected.json()["items"] if item["run_id"] == run["id"])
+    assert set(item) == {"run_id", "effective_cost_usd_micros"}
+    assert item["effective_cost_usd_micros"] > 0
+
 
 def test_cost_center_policy_mapping_applies_to_recorded_allocation(monkeypatch) -> None:
     monkeypatch.setenv(
@@ -462,6 +473,25 @@ def test_pricing_api_mode_raises_when_lookup_fails(monkeypatch) -> None:
     get_settings.cache_clear()
 
 
+def test_pricing_api_mode_hot_path_fails_without_persisted_snapshot(monkeypatch) -> None:
+    from sparkpilot.services.finops import pricing_for_region
+
+    monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
+    monkeypatch.setenv(
+        "SPARKPILOT_EMR_EXECUTION_ROLE_ARN",
+        "arn:aws:iam::123456789012:role/SparkPilotExecRole",
+    )
+    monkeypatch.setenv("SPARKPILOT_PRICING_SOURCE", "aws_pricing_api")
+    get_settings.cache_clear()
+    _reset_pricing_cache()
+
+    with SessionLocal() as db:
+        with pytest.raises(ValueError, match="No persisted AWS pricing snapshot for region eu-west-1"):
+            pricing_for_region(db, "eu-west-1")
+    _reset_pricing_cache()
+    get_settings.cache_clear()
+
+
 def test_parse_athena_cost_rows_uses_decimal_rounding_and_skips_headers() -> None:
     rows = [
         {"Data": [{"VarCharValue": "run_id"}, {"VarCharValue": "cost_usd"}]},
@@ -554,3 +584,572 @@ def test_cur_reconciliation_worker_handles_paginated_results(monkeypatch) -> Non
         assert row2.cur_reconciled_at is not None
 
     get_settings.cache_clear()
+
+
+def _pending_allocation(run_id: str, *, billing_period: str, created_at: datetime | None = None) -> CostAllocation:
+    return CostAllocation(
+        run_id=run_id,
+        environment_id="env-1",
+        tenant_id="tenant-1",
+        team="tenant-1",
+        cost_center="cc-1",
+        billing_period=billing_period,
+        estimated_vcpu_seconds=100,
+        estimated_memory_gb_seconds=200,
+        estimated_cost_usd_micros=12_000,
+        created_at=created_at or datetime.now(UTC),
+    )
+
+
+def test_cur_reconciliation_backs_off_unmatched_allocations(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_DATABASE", "cur_db")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_TABLE", "cur_table")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_OUTPUT_LOCATION", "s3://cur-results/")
+    monkeypatch.setenv("SPARKPILOT_CUR_QUERY_MAX_RUN_IDS", "1")
+    monkeypatch.setenv("SPARKPILOT_CUR_MAX_CONCURRENT_QUERIES", "1")
+    get_settings.cache_clear()
+
+    period = datetime.now(UTC).strftime("%Y-%m")
+    stale_run_id = str(uuid.uuid4())
+    fresh_run_id = str(uuid.uuid4())
+    with SessionLocal() as db:
+        db.add(_pending_allocation(stale_run_id, billing_period=period, created_at=datetime.now(UTC) - timedelta(days=3)))
+        db.add(_pending_allocation(fresh_run_id, billing_period=period))
+        db.commit()
+
+    queried: list[str] = []
+
+    class _FakeAthenaClient:
+        def start_query_execution(self, **kwargs):
+            queried.append(kwargs["QueryString"])
+            return {"QueryExecutionId": f"q-{len(queried)}"}
+
+        def get_query_execution(self, **_kwargs):
+            return {"QueryExecution": {"Status": {"State": "SUCCEEDED"}}}
+
+        def get_query_results(self, **_kwargs):
+            return {
+                "ResultSet": {
+                    "Rows": [
+                        {"Data": [{"VarCharValue": "run_id"}, {"VarCharValue": "cost_usd"}]},
+                        {"Data": [{"VarCharValue": fresh_run_id}, {"VarCharValue": "0.50"}]},
+                    ]
+                }
+            }
+
+    monkeypatch.setattr("sparkpilot.services.finops.boto3.client", lambda *_args, **_kwargs: _FakeAthenaClient())
+
+    with SessionLocal() as db:
+        assert process_cur_reconciliation_once(db) == 0
+        stale = db.execute(select(CostAllocation).where(CostAllocation.run_id == stale_run_id)).scalar_one()
+        assert stale.actual_cost_usd_micros is None
+        assert stale.cur_reconcile_attempts == 1
+        assert stale.cur_query_execution_id is None
+        assert stale.cur_next_attempt_at is not None
+
+        # The unmatched head of the queue is now deferred, so the next cycle reaches the newer run.
+        assert process_cur_reconciliation_once(db) == 1
+        fresh = db.execute(select(CostAllocation).where(CostAllocation.run_id == fresh_run_id)).scalar_one()
+        assert fresh.actual_cost_usd_micros == 500_000
+
+    assert stale_run_id in queried[0]
+    assert fresh_run_id in queried[1]
+    assert len(queried) == 2
+    get_settings.cache_clear()
+
+
+def test_cur_reconciliation_partitions_by_billing_period_and_caps_in_flight_queries(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_DATABASE", "cur_db")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_TABLE", "cur_table")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_OUTPUT_LOCATION", "s3://cur-results/")
+    monkeypatch.setenv("SPARKPILOT_CUR_PARTITION_STYLE", "year_month")
+    monkeypatch.setenv("SPARKPILOT_CUR_MAX_CONCURRENT_QUERIES", "2")
+    get_settings.cache_clear()
+
+    with SessionLocal() as db:
+        for period in ("2026-01", "2026-02", "2026-03"):
+            db.add(_pending_allocation(str(uuid.uuid4()), billing_period=period))
+        db.commit()
+
+    started: list[str] = []
+    states: dict[str, str] = {}
+
+    class _FakeAthenaClient:
+        def start_query_execution(self, **kwargs):
+            started.append(kwargs["QueryString"])
+            return {"QueryExecutionId": f"q-{len(started)}"}
+
+        def get_query_execution(self, **kwargs):
+            return {"QueryExecution": {"Status": {"State": states.get(kwargs["QueryExecutionId"], "RUNNING")}}}
+
+        def get_query_results(self, **_kwargs):
+            return {"ResultSet": {"Rows": []}}
+
+    monkeypatch.setattr("sparkpilot.services.finops.boto3.client", lambda *_args, **_kwargs: _FakeAthenaClient())
+
+    with SessionLocal() as db:
+        assert process_cur_reconciliation_once(db) == 0
+        assert len(started) == 2
+        assert "year = '2026' AND month = '1' AND " in started[0]
+        assert "year = '2026' AND month = '2' AND " in started[1]
+
+        # Both slots are still busy, so nothing new is submitted while the scans run.
+        assert process_cur_reconciliation_once(db) == 0
+        assert len(started) == 2
+
+        states["q-1"] = "SUCCEEDED"
+        assert process_cur_reconciliation_once(db) == 0
+        assert len(started) == 3
+        assert "month = '3'" in started[2]
+    get_settings.cache_clear()
+
+
+def test_cur_reconciliation_caps_failed_queries_at_max_attempts(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_DATABASE", "cur_db")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_TABLE", "cur_table")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_OUTPUT_LOCATION", "s3://cur-results/")
+    monkeypatch.setenv("SPARKPILOT_CUR_MAX_ATTEMPTS", "2")
+    get_settings.cache_clear()
+
+    run_id = str(uuid.uuid4())
+    with SessionLocal() as db:
+        db.add(_pending_allocation(run_id, billing_period=datetime.now(UTC).strftime("%Y-%m")))
+        db.commit()
+
+    started: list[str] = []
+
+    class _FakeAthenaClient:
+        def start_query_execution(self, **kwargs):
+            started.append(kwargs["QueryString"])
+            return {"QueryExecutionId": f"q-{len(started)}"}
+
+        def get_query_execution(self, **_kwargs):
+            return {"QueryExecution": {"Status": {"State": "FAILED"}}}
+
+    monkeypatch.setattr("sparkpilot.services.finops.boto3.client", lambda *_args, **_kwargs: _FakeAthenaClient())
+
+    with SessionLocal() as db:
+        for expected_attempts in (1, 2):
+            assert process_cur_reconciliation_once(db) == 0
+            row = db.execute(select(CostAllocation).where(CostAllocation.run_id == run_id)).scalar_one()
+            assert row.cur_reconcile_attempts == expected_attempts
+            assert row.cur_query_execution_id is None
+            assert row.cur_next_attempt_at is not None
+            row.cur_next_attempt_at = None
+            db.commit()
+
+        # The allocation has used its attempts, so no further query is started.
+        assert process_cur_reconciliation_once(db) == 0
+    assert len(started) == 2
+    get_settings.cache_clear()
+
+
+def test_cur_reconciliation_keeps_started_queries_when_a_start_fails(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_DATABASE", "cur_db")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_TABLE", "cur_table")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_OUTPUT_LOCATION", "s3://cur-results/")
+    monkeypatch.setenv("SPARKPILOT_CUR_MAX_CONCURRENT_QUERIES", "3")
+    get_settings.cache_clear()
+
+    run_ids = {period: str(uuid.uuid4()) for period in ("2026-01", "2026-02", "2026-03")}
+    with SessionLocal() as db:
+        for period, run_id in run_ids.items():
+            db.add(_pending_allocation(run_id, billing_period=period))
+        db.commit()
+
+    class _FakeAthenaClient:
+        def __init__(self) -> None:
+            self.starts = 0
+
+        def start_query_execution(self, **_kwargs):
+            self.starts += 1
+            if self.starts == 2:
+                raise ClientError(
+                    {"Error": {"Code": "TooManyRequestsException", "Message": "Rate exceeded"}},
+                    "StartQueryExecution",
+                )
+            return {"QueryExecutionId": f"q-{self.starts}"}
+
+        def get_query_execution(self, **_kwargs):
+            return {"QueryExecution": {"Status": {"State": "RUNNING"}}}
+
+    athena = _FakeAthenaClient()
+    monkeypatch.setattr("sparkpilot.services.finops.boto3.client", lambda *_args, **_kwargs: athena)
+
+    with SessionLocal() as db:
+        assert process_cur_reconciliation_once(db) == 0
+    assert athena.starts == 2
+
+    with SessionLocal() as db:
+        rows = {
+            row.billing_period: row
+            for row in db.execute(select(CostAllocation).where(CostAllocation.run_id.in_(run_ids.values()))).scalars()
+        }
+        assert rows["2026-01"].cur_query_execution_id == "q-1"
+        assert rows["2026-02"].cur_query_execution_id is None
+        assert rows["2026-02"].cur_reconcile_attempts == 1
+        assert rows["2026-02"].cur_next_attempt_at is not None
+        assert rows["2026-03"].cur_query_execution_id is None
+        assert rows["2026-03"].cur_reconcile_attempts == 0
+    get_settings.cache_clear()
+
+
+def test_cost_rollups_track_allocation_inserts_and_cur_updates(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_DATABASE", "cur_db")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_TABLE", "cur_table")
+    monkeypatch.setenv("SPARKPILOT_CUR_ATHENA_OUTPUT_LOCATION", "s3://cur-results/")
+    get_settings.cache_clear()
+
+    period = datetime.now(UTC).strftime("%Y-%m")
+    reconciled_run_id = str(uuid.uuid4())
+    pending_run_id = str(uuid.uuid4())
+    with SessionLocal() as db:
+        db.add(_pending_allocation(reconciled_run_id, billing_period=period))
+        db.add(_pending_allocation(pending_run_id, billing_period=period))
+        db.commit()
+        rollup = db.execute(select(CostRollup)).scalar_one()
+        assert rollup.run_count == 2
+        assert rollup.estimated_cost_usd_micros == 24_000
+        assert rollup.effective_cost_usd_micros == 24_000
+        assert rollup.reconciled_run_count == 0
+
+    class _FakeAthenaClient:
+        def start_query_execution(self, **_kwargs):
+            return {"QueryExecutionId": "q-1"}
+
+        def get_query_execution(self, **_kwargs):
+            return {"QueryExecution": {"Status": {"State": "SUCCEEDED"}}}
+
+        def get_query_results(self, **_kwargs):
+            return {
+                "ResultSet": {
+                    "Rows": [
+                        {"Data": [{"VarCharValue": "run_id"}, {"VarCharValue": "cost_usd"}]},
+                        {"Data": [{"VarCharValue": reconciled_run_id}, {"VarCharValue": "0.05"}]},
+                    ]
+                }
+            }
+
+    monkeypatch.setattr("sparkpilot.services.finops.boto3.client", lambda *_args, **_kwargs: _FakeAthenaClient())
+
+    with SessionLocal() as db:
+        assert process_cur_reconciliation_once(db) == 1
+        rollup = db.execute(select(CostRollup)).scalar_one()
+        db.refresh(rollup)
+        assert rollup.run_count == 2
+        assert rollup.reconciled_run_count == 1
+        assert rollup.estimated_cost_usd_micros == 24_000
+        assert rollup.actual_cost_usd_micros == 50_000
+        assert rollup.effective_cost_usd_micros == 62_000
+
+        showback = get_cost_showback(db, team="tenant-1", period=period)
+        assert showback.total_estimated_cost_usd_micros == 24_000
+        assert showback.total_actual_cost_usd_micros == 50_000
+        assert showback.total_effective_cost_usd_micros == 62_000
+
+        db.execute(CostRollup.__table__.delete())
+        db.commit()
+        assert rebuild_cost_rollups(db) == 1
+        rebuilt = db.execute(select(CostRollup)).scalar_one()
+        assert rebuilt.effective_cost_usd_micros == 62_000
+        assert rebuilt.reconciled_run_count == 1
+
+    get_settings.cache_clear()
+
+
+def test_cost_rollup_export_writes_parquet_partitions(monkeypatch, tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    with SessionLocal() as db:
+        assert export_cost_rollups_once(db) == 0
+
+    monkeypatch.setenv("SPARKPILOT_COST_ROLLUP_EXPORT_DIR", str(tmp_path))
+    get_settings.cache_clear()
+
+    period = datetime.now(UTC).strftime("%Y-%m")
+    with SessionLocal() as db:
+        db.add(_pending_allocation(str(uuid.uuid4()), billing_period=period))
+        db.commit()
+        assert export_cost_rollups_once(db) == 1
+
+    table = pq.read_table(tmp_path / f"billing_period={period}" / "cost_rollups.parquet")
+    assert table.num_rows == 1
+    assert table.column("estimated_cost_usd_micros").to_pylist() == [12_000]
+
+    get_settings.cache_clear()
+
+
+def test_cost_rollup_export_writes_to_s3_uri(monkeypatch, tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    from pyarrow import fs as pafs
+
+    import sparkpilot.services.cost_rollups as cost_rollups
+
+    regions: list[str] = []
+
+    def _local_s3(region: str):
+        regions.append(region)
+        return pafs.SubTreeFileSystem(str(tmp_path), pafs.LocalFileSystem())
+
+    monkeypatch.setattr(cost_rollups, "_s3_export_filesystem", _local_s3)
+    monkeypatch.setenv("SPARKPILOT_COST_ROLLUP_EXPORT_DIR", "s3://finops-exports/sparkpilot/")
+    monkeypatch.setenv("SPARKPILOT_AWS_REGION", "eu-west-1")
+    get_settings.cache_clear()
+
+    period = datetime.now(UTC).strftime("%Y-%m")
+    # S3 has no directories; the local stand-in needs the key's parent to exist.
+    for exported in (period, cost_rollups._previous_billing_period(period)):
+        (tmp_path / "finops-exports" / "sparkpilot" / f"billing_period={exported}").mkdir(parents=True)
+    with SessionLocal() as db:
+        db.add(_pending_allocation(str(uuid.uuid4()), billing_period=period))
+        db.commit()
+        assert export_cost_rollups_once(db) == 1
+
+    assert regions == ["eu-west-1"]
+    table = pq.read_table(tmp_path / "finops-exports" / "sparkpilot" / f"billing_period={period}" / "cost_rollups.parquet")
+    assert table.num_rows == 1
+
+    get_settings.cache_clear()
+
+
+def test_team_spend_cache_reuses_totals_until_allocation_write(monkeypatch) -> None:
+    import sparkpilot.services.cost_rollups as cost_rollups
+
+    calls: list[tuple[str, str]] = []
+    original_totals = cost_rollups.cost_rollup_totals
+
+    def _counting_totals(db, *, team, period):
+        calls.append((team, period))
+        return original_totals(db, team=team, period=period)
+
+    monkeypatch.setattr(cost_rollups, "cost_rollup_totals", _counting_totals)
+
+    period = datetime.now(UTC).strftime("%Y-%m")
+    with SessionLocal() as db:
+        assert cost_rollups.cached_team_spend(db, team="tenant-1", period=period) == (0, 0, 0)
+        assert cost_rollups.cached_team_spend(db, team="tenant-1", period=period) == (0, 0, 0)
+    assert len(calls) == 1
+
+    with SessionLocal() as db:
+        db.add(_pending_allocation(str(uuid.uuid4()), billing_period=period))
+        db.commit()
+
+    with SessionLocal() as db:
+        assert cost_rollups.cached_team_spend(db, team="tenant-1", period=period) == (12_000, 0, 12_000)
+    assert len(calls) == 2
+
+
+def test_projected_budget_mode_reserves_active_run_cost(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_PRICING_SOURCE", "static")
+    get_settings.cache_clear()
+    client = TestClient(app)
+    tenant, op = _create_ready_env(client, "projected")
+    team = tenant["id"]
+    client.post(
+        "/v1/team-budgets",
+        json={
+            "team": team,
+            "monthly_budget_usd_micros": 100_000,
+            "warn_threshold_pct": 80,
+            "block_threshold_pct": 100,
+        },
+    )
+    job = client.post(
+        "/v1/jobs",
+        json={
+            "environment_id": op["environment_id"],
+            "name": "job-projected",
+            "artifact_uri": "s3://bucket/job.jar",
+            "artifact_digest": "sha256:abc999",
+            "entrypoint": "com.acme.Main",
+        },
+        headers={"Idempotency-Key": "job-projected"},
+    ).json()
+    run = client.post(
+        f"/v1/jobs/{job['id']}/runs",
+        json={
+            "requested_resources": {
+                "driver_vcpu": 1,
+                "driver_memory_gb": 4,
+                "executor_vcpu": 1,
+                "executor_memory_gb": 4,
+                "executor_instances": 1,
+            }
+        },
+        headers={"Idempotency-Key": "run-projected"},
+    )
+    assert run.status_code == 201
+
+    def _team_budget_check() -> dict:
+        with SessionLocal() as db:
+            env = db.get(Environment, op["environment_id"])
+            assert env is not None
+            preflight = _build_preflight(env, db=db)
+        return next(item for item in preflight["checks"] if item["code"] == "team_budget")
+
+    effective = _team_budget_check()
+    assert effective["status"] == "pass"
+    assert "active_run_reserved_usd_micros" not in effective["details"]
+
+    monkeypatch.setenv("SPARKPILOT_TEAM_BUDGET_SPEND_MODE", "projected")
+    get_settings.cache_clear()
+    projected = _team_budget_check()
+    assert projected["status"] == "fail"
+    assert projected["details"]["active_run_reserved_usd_micros"] > 100_000
+
+    period = datetime.now(UTC).strftime("%Y-%m")
+    costs = client.get(f"/v1/costs?team={team}&period={period}")
+    assert costs.json()["active_run_reserved_cost_usd_micros"] == projected["details"]["active_run_reserved_usd_micros"]
+
+    get_settings.cache_clear()
+
+
+def test_batch_cost_estimator_matches_scalar_usage_estimate() -> None:
+    from sparkpilot.schemas import RequestedResources
+    from sparkpilot.services.finops import _estimate_usage, estimate_run_costs_usd_micros
+
+    pricing = PricingSnapshot(
+        vcpu_usd_per_second=0.000011244,
+        memory_gb_usd_per_second=0.000001235,
+        arm64_discount_pct=20.0,
+        mixed_discount_pct=10.0,
+        source="static",
+    )
+    resources = RequestedResources(
+        driver_vcpu=1,
+        driver_memory_gb=4,
+        executor_vcpu=2,
+        executor_memory_gb=8,
+        executor_instances=3,
+    )
+    durations = [0, 59, 600, 3_601, 86_400]
+    architectures = ["x86_64", "arm64", "mixed", "arm64", "x86_64"]
+    memory_gb = resources.driver_memory_gb + resources.executor_memory_gb * resources.executor_instances
+    batch = estimate_run_costs_usd_micros(
+        duration_seconds=durations,
+        vcpu=resources.total_vcpu(),
+        memory_gb=memory_gb,
+        architectures=architectures,
+        pricing=pricing,
+    )
+    expected = [
+        _estimate_usage(resources, duration_seconds=duration, instance_architecture=arch, pricing=pricing)[2]
+        for duration, arch in zip(durations, architectures)
+    ]
+    assert batch.tolist() == expected
+
+
+def test_cost_what_if_endpoint_reprices_history_on_alternate_architecture(monkeypatch) -> None:
+    monkeypatch.setenv("SPARKPILOT_PRICING_SOURCE", "static")
+    get_settings.cache_clear()
+    client = TestClient(app)
+    tenant, op = _create_ready_env(client, "what-if")
+    team = tenant["id"]
+
+    with SessionLocal() as db:
+        env = db.get(Environment, op["environment_id"])
+        assert env is not None
+        for index, period in enumerate(["2026-01", "2026-01", "2026-02", "2026-04"]):
+            db.add(
+                CostAllocation(
+                    run_id=f"run-what-if-{index}",
+                    environment_id=env.id,
+                    tenant_id=env.tenant_id,
+                    team=team,
+                    cost_center="cc-1",
+                    billing_period=period,
+                    estimated_vcpu_seconds=36_000,
+                    estimated_memory_gb_seconds=144_000,
+                    estimated_cost_usd_micros=0,
+                )
+            )
+        db.commit()
+
+    response = client.post(
+        "/v1/costs/what-if",
+        json={
+            "team": team,
+            "period_start": "2026-01",
+            "period_end": "2026-03",
+            "instance_architecture": "arm64",
+            "arm64_discount_pct": 50,
+        },
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["run_count"] == 3
+    assert [item["billing_period"] for item in payload["periods"]] == ["2026-01", "2026-02"]
+    assert payload["periods"][0]["run_count"] == 2
+    # Baseline prices the environment's default "mixed" architecture (10% off);
+    # the scenario moves everything to arm64 at 50% off.
+    per_run_list_price = (36_000 * 0.000011244) + (144_000 * 0.000001235)
+    assert payload["baseline_cost_usd_micros"] == 3 * int(per_run_list_price * 0.9 * 1_000_000)
+    assert payload["scenario_cost_usd_micros"] == 3 * int(per_run_list_price * 0.5 * 1_000_000)
+    assert payload["delta_cost_usd_micros"] < 0
+
+    invalid = client.post(
+        "/v1/costs/what-if",
+        json={"team": team, "period_start": "2026-03", "period_end": "2026-01"},
+    )
+    assert invalid.status_code == 422
+
+    get_settings.cache_clear()
+
+
+def test_pricing_refresh_persists_region_snapshots_for_hot_path(monkeypatch) -> None:
+    from sparkpilot.models import RegionPricingSnapshot
+    from sparkpilot.services.finops import pricing_for_region, refresh_pricing_snapshots_once
+
+    monkeypatch.setenv("SPARKPILOT_DRY_RUN_MODE", "false")
+    monkeypatch.setenv(
+        "SPARKPILOT_EMR_EXECUTION_ROLE_ARN",
+        "arn:aws:iam::123456789012:role/SparkPilotExecRole",
+    )
+    monkeypatch.setenv("SPARKPILOT_PRICING_SOURCE", "auto")
+    monkeypatch.setenv("SPARKPILOT_AWS_REGION", "us-east-1")
+    get_settings.cache_clear()
+    _reset_pricing_cache()
+
+    def _no_pricing_api(*_args, **_kwargs):
+        raise AssertionError("hot path must not call the AWS Pricing API")
+
+    monkeypatch.setattr("sparkpilot.services.finops._fetch_pricing_api_snapshot", _no_pricing_api)
+    with SessionLocal() as db:
+        cold = pricing_for_region(db, "eu-west-1")
+    assert cold.source == "static-cold-start"
+
+    fetched_regions: list[str] = []
+
+    def _fake_fetch(_settings, *, region=None):
+        fetched_regions.append(region)
+        return PricingSnapshot(
+            vcpu_usd_per_second=0.00003 if region == "eu-west-1" else 0.00002,
+            memory_gb_usd_per_second=0.000004,
+            arm64_discount_pct=20.0,
+            mixed_discount_pct=10.0,
+            source=f"aws_pricing_api:{region}",
+        )
+
+    monkeypatch.setattr("sparkpilot.services.finops._fetch_pricing_api_snapshot", _fake_fetch)
+    client = TestClient(app)
+    _create_ready_env(client, "pricing-refresh")
+    with SessionLocal() as db:
+        env = db.execute(select(Environment)).scalars().first()
+        env.region = "eu-west-1"
+        db.commit()
+        assert refresh_pricing_snapshots_once(db) == 2
+        # Snapshots are fresh, so a second pass makes no Pricing API calls.
+        assert refresh_pricing_snapshots_once(db) == 0
+        assert sorted(fetched_regions) == ["eu-west-1", "us-east-1"]
+        stored = {row.region: row for row in db.execute(select(RegionPricingSnapshot)).scalars()}
+        assert stored["eu-west-1"].vcpu_usd_per_second == pytest.approx(0.00003)
+
+    # A fresh process (empty in-memory cache) serves the persisted snapshot.
+    _reset_pricing_cache()
+    monkeypatch.setattr("sparkpilot.services.finops._fetch_pricing_api_snapshot", _no_pricing_api)
+    with SessionLocal() as db:
+        warm = pricing_for_region(db, "eu-west-1")
+    assert warm.source == "aws_pricing_api:eu-west-1"
+    assert warm.vcpu_usd_per_second == pytest.approx(0.00003)
+
+    _reset_pricing_cache()
+    get_settings.cache_clear()
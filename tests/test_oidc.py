@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
 
+import httpx
 import pytest
 from cryptography.hazmat.primitives.asymmetric import rsa
 import jwt
 
+import sparkpilot.oidc as oidc_module
 from sparkpilot.oidc import OIDCTokenVerifier, OIDCValidationError, OIDCKeyRotationError
 
 
@@ -350,3 +353,109 @@ def test_missing_aud_and_client_id_is_rejected(tmp_path) -> None:
 
     with pytest.raises(OIDCValidationError, match="audience/client_id"):
         verifier.verify_access_token(token)
+
+
+def test_verified_tokens_are_memoized_until_expiry(tmp_path, monkeypatch) -> None:
+    issuer = "https://issuer.test"
+    audience = "sparkpilot-api"
+    jwks_path = tmp_path / "jwks.json"
+    private_key, public_jwk = _make_signing_key()
+    public_jwk["kid"] = "memo-kid"
+    jwks_path.write_text(json.dumps({"keys": [public_jwk]}), encoding="utf-8")
+    verifier = OIDCTokenVerifier(
+        issuer=issuer,
+        audience=audience,
+        jwks_uri=jwks_path.resolve().as_uri(),
+        jwks_cache_ttl_seconds=3600,
+    )
+    token = _issue_token(
+        private_key=private_key,
+        kid="memo-kid",
+        issuer=issuer,
+        audience=audience,
+        subject="user:memo",
+    )
+
+    assert verifier.cached_identity(token) is None
+    identity = verifier.verify_access_token(token)
+
+    def _fail_decode(*_args, **_kwargs):
+        raise AssertionError("memoized token should not be decoded again")
+
+    monkeypatch.setattr("sparkpilot.oidc.jwt.decode", _fail_decode)
+    assert verifier.cached_identity(token) is identity
+    assert verifier.verify_access_token(token) is identity
+
+    real_time = time.time
+    monkeypatch.setattr("sparkpilot.oidc.time.time", lambda: real_time() + 601)
+    assert verifier.cached_identity(token) is None
+
+
+def _swr_verifier(tmp_path, *, grace_seconds: float) -> tuple[OIDCTokenVerifier, str]:
+    issuer = "https://issuer.test"
+    audience = "sparkpilot-api"
+    jwks_path = tmp_path / "jwks.json"
+    private_key, public_jwk = _make_signing_key()
+    public_jwk["kid"] = "swr-kid"
+    jwks_path.write_text(json.dumps({"keys": [public_jwk]}), encoding="utf-8")
+    verifier = OIDCTokenVerifier(
+        issuer=issuer,
+        audience=audience,
+        jwks_uri=jwks_path.resolve().as_uri(),
+        jwks_cache_ttl_seconds=300,
+        jwks_stale_grace_seconds=grace_seconds,
+    )
+    token = _issue_token(
+        private_key=private_key,
+        kid="swr-kid",
+        issuer=issuer,
+        audience=audience,
+        subject="user:swr",
+    )
+    verifier.verify_access_token(token)
+    return verifier, token
+
+
+def test_jwks_prefetch_refreshes_in_background_without_blocking(tmp_path, monkeypatch) -> None:
+    verifier, token = _swr_verifier(tmp_path, grace_seconds=600)
+    real_read = oidc_module._read_uri_json
+    release = threading.Event()
+
+    def _slow_read(uri: str, *, timeout_seconds: float):
+        assert release.wait(timeout=5)
+        return real_read(uri, timeout_seconds=timeout_seconds)
+
+    monkeypatch.setattr("sparkpilot.oidc._read_uri_json", _slow_read)
+    verifier._cached_at_monotonic = time.monotonic() - 270  # inside the prefetch window
+
+    # The slow fetch runs on a background thread; the request is served from the current keys.
+    assert verifier.verify_access_token(token).subject == "user:swr"
+    assert verifier.jwks_refresh_stats["total"] == 1
+
+    release.set()
+    verifier._background_refresh_thread.join(timeout=5)
+    stats = verifier.jwks_refresh_stats
+    assert stats["total"] == 2
+    assert stats["background"] == 1
+    assert stats["failed"] == 0
+    assert stats["staleness_seconds"] == 0
+
+
+def test_jwks_last_good_keyset_survives_idp_outage_until_grace_expires(tmp_path, monkeypatch) -> None:
+    verifier, token = _swr_verifier(tmp_path, grace_seconds=600)
+
+    def _idp_down(uri: str, *, timeout_seconds: float):
+        raise httpx.ConnectError("IdP unavailable")
+
+    monkeypatch.setattr("sparkpilot.oidc._read_uri_json", _idp_down)
+    verifier._cached_at_monotonic = time.monotonic() - 400  # past TTL, inside grace
+
+    assert verifier.verify_access_token(token).subject == "user:swr"
+    verifier._background_refresh_thread.join(timeout=5)
+    stats = verifier.jwks_refresh_stats
+    assert stats["failed"] == 1
+    assert stats["staleness_seconds"] >= 100
+
+    verifier._cached_at_monotonic = time.monotonic() - 901  # past TTL + grace
+    with pytest.raises(OIDCValidationError, match="JWKS retrieval failed"):
+        verifier.verify_access_token(token)
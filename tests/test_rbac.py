@@ -492,6 +492,62 @@ def test_rbac_operator_without_scope_cannot_access_environment() -> None:
     assert forbidden_env.status_code == 403
 
 
+def test_rbac_cached_access_context_is_invalidated_by_scope_writes() -> None:
+    client = TestClient(app)
+
+    tenant = _create_tenant(client, actor="bootstrap-admin", suffix="rbac-cache")
+    env = _create_environment(client, actor="bootstrap-admin", tenant_id=str(tenant["id"]), suffix="rbac-cache")
+    with SessionLocal() as db:
+        process_provisioning_once(db)
+
+    team = client.post(
+        "/v1/teams",
+        json={"tenant_id": tenant["id"], "name": "team-cache"},
+        headers=_headers("bootstrap-admin"),
+    )
+    assert team.status_code == 201
+    team_id = team.json()["id"]
+    operator = client.post(
+        "/v1/user-identities",
+        json={
+            "actor": "operator-cache",
+            "role": "operator",
+            "tenant_id": tenant["id"],
+            "team_id": team_id,
+            "active": True,
+        },
+        headers=_headers("bootstrap-admin"),
+    )
+    assert operator.status_code == 201
+    env_path = f"/v1/environments/{env['environment_id']}"
+
+    assert client.get(env_path, headers=_headers("operator-cache")).status_code == 403
+    granted = client.post(
+        f"/v1/teams/{team_id}/environments/{env['environment_id']}",
+        headers=_headers("bootstrap-admin"),
+    )
+    assert granted.status_code == 201
+    assert client.get(env_path, headers=_headers("operator-cache")).status_code == 200
+
+    # Out-of-band writes are not visible until the cached context expires.
+    with SessionLocal() as db:
+        row = db.execute(
+            select(UserIdentity).where(UserIdentity.actor == "operator-cache")
+        ).scalar_one()
+        row.active = False
+        db.commit()
+    assert client.get(env_path, headers=_headers("operator-cache")).status_code == 200
+
+    revoked = client.delete(
+        f"/v1/teams/{team_id}/environments/{env['environment_id']}",
+        headers=_headers("bootstrap-admin"),
+    )
+    assert revoked.status_code == 204
+    denied = client.get(env_path, headers=_headers("operator-cache"))
+    assert denied.status_code == 403
+    assert denied.json()["detail"] == "Unknown or inactive actor."
+
+
 def test_rbac_mutations_are_audited() -> None:
     client = TestClient(app)
 
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from sparkpilot.terraform_orchestrator import (
+    TerraformWorkspaceManager,
     ProvisioningStageContext,
     TerraformApplyResult,
     TerraformOrchestrator,
@@ -343,6 +345,106 @@ class TestInitAndWorkspaceIdempotency:
         assert subcmds.count("init") == 2, "each distinct workspace should trigger its own init"
 
 
+class TestPersistentWorkingCopies:
+    """Initialized working copies survive orchestrator instances and worker restarts."""
+
+    def test_new_orchestrator_reuses_persisted_init(self, tmp_path: Path) -> None:
+        context = _context(tmp_path)
+
+        with patch("shutil.which", return_value="/usr/bin/terraform"), \
+             patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _completed(0, "Terraform initialized"),  # init
+                _completed(0),                            # workspace select
+                _completed(0, "Plan: 0 to add"),          # plan (first worker)
+                _completed(0, "Plan: 0 to add"),          # plan (restarted worker)
+            ]
+            TerraformOrchestrator(enable_subprocess=True, workspaces=TerraformWorkspaceManager()).plan(context)
+            TerraformOrchestrator(enable_subprocess=True, workspaces=TerraformWorkspaceManager()).plan(context)
+
+        calls = mock_run.call_args_list
+        assert [c.args[0][1] for c in calls].count("init") == 1
+        envs = [c.kwargs["env"] for c in calls]
+        data_dirs = {env["TF_DATA_DIR"] for env in envs}
+        assert len(data_dirs) == 1
+        data_dir = Path(data_dirs.pop())
+        assert data_dir.is_relative_to(tmp_path / ".sparkpilot-terraform" / "data")
+        assert (data_dir / "sparkpilot-init.json").exists()
+        assert {env["TF_PLUGIN_CACHE_DIR"] for env in envs} == {
+            str(tmp_path / ".sparkpilot-terraform" / "plugin-cache")
+        }
+
+    def test_failed_init_is_not_persisted(self, tmp_path: Path) -> None:
+        context = _context(tmp_path)
+        workspaces = TerraformWorkspaceManager()
+        orchestrator = TerraformOrchestrator(enable_subprocess=True, workspaces=workspaces)
+
+        with patch("shutil.which", return_value="/usr/bin/terraform"), \
+             patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _completed(1, stderr="Error: Failed to query available provider packages"),
+                _completed(0, "Terraform initialized"),
+                _completed(0),
+                _completed(0, "Plan: 0 to add"),
+            ]
+            with pytest.raises(ValueError, match="Terraform init failed"):
+                orchestrator.plan(context)
+            orchestrator.plan(context)
+
+        assert [c.args[0][1] for c in mock_run.call_args_list].count("init") == 2
+
+    def test_backend_change_prepares_new_working_copy(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("SPARKPILOT_TERRAFORM_WORK_DIR", str(tmp_path / "work"))
+        monkeypatch.setenv("SPARKPILOT_TERRAFORM_PLUGIN_CACHE_DIR", str(tmp_path / "plugins"))
+        monkeypatch.delenv("SPARKPILOT_TERRAFORM_STATE_BUCKET", raising=False)
+        context = _context(tmp_path)
+        workspaces = TerraformWorkspaceManager()
+
+        with patch("shutil.which", return_value="/usr/bin/terraform"), \
+             patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _completed(0, "Terraform initialized"),
+                _completed(0),
+                _completed(0, "Plan: 0 to add"),
+                _completed(0, "Terraform initialized"),
+                _completed(0),
+                _completed(0, "Plan: 0 to add"),
+            ]
+            TerraformOrchestrator(enable_subprocess=True, workspaces=workspaces).plan(context)
+            monkeypatch.setenv("SPARKPILOT_TERRAFORM_STATE_BUCKET", "my-tf-state-bucket")
+            TerraformOrchestrator(enable_subprocess=True, workspaces=workspaces).plan(context)
+
+        init_calls = [c for c in mock_run.call_args_list if c.args[0][1] == "init"]
+        assert len(init_calls) == 2
+        first_dir, second_dir = (Path(c.kwargs["env"]["TF_DATA_DIR"]) for c in init_calls)
+        assert first_dir != second_dir
+        assert first_dir.parent == second_dir.parent == tmp_path / "work" / "data"
+        assert (tmp_path / "plugins").is_dir()
+
+
+    def test_module_change_prepares_new_working_copy(self, tmp_path: Path) -> None:
+        (tmp_path / "main.tf").write_text('module "network" {\n  source = "./network"\n}\n', encoding="utf-8")
+        (tmp_path / "network").mkdir()
+        (tmp_path / "network" / "main.tf").write_text("# v1\n", encoding="utf-8")
+        workspaces = TerraformWorkspaceManager()
+
+        first = workspaces.working_copy(tmp_path, "ws", [])
+        assert workspaces.working_copy(tmp_path, "ws", []).key == first.key
+        # Terraform's own data directories do not affect the key.
+        (tmp_path / ".terraform" / "modules").mkdir(parents=True)
+        (tmp_path / ".terraform" / "modules" / "cached.tf").write_text("# cached\n", encoding="utf-8")
+        assert workspaces.working_copy(tmp_path, "ws", []).key == first.key
+
+        (tmp_path / "network" / "main.tf").write_text("# v2\n", encoding="utf-8")
+        changed_module = workspaces.working_copy(tmp_path, "ws", [])
+        assert changed_module.key != first.key
+
+        (tmp_path / "backend.tf").write_text('terraform {\n  backend "s3" {}\n}\n', encoding="utf-8")
+        assert workspaces.working_copy(tmp_path, "ws", []).key != changed_module.key
+
+
 class TestBackendEnvVars:
     """Backend env vars should alter the terraform init -backend-config= args."""
 
@@ -613,3 +715,35 @@ class TestInitAndWorkspaceErrorMessages:
 
         assert "timed out" in str(exc_info.value).lower()
         assert "30" in str(exc_info.value)
+
+
+class TestStreamedOutput:
+    """With an output_sink, command output is forwarded line by line as it arrives."""
+
+    def test_output_sink_receives_lines_and_result_keeps_full_output(self, tmp_path: Path) -> None:
+        received: list[tuple[str, str]] = []
+        orchestrator = TerraformOrchestrator(
+            enable_subprocess=True,
+            output_sink=lambda stream, line: received.append((stream, line)),
+        )
+        script = "import sys; print('plan line 1'); print('plan line 2', flush=True); print('warn', file=sys.stderr)"
+
+        completed = orchestrator._run([sys.executable, "-c", script], cwd=tmp_path)
+
+        assert completed.returncode == 0
+        assert completed.stdout == "plan line 1\nplan line 2\n"
+        assert completed.stderr == "warn\n"
+        assert [line for stream, line in received if stream == "stdout"] == ["plan line 1", "plan line 2"]
+        assert ("stderr", "warn") in received
+
+    def test_streamed_command_is_killed_on_timeout(self, tmp_path: Path) -> None:
+        orchestrator = TerraformOrchestrator(
+            enable_subprocess=True,
+            timeout_seconds=1,
+            output_sink=lambda _stream, _line: None,
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            orchestrator._run([sys.executable, "-c", "import time; time.sleep(30)"], cwd=tmp_path)
+
+        assert "timed out after 1 seconds" in str(exc_info.value)
@@ -49,6 +49,10 @@ async function proxy(request: NextRequest, context: RouteContext): Promise<NextR
   if (idempotencyKey) {
     headers.set("Idempotency-Key", idempotencyKey);
   }
+  const ifNoneMatch = request.headers.get("If-None-Match");
+  if (ifNoneMatch) {
+    headers.set("If-None-Match", ifNoneMatch);
+  }
   const contentType = request.headers.get("Content-Type");
   if (contentType) {
     headers.set("Content-Type", contentType);
@@ -75,6 +79,13 @@ async function proxy(request: NextRequest, context: RouteContext): Promise<NextR
     if (replayHeader) {
       passthroughHeaders.set("X-Idempotent-Replay", replayHeader);
     }
+    // Forward list versioning headers so pollers can send conditional/delta requests.
+    for (const name of ["ETag", "X-Next-Updated-Since"]) {
+      const value = response.headers.get(name);
+      if (value) {
+        passthroughHeaders.set(name, value);
+      }
+    }
     // Forward auth hint so UI can detect key rotation (#84)
     const authHint = response.headers.get("X-SparkPilot-Auth-Hint");
     if (authHint) {
@@ -1,21 +1,23 @@
 "use client";
 
 import Link from "next/link";
-import { useCallback, useEffect, useMemo, useState } from "react";
+import { useCallback, useEffect, useMemo, useRef, useState } from "react";
 import {
   type DiagnosticItem,
   Environment,
   Job,
   type QueueUtilizationResponse,
   Run,
+  type RunListCursor,
   cancelRun,
   fetchEnvironments,
   fetchJobs,
   fetchQueueUtilization,
   fetchRunDiagnostics,
   fetchRunLogs,
-  fetchRuns,
+  fetchRunsDelta,
   fetchUsage,
+  mergeRunDelta,
 } from "@/lib/api";
 import { shortId, compactTime, friendlyError } from "@/lib/format";
 import { badgeClass } from "@/lib/badge";
@@ -45,6 +47,9 @@ function formatEstimatedCost(micros: number | undefined): string {
 
 export default function RunsPage() {
   const [runs, setRuns] = useState<Run[]>([]);
+  // Latest run list and list cursor, read by the poller to merge deltas.
+  const runsRef = useRef<Run[]>([]);
+  const runListCursorRef = useRef<RunListCursor | null>(null);
   const [environments, setEnvironments] = useState<Environment[]>([]);
   const [jobs, setJobs] = useState<Job[]>([]);
   const [selectedRunId, setSelectedRunId] = useState<string | null>(null);
@@ -213,11 +218,14 @@ export default function RunsPage() {
   const refreshAll = useCallback(async () => {
     setRefreshing(true);
     try {
-      const [runsPayload, envPayload, jobPayload] = await Promise.all([
-        fetchRuns(),
+      const [runsDelta, envPayload, jobPayload] = await Promise.all([
+        fetchRunsDelta(null),
         fetchEnvironments(),
         fetchJobs(),
       ]);
+      const runsPayload = runsDelta.runs;
+      runListCursorRef.current = runsDelta.cursor;
+      runsRef.current = runsPayload;
       setRuns(runsPayload);
       setEnvironments(envPayload);
       setJobs(jobPayload);
@@ -234,8 +242,16 @@ export default function RunsPage() {
 
   const reloadRuns = useCallback(async () => {
     try {
-      const data = await fetchRuns();
-      setRuns(data);
+      // Only runs changed since the last poll come back (nothing at all on a
+      // 304), so merge them into the current list instead of replacing it.
+      const delta = await fetchRunsDelta(runListCursorRef.current);
+      runListCursorRef.current = delta.cursor;
+      let data = runsRef.current;
+      if (delta.runs.length > 0) {
+        data = mergeRunDelta(data, delta.runs);
+        runsRef.current = data;
+        setRuns(data);
+      }
       await refreshQueueUtilizationForActiveRuns(data);
       setError(null);
     } catch (err: unknown) {
@@ -346,6 +362,10 @@ export default function RunsPage() {
     await loadDiagnostics(run);
   }
 
+  useEffect(() => {
+    runsRef.current = runs;
+  }, [runs]);
+
   // Initial load
   useEffect(() => {
     void refreshAll();
@@ -564,6 +564,72 @@ export async function fetchRuns(): Promise<Run[]> {
   return _asObjectArray(payload, "Run fetch") as Run[];
 }
 
+export type RunListCursor = {
+  etag: string | null;
+  updatedSince: string | null;
+};
+
+export type RunListDelta = {
+  /** Runs changed since the cursor; all runs on the page when no cursor was sent. */
+  runs: Run[];
+  /** True when the server answered 304 and `runs` is empty. */
+  notModified: boolean;
+  cursor: RunListCursor;
+};
+
+/**
+ * Poll /v1/runs for changes since a previous call.
+ *
+ * Sends the previous ETag as If-None-Match (304 when nothing changed) and the
+ * previous X-Next-Updated-Since token so only changed runs are returned.
+ * Callers merge the result into their list with `mergeRunDelta`.
+ */
+export async function fetchRunsDelta(cursor?: RunListCursor | null): Promise<RunListDelta> {
+  const params = new URLSearchParams();
+  const headers = _headers(false);
+  if (cursor?.updatedSince) {
+    params.set("updated_since", cursor.updatedSince);
+  }
+  if (cursor?.etag) {
+    headers["If-None-Match"] = cursor.etag;
+  }
+  const query = params.toString();
+  const response = await fetch(`${API_PREFIX}/v1/runs${query ? `?${query}` : ""}`, {
+    cache: "no-store",
+    headers,
+  });
+  const nextCursor: RunListCursor = {
+    etag: response.headers.get("ETag") ?? cursor?.etag ?? null,
+    updatedSince: response.headers.get("X-Next-Updated-Since") ?? cursor?.updatedSince ?? null,
+  };
+  if (response.status === 304) {
+    return { runs: [], notModified: true, cursor: nextCursor };
+  }
+  if (!response.ok) {
+    throw new Error(await _extractDetail(response, "Failed to load runs"));
+  }
+  const payload = await response.json();
+  return {
+    runs: _asObjectArray(payload, "Run fetch") as Run[],
+    notModified: false,
+    cursor: nextCursor,
+  };
+}
+
+/** Merge changed runs into a list by id, newest first, keeping at most `limit` runs. */
+export function mergeRunDelta(current: Run[], changed: Run[], limit = 200): Run[] {
+  if (changed.length === 0) {
+    return current;
+  }
+  const byId = new Map(current.map((run) => [run.id, run]));
+  for (const run of changed) {
+    byId.set(run.id, run);
+  }
+  return [...byId.values()]
+    .sort((a, b) => (b.created_at ?? "").localeCompare(a.created_at ?? ""))
+    .slice(0, limit);
+}
+
 export type RunLogsResponse = {
   run_id: string;
   log_group: string | null;
@@ -751,6 +817,7 @@ export type CostShowbackResponse = {
   total_estimated_cost_usd_micros: number;
   total_actual_cost_usd_micros: number;
   total_effective_cost_usd_micros: number;
+  active_run_reserved_cost_usd_micros?: number | null;
   items: CostShowbackItem[];
 };
 